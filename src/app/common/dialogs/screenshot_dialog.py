@@ -32,7 +32,7 @@ from PySide6.QtWidgets import (
 )
 
 from core.database.helpers import get_sequences, insert_screenshot
-from app.features.screenshots.storage import ScreenshotMetadata, save_screenshot
+from app.features.screenshots.storage import ScreenshotMetadata, release_screenshot
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +73,7 @@ class ScreenshotCaptureDialog(QDialog):
         self.forensic_context = forensic_context
         self.existing_screenshot = existing_screenshot
         self._saved_screenshot_id: Optional[int] = None
+        self._save_task = None  # Keeps the running ScreenshotSaveTask alive
 
         self._is_edit_mode = existing_screenshot is not None
 
@@ -284,17 +285,34 @@ class ScreenshotCaptureDialog(QDialog):
         sequence_name: Optional[str],
         sequence_order: int,
     ) -> None:
-        """Save a new screenshot."""
+        """Save a new screenshot (store in a worker thread, then insert the row)."""
+        from app.services.workers import ScreenshotSaveTask, start_task
+
+        annotations = dict(
+            title=title,
+            caption=caption,
+            notes=notes or None,
+            sequence_name=sequence_name,
+            sequence_order=sequence_order,
+        )
+        # QImage (unlike QPixmap) may be used from the worker thread
+        task = ScreenshotSaveTask(
+            self.forensic_context.workspace_path,
+            self.forensic_context.evidence_label,
+            self.forensic_context.evidence_id,
+            image=self.pixmap.toImage(),
+        )
+        task.signals.result.connect(lambda metadata: self._on_stored(metadata, annotations))
+        task.signals.error.connect(self._on_store_error)
+        self._save_task = task
+        self.save_btn.setEnabled(False)
+        self.save_btn.setText("Saving…")
+        start_task(task)
+
+    def _on_stored(self, metadata: ScreenshotMetadata, annotations: dict) -> None:
+        """Insert the database record once the file is stored."""
+        self._save_task = None
         try:
-            # Save pixmap to disk
-            metadata = save_screenshot(
-                self.pixmap,
-                self.forensic_context.workspace_path,
-                self.forensic_context.evidence_label,
-                self.forensic_context.evidence_id,
-            )
-
-            # Insert database record
             now_utc = datetime.now(timezone.utc).isoformat()
             screenshot_id = insert_screenshot(
                 self.forensic_context.db_conn,
@@ -307,13 +325,9 @@ class ScreenshotCaptureDialog(QDialog):
                 height=metadata.height,
                 md5=metadata.md5,
                 sha256=metadata.sha256,
-                title=title,
-                caption=caption,
-                notes=notes or None,
-                sequence_name=sequence_name,
-                sequence_order=sequence_order,
                 source="sandbox",
                 captured_at_utc=now_utc,
+                **annotations,
             )
 
             self._saved_screenshot_id = screenshot_id
@@ -322,12 +336,25 @@ class ScreenshotCaptureDialog(QDialog):
             self.accept()
 
         except Exception as e:
-            logger.error("Failed to save screenshot: %s", e)
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to save screenshot:\n{e}"
+            # No row references the stored file
+            release_screenshot(
+                {"dest_path": metadata.dest_path, "sha256": metadata.sha256},
+                self.forensic_context.workspace_path,
+                self.forensic_context.evidence_label,
+                self.forensic_context.evidence_id,
             )
+            self._on_store_error(str(e), "")
+
+    def _on_store_error(self, error: str, traceback_str: str) -> None:
+        self._save_task = None
+        logger.error("Failed to save screenshot: %s", error)
+        self.save_btn.setEnabled(True)
+        self.save_btn.setText("💾 Save Screenshot")
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Failed to save screenshot:\n{error}"
+        )
 
     def _save_edit(
         self,
@@ -284,26 +284,27 @@ class TagArtifactsDialog(QDialog):
         selected_tags = self.get_selected_tags()
 
         try:
-            # For each artifact, sync its tags with the selected list
-            for artifact_id in self.artifact_ids:
-                # Get current tags
-                current_tags = self.case_data.get_artifact_tags(
-                    self.evidence_id, self.artifact_type, artifact_id
+            # Sync every selected artifact to the chosen tag list with one
+            # bulk call per tag (untagging a tag an artifact lacks and
+            # re-tagging an already-tagged artifact are both no-ops).
+            artifact_ids = list(self.artifact_ids)
+            current_tags = self.case_data.get_tags_for_artifacts(
+                self.evidence_id, self.artifact_type, artifact_ids
+            )
+            current_tag_names = {tag['name'] for tag in current_tags}
+            selected_tag_set = set(selected_tags)
+
+            # Remove tags that are no longer selected
+            for tag_name in current_tag_names - selected_tag_set:
+                self.case_data.untag_artifacts(
+                    self.evidence_id, tag_name, self.artifact_type, artifact_ids
+                )
+
+            # Add selected tags
+            for tag_name in selected_tag_set:
+                self.case_data.tag_artifacts(
+                    self.evidence_id, tag_name, self.artifact_type, artifact_ids
                 )
-                current_tag_names = {tag['name'] for tag in current_tags}
-                selected_tag_set = set(selected_tags)
-
-                # Remove tags that are no longer selected
-                for tag_name in current_tag_names - selected_tag_set:
-                    self.case_data.untag_artifact(
-                        self.evidence_id, tag_name, self.artifact_type, artifact_id
-                    )
-
-                # Add new tags
-                for tag_name in selected_tag_set - current_tag_names:
-                    self.case_data.tag_artifact(
-                        self.evidence_id, tag_name, self.artifact_type, artifact_id
-                    )
 
             self.tags_changed.emit()
             super().accept()
@@ -2,6 +2,7 @@
 
 This module provides the foundation for all data access classes:
 - Database connection management (case DB and evidence DBs)
+- Pooled read-only connections for UI queries (instrumented)
 - Thread-safe evidence context switching
 - TTL-based filter caching with thread-safe operations
 - Evidence existence guards
@@ -16,7 +17,7 @@ import time
 import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 
 from core.database import DatabaseManager, find_case_database
 
@@ -226,6 +227,25 @@ class BaseDataAccess:
         conn.row_factory = sqlite3.Row
         return conn
 
+    @contextmanager
+    def _connect_read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection for the current evidence context.
+
+        Connections come from the DatabaseManager read pool (``mode=ro``,
+        ``query_only``) and record per-statement latency for the Audit tab.
+        Use for queries only; writes go through _connect().
+
+        Yields:
+            SQLite connection with row_factory set to sqlite3.Row
+        """
+        if self._current_evidence_id is not None:
+            label = self._get_evidence_label(self._current_evidence_id)
+            with self._db_manager.read_evidence_conn(self._current_evidence_id, label) as conn:
+                yield conn
+        else:
+            with self._db_manager.read_case_conn() as conn:
+                yield conn
+
     def _connect_case(self) -> sqlite3.Connection:
         """Connect to case database only (not evidence database).
 
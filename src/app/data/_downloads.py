@@ -546,6 +546,22 @@ class DownloadQueryMixin(BaseDataAccess):
                 )
                 conn.commit()
 
+    def update_download_image_metadata_batch(
+        self,
+        evidence_id: int,
+        records: List[Dict[str, Any]],
+    ) -> int:
+        """Update image metadata for many downloads in one transaction."""
+        if not records:
+            return 0
+        with self._use_evidence_conn(evidence_id):
+            with self._connect() as conn:
+                count = downloads_helpers.update_download_image_metadata_batch(
+                    conn, evidence_id, records
+                )
+                conn.commit()
+        return count
+
     def list_downloads(
         self,
         evidence_id: int,
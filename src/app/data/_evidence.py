@@ -10,6 +10,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from core.database.helpers import fts as fts_helpers
+from core.database.helpers.artifact_counts import get_artifact_counts
+
 from ._base import BaseDataAccess
 
 
@@ -26,7 +29,8 @@ class EvidenceMetadataMixin(BaseDataAccess):
     """Mixin providing evidence metadata operations.
 
     Methods operate on the case database (evidences table),
-    except get_evidence_counts() which queries the evidence database.
+    except get_evidence_counts() and the search index methods which use
+    the evidence database.
 
     Extracted from CaseMetadataMixin for modular architecture.
     """
@@ -115,8 +119,8 @@ class EvidenceMetadataMixin(BaseDataAccess):
     def get_evidence_counts(self, evidence_id: int) -> EvidenceCounts:
         """Get summary counts for an evidence item.
 
-        Queries the evidence database for URL, image, and indicator counts,
-        plus the timestamp of the last extraction run.
+        Reads URL, image, and indicator counts from the maintained artifact
+        counters, plus the timestamp of the last extraction run.
 
         Args:
             evidence_id: Evidence ID to get counts for
@@ -129,14 +133,8 @@ class EvidenceMetadataMixin(BaseDataAccess):
             return EvidenceCounts(urls=0, images=0, indicators=0, last_run_utc=None)
         with self._use_evidence_conn(evidence_id):
             with self._connect() as conn:
-                urls = self._scalar(
-                    conn, "SELECT COUNT(*) FROM urls WHERE evidence_id = ?", (evidence_id,)
-                )
-                images = self._scalar(
-                    conn, "SELECT COUNT(*) FROM images WHERE evidence_id = ?", (evidence_id,)
-                )
-                indicators = self._scalar(
-                    conn, "SELECT COUNT(*) FROM os_indicators WHERE evidence_id = ?", (evidence_id,)
+                counts = get_artifact_counts(
+                    conn, evidence_id, ("urls", "images", "os_indicators")
                 )
                 last_run = self._scalar(
                     conn,
@@ -149,5 +147,35 @@ class EvidenceMetadataMixin(BaseDataAccess):
                 )
         last_run_str = str(last_run) if last_run else None
         return EvidenceCounts(
-            urls=urls, images=images, indicators=indicators, last_run_utc=last_run_str
+            urls=counts["urls"],
+            images=counts["images"],
+            indicators=counts["os_indicators"],
+            last_run_utc=last_run_str,
         )
+
+    # -------------------------------------------------------------------------
+    # Full-Text Search Index (Evidence DB)
+    # -------------------------------------------------------------------------
+
+    def ensure_search_index(self, evidence_id: int) -> List[str]:
+        """Build any missing FTS5 trigram search indexes for an evidence.
+
+        Indexes that already exist are kept current by their triggers, so this
+        is cheap to call after every ingestion batch.
+
+        Returns:
+            Source tables whose index was built by this call
+        """
+        if not self._evidence_db_exists(evidence_id):
+            return []
+        with self._use_evidence_conn(evidence_id):
+            with self._connect() as conn:
+                return fts_helpers.ensure_fts_indexes(conn)
+
+    def has_search_index(self, evidence_id: int, table: str) -> bool:
+        """Return True if substring searches on ``table`` use the FTS index."""
+        if not self._evidence_db_exists(evidence_id):
+            return False
+        with self._use_evidence_conn(evidence_id):
+            with self._connect() as conn:
+                return fts_helpers.has_fts_index(conn, table)
@@ -75,7 +75,7 @@ class ImageQueryMixin(BaseDataAccess):
             ORDER BY COALESCE(i.ts_utc, '') DESC
         """
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 cursor = conn.execute(sql, (evidence_id, tag.lower()))
                 return [dict(row) for row in cursor.fetchall()]
 
@@ -115,7 +115,7 @@ class ImageQueryMixin(BaseDataAccess):
             GROUP BY i.id
         """
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 cursor = conn.execute(sql, ids)
                 rows = [dict(row) for row in cursor.fetchall()]
         rows_by_id = {row["id"]: row for row in rows}
@@ -258,7 +258,7 @@ class ImageQueryMixin(BaseDataAccess):
         """
         params.extend([limit, offset])
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 cursor = conn.execute(sql, params)
                 return [dict(row) for row in cursor.fetchall()]
 
@@ -303,7 +303,7 @@ class ImageQueryMixin(BaseDataAccess):
             ORDER BY discovered_by
         """
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 cursor = conn.execute(sql, (evidence_id,))
                 result = [row[0] for row in cursor.fetchall()]
 
@@ -335,7 +335,7 @@ class ImageQueryMixin(BaseDataAccess):
             ORDER BY discovered_by
         """
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 cursor = conn.execute(sql, (evidence_id,))
                 result = [(row[0], row[1]) for row in cursor.fetchall()]
 
@@ -395,7 +395,7 @@ class ImageQueryMixin(BaseDataAccess):
             ORDER BY count DESC, ext ASC
         """
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 cursor = conn.execute(sql, (evidence_id,))
                 result = [(row[0], row[1]) for row in cursor.fetchall()]
 
@@ -434,7 +434,7 @@ class ImageQueryMixin(BaseDataAccess):
             ORDER BY count DESC, hm.list_name ASC
         """
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 cursor = conn.execute(sql, (evidence_id,))
                 result = [(row[0], row[1]) for row in cursor.fetchall()]
 
@@ -464,7 +464,7 @@ class ImageQueryMixin(BaseDataAccess):
             GROUP BY i.id
         """
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 row = conn.execute(sql, (image_id,)).fetchone()
                 return dict(row) if row else None
 
@@ -570,7 +570,7 @@ class ImageQueryMixin(BaseDataAccess):
 
         results = []
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 if target_prefix is not None:
                     # Phase 1: SQL prefix filter
                     # Allow prefix difference based on threshold
@@ -630,7 +630,7 @@ class ImageQueryMixin(BaseDataAccess):
             return []
 
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 query = "SELECT * FROM hash_matches WHERE evidence_id = ?"
                 params: List[Any] = [evidence_id]
 
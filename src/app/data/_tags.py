@@ -10,7 +10,7 @@ Extracted from case_data.py for modular repository pattern.
 from __future__ import annotations
 
 import sqlite3
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
 from core.database.helpers import tags as tag_helpers
 
@@ -232,6 +232,217 @@ class TagQueryMixin(BaseDataAccess):
 
         self._invalidate_tag_cache(evidence_id)
 
+    # -------------------------------------------------------------------------
+    # Bulk Artifact Tagging
+    # -------------------------------------------------------------------------
+
+    def tag_artifacts(
+        self,
+        evidence_id: int,
+        tag_name: str,
+        artifact_type: str,
+        artifact_ids: Iterable[int],
+        tagged_by: str = "manual",
+        *,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Apply a tag to a set of artifacts in one transaction.
+
+        Rows are written with chunked executemany; caches are invalidated
+        once. A cancelled call rolls back and leaves no partial tagging.
+
+        Args:
+            evidence_id: Evidence ID
+            tag_name: Tag name (creates if not exists)
+            artifact_type: Artifact type ('url', 'image', 'file_list', etc.)
+            artifact_ids: Artifact IDs to tag
+            tagged_by: Tagger identifier
+            progress_callback: Optional callback(done, total) per chunk
+            cancel_check: Optional callable returning True to cancel
+
+        Returns:
+            Dict with tag_id, changed (new associations) and cancelled
+        """
+        return self._run_bulk_tag_op(
+            evidence_id,
+            tag_name,
+            tagged_by,
+            lambda conn, tag_id: tag_helpers.insert_tag_associations_bulk(
+                conn,
+                tag_id,
+                evidence_id,
+                artifact_type,
+                artifact_ids,
+                tagged_by,
+                progress_callback=progress_callback,
+                cancel_check=cancel_check,
+            ),
+        )
+
+    def untag_artifacts(
+        self,
+        evidence_id: int,
+        tag_name: str,
+        artifact_type: str,
+        artifact_ids: Iterable[int],
+        *,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Remove a tag from a set of artifacts in one transaction.
+
+        Args:
+            evidence_id: Evidence ID
+            tag_name: Tag name
+            artifact_type: Artifact type
+            artifact_ids: Artifact IDs to untag
+            progress_callback: Optional callback(done, total) per chunk
+            cancel_check: Optional callable returning True to cancel
+
+        Returns:
+            Dict with tag_id, changed (removed associations) and cancelled
+        """
+        return self._run_bulk_tag_op(
+            evidence_id,
+            tag_name,
+            None,
+            lambda conn, tag_id: tag_helpers.delete_tag_associations_bulk(
+                conn,
+                tag_id,
+                artifact_type,
+                artifact_ids,
+                progress_callback=progress_callback,
+                cancel_check=cancel_check,
+            ),
+        )
+
+    def tag_artifacts_where(
+        self,
+        evidence_id: int,
+        tag_name: str,
+        artifact_type: str,
+        table_name: str,
+        where_sql: str,
+        params: Sequence[Any] = (),
+        tagged_by: str = "manual",
+        *,
+        cancel_check: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Tag every artifact matching a filter predicate with INSERT ... SELECT.
+
+        Args:
+            evidence_id: Evidence ID
+            tag_name: Tag name (creates if not exists)
+            artifact_type: Artifact type stored in tag_associations
+            table_name: Artifact table (e.g. 'urls', 'images', 'file_list')
+            where_sql: Predicate over the table aliased as ``a``
+                (e.g. ``"a.domain = ?"``)
+            params: Parameters for where_sql
+            tagged_by: Tagger identifier
+            cancel_check: Optional callable returning True to cancel
+
+        Returns:
+            Dict with tag_id, changed (new associations) and cancelled
+        """
+        return self._run_bulk_tag_op(
+            evidence_id,
+            tag_name,
+            tagged_by,
+            lambda conn, tag_id: tag_helpers.tag_artifacts_where(
+                conn,
+                tag_id,
+                evidence_id,
+                artifact_type,
+                table_name,
+                where_sql,
+                params,
+                tagged_by,
+                cancel_check=cancel_check,
+            ),
+        )
+
+    def untag_artifacts_where(
+        self,
+        evidence_id: int,
+        tag_name: str,
+        artifact_type: str,
+        table_name: str,
+        where_sql: str,
+        params: Sequence[Any] = (),
+        *,
+        cancel_check: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Remove a tag from every artifact matching a filter predicate.
+
+        Returns:
+            Dict with tag_id, changed (removed associations) and cancelled
+        """
+        return self._run_bulk_tag_op(
+            evidence_id,
+            tag_name,
+            None,
+            lambda conn, tag_id: tag_helpers.untag_artifacts_where(
+                conn,
+                tag_id,
+                evidence_id,
+                artifact_type,
+                table_name,
+                where_sql,
+                params,
+                cancel_check=cancel_check,
+            ),
+        )
+
+    def _run_bulk_tag_op(
+        self,
+        evidence_id: int,
+        tag_name: str,
+        create_as: Optional[str],
+        operation: Callable[[sqlite3.Connection, int], int],
+    ) -> Dict[str, Any]:
+        """
+        Resolve the tag and run a bulk operation inside one transaction.
+
+        Args:
+            evidence_id: Evidence ID
+            tag_name: Tag name
+            create_as: created_by value if the tag should be created when
+                missing; None to make the call a no-op for unknown tags
+            operation: Callable(conn, tag_id) -> changed row count
+
+        Returns:
+            Dict with tag_id, changed and cancelled
+        """
+        result: Dict[str, Any] = {"tag_id": None, "changed": 0, "cancelled": False}
+
+        with self._use_evidence_conn(evidence_id):
+            conn = self._connect()
+            try:
+                with conn:
+                    if create_as is not None:
+                        tag_id = tag_helpers.get_or_create_tag(
+                            conn, evidence_id, tag_name, created_by=create_as
+                        )
+                    else:
+                        tag = tag_helpers.get_tag_by_name(conn, evidence_id, tag_name)
+                        if not tag:
+                            return result
+                        tag_id = tag["id"]
+                    result["tag_id"] = tag_id
+                    result["changed"] = operation(conn, tag_id)
+            except tag_helpers.BulkTagCancelled:
+                result["changed"] = 0
+                result["cancelled"] = True
+
+        if result["changed"] or create_as is not None:
+            self._invalidate_tag_cache(evidence_id)
+        return result
+
     # -------------------------------------------------------------------------
     # Tag Queries
     # -------------------------------------------------------------------------
@@ -259,6 +470,32 @@ class TagQueryMixin(BaseDataAccess):
                     conn, evidence_id, artifact_type, artifact_id
                 )
 
+    def get_tags_for_artifacts(
+        self,
+        evidence_id: int,
+        artifact_type: str,
+        artifact_ids: Sequence[int],
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the distinct tags applied to any of the given artifacts.
+
+        Args:
+            evidence_id: Evidence ID
+            artifact_type: Artifact type
+            artifact_ids: Artifact IDs
+
+        Returns:
+            List of tag dicts with keys: id, name, name_normalized
+        """
+        if not artifact_ids:
+            return []
+
+        with self._use_evidence_conn(evidence_id):
+            with self._connect() as conn:
+                return tag_helpers.get_tags_for_artifacts(
+                    conn, evidence_id, artifact_type, artifact_ids
+                )
+
     def get_artifact_tags_str(
         self,
         evidence_id: int,
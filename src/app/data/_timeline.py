@@ -108,9 +108,9 @@ class TimelineQueryMixin(BaseDataAccess):
         params.extend([page_size, offset])
 
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 cursor = conn.execute(sql, params)
-            return [dict(row) for row in cursor.fetchall()]
+                return [dict(row) for row in cursor.fetchall()]
 
     def get_timeline_stats(self, evidence_id: int) -> Dict[str, Any]:
         """Get timeline statistics for an evidence item.
@@ -119,7 +119,7 @@ class TimelineQueryMixin(BaseDataAccess):
             Dict with keys: total_events, earliest, latest, by_kind, by_confidence
         """
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 # Total events
                 total = self._scalar(
                     conn,
@@ -182,7 +182,7 @@ class TimelineQueryMixin(BaseDataAccess):
             ORDER BY kind
         """
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 cursor = conn.execute(sql, (evidence_id,))
                 return [row[0] for row in cursor.fetchall()]
 
@@ -201,7 +201,7 @@ class TimelineQueryMixin(BaseDataAccess):
                 END
         """
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 cursor = conn.execute(sql, (evidence_id,))
                 return [row[0] for row in cursor.fetchall()]
 
@@ -267,7 +267,7 @@ class TimelineQueryMixin(BaseDataAccess):
 
         count = 0
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 cursor = conn.execute(sql, params)
                 with open(output_path, "w", newline="", encoding="utf-8") as f:
                     writer = csv.writer(f)
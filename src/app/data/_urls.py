@@ -1,7 +1,7 @@
 """URL query operations for UI layer.
 
 This module provides URL-specific queries for the UI:
-- Paginated URL listing with LIKE filtering
+- Paginated URL listing with LIKE filtering (FTS5 trigram index when built)
 - Tag-aware queries via tag_associations
 - Match filtering (matched/unmatched/specific list)
 - Domain and source listing with caching
@@ -13,7 +13,9 @@ from __future__ import annotations
 import logging
 import sqlite3
 import time
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core.database.helpers.fts import fts_like_condition
 
 from ._base import BaseDataAccess
 
@@ -38,35 +40,24 @@ class UrlQueryMixin(BaseDataAccess):
     # URL Queries (Evidence DB)
     # -------------------------------------------------------------------------
 
-    def count_urls(
-        self,
+    @staticmethod
+    def _url_filter_where(
+        conn: sqlite3.Connection,
         evidence_id: int,
-        *,
-        domain_like: str = "%",
-        url_like: str = "%",
-        tag_like: str = "%",
-        discovered_by: Optional[Iterable[str]] = None,
-        match_filter: Optional[str] = None,
-    ) -> int:
+        domain_like: str,
+        url_like: str,
+        tag_like: str,
+        discovered_by: Optional[Iterable[str]],
+        match_filter: Optional[str],
+    ) -> Tuple[List[str], List[Any]]:
+        """Build the shared WHERE clauses/params for count_urls() and iter_urls().
+
+        Substring URL filters go through the urls_fts trigram index when it
+        has been built; otherwise (or for very short terms) a plain LIKE is used.
         """
-        Fast count of URLs matching filters (without GROUP_CONCAT).
-
-        Args:
-            evidence_id: Evidence ID
-            domain_like: Domain filter pattern (SQL LIKE)
-            url_like: URL filter pattern (SQL LIKE)
-            tag_like: Tag filter pattern (SQL LIKE)
-            discovered_by: Optional list of source filters
-            match_filter: Match filter ("matched", "unmatched", or specific list name)
-
-        Returns:
-            Total count of matching URLs
-        """
-        logger = logging.getLogger(__name__)
-        start_time = time.time()
-
+        url_condition = fts_like_condition(conn, "urls", "url", url_like, id_expr="u.id")
         params: List[Any] = [evidence_id, domain_like, url_like]
-        where = ["u.evidence_id = ?", "COALESCE(u.domain, '') LIKE ?", "u.url LIKE ?"]
+        where = ["u.evidence_id = ?", "COALESCE(u.domain, '') LIKE ?", url_condition or "u.url LIKE ?"]
 
         if tag_like and tag_like != "%":
             where.append("""
@@ -85,7 +76,7 @@ class UrlQueryMixin(BaseDataAccess):
             where.append(f"u.discovered_by IN ({placeholders})")
             params.extend(discovered_by)
 
-        # Match filter (same logic as iter_urls)
+        # Match filter - use EXISTS for performance (no JOIN needed)
         if match_filter and match_filter != "all":
             if match_filter == "matched":
                 where.append("EXISTS (SELECT 1 FROM url_matches m WHERE m.url_id = u.id AND m.evidence_id = u.evidence_id)")
@@ -96,15 +87,46 @@ class UrlQueryMixin(BaseDataAccess):
                 where.append("EXISTS (SELECT 1 FROM url_matches m WHERE m.url_id = u.id AND m.evidence_id = u.evidence_id AND m.list_name = ?)")
                 params.append(match_filter)
 
-        # Fast COUNT query (no JOIN, no GROUP_CONCAT)
-        sql = f"""
-            SELECT COUNT(*)
-            FROM urls u
-            WHERE {' AND '.join(where)}
+        return where, params
+
+    def count_urls(
+        self,
+        evidence_id: int,
+        *,
+        domain_like: str = "%",
+        url_like: str = "%",
+        tag_like: str = "%",
+        discovered_by: Optional[Iterable[str]] = None,
+        match_filter: Optional[str] = None,
+    ) -> int:
+        """
+        Fast count of URLs matching filters (without GROUP_CONCAT).
+
+        Args:
+            evidence_id: Evidence ID
+            domain_like: Domain filter pattern (SQL LIKE)
+            url_like: URL filter pattern (SQL LIKE)
+            tag_like: Tag filter pattern (SQL LIKE)
+            discovered_by: Optional list of source filters
+            match_filter: Match filter ("matched", "unmatched", or specific list name)
+
+        Returns:
+            Total count of matching URLs
         """
+        logger = logging.getLogger(__name__)
+        start_time = time.time()
 
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
+                where, params = self._url_filter_where(
+                    conn, evidence_id, domain_like, url_like, tag_like, discovered_by, match_filter
+                )
+                # Fast COUNT query (no JOIN, no GROUP_CONCAT)
+                sql = f"""
+                    SELECT COUNT(*)
+                    FROM urls u
+                    WHERE {' AND '.join(where)}
+                """
                 count = conn.execute(sql, params).fetchone()[0]
                 elapsed = time.time() - start_time
                 logger.info(
@@ -147,50 +169,22 @@ class UrlQueryMixin(BaseDataAccess):
         logger = logging.getLogger(__name__)
         start_time = time.time()
 
-        params: List[Any] = [evidence_id, domain_like, url_like]
-        where = ["u.evidence_id = ?", "COALESCE(u.domain, '') LIKE ?", "u.url LIKE ?"]
-
-        if tag_like and tag_like != "%":
-            where.append("""
-                EXISTS (
-                    SELECT 1 FROM tag_associations ta
-                    JOIN tags t ON ta.tag_id = t.id
-                    WHERE ta.artifact_type = 'url'
-                    AND ta.artifact_id = u.id
-                    AND t.name LIKE ?
-                )
-            """)
-            params.append(tag_like)
-
-        if discovered_by:
-            placeholders = ",".join("?" for _ in discovered_by)
-            where.append(f"u.discovered_by IN ({placeholders})")
-            params.extend(discovered_by)
-
-        # Match filter - use EXISTS for performance (no JOIN needed)
-        if match_filter and match_filter != "all":
-            if match_filter == "matched":
-                where.append("EXISTS (SELECT 1 FROM url_matches m WHERE m.url_id = u.id AND m.evidence_id = u.evidence_id)")
-            elif match_filter == "unmatched":
-                where.append("NOT EXISTS (SELECT 1 FROM url_matches m WHERE m.url_id = u.id AND m.evidence_id = u.evidence_id)")
-            else:
-                # Specific list name
-                where.append("EXISTS (SELECT 1 FROM url_matches m WHERE m.url_id = u.id AND m.evidence_id = u.evidence_id AND m.list_name = ?)")
-                params.append(match_filter)
-
-        # Removed GROUP_CONCAT - tags loaded on-demand via get_artifact_tags_str()
-        # This removes the LEFT JOIN overhead for every query (30-50% faster)
-        sql = f"""
-            SELECT u.id, u.url, u.domain, u.scheme, u.discovered_by, u.first_seen_utc,
-                   u.last_seen_utc, u.source_path, u.notes, u.occurrence_count
-            FROM urls u
-            WHERE {' AND '.join(where)}
-            ORDER BY COALESCE(u.first_seen_utc, u.last_seen_utc) DESC
-            LIMIT ? OFFSET ?
-        """
-        params.extend([limit, offset])
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
+                where, params = self._url_filter_where(
+                    conn, evidence_id, domain_like, url_like, tag_like, discovered_by, match_filter
+                )
+                # Removed GROUP_CONCAT - tags loaded on-demand via get_artifact_tags_str()
+                # This removes the LEFT JOIN overhead for every query (30-50% faster)
+                sql = f"""
+                    SELECT u.id, u.url, u.domain, u.scheme, u.discovered_by, u.first_seen_utc,
+                           u.last_seen_utc, u.source_path, u.notes, u.occurrence_count
+                    FROM urls u
+                    WHERE {' AND '.join(where)}
+                    ORDER BY COALESCE(u.first_seen_utc, u.last_seen_utc) DESC
+                    LIMIT ? OFFSET ?
+                """
+                params.extend([limit, offset])
                 cursor = conn.execute(sql, params)
                 results = [dict(row) for row in cursor.fetchall()]
                 elapsed = time.time() - start_time
@@ -253,7 +247,7 @@ class UrlQueryMixin(BaseDataAccess):
             ORDER BY COALESCE(u.first_seen_utc, u.last_seen_utc) DESC
         """
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 cursor = conn.execute(sql, (evidence_id, tag.lower()))
                 return [dict(row) for row in cursor.fetchall()]
 
@@ -274,7 +268,7 @@ class UrlQueryMixin(BaseDataAccess):
             WHERE evidence_id = ? AND url_id = ?
         """
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 result = conn.execute(sql, (evidence_id, url_id)).fetchone()
                 # SQLite's GROUP_CONCAT with DISTINCT uses ',' as default separator
                 return result[0] if result and result[0] else ""
@@ -326,7 +320,7 @@ class UrlQueryMixin(BaseDataAccess):
             params = (evidence_id,)
 
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 cursor = conn.execute(sql, params)
                 result = [row[0] for row in cursor.fetchall()]
 
@@ -359,7 +353,7 @@ class UrlQueryMixin(BaseDataAccess):
             ORDER BY discovered_by
         """
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 cursor = conn.execute(sql, (evidence_id,))
                 result = [row[0] for row in cursor.fetchall()]
 
@@ -395,7 +389,7 @@ class UrlQueryMixin(BaseDataAccess):
             ORDER BY list_name
         """
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 # Check if table exists first (migration might not have run if very old DB)
                 # But we assume schema is up to date.
                 try:
@@ -428,7 +422,7 @@ class UrlQueryMixin(BaseDataAccess):
             Dict with 'items' (list of {domain, count}), 'total_count', 'truncated'
         """
         with self._use_evidence_conn(evidence_id):
-            with self._connect() as conn:
+            with self._connect_read() as conn:
                 # Get total count of unique domains
                 total_count = conn.execute(
                     "SELECT COUNT(DISTINCT domain) FROM urls WHERE evidence_id = ?",
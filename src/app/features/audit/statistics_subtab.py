@@ -6,6 +6,7 @@ This subtab is displayed within the Audit tab (per-evidence).
 Initial implementation as standalone tab.
 Moved to subtab within Audit tab.
 Relocated from app.features.statistics to app.features.audit.
+Added query performance card (read pool instrumentation).
 """
 
 from __future__ import annotations
@@ -20,10 +21,15 @@ from PySide6.QtWidgets import (
     QFrame,
     QScrollArea,
     QGridLayout,
+    QTableWidget,
+    QTableWidgetItem,
+    QHeaderView,
+    QPushButton,
 )
 from PySide6.QtCore import Qt, Slot
 from PySide6.QtGui import QFont
 
+from core.database.query_stats import QueryStats, get_query_instrumentation
 from core.statistics_collector import StatisticsCollector, ExtractorRunStats
 from core.logging import get_logger
 
@@ -208,6 +214,99 @@ class AggregatedTotalsCard(QFrame):
         self._content.setText("<br>".join(lines))
 
 
+class QueryPerformanceCard(QFrame):
+    """Card listing the slowest UI/report queries recorded by the read pool."""
+
+    MAX_ROWS = 15
+    COLUMNS = ["Statement", "Calls", "Mean", "p95", "Max", "Slow", "Full scans"]
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setFrameShape(QFrame.StyledPanel)
+        self.setStyleSheet("""
+            QueryPerformanceCard {
+                background-color: #ffffff;
+                border: 1px solid #e0e0e0;
+                border-radius: 8px;
+                padding: 12px;
+            }
+        """)
+
+        layout = QVBoxLayout(self)
+
+        header = QHBoxLayout()
+        title = QLabel("⚡ Query Performance")
+        title.setFont(QFont("", 12, QFont.Bold))
+        header.addWidget(title)
+        header.addStretch()
+        self._reset_button = QPushButton("Reset")
+        self._reset_button.setToolTip("Clear recorded query statistics")
+        self._reset_button.clicked.connect(self._on_reset)
+        header.addWidget(self._reset_button)
+        layout.addLayout(header)
+
+        self._summary_label = QLabel()
+        self._summary_label.setStyleSheet("color: #666;")
+        layout.addWidget(self._summary_label)
+
+        self._table = QTableWidget(0, len(self.COLUMNS))
+        self._table.setHorizontalHeaderLabels(self.COLUMNS)
+        self._table.verticalHeader().setVisible(False)
+        self._table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self._table.setSelectionBehavior(QTableWidget.SelectRows)
+        self._table.setMaximumHeight(260)
+        table_header = self._table.horizontalHeader()
+        table_header.setSectionResizeMode(0, QHeaderView.Stretch)
+        for column in range(1, len(self.COLUMNS)):
+            table_header.setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        layout.addWidget(self._table)
+
+    def set_stats(self, stats_list: List[QueryStats]) -> None:
+        """Update with statement stats (slowest total time first)."""
+        total_calls = sum(s.calls for s in stats_list)
+        scan_count = sum(1 for s in stats_list if s.full_scans)
+        if stats_list:
+            self._summary_label.setText(
+                f"{len(stats_list):,} statements, {total_calls:,} executions, "
+                f"{scan_count:,} with full table scans"
+            )
+        else:
+            self._summary_label.setText("No queries recorded yet.")
+
+        rows = stats_list[: self.MAX_ROWS]
+        self._table.setRowCount(len(rows))
+        for row, stats in enumerate(rows):
+            statement = QTableWidgetItem(stats.sql[:200])
+            tooltip = stats.sql
+            if stats.plan:
+                tooltip += "\n\nQuery plan:\n" + "\n".join(stats.plan)
+            statement.setToolTip(tooltip)
+            values = [
+                statement,
+                QTableWidgetItem(f"{stats.calls:,}"),
+                QTableWidgetItem(_format_ms(stats.mean_seconds)),
+                QTableWidgetItem(_format_ms(stats.percentile_seconds(0.95))),
+                QTableWidgetItem(_format_ms(stats.max_seconds)),
+                QTableWidgetItem(f"{stats.slow_calls:,}"),
+                QTableWidgetItem(", ".join(stats.full_scans)),
+            ]
+            for column, item in enumerate(values):
+                if 0 < column < 6:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self._table.setItem(row, column, item)
+            if stats.full_scans:
+                values[6].setForeground(Qt.darkRed)
+
+    @Slot()
+    def _on_reset(self) -> None:
+        get_query_instrumentation().reset()
+        self.set_stats([])
+
+
+def _format_ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f} ms"
+
+
 class StatisticsSubtab(QWidget):
     """
     Statistics subtab with summary cards (per-evidence).
@@ -242,6 +341,10 @@ class StatisticsSubtab(QWidget):
         self._totals_card = AggregatedTotalsCard()
         layout.addWidget(self._totals_card)
 
+        # Query latency for UI/report reads (process-wide)
+        self._query_card = QueryPerformanceCard()
+        layout.addWidget(self._query_card)
+
         # Scroll area for extractor cards
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -280,6 +383,7 @@ class StatisticsSubtab(QWidget):
         """Refresh statistics display."""
         # Ensure signals are connected (collector may be installed after init)
         self._connect_signals()
+        self._query_card.set_stats(get_query_instrumentation().snapshot())
 
         collector = StatisticsCollector.get_instance()
         if not collector:
@@ -354,6 +458,9 @@ class StatisticsSubtab(QWidget):
         if self._data_stale:
             self._data_stale = False
             self.refresh()
+        else:
+            # Query stats have no signal; refresh them on every show
+            self._query_card.set_stats(get_query_instrumentation().snapshot())
 
 
 # Backward compatibility alias
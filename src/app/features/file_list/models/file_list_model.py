@@ -4,14 +4,16 @@ Qt models for file list data.
 from __future__ import annotations
 
 import logging
+import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PySide6.QtGui import QIcon
 
 from core.database import DatabaseManager
+from core.database.helpers.fts import fts_like_any_condition
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +24,9 @@ class FileListModel(QAbstractTableModel):
     # Pagination settings (Phase 1 performance optimization)
     PAGE_SIZE = 10000  # Load 10k rows at a time to prevent memory exhaustion
 
+    # Max file IDs per IN (...) lookup when prefetching tags/matches for a page
+    ANNOTATION_CHUNK_SIZE = 900
+
     # Column definitions
     COLUMNS = [
         "checkbox",
@@ -70,7 +75,7 @@ class FileListModel(QAbstractTableModel):
         self._loaded_rows: int = 0  # Number of rows currently loaded
         self.selected_rows: Set[int] = set()  # Set of row indices
 
-        # Caches for on-demand loading (Phase 1 optimization)
+        # Per-page prefetched tags/matches (filled by _prefetch_annotations)
         self._matches_cache: Dict[int, str] = {}  # file_id -> matches string
         self._tags_cache: Dict[int, str] = {}  # file_id -> tags string
 
@@ -199,9 +204,9 @@ class FileListModel(QAbstractTableModel):
                     params.append(self._filters["tags"])
 
             if self._filters["search"]:
-                filter_clauses.append("(fl.file_name LIKE ? OR fl.file_path LIKE ?)")
-                search_term = f"%{self._filters['search']}%"
-                params.extend([search_term, search_term])
+                clause, search_params = self.search_condition(evidence_conn, self._filters["search"])
+                filter_clauses.append(clause)
+                params.extend(search_params)
 
             # Build filter clause
             filter_clause = ""
@@ -244,6 +249,7 @@ class FileListModel(QAbstractTableModel):
             cursor = evidence_conn.execute(data_query, params)
 
             rows_loaded = 0
+            page_ids: List[int] = []
             for row in cursor.fetchall():
                 self._rows.append({
                     "id": row[0],
@@ -253,11 +259,13 @@ class FileListModel(QAbstractTableModel):
                     "size_bytes": row[4] or 0,
                     "modified_ts": row[5] or "",
                     "deleted": bool(row[6]),
-                    # matches and tags loaded on-demand via _get_matches()/_get_tags()
+                    # matches and tags prefetched per page into the caches
                 })
+                page_ids.append(row[0])
                 rows_loaded += 1
 
             self._loaded_rows += rows_loaded
+            self._prefetch_annotations(page_ids)
 
             page_time = time.time() - page_start
             total_time = time.time() - start_time
@@ -283,9 +291,103 @@ class FileListModel(QAbstractTableModel):
             self._total_rows = 0
             self._loaded_rows = 0
 
+    @staticmethod
+    def search_condition(conn: sqlite3.Connection, search: str) -> tuple[str, List[str]]:
+        """Build the name/path substring search clause for a file list query.
+
+        Uses the file_list_fts trigram index when it has been built, otherwise
+        a leading-wildcard LIKE on file_name/file_path.
+        """
+        search_term = f"%{search}%"
+        clause = fts_like_any_condition(
+            conn, "file_list", ("file_name", "file_path"), search_term, id_expr="fl.id"
+        )
+        return clause or "(fl.file_name LIKE ? OR fl.file_path LIKE ?)", [search_term, search_term]
+
+    def _prefetch_annotations(self, file_ids: Iterable[int]) -> None:
+        """
+        Load tags and matches for a page of rows in bulk.
+
+        Reads the pre-aggregated file_list_annotations side table with one
+        ``file_list_id IN (...)`` query per chunk. Databases without the side
+        table fall back to two grouped GROUP_CONCAT queries per chunk. IDs
+        without annotations are cached as empty strings so painting a row
+        never triggers a per-row query.
+
+        Args:
+            file_ids: File list IDs of the rows just loaded
+        """
+        ids = [fid for fid in file_ids if fid is not None and fid not in self._tags_cache]
+        if not ids:
+            return
+
+        matches: Dict[int, str] = {}
+        tags: Dict[int, str] = {}
+        try:
+            evidence_conn = self.db_manager.get_evidence_conn(
+                self.evidence_id, label=self._get_evidence_label()
+            )
+            for start in range(0, len(ids), self.ANNOTATION_CHUNK_SIZE):
+                chunk = ids[start:start + self.ANNOTATION_CHUNK_SIZE]
+                placeholders = ",".join("?" for _ in chunk)
+                try:
+                    rows = evidence_conn.execute(
+                        f"""
+                        SELECT file_list_id, matches, tags
+                        FROM file_list_annotations
+                        WHERE file_list_id IN ({placeholders})
+                        """,
+                        chunk,
+                    ).fetchall()
+                    for file_id, match_str, tag_str in rows:
+                        matches[file_id] = match_str or ""
+                        tags[file_id] = tag_str or ""
+                except sqlite3.OperationalError:
+                    # Side table missing: aggregate on the fly for this chunk
+                    self._query_annotations_grouped(
+                        evidence_conn, chunk, placeholders, matches, tags
+                    )
+        except Exception as e:
+            logger.error(f"Failed to prefetch tags/matches for {len(ids)} files: {e}")
+
+        for file_id in ids:
+            self._matches_cache[file_id] = matches.get(file_id, "")
+            self._tags_cache[file_id] = tags.get(file_id, "")
+
+    @staticmethod
+    def _query_annotations_grouped(
+        evidence_conn: sqlite3.Connection,
+        chunk: List[int],
+        placeholders: str,
+        matches: Dict[int, str],
+        tags: Dict[int, str],
+    ) -> None:
+        """Fill ``matches``/``tags`` for ``chunk`` with grouped GROUP_CONCAT queries."""
+        for file_id, match_str in evidence_conn.execute(
+            f"""
+            SELECT file_list_id, GROUP_CONCAT(reference_list_name)
+            FROM file_list_matches
+            WHERE file_list_id IN ({placeholders})
+            GROUP BY file_list_id
+            """,
+            chunk,
+        ):
+            matches[file_id] = match_str or ""
+        for file_id, tag_str in evidence_conn.execute(
+            f"""
+            SELECT ta.artifact_id, GROUP_CONCAT(t.name, ', ')
+            FROM tag_associations ta
+            JOIN tags t ON ta.tag_id = t.id
+            WHERE ta.artifact_type = 'file_list' AND ta.artifact_id IN ({placeholders})
+            GROUP BY ta.artifact_id
+            """,
+            chunk,
+        ):
+            tags[file_id] = tag_str or ""
+
     def _get_matches(self, file_id: int) -> str:
         """
-        Load matches for a file on-demand (Phase 1 optimization).
+        Return matched reference lists for a file from the page prefetch.
 
         Args:
             file_id: File list ID
@@ -294,24 +396,12 @@ class FileListModel(QAbstractTableModel):
             Comma-separated list of matched reference lists
         """
         if file_id not in self._matches_cache:
-            try:
-                evidence_conn = self.db_manager.get_evidence_conn(
-                    self.evidence_id, label=self._get_evidence_label()
-                )
-                result = evidence_conn.execute(
-                    "SELECT GROUP_CONCAT(reference_list_name) FROM file_list_matches WHERE file_list_id = ?",
-                    (file_id,)
-                ).fetchone()
-                self._matches_cache[file_id] = result[0] if result and result[0] else ""
-            except Exception as e:
-                logger.error(f"Failed to load matches for file {file_id}: {e}")
-                self._matches_cache[file_id] = ""
-
-        return self._matches_cache[file_id]
+            self._prefetch_annotations([file_id])
+        return self._matches_cache.get(file_id, "")
 
     def _get_tags(self, file_id: int) -> str:
         """
-        Load tags for a file on-demand (Phase 1 optimization).
+        Return tags for a file from the page prefetch.
 
         Args:
             file_id: File list ID
@@ -320,25 +410,8 @@ class FileListModel(QAbstractTableModel):
             Comma-separated list of tags
         """
         if file_id not in self._tags_cache:
-            try:
-                evidence_conn = self.db_manager.get_evidence_conn(
-                    self.evidence_id, label=self._get_evidence_label()
-                )
-                result = evidence_conn.execute(
-                    """
-                    SELECT GROUP_CONCAT(t.name, ', ')
-                    FROM tag_associations ta
-                    JOIN tags t ON ta.tag_id = t.id
-                    WHERE ta.artifact_type = 'file_list' AND ta.artifact_id = ?
-                    """,
-                    (file_id,)
-                ).fetchone()
-                self._tags_cache[file_id] = result[0] if result and result[0] else ""
-            except Exception as e:
-                logger.error(f"Failed to load tags for file {file_id}: {e}")
-                self._tags_cache[file_id] = ""
-
-        return self._tags_cache[file_id]
+            self._prefetch_annotations([file_id])
+        return self._tags_cache.get(file_id, "")
 
     def apply_filters(self, filters: Dict[str, Any]) -> None:
         """
@@ -379,6 +452,7 @@ class FileListModel(QAbstractTableModel):
         self._total_rows = total_rows
         self._matches_cache.clear()
         self._tags_cache.clear()
+        self._prefetch_annotations(row.get("id") for row in rows)
         self.endResetModel()
 
     def get_selected_ids(self) -> List[int]:
@@ -488,7 +562,7 @@ class FileListModel(QAbstractTableModel):
         return None
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
-        """Return data for given index and role (Phase 1: lazy-load matches/tags)."""
+        """Return data for given index and role (matches/tags come from the page prefetch)."""
         if not index.isValid() or not (0 <= index.row() < len(self._rows)):
             return None
 
@@ -515,7 +589,7 @@ class FileListModel(QAbstractTableModel):
                         return timestamp
                 return ""
             elif column == "matches":
-                # Phase 1: Load matches on-demand
+                # Matches from the page prefetch
                 file_id = row_data.get("id")
                 matches = self._get_matches(file_id)
                 if matches:
@@ -526,7 +600,7 @@ class FileListModel(QAbstractTableModel):
                     return matches
                 return ""
             elif column == "tags":
-                # Phase 1: Load tags on-demand
+                # Tags from the page prefetch
                 file_id = row_data.get("id")
                 tags = self._get_tags(file_id)
                 if tags:
@@ -542,13 +616,13 @@ class FileListModel(QAbstractTableModel):
             if column == "file_path":
                 return row_data.get("file_path", "")
             elif column == "matches":
-                # Phase 1: Load matches on-demand for tooltip
+                # Matches from the page prefetch (tooltip)
                 file_id = row_data.get("id")
                 matches = self._get_matches(file_id)
                 if matches:
                     return f"Matched lists: {matches}"
             elif column == "tags":
-                # Phase 1: Load tags on-demand for tooltip
+                # Tags from the page prefetch (tooltip)
                 file_id = row_data.get("id")
                 tags = self._get_tags(file_id)
                 if tags:
@@ -151,9 +151,9 @@ class ModelRefreshWorker(QThread):
 
             search = self.filters.get("search", "")
             if search:
-                filter_clauses.append("(fl.file_name LIKE ? OR fl.file_path LIKE ?)")
-                search_term = f"%{search}%"
-                params.extend([search_term, search_term])
+                clause, search_params = FileListModel.search_condition(evidence_conn, search)
+                filter_clauses.append(clause)
+                params.extend(search_params)
 
             filter_clause = ""
             if filter_clauses:
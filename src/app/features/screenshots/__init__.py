@@ -12,6 +12,8 @@ from .storage import (
     save_screenshot,
     import_screenshot,
     get_screenshots_dir,
+    resolve_screenshot_path,
+    release_screenshot,
 )
 
 __all__ = [
@@ -21,4 +23,6 @@ __all__ = [
     "save_screenshot",
     "import_screenshot",
     "get_screenshots_dir",
+    "resolve_screenshot_path",
+    "release_screenshot",
 ]
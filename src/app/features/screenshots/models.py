@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Optional
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSize
 from PySide6.QtGui import QIcon, QPixmap
 
-from core.database.manager import slugify_label
+from core.screenshot_store import STORE_DIRNAME, ScreenshotStore, resolve_screenshot_path
 
 logger = logging.getLogger(__name__)
 
@@ -145,8 +145,16 @@ class ScreenshotsTableModel(QAbstractTableModel):
             return self._thumbnail_cache[dest_path]
 
         try:
-            slug = slugify_label(self._evidence_label, self._evidence_id)
-            image_path = self._case_folder / "evidences" / slug / dest_path
+            # Store screenshots have a pre-built thumbnail next to the blob
+            image_path = None
+            if record.get("sha256") and dest_path.startswith(f"{STORE_DIRNAME}/"):
+                thumb_path = ScreenshotStore(self._case_folder).thumbnail_path(record["sha256"])
+                if thumb_path.exists():
+                    image_path = thumb_path
+            if image_path is None:
+                image_path = resolve_screenshot_path(
+                    self._case_folder, self._evidence_label, self._evidence_id, dest_path,
+                )
 
             if not image_path.exists():
                 logger.debug("Screenshot file not found: %s", image_path)
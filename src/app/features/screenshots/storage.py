@@ -1,22 +1,35 @@
 """
 Screenshot storage utilities.
 
-Provides functions for saving and importing screenshots to the evidence workspace.
+Provides functions for saving and importing screenshots to the case
+screenshot store (core.screenshot_store). Files are content-addressed by
+SHA-256 and shared between identical screenshots of all evidences in a case.
+
+Hashing, file writes and thumbnail generation happen here; callers on the
+GUI thread run these functions through ScreenshotSaveTask /
+ScreenshotImportTask (app.services.workers). save_screenshot accepts a
+QImage, which unlike QPixmap may be used outside the GUI thread.
 
 Initial implementation for investigator screenshot documentation.
 """
 from __future__ import annotations
 
-import hashlib
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Union
 
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+from PySide6.QtGui import QImage, QImageReader, QPixmap
 
 from core.database.manager import slugify_label
+from core.screenshot_store import (
+    STORE_DIRNAME,
+    ScreenshotStore,
+    StoredBlob,
+    resolve_screenshot_path,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +38,8 @@ __all__ = [
     "save_screenshot",
     "import_screenshot",
     "get_screenshots_dir",
+    "resolve_screenshot_path",
+    "release_screenshot",
 ]
 
 
@@ -32,13 +47,14 @@ __all__ = [
 class ScreenshotMetadata:
     """Metadata for a saved screenshot."""
 
-    dest_path: str      # Relative path from evidence folder
-    filename: str       # Just the filename
+    dest_path: str      # Store path relative to the case folder (legacy: evidence folder)
+    filename: str       # Display filename
     width: int
     height: int
     size_bytes: int
     md5: str
     sha256: str
+    deduplicated: bool = False  # Identical content was already stored
 
 
 def get_screenshots_dir(workspace_path: Path, evidence_label: str, evidence_id: int) -> Path:
@@ -59,79 +75,70 @@ def get_screenshots_dir(workspace_path: Path, evidence_label: str, evidence_id:
     return screenshots_dir
 
 
-def _compute_hashes(data: bytes) -> tuple[str, str]:
-    """Compute MD5 and SHA-256 hashes of data."""
-    md5 = hashlib.md5(data).hexdigest()
-    sha256 = hashlib.sha256(data).hexdigest()
-    return md5, sha256
+def _timestamped_name(prefix: str, suffix: str) -> str:
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+    return f"{prefix}_{timestamp}{suffix}"
+
+
+def _metadata(blob: StoredBlob, filename: str, width: int, height: int) -> ScreenshotMetadata:
+    return ScreenshotMetadata(
+        dest_path=blob.rel_path,
+        filename=filename,
+        width=blob.width if blob.width is not None else width,
+        height=blob.height if blob.height is not None else height,
+        size_bytes=blob.size_bytes,
+        md5=blob.md5,
+        sha256=blob.sha256,
+        deduplicated=not blob.created,
+    )
 
 
 def save_screenshot(
-    pixmap: QPixmap,
+    image: Union[QImage, QPixmap],
     workspace_path: Path,
     evidence_label: str,
     evidence_id: int,
     prefix: str = "screenshot",
 ) -> ScreenshotMetadata:
     """
-    Save a QPixmap screenshot to the evidence workspace.
+    Save a screenshot image to the case screenshot store.
 
-    The file is saved as PNG with a timestamp-based filename to ensure uniqueness.
+    The image is encoded as PNG in memory, hashed once and written only if
+    the store does not already hold identical content.
 
     Args:
-        pixmap: QPixmap to save
+        image: QImage to save (a QPixmap is converted; only on the GUI thread)
         workspace_path: Path to case workspace
         evidence_label: Evidence label
         evidence_id: Evidence ID
-        prefix: Filename prefix (default: "screenshot")
+        prefix: Display filename prefix (default: "screenshot")
 
     Returns:
         ScreenshotMetadata with file info and hashes
 
     Raises:
-        ValueError: If pixmap is null or save fails
+        ValueError: If image is null or encoding fails
     """
-    if pixmap.isNull():
-        raise ValueError("Cannot save null pixmap")
+    if isinstance(image, QPixmap):
+        image = image.toImage()
+    if image.isNull():
+        raise ValueError("Cannot save null image")
 
-    screenshots_dir = get_screenshots_dir(workspace_path, evidence_label, evidence_id)
-    slug = slugify_label(evidence_label, evidence_id)
-
-    # Generate unique filename with timestamp
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
-    filename = f"{prefix}_{timestamp}.png"
-    full_path = screenshots_dir / filename
-
-    # Handle unlikely collision
-    counter = 1
-    while full_path.exists():
-        filename = f"{prefix}_{timestamp}_{counter}.png"
-        full_path = screenshots_dir / filename
-        counter += 1
+    buffer = QByteArray()
+    device = QBuffer(buffer)
+    device.open(QIODevice.OpenModeFlag.WriteOnly)
+    if not image.save(device, "PNG"):
+        raise ValueError("Failed to encode screenshot as PNG")
+    device.close()
 
-    # Save the pixmap
-    if not pixmap.save(str(full_path), "PNG"):
-        raise ValueError(f"Failed to save screenshot to {full_path}")
+    blob = ScreenshotStore(workspace_path).put_bytes(bytes(buffer.data()), ".png", evidence_id)
+    filename = _timestamped_name(prefix, ".png")
 
-    # Read back for hashing
-    data = full_path.read_bytes()
-    md5, sha256 = _compute_hashes(data)
+    logger.info("Saved screenshot: %s as %s (%d bytes, %dx%d%s)",
+                filename, blob.rel_path, blob.size_bytes, image.width(), image.height(),
+                ", deduplicated" if not blob.created else "")
 
-    # Build relative path from evidence folder
-    rel_path = f"screenshots/{filename}"
-
-    logger.info("Saved screenshot: %s (%d bytes, %dx%d)",
-                full_path, len(data), pixmap.width(), pixmap.height())
-
-    return ScreenshotMetadata(
-        dest_path=rel_path,
-        filename=filename,
-        width=pixmap.width(),
-        height=pixmap.height(),
-        size_bytes=len(data),
-        md5=md5,
-        sha256=sha256,
-    )
+    return _metadata(blob, filename, image.width(), image.height())
 
 
 def import_screenshot(
@@ -143,8 +150,8 @@ def import_screenshot(
     """
     Import an external image file as a screenshot.
 
-    The file is copied to the evidence screenshots directory.
-    Supports common image formats (PNG, JPEG, GIF, WebP, BMP).
+    The original bytes are copied to the case screenshot store (hashed in
+    the same pass). Supports common image formats (PNG, JPEG, GIF, WebP, BMP).
 
     Args:
         source_path: Path to image file to import
@@ -162,47 +169,39 @@ def import_screenshot(
     if not source_path.exists():
         raise FileNotFoundError(f"Source file not found: {source_path}")
 
-    # Load image to validate and get dimensions
-    pixmap = QPixmap(str(source_path))
-    if pixmap.isNull():
+    # Validate from the header and get dimensions without decoding pixels
+    reader = QImageReader(str(source_path))
+    size = reader.size()
+    if not reader.canRead() or not size.isValid():
         raise ValueError(f"Could not load image: {source_path}")
 
-    screenshots_dir = get_screenshots_dir(workspace_path, evidence_label, evidence_id)
-    slug = slugify_label(evidence_label, evidence_id)
-
-    # Generate unique filename with timestamp, preserving extension
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+    blob = ScreenshotStore(workspace_path).put_file(source_path, evidence_id)
     suffix = source_path.suffix.lower() or ".png"
-    filename = f"import_{timestamp}{suffix}"
-    full_path = screenshots_dir / filename
-
-    # Handle unlikely collision
-    counter = 1
-    while full_path.exists():
-        filename = f"import_{timestamp}_{counter}{suffix}"
-        full_path = screenshots_dir / filename
-        counter += 1
+    filename = _timestamped_name("import", suffix)
 
-    # Copy the file
-    import shutil
-    shutil.copy2(source_path, full_path)
+    logger.info("Imported screenshot: %s -> %s (%d bytes, %dx%d%s)",
+                source_path, blob.rel_path, blob.size_bytes, size.width(), size.height(),
+                ", deduplicated" if not blob.created else "")
 
-    # Read for hashing
-    data = full_path.read_bytes()
-    md5, sha256 = _compute_hashes(data)
+    return _metadata(blob, filename, size.width(), size.height())
 
-    # Build relative path from evidence folder
-    rel_path = f"screenshots/{filename}"
 
-    logger.info("Imported screenshot: %s -> %s (%d bytes, %dx%d)",
-                source_path, full_path, len(data), pixmap.width(), pixmap.height())
+def release_screenshot(
+    screenshot: dict,
+    workspace_path: Path,
+    evidence_label: str,
+    evidence_id: int,
+) -> None:
+    """
+    Release the file of a deleted screenshot row.
 
-    return ScreenshotMetadata(
-        dest_path=rel_path,
-        filename=filename,
-        width=pixmap.width(),
-        height=pixmap.height(),
-        size_bytes=len(data),
-        md5=md5,
-        sha256=sha256,
-    )
+    Store files are removed once no screenshot of any evidence uses them;
+    files written before the store existed are deleted directly.
+    """
+    dest_path = screenshot["dest_path"]
+    if dest_path.startswith(f"{STORE_DIRNAME}/"):
+        ScreenshotStore(workspace_path).release(screenshot["sha256"], evidence_id)
+        return
+    file_path = resolve_screenshot_path(workspace_path, evidence_label, evidence_id, dest_path)
+    if file_path.exists():
+        file_path.unlink()
@@ -36,11 +36,18 @@ from core.database.helpers import (
     get_sequences,
     insert_screenshot,
 )
-from core.database.manager import slugify_label, DatabaseManager
-from app.features.screenshots.storage import import_screenshot
+from core.database.manager import DatabaseManager
+from app.features.screenshots.storage import (
+    ScreenshotMetadata,
+    release_screenshot,
+    resolve_screenshot_path,
+)
 
 logger = logging.getLogger(__name__)
 
+# File types picked up by folder import
+IMPORT_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp"})
+
 
 class ScreenshotsTab(QWidget):
     """
@@ -64,6 +71,7 @@ class ScreenshotsTab(QWidget):
         self._db_manager = db_manager
         self.evidence_id: Optional[int] = None
         self.evidence_label: Optional[str] = None
+        self._import_task = None  # Running ScreenshotImportTask
 
         self._init_ui()
 
@@ -86,6 +94,14 @@ class ScreenshotsTab(QWidget):
         self.upload_btn.clicked.connect(self._upload_screenshot)
         header_layout.addWidget(self.upload_btn)
 
+        # Bulk import button
+        self.import_folder_btn = QPushButton("📁 Import Folder")
+        self.import_folder_btn.setToolTip(
+            "Import all images of a folder (titles from file names; identical files are stored once)"
+        )
+        self.import_folder_btn.clicked.connect(self._import_folder)
+        header_layout.addWidget(self.import_folder_btn)
+
         # Delete button
         self.delete_btn = QPushButton("🗑️ Delete Selected")
         self.delete_btn.setToolTip("Delete selected screenshots")
@@ -310,8 +326,9 @@ class ScreenshotsTab(QWidget):
             return
 
         # Load the image from disk
-        slug = slugify_label(self.evidence_label, self.evidence_id)
-        image_path = self.case_folder / "evidences" / slug / screenshot["dest_path"]
+        image_path = resolve_screenshot_path(
+            self.case_folder, self.evidence_label, self.evidence_id, screenshot["dest_path"]
+        )
 
         if not image_path.exists():
             QMessageBox.warning(
@@ -406,7 +423,7 @@ class ScreenshotsTab(QWidget):
             # Since the file isn't saved yet, we show dialog first
             dialog = UploadScreenshotDialog(
                 pixmap,
-                path.name,
+                path,
                 forensic_context,
                 parent=self,
             )
@@ -418,6 +435,74 @@ class ScreenshotsTab(QWidget):
             self.status_label.setText(f"Uploaded {uploaded} screenshot(s)")
             self._refresh()
 
+    def _import_folder(self) -> None:
+        """Import all images of a folder in a background task."""
+        if not self._db_manager or not self.case_folder or not self.evidence_id:
+            QMessageBox.warning(
+                self,
+                "No Evidence Selected",
+                "Please select an evidence before importing screenshots."
+            )
+            return
+        if self._import_task is not None:
+            return
+
+        folder = QFileDialog.getExistingDirectory(
+            self,
+            "Select Folder of Screenshots",
+            str(Path.home()),
+        )
+        if not folder:
+            return
+
+        files = tuple(sorted(
+            path for path in Path(folder).iterdir()
+            if path.is_file() and path.suffix.lower() in IMPORT_EXTENSIONS
+        ))
+        if not files:
+            QMessageBox.information(self, "No Images", f"No images found in:\n{folder}")
+            return
+
+        from app.services.workers import ScreenshotImportConfig, ScreenshotImportTask, start_task
+
+        task = ScreenshotImportTask(ScreenshotImportConfig(
+            case_root=self.case_folder,
+            evidence_id=self.evidence_id,
+            evidence_label=self.evidence_label,
+            files=files,
+            db_manager=self._db_manager,
+            sequence_name=Path(folder).name,
+        ))
+        task.signals.progress.connect(lambda _pct, msg: self.status_label.setText(msg))
+        task.signals.result.connect(self._on_import_finished)
+        task.signals.error.connect(self._on_import_error)
+        task.signals.finished.connect(self._on_import_done)
+        self._import_task = task
+        self.import_folder_btn.setEnabled(False)
+        start_task(task)
+
+    def _on_import_finished(self, result: Dict[str, Any]) -> None:
+        message = f"Imported {result['imported']} of {result['total']} screenshot(s)"
+        if result["deduplicated"]:
+            message += f", {result['deduplicated']} identical to already stored files"
+        self.status_label.setText(message)
+        if result["failed"]:
+            QMessageBox.warning(
+                self,
+                "Partial Import",
+                f"{message}.\n\nFailed to import {len(result['failed'])} file(s):\n" +
+                "\n".join(f"{path.name}: {error}" for path, error in result["failed"][:5])
+            )
+
+    def _on_import_error(self, error: str, traceback_str: str) -> None:
+        logger.error("Screenshot import failed: %s", error)
+        QMessageBox.critical(self, "Import Error", f"Failed to import screenshots:\n{error}")
+
+    def _on_import_done(self) -> None:
+        self._import_task = None
+        self.import_folder_btn.setEnabled(True)
+        self._refresh()
+
     def _delete_selected(self) -> None:
         """Delete selected screenshots."""
         if not self.case_data or not self.evidence_id:
@@ -449,15 +534,13 @@ class ScreenshotsTab(QWidget):
 
         for screenshot in checked:
             try:
-                # Delete file
-                if self.case_folder and self.evidence_label:
-                    slug = slugify_label(self.evidence_label, self.evidence_id)
-                    file_path = self.case_folder / "evidences" / slug / screenshot["dest_path"]
-                    if file_path.exists():
-                        file_path.unlink()
-
-                # Delete database record
+                # Delete database record, then the file (store files are
+                # kept while other screenshots still use them)
                 delete_screenshot(conn, self.evidence_id, screenshot["id"])
+                if self.case_folder and self.evidence_label:
+                    release_screenshot(
+                        screenshot, self.case_folder, self.evidence_label, self.evidence_id
+                    )
                 deleted += 1
 
             except Exception as e:
@@ -495,7 +578,7 @@ class UploadScreenshotDialog(QWidget):
     def __init__(
         self,
         pixmap: QPixmap,
-        original_filename: str,
+        source_path: Path,
         forensic_context,
         parent: Optional[QWidget] = None,
     ):
@@ -506,7 +589,9 @@ class UploadScreenshotDialog(QWidget):
         self._dialog.setMinimumWidth(600)
 
         self.pixmap = pixmap
-        self.original_filename = original_filename
+        self.source_path = source_path
+        self.original_filename = source_path.name
+        self._save_task = None  # Keeps the running ScreenshotSaveTask alive
         self.forensic_context = forensic_context
         self._result = 0
 
@@ -583,7 +668,7 @@ class UploadScreenshotDialog(QWidget):
 
         # Buttons
         button_box = QDialogButtonBox()
-        save_btn = button_box.addButton("📤 Upload", QDialogButtonBox.ButtonRole.AcceptRole)
+        self.save_btn = button_box.addButton("📤 Upload", QDialogButtonBox.ButtonRole.AcceptRole)
         button_box.addButton(QDialogButtonBox.StandardButton.Cancel)
 
         button_box.accepted.connect(self._on_save)
@@ -624,19 +709,32 @@ class UploadScreenshotDialog(QWidget):
             )
             return
 
-        try:
-            # Save the pixmap
-            from app.features.screenshots.storage import save_screenshot
-
-            metadata = save_screenshot(
-                self.pixmap,
-                self.forensic_context.workspace_path,
-                self.forensic_context.evidence_label,
-                self.forensic_context.evidence_id,
-                prefix="upload",
-            )
+        # The original file is stored unchanged (hashing and copying in a
+        # worker thread); the record is inserted once it is stored
+        from app.services.workers import ScreenshotSaveTask, start_task
 
-            # Insert record
+        annotations = dict(
+            title=title,
+            caption=caption,
+            notes=self.notes_edit.toPlainText().strip() or None,
+            sequence_name=self.sequence_combo.currentText().strip() or None,
+            sequence_order=self.order_spin.value(),
+        )
+        task = ScreenshotSaveTask(
+            self.forensic_context.workspace_path,
+            self.forensic_context.evidence_label,
+            self.forensic_context.evidence_id,
+            source_path=self.source_path,
+        )
+        task.signals.result.connect(lambda metadata: self._on_stored(metadata, annotations))
+        task.signals.error.connect(self._on_store_error)
+        self._save_task = task
+        self.save_btn.setEnabled(False)
+        start_task(task)
+
+    def _on_stored(self, metadata: ScreenshotMetadata, annotations: Dict[str, Any]) -> None:
+        self._save_task = None
+        try:
             now_utc = datetime.now(timezone.utc).isoformat()
             insert_screenshot(
                 self.forensic_context.db_conn,
@@ -649,25 +747,33 @@ class UploadScreenshotDialog(QWidget):
                 height=metadata.height,
                 md5=metadata.md5,
                 sha256=metadata.sha256,
-                title=title,
-                caption=caption,
-                notes=self.notes_edit.toPlainText().strip() or None,
-                sequence_name=self.sequence_combo.currentText().strip() or None,
-                sequence_order=self.order_spin.value(),
                 source="upload",
                 captured_at_utc=now_utc,
+                **annotations,
             )
 
             self._result = 1
             self._dialog.accept()
 
         except Exception as e:
-            logger.error("Failed to upload screenshot: %s", e)
-            QMessageBox.critical(
-                self._dialog,
-                "Upload Error",
-                f"Failed to upload screenshot:\n{e}"
+            # No row references the stored file
+            release_screenshot(
+                {"dest_path": metadata.dest_path, "sha256": metadata.sha256},
+                self.forensic_context.workspace_path,
+                self.forensic_context.evidence_label,
+                self.forensic_context.evidence_id,
             )
+            self._on_store_error(str(e), "")
+
+    def _on_store_error(self, error: str, traceback_str: str) -> None:
+        self._save_task = None
+        logger.error("Failed to upload screenshot: %s", error)
+        self.save_btn.setEnabled(True)
+        QMessageBox.critical(
+            self._dialog,
+            "Upload Error",
+            f"Failed to upload screenshot:\n{error}"
+        )
 
     def exec(self) -> int:
         self._dialog.exec()
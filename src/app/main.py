@@ -7,7 +7,7 @@ import sys
 import time
 from pathlib import Path
 from urllib.parse import urlparse
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from PySide6.QtCore import Qt, QThreadPool, QCoreApplication, QEvent, QUrl, Signal, QObject, QTimer
 from PySide6.QtWidgets import (
@@ -42,30 +42,16 @@ from core.database import DatabaseManager, find_case_database, slugify_label
 from core.evidence_fs import MountedFS, PyEwfTskFS, find_ewf_segments, list_ewf_partitions
 from core.logging import configure_logging, get_logger
 
-from .data.case_data import CaseDataAccess, EvidenceCounts
-from .features.urls import UrlsTab
-from .features.images import ImagesTab
-from .features.os_artifacts import OSArtifactsTab
-from .features.timeline import TimelineTab
-from .features.tags import TagsTab
-from .features.settings import PreferencesDialog
-from .common.dialogs import show_error_dialog, CreateCaseDialog, ValidationDialog, ExportDialog, ImportDialog, RemoveEvidenceDialog
-from .services.workers import (
-    ExecutorTask,
-    ExecutorTaskConfig,
-    start_task,
-    DownloadTask,
-    DownloadTaskConfig,
-    DownloadPostProcessTask,
-    DownloadPostProcessConfig,
-    CaseLoadTask,
-    CaseLoadTaskConfig,
-    CaseLoadResult,
-    ValidationWorker,
-)
 from .config.settings import AppSettings, settings_path
-from .features.downloads.legacy import DownloadManagerDialog, DownloadQueueItem
-from .common.widgets import DiskLayoutWidget, CaseInfoWidget, DiskTabWidget
+from .startup import get_startup_profiler, startup_budget_seconds
+
+# Feature tabs, dialogs, workers and data access are imported where they are
+# first used so that importing this module (and showing the first window)
+# does not pay for every extractor and feature package up front.
+if TYPE_CHECKING:
+    from .data.case_data import CaseDataAccess, EvidenceCounts
+    from .services.workers import CaseLoadResult, CaseLoadTask, DownloadTask, ValidationWorker
+    from .features.downloads.legacy import DownloadManagerDialog
 
 LOGGER = get_logger("app.main")
 
@@ -236,6 +222,7 @@ class MainWindow(QMainWindow):
         self.main_tabs.tabCloseRequested.connect(self._on_close_evidence_tab)
 
         # Case tab (always first)
+        from .common.widgets import CaseInfoWidget
         self.case_info_tab = CaseInfoWidget()
         self.case_info_tab.field_changed.connect(self._on_case_field_changed)
         self.case_info_tab.extract_all_requested.connect(self._on_case_wide_extract_requested)
@@ -332,6 +319,7 @@ class MainWindow(QMainWindow):
         disk_layout.addWidget(disk_info_label)
 
         # DiskTabWidget for partition visualization (no selection UI)
+        from .common.widgets import DiskTabWidget
         disk_tab_widget = DiskTabWidget()
         disk_tab_widget.set_selection_enabled(False)
         disk_tab_widget.rescan_requested.connect(self._on_partition_rescan_requested)
@@ -486,6 +474,7 @@ class MainWindow(QMainWindow):
         evidence_tabs.addTab(screenshots_tab, "Screenshots")
 
         # 12. Tags (NEW)
+        from app.features.tags import TagsTab
         tags_tab = TagsTab()
         # IMPORTANT: Set case_data BEFORE evidence_id to ensure reload() has data access
         if self.case_data:
@@ -566,6 +555,7 @@ class MainWindow(QMainWindow):
             self._validation_worker = None
 
         # Start background validation
+        from .services.workers import ValidationWorker
         worker = ValidationWorker(self.case_path, quick=True)
         worker.signals.finished.connect(self._on_validation_finished)
         worker.signals.error.connect(self._on_validation_error)
@@ -631,6 +621,7 @@ class MainWindow(QMainWindow):
             progress.close()
 
             # Show validation dialog
+            from .common.dialogs import ValidationDialog
             dialog = ValidationDialog(report, parent=self)
             dialog.exec()
 
@@ -653,6 +644,7 @@ class MainWindow(QMainWindow):
             self._validate_case_manual()
             return
 
+        from .common.dialogs import ValidationDialog
         dialog = ValidationDialog(self._validation_report, parent=self)
         dialog.exec()
 
@@ -687,6 +679,7 @@ class MainWindow(QMainWindow):
 
     def _create_case_dialog(self) -> None:
         """Show dialog to create a new case with metadata."""
+        from .common.dialogs import CreateCaseDialog
         dialog = CreateCaseDialog(self, self.browse_dir)
         if dialog.exec() != QDialog.Accepted:
             return
@@ -814,6 +807,7 @@ class MainWindow(QMainWindow):
         self._pending_db_path = db_path
 
         # Create and configure the background task
+        from .services.workers import CaseLoadTask, CaseLoadTaskConfig, start_task
         config = CaseLoadTaskConfig(case_path=case_path, db_path=db_path)
         self._case_load_task = CaseLoadTask(config)
 
@@ -922,6 +916,7 @@ class MainWindow(QMainWindow):
         self.case_db_id = result.case_metadata.get("id")
 
         # Create CaseDataAccess with the loaded manager
+        from .data.case_data import CaseDataAccess
         self.case_data = CaseDataAccess(result.case_path, db_manager=result.db_manager)
         self._current_counts = None
 
@@ -1275,6 +1270,7 @@ class MainWindow(QMainWindow):
             return False
 
     def _open_preferences_dialog(self, initial_tab: Optional[str] = None) -> None:
+        from .features.settings import PreferencesDialog
         dialog = PreferencesDialog(
             self.settings,
             self.settings_file.parent,
@@ -1324,6 +1320,8 @@ class MainWindow(QMainWindow):
             return
 
         # Find the DiskTabWidget within Overview
+        from .common.widgets import DiskTabWidget
+
         disk_tab = None
         for child in overview_widget.findChildren(DiskTabWidget):
             disk_tab = child
@@ -1608,6 +1606,7 @@ class MainWindow(QMainWindow):
                 return {}
 
         # Show dialog
+        from .common.dialogs import RemoveEvidenceDialog
         dialog = RemoveEvidenceDialog(evidences, get_evidence_counts, parent=self)
         if dialog.exec() != QDialog.Accepted:
             return
@@ -1672,6 +1671,12 @@ class MainWindow(QMainWindow):
             self.logger.info("Deleting evidence folder: %s", evidence_folder)
             shutil.rmtree(evidence_folder)
 
+        # Screenshots in the case store are removed unless another evidence uses them
+        from core.screenshot_store import ScreenshotStore
+        removed = ScreenshotStore(self.case_path).release_evidence(evidence_id)
+        if removed:
+            self.logger.info("Deleted %d screenshot files of evidence %d", removed, evidence_id)
+
         # 4. Delete the evidence log file
         evidence_log = self.case_path / "logs" / f"evidence_{evidence_id}.log"
         if evidence_log.exists():
@@ -1859,6 +1864,7 @@ class MainWindow(QMainWindow):
                 return
             config_kwargs["mount_root"] = Path(mount_dir)
 
+        from .services.workers import ExecutorTask, ExecutorTaskConfig, start_task
         config = ExecutorTaskConfig(**config_kwargs)
         task = ExecutorTask(config)
         task.signals.progress.connect(self._on_task_progress)
@@ -1899,6 +1905,8 @@ class MainWindow(QMainWindow):
                         tab.refresh()
 
     def _on_task_error(self, message: str, details: str) -> None:
+        from .common.dialogs import show_error_dialog
+
         LOGGER.error("Worker error: %s", message)
         show_error_dialog(
             self,
@@ -2130,6 +2138,7 @@ class MainWindow(QMainWindow):
         self.log_widget.append(f"Starting download of {len(urls_for_download)} items...")
 
         # Show download dialog and start task (reusing existing flow)
+        from .features.downloads.legacy import DownloadManagerDialog, DownloadQueueItem
         dialog = DownloadManagerDialog(self)
         queue = [
             DownloadQueueItem(
@@ -2169,6 +2178,7 @@ class MainWindow(QMainWindow):
             if self.case_path is None or self.case_db_path is None:
                 self.logger.error("Cannot start download: case_path or case_db_path is None")
                 return
+            from .services.workers import DownloadTask, DownloadTaskConfig, start_task
             config = DownloadTaskConfig(
                 case_root=self.case_path,
                 case_db_path=self.case_db_path,
@@ -2343,6 +2353,7 @@ class MainWindow(QMainWindow):
         if self.case_path is None or self.case_db_path is None:
             self.logger.error("Cannot post-process: case_path or case_db_path is None")
             return
+        from .services.workers import DownloadPostProcessConfig, DownloadPostProcessTask, start_task
         config = DownloadPostProcessConfig(
             case_root=self.case_path,
             case_db_path=self.case_db_path,
@@ -2606,6 +2617,7 @@ class MainWindow(QMainWindow):
         case_id = case_metadata.get("case_id", "Unknown")
 
         # Show export dialog
+        from .common.dialogs import ExportDialog
         dialog = ExportDialog(self.case_path, case_id, self)
         if dialog.exec() == QDialog.Accepted:
             self.statusBar().showMessage("Case exported successfully", 5000)
@@ -2619,6 +2631,7 @@ class MainWindow(QMainWindow):
             cases_dir = self.browse_dir
 
         # Show import dialog (dialog now has destination picker)
+        from .common.dialogs import ImportDialog
         dialog = ImportDialog(cases_dir, self)
         if dialog.exec() == QDialog.Accepted:
             # Get import result from dialog
@@ -2821,9 +2834,27 @@ def main() -> int:
         # Running from source
         base_dir = Path(__file__).resolve().parents[2]
 
-    app = QApplication(sys.argv)
-    window = MainWindow(base_dir)
-    window.show()
+    profiler = get_startup_profiler()
+    with profiler.phase("qt_application"):
+        app = QApplication(sys.argv)
+    with profiler.phase("main_window"):
+        window = MainWindow(base_dir)
+    with profiler.phase("show"):
+        window.show()
+
+    # First event-loop tick after show() ~ first window on screen
+    shown_at = time.perf_counter()
+
+    def _log_startup_timing() -> None:
+        profiler.mark("first_event_loop_tick", shown_at)
+        profiler.log_summary(LOGGER)
+        budget = startup_budget_seconds(window.app_config.startup.cold_start_budget_s)
+        if profiler.elapsed() > budget:
+            LOGGER.warning(
+                "Cold start took %.2fs (budget %.2fs)", profiler.elapsed(), budget
+            )
+
+    QTimer.singleShot(0, _log_startup_timing)
     return app.exec()
 
 
@@ -0,0 +1,227 @@
+"""
+Post-processing for downloaded images.
+
+Each downloaded image is opened once: the content hashes are computed while
+reading the file, and the same decoded image provides dimensions, EXIF, the
+perceptual hash and the thumbnail (written through the shared thumbnailer
+cache). Images are processed in chunks in a process pool with a bounded
+number of chunks in flight; results come back in input order so the caller
+can write them in batches.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from PIL import Image, UnidentifiedImageError
+from PIL.Image import DecompressionBombError
+
+from core.image_codecs import ensure_pillow_heif_registered
+from core.logging import get_logger
+from core.phash import compute_phash
+
+from .thumbnailer import ensure_thumbnail, ensure_thumbnail_from_image
+
+LOGGER = get_logger("app.services.download_postprocess")
+
+# Images per worker task
+POSTPROCESS_CHUNK_SIZE = 16
+
+# Fewer images than this are processed in the calling thread
+PARALLEL_MIN_IMAGES = 2 * POSTPROCESS_CHUNK_SIZE
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+# (item_id, download_id, file_path)
+PostProcessItem = Tuple[int, int, Path]
+
+
+@dataclass(slots=True)
+class DownloadImageResult:
+    """Metadata derived from one downloaded image."""
+    item_id: int
+    download_id: int
+    phash: Optional[str] = None
+    exif_json: str = "{}"
+    width: Optional[int] = None
+    height: Optional[int] = None
+    md5: Optional[str] = None
+    sha256: Optional[str] = None
+    error: Optional[str] = None
+
+    def to_db_record(self) -> Dict[str, Any]:
+        """Record for update_download_image_metadata_batch."""
+        return {
+            "download_id": self.download_id,
+            "phash": self.phash,
+            "exif_json": self.exif_json,
+            "width": self.width,
+            "height": self.height,
+            "md5": self.md5,
+            "sha256": self.sha256,
+        }
+
+
+def analyze_downloaded_image(
+    item_id: int,
+    download_id: int,
+    file_path: Path,
+    thumb_dir: Path,
+) -> DownloadImageResult:
+    """
+    Derive hashes, dimensions, EXIF, pHash and thumbnail from one file open.
+
+    Files Pillow cannot decode (e.g. SVG) still get content hashes and a
+    thumbnail via ensure_thumbnail. Errors are returned in the result
+    instead of raised.
+    """
+    result = DownloadImageResult(item_id=item_id, download_id=download_id)
+    if not file_path.exists():
+        result.error = "File not found"
+        return result
+
+    try:
+        md5 = hashlib.md5()
+        sha256 = hashlib.sha256()
+        with file_path.open("rb") as handle:
+            while block := handle.read(_HASH_BLOCK_SIZE):
+                md5.update(block)
+                sha256.update(block)
+            result.md5 = md5.hexdigest()
+            result.sha256 = sha256.hexdigest()
+
+            handle.seek(0)
+            try:
+                ensure_pillow_heif_registered()
+                img = Image.open(handle)
+            except (UnidentifiedImageError, OSError, DecompressionBombError):
+                img = None
+
+            if img is None:
+                # Not a raster format Pillow understands; the thumbnailer may still render it
+                ensure_thumbnail(file_path, thumb_dir)
+                return result
+
+            with img:
+                result.width, result.height = img.size
+                try:
+                    exif = {str(tag): str(value) for tag, value in img.getexif().items()}
+                except (OSError, ValueError, DecompressionBombError) as exc:
+                    LOGGER.debug("EXIF extraction failed for %s: %s", file_path, exc)
+                    exif = {}
+                result.exif_json = json.dumps(exif, sort_keys=True) if exif else "{}"
+                result.phash = compute_phash(img)
+                # Resizes img in place, so it runs last
+                ensure_thumbnail_from_image(img, file_path, thumb_dir)
+    except Exception as exc:
+        LOGGER.warning("Failed to post-process image %s: %s", file_path, exc)
+        result.error = str(exc)
+    return result
+
+
+def analyze_image_chunk(
+    items: Sequence[Tuple[int, int, str]],
+    thumb_dir: str,
+) -> List[DownloadImageResult]:
+    """
+    Analyze ``(item_id, download_id, path)`` triples in order.
+
+    Top-level so it can run in a process pool.
+    """
+    base = Path(thumb_dir)
+    return [
+        analyze_downloaded_image(item_id, download_id, Path(path), base)
+        for item_id, download_id, path in items
+    ]
+
+
+def _failed_chunk_results(items: Sequence[Tuple[int, int, str]], error: str) -> List[DownloadImageResult]:
+    """Results for a chunk whose worker task did not complete."""
+    return [
+        DownloadImageResult(item_id=item_id, download_id=download_id, error=error)
+        for item_id, download_id, _path in items
+    ]
+
+
+def iter_postprocess_batches(
+    items: Sequence[PostProcessItem],
+    thumb_dir: Path,
+    *,
+    enable_parallel: bool = True,
+    max_workers: Optional[int] = None,
+    chunk_size: int = POSTPROCESS_CHUNK_SIZE,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+) -> Iterator[List[DownloadImageResult]]:
+    """
+    Yield analysis results chunk by chunk, in input order.
+
+    Chunks run in a process pool with at most two chunks per worker in
+    flight. Small inputs, ``enable_parallel=False`` or a sandbox without
+    process support are processed in the calling thread. Stops early when
+    cancelled.
+
+    If a worker task fails (e.g. a worker crashed and broke the pool), the
+    images of its chunk get error results; a broken pool's remaining chunks
+    are processed in the calling thread.
+    """
+    chunks = [
+        [(item_id, download_id, str(path)) for item_id, download_id, path in items[start:start + chunk_size]]
+        for start in range(0, len(items), chunk_size)
+    ]
+
+    executor = None
+    workers = min(len(chunks), max_workers or os.cpu_count() or 1)
+    if enable_parallel and len(items) >= PARALLEL_MIN_IMAGES and workers > 1:
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        except PermissionError as e:
+            LOGGER.warning("Parallel image post-processing unavailable (%s); running sequentially", e)
+
+    if executor is None:
+        for chunk in chunks:
+            if is_cancelled is not None and is_cancelled():
+                return
+            yield analyze_image_chunk(chunk, str(thumb_dir))
+        return
+
+    window = workers * 2
+    in_flight: Deque = deque()
+    next_chunk = 0
+    with executor:
+        try:
+            while next_chunk < len(chunks) or in_flight:
+                if is_cancelled is not None and is_cancelled():
+                    return
+                while next_chunk < len(chunks) and len(in_flight) < window:
+                    in_flight.append((next_chunk, executor.submit(
+                        analyze_image_chunk, chunks[next_chunk], str(thumb_dir)
+                    )))
+                    next_chunk += 1
+                chunk_index, future = in_flight.popleft()
+                try:
+                    results = future.result()
+                except Exception as e:
+                    LOGGER.error("Image post-processing worker failed on %d images: %s",
+                                 len(chunks[chunk_index]), e)
+                    yield _failed_chunk_results(chunks[chunk_index], f"Worker failed: {e}")
+                    if not isinstance(e, BrokenProcessPool):
+                        continue
+                    LOGGER.warning("Image post-processing pool broke; processing remaining images sequentially")
+                    remaining = [index for index, _ in in_flight] + list(range(next_chunk, len(chunks)))
+                    in_flight.clear()
+                    for index in remaining:
+                        if is_cancelled is not None and is_cancelled():
+                            return
+                        yield analyze_image_chunk(chunks[index], str(thumb_dir))
+                    return
+                yield results
+        finally:
+            for _, future in in_flight:
+                future.cancel()
@@ -19,6 +19,43 @@ _MIN_VALID_THUMB_SIZE = 100  # bytes
 MAX_SVG_FILE_SIZE_BYTES = 20 * 1024 * 1024  # 20 MiB
 
 
+def thumbnail_path(image_path: Path, cache_dir: Path) -> Path:
+    """Return the cache location of the thumbnail for ``image_path``."""
+    key = hashlib.md5(str(image_path).encode("utf-8")).hexdigest()
+    return cache_dir / f"{key}.jpg"
+
+
+def _cached_thumbnail(image_path: Path, thumb_path: Path) -> Optional[Path]:
+    """Return ``thumb_path`` if it is a valid, up-to-date thumbnail; drop it if stale."""
+    if not thumb_path.exists():
+        return None
+    try:
+        stat = thumb_path.stat()
+        # Validate: must be newer than source AND have actual content
+        if stat.st_mtime >= image_path.stat().st_mtime and stat.st_size >= _MIN_VALID_THUMB_SIZE:
+            _touch_cache(thumb_path)
+            _prune_disk(thumb_path.parent)
+            return thumb_path
+        # Cached thumbnail is invalid (empty/stale) - regenerate
+        thumb_path.unlink(missing_ok=True)
+    except OSError:
+        # Source file missing or inaccessible
+        pass
+    return None
+
+
+def _finish_thumbnail(thumb_path: Path) -> Optional[Path]:
+    """Register a freshly written thumbnail, or remove it if it is empty."""
+    # Verify the generated thumbnail is valid
+    if thumb_path.exists() and thumb_path.stat().st_size >= _MIN_VALID_THUMB_SIZE:
+        _touch_cache(thumb_path)
+        _prune_disk(thumb_path.parent)
+        return thumb_path
+    # Generated file too small/empty - remove it
+    thumb_path.unlink(missing_ok=True)
+    return None
+
+
 def ensure_thumbnail(image_path: Path, cache_dir: Path, size: Tuple[int, int] = (200, 200)) -> Optional[Path]:
     """
     Generate or retrieve a cached thumbnail for an image.
@@ -35,23 +72,12 @@ def ensure_thumbnail(image_path: Path, cache_dir: Path, size: Tuple[int, int] =
              Also validates existing thumbnails aren't empty/corrupted.
     """
     cache_dir.mkdir(parents=True, exist_ok=True)
-    key = hashlib.md5(str(image_path).encode("utf-8")).hexdigest()
-    thumb_path = cache_dir / f"{key}.jpg"
+    thumb_path = thumbnail_path(image_path, cache_dir)
 
     # Check for valid cached thumbnail
-    if thumb_path.exists():
-        try:
-            stat = thumb_path.stat()
-            # Validate: must be newer than source AND have actual content
-            if stat.st_mtime >= image_path.stat().st_mtime and stat.st_size >= _MIN_VALID_THUMB_SIZE:
-                _touch_cache(thumb_path)
-                _prune_disk(cache_dir)
-                return thumb_path
-            # Cached thumbnail is invalid (empty/stale) - regenerate
-            thumb_path.unlink(missing_ok=True)
-        except OSError:
-            # Source file missing or inaccessible
-            pass
+    cached = _cached_thumbnail(image_path, thumb_path)
+    if cached is not None:
+        return cached
 
     try:
         generated = False
@@ -68,14 +94,7 @@ def ensure_thumbnail(image_path: Path, cache_dir: Path, size: Tuple[int, int] =
             thumb_path.unlink(missing_ok=True)
             return None
 
-        # Verify the generated thumbnail is valid
-        if thumb_path.exists() and thumb_path.stat().st_size >= _MIN_VALID_THUMB_SIZE:
-            _touch_cache(thumb_path)
-            _prune_disk(cache_dir)
-            return thumb_path
-        # Generated file too small/empty - remove it
-        thumb_path.unlink(missing_ok=True)
-        return None
+        return _finish_thumbnail(thumb_path)
     except Exception:
         # Image processing failed (unsupported format, corrupted file, etc.)
         # Don't cache the failure - return None so placeholder icon is used
@@ -83,6 +102,37 @@ def ensure_thumbnail(image_path: Path, cache_dir: Path, size: Tuple[int, int] =
         return None
 
 
+def ensure_thumbnail_from_image(
+    img: Image.Image,
+    image_path: Path,
+    cache_dir: Path,
+    size: Tuple[int, int] = (200, 200),
+) -> Optional[Path]:
+    """
+    Like ensure_thumbnail, but for an image the caller already opened.
+
+    The thumbnail is written to the same cache location ensure_thumbnail
+    uses for ``image_path``. ``img`` is resized in place, so call this last.
+
+    Returns:
+        Path to the thumbnail file, or None if generation failed.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    thumb_path = thumbnail_path(image_path, cache_dir)
+
+    cached = _cached_thumbnail(image_path, thumb_path)
+    if cached is not None:
+        return cached
+
+    try:
+        img.thumbnail(size)
+        img.convert("RGB").save(thumb_path, format="JPEG")
+        return _finish_thumbnail(thumb_path)
+    except Exception:
+        thumb_path.unlink(missing_ok=True)
+        return None
+
+
 def _render_svg_thumbnail(image_path: Path, thumb_path: Path, size: Tuple[int, int]) -> bool:
     try:
         if image_path.stat().st_size > MAX_SVG_FILE_SIZE_BYTES:
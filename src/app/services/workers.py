@@ -471,42 +471,48 @@ class HashLookupTask(BaseTask):
             }
         return None
 
-    def _lookup_new(
-        self, hash_conn: sqlite3.Connection, md5_value: str, sha256_value: Optional[str]
-    ) -> Optional[Dict[str, Any]]:
-        """Look up hash using new schema: hash_entries + hash_lists."""
-        # Build query for MD5 or SHA256 match
-        conditions = []
-        params = []
-
-        if md5_value:
-            conditions.append("he.hash_md5 = ?")
-            params.append(md5_value.lower())
-        if sha256_value:
-            conditions.append("he.hash_sha256 = ?")
-            params.append(sha256_value.lower())
-
-        if not conditions:
-            return None
+    def _lookup_bulk(self, evidence_conn: sqlite3.Connection) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Look up the hashes of all images at once (new schema).
 
-        sql = f"""
-            SELECT he.hash_md5, he.hash_sha256, he.note,
-                   hl.name as list_name, hl.source_file_hash as list_version
-            FROM hash_entries he
-            JOIN hash_lists hl ON he.list_id = hl.id
-            WHERE {' OR '.join(conditions)}
-            LIMIT 1
+        The sorted hashes are matched against the hash index in one pass
+        instead of one query per image.
         """
+        from core.matching import lookup_hashes
+        from core.matching.hash_db import LOOKUP_CHUNK_SIZE
+
+        md5s: List[str] = []
+        sha256s: List[str] = []
+        for start in range(0, len(self.image_ids), LOOKUP_CHUNK_SIZE):
+            chunk = self.image_ids[start:start + LOOKUP_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            for row in evidence_conn.execute(
+                f"SELECT md5, sha256 FROM images WHERE id IN ({placeholders})",
+                chunk,
+            ):
+                if row["md5"]:
+                    md5s.append(row["md5"])
+                if row["sha256"]:
+                    sha256s.append(row["sha256"])
+        return lookup_hashes(self.hash_db_path, md5s=md5s, sha256s=sha256s)
 
-        hash_row = hash_conn.execute(sql, params).fetchone()
-        if hash_row:
-            return {
-                "db_md5": hash_row["hash_md5"] or md5_value,
-                "note": hash_row["note"] or "",
-                "list_name": hash_row["list_name"],
-                "list_version": hash_row["list_version"],
-                "hash_sha256": hash_row["hash_sha256"],
-            }
+    def _lookup_new(
+        self,
+        matches_by_hash: Dict[str, List[Dict[str, Any]]],
+        md5_value: str,
+        sha256_value: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """Pick the match of one image from the bulk lookup (new schema)."""
+        for value in (md5_value, sha256_value):
+            if value and matches_by_hash.get(value.lower()):
+                hash_row = matches_by_hash[value.lower()][0]
+                return {
+                    "db_md5": hash_row["hash_md5"] or md5_value,
+                    "note": hash_row["note"] or "",
+                    "list_name": hash_row["list_name"],
+                    "list_version": hash_row["list_version"],
+                    "hash_sha256": hash_row["hash_sha256"],
+                }
         return None
 
     def run_task(self) -> List[Tuple[int, str, str]]:
@@ -543,6 +549,9 @@ class HashLookupTask(BaseTask):
         try:
             total = len(self.image_ids)
             self.signals.progress.emit(0, total)
+            matches_by_hash: Dict[str, List[Dict[str, Any]]] = {}
+            if schema_type == "new":
+                matches_by_hash = self._lookup_bulk(evidence_conn)
             for idx, image_id in enumerate(self.image_ids, start=1):
                 self.raise_if_cancelled()
                 self.signals.progress.emit(idx - 1, total)
@@ -562,7 +571,7 @@ class HashLookupTask(BaseTask):
 
                 # Look up hash
                 if schema_type == "new":
-                    match = self._lookup_new(hash_conn, md5_value, sha256_value)
+                    match = self._lookup_new(matches_by_hash, md5_value, sha256_value)
                 else:
                     match = self._lookup_legacy(hash_conn, md5_value, sha256_value)
 
@@ -959,20 +968,21 @@ class DownloadPostProcessTask(BaseTask):
     Post-process downloaded images: compute pHash, extract EXIF, get dimensions.
 
     Runs after successful image downloads to populate image metadata fields.
+    Each image is opened once (hashes, dimensions, EXIF, pHash, thumbnail)
+    in a process pool, and results are written in batched updates.
     """
 
+    # Results written per database transaction
+    WRITE_BATCH_SIZE = 256
+
     def __init__(self, config: DownloadPostProcessConfig) -> None:
         super().__init__()
         self.signals = DownloadPostProcessSignals()
         self.config = config
 
     def run_task(self) -> Dict[str, Any]:
-        import json
-        from PIL import Image, UnidentifiedImageError
-        from core.image_codecs import ensure_pillow_heif_registered
-        from core.phash import compute_phash
-        from extractors._shared.carving.exif import extract_exif
-        from app.services.thumbnailer import ensure_thumbnail
+        from core.config import ParallelConfig
+        from app.services.download_postprocess import iter_postprocess_batches
 
         manager = self.config.db_manager or DatabaseManager(
             self.config.case_root,
@@ -998,70 +1008,56 @@ class DownloadPostProcessTask(BaseTask):
             case_conn.close()
 
         evidence_slug = slugify_label(evidence_label, self.config.evidence_id) if evidence_label else f"evidence_{self.config.evidence_id}"
+        # Thumbnails go inside _downloads/thumbnails/ folder
+        thumb_dir = self.config.case_root / "evidences" / evidence_slug / "_downloads" / "thumbnails"
 
         processed = 0
         failed = 0
+        done = 0
         total = len(self.config.items)
+        pending: List[Any] = []
 
-        for idx, (item_id, download_id, file_path) in enumerate(self.config.items):
-            self.raise_if_cancelled()
-
-            pct = int((idx / total) * 100) if total > 0 else 0
-            self.report_progress(pct, f"Processing image {idx + 1}/{total}")
-
-            if not file_path.exists():
-                failed += 1
-                self.signals.item_processed.emit(item_id, download_id, False, "", "File not found")
-                continue
-
+        def flush() -> None:
+            nonlocal processed, failed
+            ok = [r for r in pending if r.error is None]
             try:
-                # Compute perceptual hash
-                phash = compute_phash(file_path)
-
-                # Extract EXIF metadata
-                exif_data = extract_exif(file_path)
-                exif_json = json.dumps(exif_data, sort_keys=True) if exif_data else "{}"
-
-                # Get image dimensions
-                width: Optional[int] = None
-                height: Optional[int] = None
-                try:
-                    ensure_pillow_heif_registered()
-                    with Image.open(file_path) as img:
-                        width, height = img.size
-                except (UnidentifiedImageError, OSError):
-                    pass
-
-                # Generate thumbnail (inside _downloads/thumbnails/ folder)
-                thumb_dir = self.config.case_root / "evidences" / evidence_slug / "_downloads" / "thumbnails"
-                try:
-                    ensure_thumbnail(file_path, thumb_dir)
-                except Exception:
-                    pass  # Non-critical
-
-                # Update database
-                case_data.update_download_image_metadata(
+                case_data.update_download_image_metadata_batch(
                     self.config.evidence_id,
-                    download_id,
-                    phash=phash,
-                    exif_json=exif_json,
-                    width=width,
-                    height=height,
+                    [r.to_db_record() for r in ok],
                 )
-
-                processed += 1
-                self.signals.item_processed.emit(
-                    item_id, download_id, True, phash or "", ""
-                )
-
             except Exception as exc:
-                failed += 1
-                from core.logging import get_logger
                 logger = get_logger("app.workers")
-                logger.warning("Failed to post-process image %s: %s", file_path, exc)
-                self.signals.item_processed.emit(
-                    item_id, download_id, False, "", str(exc)
-                )
+                logger.warning("Failed to store metadata for %d images: %s", len(ok), exc)
+                for r in ok:
+                    r.error = str(exc)
+            for r in pending:
+                if r.error is None:
+                    processed += 1
+                    self.signals.item_processed.emit(r.item_id, r.download_id, True, r.phash or "", "")
+                else:
+                    failed += 1
+                    self.signals.item_processed.emit(r.item_id, r.download_id, False, "", r.error)
+            pending.clear()
+
+        parallel_cfg = ParallelConfig.from_environment()
+        self.report_progress(0, f"Processing {total} images")
+        for batch in iter_postprocess_batches(
+            self.config.items,
+            thumb_dir,
+            enable_parallel=parallel_cfg.enable_parallel,
+            max_workers=parallel_cfg.max_workers,
+            is_cancelled=self.is_cancelled,
+        ):
+            pending.extend(batch)
+            done += len(batch)
+            if len(pending) >= self.WRITE_BATCH_SIZE:
+                flush()
+            pct = int((done / total) * 100) if total > 0 else 0
+            self.report_progress(pct, f"Processing image {done}/{total}")
+
+        # Results computed before a cancel are still stored
+        flush()
+        self.raise_if_cancelled()
 
         self.report_progress(100, f"Processed {processed} images, {failed} failed")
 
@@ -1173,6 +1169,140 @@ class BatchHashListImportTask(BaseTask):
         }
 
 
+# -----------------------------------------------------------------------------
+# Screenshot Tasks — hashing, storing and thumbnailing off the GUI thread
+# -----------------------------------------------------------------------------
+
+
+class ScreenshotSaveTask(BaseTask):
+    """
+    Store one screenshot in the case screenshot store.
+
+    Takes either a QImage (sandbox capture) or the path of an image file
+    (upload). **Result signal payload:** ``ScreenshotMetadata``; the caller
+    inserts the database row with its annotations.
+    """
+
+    def __init__(
+        self,
+        workspace_path: Path,
+        evidence_label: str,
+        evidence_id: int,
+        *,
+        image: Any = None,
+        source_path: Optional[Path] = None,
+        prefix: str = "screenshot",
+    ) -> None:
+        super().__init__()
+        if (image is None) == (source_path is None):
+            raise ValueError("ScreenshotSaveTask needs exactly one of image or source_path")
+        self.workspace_path = workspace_path
+        self.evidence_label = evidence_label
+        self.evidence_id = evidence_id
+        self.image = image
+        self.source_path = source_path
+        self.prefix = prefix
+
+    def run_task(self) -> Any:
+        from app.features.screenshots.storage import import_screenshot, save_screenshot
+
+        if self.source_path is not None:
+            return import_screenshot(
+                self.source_path, self.workspace_path, self.evidence_label, self.evidence_id,
+            )
+        return save_screenshot(
+            self.image, self.workspace_path, self.evidence_label, self.evidence_id,
+            prefix=self.prefix,
+        )
+
+
+@dataclass(frozen=True)
+class ScreenshotImportConfig:
+    """Configuration for bulk screenshot import."""
+    case_root: Path
+    evidence_id: int
+    evidence_label: str
+    files: Tuple[Path, ...]
+    db_manager: DatabaseManager
+    sequence_name: Optional[str] = None
+
+
+class ScreenshotImportTask(BaseTask):
+    """
+    Import a folder of screenshots into an evidence.
+
+    Files are copied into the screenshot store (identical files are stored
+    once per case) and all rows are inserted in one transaction. Files
+    stored before a cancel are still recorded. Titles default to the file
+    stem; sequence_order follows the file order.
+
+    **Result signal payload:** ``dict`` with keys ``imported``,
+    ``deduplicated``, ``failed`` (list of (path, error)) and ``total``.
+    """
+
+    def __init__(self, config: ScreenshotImportConfig) -> None:
+        super().__init__()
+        self.config = config
+
+    def run_task(self) -> Dict[str, Any]:
+        from app.features.screenshots.storage import import_screenshot
+        from core.database.helpers import insert_screenshots
+        from core.screenshot_store import ScreenshotStore
+
+        cfg = self.config
+        total = len(cfg.files)
+        records: List[Dict[str, Any]] = []
+        failed: List[Tuple[Path, str]] = []
+        deduplicated = 0
+
+        self.report_progress(0, f"Importing {total} screenshots")
+        for index, path in enumerate(cfg.files):
+            if self.is_cancelled():
+                break
+            try:
+                metadata = import_screenshot(path, cfg.case_root, cfg.evidence_label, cfg.evidence_id)
+            except Exception as exc:
+                failed.append((path, str(exc)))
+                continue
+            deduplicated += metadata.deduplicated
+            records.append({
+                "dest_path": metadata.dest_path,
+                "filename": metadata.filename,
+                "size_bytes": metadata.size_bytes,
+                "width": metadata.width,
+                "height": metadata.height,
+                "md5": metadata.md5,
+                "sha256": metadata.sha256,
+                "title": path.stem,
+                "sequence_name": cfg.sequence_name,
+                "sequence_order": index,
+                "source": "upload",
+            })
+            done = index + 1
+            self.report_progress(int(done * 95 / total), f"Stored {done}/{total}: {path.name}")
+
+        if records:
+            self.report_progress(95, f"Recording {len(records)} screenshots")
+            conn = cfg.db_manager.get_evidence_conn(cfg.evidence_id, cfg.evidence_label)
+            try:
+                insert_screenshots(conn, cfg.evidence_id, records)
+            except Exception:
+                # Rows were not written: drop the store references taken above
+                store = ScreenshotStore(cfg.case_root)
+                for record in records:
+                    store.release(record["sha256"], cfg.evidence_id)
+                raise
+        self.raise_if_cancelled()
+
+        self.report_progress(100, f"Imported {len(records)} screenshots")
+        return {
+            "imported": len(records),
+            "deduplicated": deduplicated,
+            "failed": failed,
+            "total": total,
+        }
+
+
 # =============================================================================
 # Extract & Ingest Worker (moved from features/extraction/workers.py )
 # =============================================================================
@@ -1337,8 +1467,42 @@ class ExtractAndIngestWorker(QThread):
 
             ingest_index += 1
 
+        if ingest_index and not self._cancelled:
+            self._refresh_search_index()
+
         self.batch_finished.emit(succeeded, skipped, failed, self._cancelled)
 
+    def _refresh_search_index(self) -> None:
+        """Build missing full-text search indexes after an ingestion batch.
+
+        Existing indexes are maintained by triggers during ingestion; this only
+        creates indexes for tables that had none yet (first ingestion). Rows
+        ingested by the batch are also folded into the artifact counters.
+        """
+        from core.database.helpers.artifact_counts import ensure_artifact_counters
+        from core.database.helpers.fts import ensure_fts_indexes
+        from core.logging import get_logger
+
+        logger = get_logger("app.services.workers")
+        evidence_conn = None
+        try:
+            evidence_conn = self.db_manager.get_evidence_conn(
+                self.evidence_id,
+                self.evidence_label
+            )
+            ensure_artifact_counters(evidence_conn)
+            built = ensure_fts_indexes(evidence_conn)
+            if built:
+                self.log_message.emit(f"🔎 Built search index for: {', '.join(built)}")
+        except Exception as e:
+            logger.warning(f"Failed to build search index: {e}")
+        finally:
+            if evidence_conn:
+                try:
+                    evidence_conn.close()
+                except Exception as e:
+                    logger.warning(f"Failed to close evidence_conn: {e}")
+
     def _run_single_extraction(self, extractor, evidence_slug: str, run_id: str) -> tuple:
         """
         Run extraction phase for a single extractor.
@@ -2154,8 +2318,8 @@ class ReportBuildTask(BaseTask):
 
     1. ``ReportBuilder.load_sections_from_db()`` / ``load_appendix_from_db()``
        (which generates thumbnails in parallel for image appendix modules)
-    2. ``ReportBuilder.render_html()``
-    3. ``ReportGenerator.generate_pdf()`` / ``generate_pdf_pair()``
+    2. ``ReportGenerator.generate_documents()`` (report and appendix PDFs
+       rendered in worker processes)
 
     **Result signal payload:** ``dict`` with keys ``mode``, ``report_path``,
     ``appendix_path`` (paths may be ``None`` depending on mode).
@@ -2216,39 +2380,19 @@ class ReportBuildTask(BaseTask):
 
         self.raise_if_cancelled()
 
-        # ── Render HTML ───────────────────────────────────────────────
-        self.report_progress(82, "Rendering HTML…")
-        html_result = builder.render_html(mode)
-
-        self.raise_if_cancelled()
+        # ── Render HTML and generate PDF(s) ──────────────────────────
+        self.report_progress(85, "Generating PDF…")
+        report_path, appendix_path = self._generator.generate_documents(
+            builder,
+            mode,
+            report_path=self._report_path,
+            appendix_path=self._appendix_path,
+            progress_callback=self._progress_bridge,
+        )
 
-        # ── Generate PDF(s) ──────────────────────────────────────────
-        result: Dict[str, Any] = {
+        self.report_progress(100, "Done")
+        return {
             "mode": mode,
-            "report_path": None,
-            "appendix_path": None,
+            "report_path": str(report_path) if report_path is not None else None,
+            "appendix_path": str(appendix_path) if appendix_path is not None else None,
         }
-
-        if mode == ReportMode.COMPLETE:
-            report_html, appendix_html = html_result
-            self.report_progress(85, "Generating report PDF…")
-            self._generator.generate_pdf(report_html, self._report_path)
-            result["report_path"] = str(self._report_path)
-            self.raise_if_cancelled()
-
-            self.report_progress(92, "Generating appendix PDF…")
-            self._generator.generate_pdf(appendix_html, self._appendix_path)
-            result["appendix_path"] = str(self._appendix_path)
-
-        elif mode == ReportMode.REPORT_ONLY:
-            self.report_progress(85, "Generating report PDF…")
-            self._generator.generate_pdf(html_result, self._report_path)
-            result["report_path"] = str(self._report_path)
-
-        else:  # APPENDIX_ONLY
-            self.report_progress(85, "Generating appendix PDF…")
-            self._generator.generate_pdf(html_result, self._appendix_path)
-            result["appendix_path"] = str(self._appendix_path)
-
-        self.report_progress(100, "Done")
-        return result
@@ -0,0 +1,272 @@
+"""
+Startup instrumentation for the GUI entry point.
+
+Provides two opt-in/cheap measurement surfaces used by ``app.main.main()``
+and ``run.py``:
+
+* :class:`StartupProfiler` records wall-clock durations of the named
+  ``main()`` phases (QApplication creation, MainWindow construction, first
+  event-loop tick) and writes a breakdown to the application log.
+* :class:`ImportTimeRecorder` is a ``sys.meta_path`` hook that produces an
+  ``-X importtime``-style report (self/cumulative microseconds per module).
+  It is only installed when startup profiling is requested with
+  ``--profile-startup`` or ``SURFSIFTER_PROFILE_STARTUP=1``.
+
+This module must stay import-light (stdlib only) so it can be loaded
+before the rest of the application without skewing the measurements.
+"""
+from __future__ import annotations
+
+import importlib.abc
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+PROFILE_STARTUP_FLAG = "--profile-startup"
+PROFILE_STARTUP_ENV = "SURFSIFTER_PROFILE_STARTUP"
+STARTUP_BUDGET_ENV = "SURFSIFTER_STARTUP_BUDGET_S"
+DEFAULT_STARTUP_BUDGET_S = 10.0
+
+# Process start reference. Captured at first import of this module, which
+# run.py / app.main do before anything heavy is loaded.
+_PROCESS_T0 = time.perf_counter()
+
+
+def startup_profiling_requested(
+    argv: Optional[Sequence[str]] = None,
+    environ: Optional[Mapping[str, str]] = None,
+) -> bool:
+    """Return True if the user opted into startup/import profiling."""
+    argv = sys.argv if argv is None else argv
+    environ = os.environ if environ is None else environ
+    if PROFILE_STARTUP_FLAG in argv:
+        return True
+    return environ.get(PROFILE_STARTUP_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def startup_budget_seconds(
+    configured: Optional[float] = None,
+    environ: Optional[Mapping[str, str]] = None,
+) -> float:
+    """
+    Resolve the cold-start budget (seconds to first window).
+
+    Precedence: ``SURFSIFTER_STARTUP_BUDGET_S`` environment variable,
+    then the ``startup.cold_start_budget_s`` value from config.yml,
+    then :data:`DEFAULT_STARTUP_BUDGET_S`.
+    """
+    environ = os.environ if environ is None else environ
+    raw = environ.get(STARTUP_BUDGET_ENV)
+    if raw:
+        try:
+            return float(raw)
+        except ValueError:
+            pass
+    if configured is not None and configured > 0:
+        return float(configured)
+    return DEFAULT_STARTUP_BUDGET_S
+
+
+# -----------------------------------------------------------------------------
+# Import-time recorder
+# -----------------------------------------------------------------------------
+
+@dataclass
+class ImportRecord:
+    """Timing of a single module import (microseconds, like ``-X importtime``)."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+class _TimedLoader:
+    """Loader proxy that times ``exec_module`` and restores the real loader."""
+
+    def __init__(self, loader, recorder: "ImportTimeRecorder") -> None:
+        self._loader = loader
+        self._recorder = recorder
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        name = module.__name__
+        recorder = self._recorder
+        recorder._enter(name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            recorder._exit(name)
+            # Put the original loader back so nothing downstream sees the proxy
+            spec = getattr(module, "__spec__", None)
+            if spec is not None and spec.loader is self:
+                spec.loader = self._loader
+            if getattr(module, "__loader__", None) is self:
+                module.__loader__ = self._loader
+
+
+class ImportTimeRecorder(importlib.abc.MetaPathFinder):
+    """
+    ``sys.meta_path`` hook recording per-module import durations.
+
+    Resolution is delegated to the remaining finders; only loaders that
+    implement ``exec_module`` are wrapped. Use :meth:`install` /
+    :meth:`uninstall`, then :meth:`format_report` for a text report.
+    """
+
+    def __init__(self) -> None:
+        self.records: List[ImportRecord] = []
+        self._stack: List[Tuple[str, float, float]] = []  # (name, start, child_time)
+        self._resolving: set[str] = set()
+        self.installed = False
+
+    # -- meta_path protocol ---------------------------------------------------
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname in self._resolving:
+            return None
+        self._resolving.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._resolving.discard(fullname)
+
+        loader = spec.loader
+        if loader is not None and hasattr(loader, "exec_module"):
+            spec.loader = _TimedLoader(loader, self)
+        return spec
+
+    # -- timing stack ---------------------------------------------------------
+
+    def _enter(self, name: str) -> None:
+        self._stack.append((name, time.perf_counter(), 0.0))
+
+    def _exit(self, name: str) -> None:
+        entry_name, start, child_time = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        self.records.append(
+            ImportRecord(
+                name=entry_name,
+                self_us=int((elapsed - child_time) * 1_000_000),
+                cumulative_us=int(elapsed * 1_000_000),
+                depth=len(self._stack),
+            )
+        )
+        if self._stack:
+            parent_name, parent_start, parent_child = self._stack[-1]
+            self._stack[-1] = (parent_name, parent_start, parent_child + elapsed)
+
+    # -- lifecycle ------------------------------------------------------------
+
+    def install(self) -> "ImportTimeRecorder":
+        if not self.installed:
+            sys.meta_path.insert(0, self)
+            self.installed = True
+        return self
+
+    def uninstall(self) -> None:
+        if self.installed:
+            try:
+                sys.meta_path.remove(self)
+            except ValueError:
+                pass
+            self.installed = False
+
+    # -- reporting ------------------------------------------------------------
+
+    def top(self, limit: int = 30) -> List[ImportRecord]:
+        """Return the slowest top-level-ish imports by cumulative time."""
+        return sorted(self.records, key=lambda r: r.cumulative_us, reverse=True)[:limit]
+
+    def format_report(self, limit: int = 30) -> str:
+        """Render an ``-X importtime``-style table of the slowest imports."""
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for rec in self.top(limit):
+            lines.append(
+                f"import time: {rec.self_us:>9} | {rec.cumulative_us:>10} | "
+                f"{'  ' * rec.depth}{rec.name}"
+            )
+        return "\n".join(lines)
+
+
+# -----------------------------------------------------------------------------
+# Phase profiler
+# -----------------------------------------------------------------------------
+
+@dataclass
+class StartupProfiler:
+    """
+    Collect named phase timings for application startup.
+
+    Phases are recorded in order; :meth:`format_breakdown` renders them
+    together with the elapsed time since process start.
+    """
+
+    import_recorder: Optional[ImportTimeRecorder] = None
+    phases: Dict[str, float] = field(default_factory=dict)
+    started_at: float = field(default_factory=lambda: _PROCESS_T0)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as phase ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (time.perf_counter() - start)
+
+    def mark(self, name: str, since: float) -> None:
+        """Record phase ``name`` as the time elapsed from ``since``."""
+        self.phases[name] = time.perf_counter() - since
+
+    def elapsed(self) -> float:
+        """Seconds since process start (first import of this module)."""
+        return time.perf_counter() - self.started_at
+
+    def format_breakdown(self) -> str:
+        parts = [f"{name}={seconds * 1000:.0f}ms" for name, seconds in self.phases.items()]
+        parts.append(f"total_since_start={self.elapsed() * 1000:.0f}ms")
+        return "Startup timing: " + ", ".join(parts)
+
+    def log_summary(self, logger, import_limit: int = 30) -> None:
+        """Write the phase breakdown (and import report, if recorded) to ``logger``."""
+        logger.info(self.format_breakdown())
+        if self.import_recorder is not None:
+            self.import_recorder.uninstall()
+            logger.info(
+                "Startup import profile (%d modules):\n%s",
+                len(self.import_recorder.records),
+                self.import_recorder.format_report(import_limit),
+            )
+
+
+_active_profiler: Optional[StartupProfiler] = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """
+    Return the process-wide startup profiler, creating it on first use.
+
+    When profiling was requested, the import recorder is installed on
+    creation so every subsequent import is captured.
+    """
+    global _active_profiler
+    if _active_profiler is None:
+        recorder = ImportTimeRecorder().install() if startup_profiling_requested() else None
+        _active_profiler = StartupProfiler(import_recorder=recorder)
+    return _active_profiler
@@ -29,6 +29,13 @@ class ExtractionConfig:
     auto_generate_file_list: bool = True  # Auto-run fls on E01 evidence addition
 
 
+@dataclass(slots=True)
+class StartupConfig:
+    """Startup instrumentation configuration from config.yml."""
+
+    cold_start_budget_s: float = 10.0  # Budget for cold start to first window
+
+
 @dataclass(slots=True)
 class AppConfig:
     """Top-level configuration resolved from disk."""
@@ -39,6 +46,7 @@ class AppConfig:
     logs_dir: Path
     logging: LoggingConfig = field(default_factory=LoggingConfig)
     extraction: ExtractionConfig = field(default_factory=ExtractionConfig)
+    startup: StartupConfig = field(default_factory=StartupConfig)
 
     def to_json(self) -> str:
         """Serialize the configuration into a JSON string for manifest outputs."""
@@ -102,6 +110,12 @@ def load_app_config(base_dir: Path) -> AppConfig:
         auto_generate_file_list=extraction_cfg.get("auto_generate_file_list", True),
     )
 
+    # Load startup configuration
+    startup_cfg = config_overrides.get("startup", {})
+    startup_config = StartupConfig(
+        cold_start_budget_s=float(startup_cfg.get("cold_start_budget_s", 10.0)),
+    )
+
     return AppConfig(
         base_dir=base_dir,
         tool_paths=tool_paths,
@@ -109,6 +123,7 @@ def load_app_config(base_dir: Path) -> AppConfig:
         logs_dir=logs_dir,
         logging=logging_config,
         extraction=extraction_config,
+        startup=startup_config,
     )
 
 
@@ -9,6 +9,9 @@ including:
 - Schema definitions (TableSchema, Column, FilterOp, etc.)
 - Connection management and migrations (init_db, migrate, DatabaseManager)
 - Generic CRUD helpers (insert_row, insert_rows, get_rows, delete_by_run)
+- Batched inserts (BatchWriter)
+- Bulk ingest mode with deferred index builds (bulk_ingest)
+- Read-only connection pool with query instrumentation (ReadConnectionPool)
 - Domain-specific helpers (cookies, browser_history, images, etc.)
 - Extractor statistics tracking
 
@@ -113,6 +116,28 @@ from .manager import (
     LEGACY_CASE_DB_GLOB,
 )
 
+# Read-only connection pool and query instrumentation
+from .read_pool import (
+    InstrumentedConnection,
+    ReadConnectionPool,
+    open_read_connection,
+)
+from .query_stats import (
+    QueryInstrumentation,
+    QueryStats,
+    get_query_instrumentation,
+)
+
+# Bulk ingest mode (deferred index builds)
+from .bulk_ingest import (
+    BULK_INGEST_TABLES,
+    BULK_INGEST_MIN_ROWS,
+    BulkIngestResult,
+    bulk_ingest,
+    defer_indexes,
+    restore_deferred_indexes,
+)
+
 # Generic CRUD helpers
 from .helpers import (
     insert_row,
@@ -121,6 +146,9 @@ from .helpers import (
     delete_by_run,
     get_distinct_values,
     get_count,
+    BatchWriter,
+    TableWriteStats,
+    compile_insert,
 )
 
 # Statistics helpers
@@ -171,6 +199,7 @@ from .helpers import (
     insert_download,
     update_download_status,
     update_download_image_metadata,
+    update_download_image_metadata_batch,
     get_download,
     get_download_by_path,
     get_downloads,
@@ -435,6 +464,12 @@ from .helpers import (
     get_evidence_table_counts,
     purge_evidence_data,
     PURGEABLE_TABLES,
+    # Artifact Counts
+    COUNTED_TABLES,
+    ArtifactCountDrift,
+    ensure_artifact_counters,
+    get_artifact_counts,
+    reconcile_artifact_counts,
     # OS Indicators
     insert_os_indicator,
     insert_os_indicators,
@@ -560,9 +595,26 @@ __all__ = [
     "LEGACY_CASE_DB_SUFFIX",
     "CASE_DB_GLOB",
     "LEGACY_CASE_DB_GLOB",
+    # Read pool / query instrumentation
+    "InstrumentedConnection",
+    "ReadConnectionPool",
+    "open_read_connection",
+    "QueryInstrumentation",
+    "QueryStats",
+    "get_query_instrumentation",
+    # Bulk ingest mode
+    "BULK_INGEST_TABLES",
+    "BULK_INGEST_MIN_ROWS",
+    "BulkIngestResult",
+    "bulk_ingest",
+    "defer_indexes",
+    "restore_deferred_indexes",
     # Generic CRUD helpers
     "insert_row",
     "insert_rows",
+    "BatchWriter",
+    "TableWriteStats",
+    "compile_insert",
     "get_rows",
     "delete_by_run",
     "get_distinct_values",
@@ -610,6 +662,7 @@ __all__ = [
     "insert_download",
     "update_download_status",
     "update_download_image_metadata",
+    "update_download_image_metadata_batch",
     "get_download",
     "get_download_by_path",
     "get_downloads",
@@ -892,6 +945,12 @@ __all__ = [
     "get_evidence_table_counts",
     "purge_evidence_data",
     "PURGEABLE_TABLES",
+    # Artifact Counts
+    "COUNTED_TABLES",
+    "ArtifactCountDrift",
+    "ensure_artifact_counters",
+    "get_artifact_counts",
+    "reconcile_artifact_counts",
     # OS Indicators
     "insert_os_indicator",
     "insert_os_indicators",
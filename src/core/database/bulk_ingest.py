@@ -0,0 +1,248 @@
+"""
+Bulk ingest mode for evidence databases.
+
+This module provides:
+- bulk_ingest: Context manager for large loads into urls/file_list (or any
+  tables). Non-unique secondary indexes are dropped for the duration of the
+  load, the connection gets larger cache/mmap/WAL checkpoint settings, and on
+  exit the indexes are rebuilt in one transaction followed by ANALYZE and
+  PRAGMA optimize. Artifact counters are brought up to date on exit.
+- defer_indexes / restore_deferred_indexes: The drop/rebuild steps on their own.
+
+Dropped index definitions are recorded in the ``deferred_indexes`` table in
+the same transaction as the DROP, so a load that dies half way leaves a
+record behind; DatabaseManager rebuilds recorded indexes when it opens the
+database. Unique indexes are never dropped, since INSERT OR IGNORE depends on
+them.
+
+Queries run by the loader itself should not depend on the deferred indexes.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from core.logging import get_logger
+
+from .helpers.artifact_counts import ensure_artifact_counters
+
+__all__ = [
+    "BULK_INGEST_TABLES",
+    "BULK_INGEST_MIN_ROWS",
+    "BulkIngestResult",
+    "bulk_ingest",
+    "defer_indexes",
+    "restore_deferred_indexes",
+]
+
+LOGGER = get_logger("core.database.bulk_ingest")
+
+# Tables with many secondary indexes that receive large loads
+BULK_INGEST_TABLES = ("urls", "file_list")
+
+# Below this many rows, rebuilding the indexes costs more than it saves
+BULK_INGEST_MIN_ROWS = 50_000
+
+# Connection settings while a bulk load is running
+BULK_CACHE_SIZE_KIB = 256 * 1024
+BULK_MMAP_SIZE = 1024 * 1024 * 1024
+BULK_WAL_AUTOCHECKPOINT = 10_000  # pages; default is 1000
+
+_DEFERRED_TABLE = "deferred_indexes"
+_BULK_PRAGMAS = ("cache_size", "mmap_size", "wal_autocheckpoint")
+
+# Database files with a bulk load running in this process, with nesting depth
+_active: Dict[str, int] = {}
+_active_lock = threading.Lock()
+
+
+@dataclass
+class BulkIngestResult:
+    """What a bulk_ingest block did; filled in when the block exits."""
+
+    tables: List[str] = field(default_factory=list)
+    deferred_indexes: List[str] = field(default_factory=list)
+    rebuild_seconds: float = 0.0
+    analyze_seconds: float = 0.0
+
+
+def _db_file(conn: sqlite3.Connection) -> str:
+    for row in conn.execute("PRAGMA database_list"):
+        if row[1] == "main":
+            return row[2] or f":memory:{id(conn)}"
+    return f":memory:{id(conn)}"
+
+
+def _deferred_table_exists(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (_DEFERRED_TABLE,),
+    ).fetchone() is not None
+
+
+def defer_indexes(conn: sqlite3.Connection, tables: Sequence[str]) -> List[str]:
+    """
+    Drop the non-unique secondary indexes of ``tables``.
+
+    The definitions are recorded in ``deferred_indexes`` within the same
+    transaction. Commits any pending transaction on ``conn``.
+
+    Returns:
+        Names of the dropped indexes
+    """
+    dropped: List[str] = []
+    conn.commit()
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {_DEFERRED_TABLE} ("
+        "name TEXT PRIMARY KEY, tbl_name TEXT NOT NULL, sql TEXT NOT NULL)"
+    )
+    with conn:
+        for table in tables:
+            unique = {
+                row[1] for row in conn.execute(f"PRAGMA index_list({table})") if row[2]
+            }
+            indexes = conn.execute(
+                "SELECT name, sql FROM sqlite_master "
+                "WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL ORDER BY name",
+                (table,),
+            ).fetchall()
+            for name, sql in indexes:
+                if name in unique:
+                    continue
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {_DEFERRED_TABLE} (name, tbl_name, sql) VALUES (?, ?, ?)",
+                    (name, table, sql),
+                )
+                conn.execute(f'DROP INDEX "{name}"')
+                dropped.append(name)
+    if dropped:
+        LOGGER.debug("Deferred %d indexes on %s", len(dropped), ", ".join(tables))
+    return dropped
+
+
+def restore_deferred_indexes(
+    conn: sqlite3.Connection,
+    tables: Optional[Sequence[str]] = None,
+) -> List[str]:
+    """
+    Rebuild indexes recorded by defer_indexes, in one transaction.
+
+    Skipped while a bulk_ingest block for the same database file is running
+    in this process.
+
+    Args:
+        conn: Database connection
+        tables: Only rebuild indexes of these tables (default: all recorded)
+
+    Returns:
+        Names of the rebuilt indexes
+    """
+    if not _deferred_table_exists(conn):
+        return []
+    with _active_lock:
+        if _db_file(conn) in _active:
+            return []
+    return _rebuild(conn, tables)
+
+
+def _rebuild(conn: sqlite3.Connection, tables: Optional[Sequence[str]]) -> List[str]:
+    rows = conn.execute(f"SELECT name, tbl_name, sql FROM {_DEFERRED_TABLE} ORDER BY name").fetchall()
+    if tables is not None:
+        rows = [row for row in rows if row[1] in tables]
+    if not rows:
+        return []
+
+    existing = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    }
+    rebuilt: List[str] = []
+    conn.commit()
+    with conn:
+        for name, _table, sql in rows:
+            conn.execute(f"DELETE FROM {_DEFERRED_TABLE} WHERE name = ?", (name,))
+            if name not in existing:
+                conn.execute(sql)
+                rebuilt.append(name)
+    LOGGER.debug("Rebuilt %d deferred indexes", len(rebuilt))
+    return rebuilt
+
+
+@contextmanager
+def bulk_ingest(
+    conn: sqlite3.Connection,
+    tables: Sequence[str] = BULK_INGEST_TABLES,
+    *,
+    analyze: bool = True,
+) -> Iterator[BulkIngestResult]:
+    """
+    Run a large load into ``tables`` with deferred index builds.
+
+    On entry the non-unique secondary indexes of ``tables`` are dropped and
+    the connection's cache_size, mmap_size and wal_autocheckpoint are raised.
+    On exit (also on error) the indexes are rebuilt in one transaction, the
+    loaded rows are folded into the artifact counters, the previous settings
+    are restored and, if ``analyze`` is set, ANALYZE runs on the tables
+    followed by PRAGMA optimize.
+
+    Nested blocks on the same database file do nothing; the outermost block
+    owns the rebuild.
+
+    Example:
+        with bulk_ingest(conn, ("file_list",)):
+            for batch in batches:
+                conn.executemany(INSERT_SQL, batch)
+                conn.commit()
+    """
+    result = BulkIngestResult(tables=list(tables))
+    db_file = _db_file(conn)
+    with _active_lock:
+        depth = _active.get(db_file, 0)
+        _active[db_file] = depth + 1
+    if depth:
+        try:
+            yield result
+        finally:
+            with _active_lock:
+                _active[db_file] -= 1
+        return
+
+    previous = {name: conn.execute(f"PRAGMA {name}").fetchone()[0] for name in _BULK_PRAGMAS}
+    try:
+        conn.execute(f"PRAGMA cache_size = -{BULK_CACHE_SIZE_KIB}")
+        conn.execute(f"PRAGMA mmap_size = {BULK_MMAP_SIZE}")
+        conn.execute(f"PRAGMA wal_autocheckpoint = {BULK_WAL_AUTOCHECKPOINT}")
+        # Leftovers from an interrupted load are rebuilt with this one
+        result.deferred_indexes = defer_indexes(conn, tables)
+        yield result
+    finally:
+        try:
+            started = time.perf_counter()
+            _rebuild(conn, tables)
+            ensure_artifact_counters(conn, tables)
+            result.rebuild_seconds = time.perf_counter() - started
+            if analyze:
+                started = time.perf_counter()
+                for table in tables:
+                    conn.execute(f"ANALYZE {table}")
+                conn.execute("PRAGMA optimize")
+                conn.commit()
+                result.analyze_seconds = time.perf_counter() - started
+        finally:
+            for name, value in previous.items():
+                conn.execute(f"PRAGMA {name} = {int(value)}")
+            with _active_lock:
+                if _active[db_file] <= 1:
+                    del _active[db_file]
+                else:
+                    _active[db_file] -= 1
+        LOGGER.info(
+            "Bulk ingest on %s: rebuilt %d indexes in %.2fs, analyze %.2fs",
+            ", ".join(tables),
+            len(result.deferred_indexes),
+            result.rebuild_seconds,
+            result.analyze_seconds,
+        )
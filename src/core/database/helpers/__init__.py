@@ -5,6 +5,7 @@ This package provides domain-specific CRUD operations for all artifact tables.
 
 Exports:
 - Generic CRUD: insert_rows, insert_row, get_rows, delete_by_run, get_distinct_values, get_count
+- Batched inserts: BatchWriter, compile_insert
 - Statistics: upsert_extractor_statistics, get_extractor_statistics_*
 - Browser History: insert_browser_history*, get_browser_history*, delete_browser_history_by_run
 - Cookies: insert_cookie*, get_cookies, get_cookie_*, delete_cookies_by_run
@@ -26,7 +27,9 @@ Exports:
 - Sync Data: insert_sync_data*, get_sync_data*
 - Favicons: insert_favicon*, get_favicons*, favicon_mappings, top_sites
 - Browser Inventory: get_browser_inventory
+- Full-text search: ensure_fts_indexes, build_fts_index, fts_like_condition
 - Batch Operations: get_evidence_table_counts, purge_evidence_data
+- Artifact Counts: get_artifact_counts, ensure_artifact_counters, reconcile_artifact_counts
 - OS Indicators: insert_os_indicator*, get_os_indicators*, platform_detections
 - Hash Matches: insert_hash_match*, get_hash_matches*, url_matches
 - Report Sections v2: list_report_sections_v2, create/update/delete sections and modules
@@ -42,6 +45,11 @@ from .generic import (
     insert_row,
     insert_rows,
 )
+from .batch_writer import (
+    BatchWriter,
+    TableWriteStats,
+    compile_insert,
+)
 from .statistics import (
     delete_extractor_statistics_by_evidence,
     delete_extractor_statistics_by_run,
@@ -110,6 +118,7 @@ from .downloads import (
     insert_download,
     update_download_status,
     update_download_image_metadata,
+    update_download_image_metadata_batch,
     get_download,
     get_download_by_path,
     get_downloads,
@@ -185,6 +194,12 @@ from .tags import (
     get_tag_strings_for_artifacts,
     get_artifacts_by_tag_id,
     merge_tag_associations,
+    BulkTagCancelled,
+    insert_tag_associations_bulk,
+    delete_tag_associations_bulk,
+    tag_artifacts_where,
+    untag_artifacts_where,
+    get_tags_for_artifacts,
     query_artifacts_by_tags,
     query_all_tagged_artifacts,
 )
@@ -522,6 +537,20 @@ from .browser_inventory import (
     get_browser_inventory,
 )
 
+# Full-text search index
+from .fts import (
+    FTS_INDEXED_COLUMNS,
+    FTS_MIN_TERM_LENGTH,
+    build_fts_index,
+    drop_fts_index,
+    ensure_fts_indexes,
+    fts_like_any_condition,
+    fts_like_condition,
+    fts_table_name,
+    fts_trigram_available,
+    has_fts_index,
+)
+
 # Batch Operations
 from .batch import (
     get_evidence_table_counts,
@@ -529,6 +558,15 @@ from .batch import (
     PURGEABLE_TABLES,
 )
 
+# Artifact Counts
+from .artifact_counts import (
+    COUNTED_TABLES,
+    ArtifactCountDrift,
+    ensure_artifact_counters,
+    get_artifact_counts,
+    reconcile_artifact_counts,
+)
+
 # OS Indicators
 from .os_indicators import (
     insert_os_indicator,
@@ -571,6 +609,7 @@ from .extracted_files import (
 # Screenshots
 from .screenshots import (
     insert_screenshot,
+    insert_screenshots,
     update_screenshot,
     delete_screenshot,
     get_screenshot,
@@ -619,6 +658,10 @@ __all__ = [
     "get_rows",
     "insert_row",
     "insert_rows",
+    # Batched inserts
+    "BatchWriter",
+    "TableWriteStats",
+    "compile_insert",
     # Statistics
     "delete_extractor_statistics_by_evidence",
     "delete_extractor_statistics_by_run",
@@ -669,6 +712,7 @@ __all__ = [
     "insert_download",
     "update_download_status",
     "update_download_image_metadata",
+    "update_download_image_metadata_batch",
     "get_download",
     "get_download_by_path",
     "get_downloads",
@@ -729,6 +773,12 @@ __all__ = [
     "get_tag_strings_for_artifacts",
     "get_artifacts_by_tag_id",
     "merge_tag_associations",
+    "BulkTagCancelled",
+    "insert_tag_associations_bulk",
+    "delete_tag_associations_bulk",
+    "tag_artifacts_where",
+    "untag_artifacts_where",
+    "get_tags_for_artifacts",
     "query_artifacts_by_tags",
     "query_all_tagged_artifacts",
     # Timeline
@@ -977,10 +1027,27 @@ __all__ = [
     "insert_browser_inventory",
     "update_inventory_ingestion_status",
     "get_browser_inventory",
+    # Full-text search index
+    "FTS_INDEXED_COLUMNS",
+    "FTS_MIN_TERM_LENGTH",
+    "build_fts_index",
+    "drop_fts_index",
+    "ensure_fts_indexes",
+    "fts_like_any_condition",
+    "fts_like_condition",
+    "fts_table_name",
+    "fts_trigram_available",
+    "has_fts_index",
     # Batch Operations
     "get_evidence_table_counts",
     "purge_evidence_data",
     "PURGEABLE_TABLES",
+    # Artifact Counts
+    "COUNTED_TABLES",
+    "ArtifactCountDrift",
+    "ensure_artifact_counters",
+    "get_artifact_counts",
+    "reconcile_artifact_counts",
     # OS Indicators
     "insert_os_indicator",
     "insert_os_indicators",
@@ -1013,6 +1080,7 @@ __all__ = [
     "delete_extracted_files_by_extractor",
     # Screenshots
     "insert_screenshot",
+    "insert_screenshots",
     "update_screenshot",
     "delete_screenshot",
     "get_screenshot",
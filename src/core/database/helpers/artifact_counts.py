@@ -0,0 +1,324 @@
+"""
+Maintained per-evidence row counters.
+
+Counting rows with ``SELECT COUNT(*) ... WHERE evidence_id = ?`` walks the
+whole evidence index of a table, which takes seconds on tables with tens of
+millions of rows and is repeated on every summary refresh. This module
+keeps the counts in the ``artifact_counts`` table instead.
+
+Counters cover the rows of a table up to a rowid watermark, recorded in
+``artifact_count_marks``. Rows above the watermark (inserted since the last
+fold) are counted on read with a rowid range scan, so inserts pay nothing:
+an AFTER INSERT trigger would make every single-row INSERT a multi-write
+statement with a statement journal, which doubled ingestion time on urls.
+Counted tables use AUTOINCREMENT, so rowids are never reused. Rows at or
+below the watermark are tracked by AFTER DELETE and AFTER UPDATE OF
+evidence_id triggers.
+
+- :func:`ensure_artifact_counters` seeds counters for untracked tables and
+  folds rows above the watermark into the counters. Called when the
+  database is opened, after ingestion batches and after bulk loads.
+- :func:`get_artifact_counts` reads the counts of an evidence in one query.
+- :func:`reconcile_artifact_counts` recounts and reports (and by default
+  repairs) counters that drifted from the actual row counts.
+"""
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from core.logging import get_logger
+
+from .batch import PURGEABLE_TABLES
+
+__all__ = [
+    "COUNTED_TABLES",
+    "ArtifactCountDrift",
+    "ensure_artifact_counters",
+    "get_artifact_counts",
+    "reconcile_artifact_counts",
+]
+
+LOGGER = get_logger("core.database.helpers.artifact_counts")
+
+# Tables written with INSERT OR REPLACE: rows replaced on conflict are deleted
+# without firing DELETE triggers, so these are always counted directly
+_REPLACE_TABLES = frozenset({"hsts_entries"})
+
+# Tables with maintained counters
+COUNTED_TABLES = tuple(t for t in PURGEABLE_TABLES if t not in _REPLACE_TABLES)
+
+_COUNTS_TABLE = "artifact_counts"
+_MARKS_TABLE = "artifact_count_marks"
+
+
+@dataclass(frozen=True)
+class ArtifactCountDrift:
+    """A counter that did not match the actual row count."""
+    table: str
+    evidence_id: int
+    stored: int
+    actual: int
+
+
+def _trigger_names(table: str) -> List[str]:
+    return [f"trg_{table}_count_ad", f"trg_{table}_count_au"]
+
+
+def _marks_table_exists(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (_MARKS_TABLE,),
+    ).fetchone() is not None
+
+
+def _countable_tables(conn: sqlite3.Connection, tables: Iterable[str]) -> List[str]:
+    """Filter ``tables`` to existing tables with an evidence_id column."""
+    with_evidence = {
+        row[0]
+        for row in conn.execute(
+            "SELECT m.name FROM sqlite_master AS m, pragma_table_info(m.name) AS c "
+            "WHERE m.type = 'table' AND c.name = 'evidence_id'"
+        )
+    }
+    return [table for table in tables if table in with_evidence]
+
+
+def _marks(conn: sqlite3.Connection) -> Dict[str, int]:
+    """Watermark per tracked table."""
+    return dict(conn.execute(f"SELECT table_name, counted_rowid FROM {_MARKS_TABLE}").fetchall())
+
+
+def _tracked_tables(conn: sqlite3.Connection, marks: Dict[str, int]) -> Set[str]:
+    """Tables with a watermark and all of their triggers."""
+    names = {
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_%_count_%'"
+        )
+    }
+    return {
+        table for table in marks
+        if all(name in names for name in _trigger_names(table))
+    }
+
+
+def _max_rowid(conn: sqlite3.Connection, table: str) -> int:
+    return conn.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {table}").fetchone()[0]
+
+
+def _create_triggers(conn: sqlite3.Connection, table: str) -> None:
+    ad, au = _trigger_names(table)
+    counted = (
+        f"OLD.rowid <= (SELECT counted_rowid FROM {_MARKS_TABLE} WHERE table_name = '{table}')"
+    )
+    decrement = (
+        f"UPDATE {_COUNTS_TABLE} SET row_count = row_count - 1 "
+        f"WHERE table_name = '{table}' AND evidence_id = OLD.evidence_id;"
+    )
+    conn.execute(
+        f"CREATE TRIGGER IF NOT EXISTS {ad} AFTER DELETE ON {table} "
+        f"WHEN OLD.evidence_id IS NOT NULL AND {counted} BEGIN {decrement} END"
+    )
+    # Moving a counted row between evidences: decrement the old counter (a
+    # no-op when OLD.evidence_id is NULL) and increment the new one
+    conn.execute(
+        f"CREATE TRIGGER IF NOT EXISTS {au} AFTER UPDATE OF evidence_id ON {table} "
+        f"WHEN OLD.evidence_id IS NOT NEW.evidence_id AND {counted} BEGIN {decrement} "
+        f"INSERT INTO {_COUNTS_TABLE} (table_name, evidence_id, row_count) "
+        f"SELECT '{table}', NEW.evidence_id, 1 WHERE NEW.evidence_id IS NOT NULL "
+        f"ON CONFLICT (table_name, evidence_id) DO UPDATE SET row_count = row_count + 1; "
+        f"END"
+    )
+
+
+def _build(conn: sqlite3.Connection, table: str) -> None:
+    """Count ``table`` from scratch and install its triggers (inside a transaction)."""
+    high = _max_rowid(conn, table)
+    conn.execute(f"DELETE FROM {_COUNTS_TABLE} WHERE table_name = ?", (table,))
+    conn.execute(
+        f"INSERT INTO {_COUNTS_TABLE} (table_name, evidence_id, row_count) "
+        f"SELECT ?, evidence_id, COUNT(*) FROM {table} "
+        f"WHERE rowid <= ? AND evidence_id IS NOT NULL GROUP BY evidence_id",
+        (table, high),
+    )
+    conn.execute(
+        f"INSERT OR REPLACE INTO {_MARKS_TABLE} (table_name, counted_rowid) VALUES (?, ?)",
+        (table, high),
+    )
+    _create_triggers(conn, table)
+
+
+def _fold(conn: sqlite3.Connection, table: str, mark: int, high: int) -> None:
+    """Add rows in (mark, high] to the counters and advance the watermark."""
+    conn.execute(
+        f"INSERT INTO {_COUNTS_TABLE} (table_name, evidence_id, row_count) "
+        f"SELECT ?, evidence_id, COUNT(*) FROM {table} "
+        f"WHERE rowid > ? AND rowid <= ? AND evidence_id IS NOT NULL GROUP BY evidence_id "
+        f"ON CONFLICT (table_name, evidence_id) DO UPDATE SET row_count = row_count + excluded.row_count",
+        (table, mark, high),
+    )
+    conn.execute(
+        f"UPDATE {_MARKS_TABLE} SET counted_rowid = ? WHERE table_name = ?",
+        (high, table),
+    )
+
+
+def ensure_artifact_counters(
+    conn: sqlite3.Connection,
+    tables: Optional[Sequence[str]] = None,
+) -> List[str]:
+    """
+    Seed counters for untracked tables and fold newly inserted rows.
+
+    Untracked tables are counted and get their triggers in one transaction.
+    For tracked tables, rows inserted since the last call are added to the
+    counters. Rows committed concurrently are left for the next call.
+    Commits any pending transaction.
+
+    Args:
+        conn: Evidence database connection
+        tables: Tables to process (default: COUNTED_TABLES)
+
+    Returns:
+        Tables whose counters were built from scratch by this call
+    """
+    if not _marks_table_exists(conn):
+        return []
+    requested = [t for t in (tables or COUNTED_TABLES) if t in COUNTED_TABLES]
+    marks = _marks(conn)
+    tracked = _tracked_tables(conn, marks)
+    built = _countable_tables(conn, [t for t in requested if t not in tracked])
+    # Upper bounds are read before the write transaction starts; rows
+    # committed later have higher rowids and are folded next time
+    folds = []
+    for table in requested:
+        if table in tracked:
+            high = _max_rowid(conn, table)
+            if high > marks[table]:
+                folds.append((table, marks[table], high))
+    if not built and not folds:
+        return []
+
+    conn.commit()
+    with conn:
+        for table in built:
+            _build(conn, table)
+        for table, mark, high in folds:
+            _fold(conn, table, mark, high)
+    if built:
+        LOGGER.debug("Artifact counters built for %s", ", ".join(built))
+    return built
+
+
+def get_artifact_counts(
+    conn: sqlite3.Connection,
+    evidence_id: int,
+    tables: Optional[Sequence[str]] = None,
+) -> Dict[str, int]:
+    """
+    Get row counts of an evidence for several tables, in one query.
+
+    Each count is the stored counter plus the rows above the table's
+    watermark. Tables without counters have no watermark and no stored
+    counter, so all their rows are counted directly. Missing tables count
+    as 0.
+
+    Args:
+        conn: Evidence database connection
+        evidence_id: Evidence ID
+        tables: Tables to count (default: PURGEABLE_TABLES)
+
+    Returns:
+        Dict mapping table name to row count
+    """
+    tables = list(tables or PURGEABLE_TABLES)
+    counts: Dict[str, int] = {table: 0 for table in tables}
+    countable = _countable_tables(conn, tables)
+    if not countable:
+        return counts
+
+    parts: List[str] = []
+    params: List[object] = []
+    has_counters = _marks_table_exists(conn)
+    if has_counters:
+        placeholders = ", ".join("?" for _ in countable)
+        parts.append(
+            f"SELECT table_name, row_count FROM {_COUNTS_TABLE} "
+            f"WHERE evidence_id = ? AND table_name IN ({placeholders})"
+        )
+        params.extend([evidence_id, *countable])
+    for table in countable:
+        if has_counters:
+            parts.append(
+                f"SELECT '{table}', COUNT(*) FROM {table} WHERE evidence_id = ? AND rowid > "
+                f"COALESCE((SELECT counted_rowid FROM {_MARKS_TABLE} WHERE table_name = '{table}'), 0)"
+            )
+        else:
+            parts.append(f"SELECT '{table}', COUNT(*) FROM {table} WHERE evidence_id = ?")
+        params.append(evidence_id)
+
+    for table, count in conn.execute(" UNION ALL ".join(parts), params):
+        counts[table] += count
+    return counts
+
+
+def reconcile_artifact_counts(
+    conn: sqlite3.Connection,
+    tables: Optional[Sequence[str]] = None,
+    *,
+    fix: bool = True,
+) -> List[ArtifactCountDrift]:
+    """
+    Recount tracked tables and report counters that drifted.
+
+    Only rows up to each table's watermark are compared; rows above it are
+    counted directly on read and cannot drift.
+
+    Args:
+        conn: Evidence database connection
+        tables: Tables to check (default: all tracked tables)
+        fix: Overwrite drifted counters with the actual counts
+
+    Returns:
+        One ArtifactCountDrift per (table, evidence) whose counter was wrong
+    """
+    if not _marks_table_exists(conn):
+        return []
+    marks = _marks(conn)
+    check = [t for t in (tables or COUNTED_TABLES) if t in marks]
+
+    drift: List[ArtifactCountDrift] = []
+    for table in check:
+        actual = dict(conn.execute(
+            f"SELECT evidence_id, COUNT(*) FROM {table} "
+            f"WHERE rowid <= ? AND evidence_id IS NOT NULL GROUP BY evidence_id",
+            (marks[table],),
+        ).fetchall())
+        stored = dict(conn.execute(
+            f"SELECT evidence_id, row_count FROM {_COUNTS_TABLE} WHERE table_name = ?",
+            (table,),
+        ).fetchall())
+        for evidence_id in sorted(set(actual) | set(stored)):
+            have = stored.get(evidence_id, 0)
+            want = actual.get(evidence_id, 0)
+            if have != want:
+                drift.append(ArtifactCountDrift(table, evidence_id, have, want))
+
+    if drift:
+        LOGGER.warning(
+            "Artifact counter drift in %d counters: %s",
+            len(drift),
+            ", ".join(f"{d.table}[{d.evidence_id}] {d.stored}->{d.actual}" for d in drift[:10]),
+        )
+        if fix:
+            with conn:
+                for d in drift:
+                    conn.execute(
+                        f"INSERT INTO {_COUNTS_TABLE} (table_name, evidence_id, row_count) "
+                        f"VALUES (?, ?, ?) ON CONFLICT (table_name, evidence_id) "
+                        f"DO UPDATE SET row_count = excluded.row_count",
+                        (d.table, d.evidence_id, d.actual),
+                    )
+    return drift
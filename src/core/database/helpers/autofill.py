@@ -100,6 +100,7 @@ def get_autofill_entries(
     *,
     browser: Optional[str] = None,
     name: Optional[str] = None,
+    value: Optional[str] = None,
     limit: int = 1000,
 ) -> List[Dict[str, Any]]:
     """
@@ -110,6 +111,7 @@ def get_autofill_entries(
         evidence_id: Evidence ID
         browser: Optional browser filter
         name: Optional field name filter (partial match)
+        value: Optional field value filter (partial match)
         limit: Maximum rows to return
 
     Returns:
@@ -120,6 +122,8 @@ def get_autofill_entries(
         filters["browser"] = (FilterOp.EQ, browser)
     if name:
         filters["name"] = (FilterOp.LIKE, f"%{name}%")
+    if value:
+        filters["value"] = (FilterOp.LIKE, f"%{value}%")
 
     return get_rows(
         conn,
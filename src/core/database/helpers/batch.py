@@ -11,6 +11,8 @@ from __future__ import annotations
 import sqlite3
 from typing import Any, Dict, List
 
+from .generic import bump_data_version
+
 __all__ = [
     "get_evidence_table_counts",
     "purge_evidence_data",
@@ -80,7 +82,9 @@ def get_evidence_table_counts(conn: sqlite3.Connection, evidence_id: int) -> Dic
     """
     Get row counts for all evidence tables.
 
-    Used by batch operations dialogs to show data preview.
+    Used by batch operations dialogs to show data preview. Counts come from
+    the maintained artifact counters (one query); untracked tables are
+    counted directly.
 
     Args:
         conn: SQLite connection to evidence database
@@ -89,19 +93,10 @@ def get_evidence_table_counts(conn: sqlite3.Connection, evidence_id: int) -> Dic
     Returns:
         Dict mapping table name to row count
     """
-    counts = {}
-    for table in PURGEABLE_TABLES:
-        try:
-            row = conn.execute(
-                f"SELECT COUNT(*) FROM {table} WHERE evidence_id = ?",
-                (evidence_id,)
-            ).fetchone()
-            counts[table] = row[0] if row else 0
-        except sqlite3.OperationalError:
-            # Table may not exist
-            counts[table] = 0
+    # Local import: artifact_counts imports PURGEABLE_TABLES from this module
+    from .artifact_counts import get_artifact_counts
 
-    return counts
+    return get_artifact_counts(conn, evidence_id, PURGEABLE_TABLES)
 
 
 def purge_evidence_data(
@@ -140,5 +135,7 @@ def purge_evidence_data(
             # Table may not exist
             pass
 
+    if total_deleted:
+        bump_data_version(conn)
     conn.commit()
     return total_deleted
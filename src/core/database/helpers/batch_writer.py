@@ -0,0 +1,268 @@
+"""
+Batched inserts for TableSchema-based tables.
+
+- CompiledInsert: INSERT statement and row extraction for one TableSchema,
+  built once per schema and cached (compile_insert)
+- BatchWriter: accumulates rows for several tables across calls and writes
+  them in large transactions when a row-count or time threshold is reached,
+  with per-table throughput counters
+
+insert_rows/insert_row in generic.py run on the same compiled statements.
+"""
+from __future__ import annotations
+
+import sqlite3
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from ..schema import TABLE_SCHEMAS, ConflictAction, TableSchema
+
+__all__ = [
+    "BatchWriter",
+    "CompiledInsert",
+    "TableWriteStats",
+    "compile_insert",
+]
+
+
+class CompiledInsert:
+    """
+    INSERT statement and row builder for one TableSchema.
+
+    ``evidence_id`` is bound as the first column so rows are
+    ``(evidence_id, *values)``. Records that carry every column key are
+    extracted with a single ``operator.itemgetter`` call; others fall back to
+    per-column ``dict.get`` with the column defaults.
+    """
+
+    __slots__ = ("schema", "sql", "_fields", "_getter", "_hook", "_single", "_has_evidence_id")
+
+    def __init__(self, schema: TableSchema):
+        columns = [c for c in schema.columns if c.name not in ("id", "evidence_id")]
+        has_evidence_id = any(c.name == "evidence_id" for c in schema.columns)
+
+        if schema.conflict_action == ConflictAction.FAIL:
+            insert_sql = f"INSERT INTO {schema.name}"
+        else:
+            insert_sql = f"INSERT OR {schema.conflict_action} INTO {schema.name}"
+
+        names = (["evidence_id"] if has_evidence_id else []) + [c.name for c in columns]
+        placeholders = ", ".join("?" * len(names))
+
+        self.schema = schema
+        self.sql = f"{insert_sql} ({', '.join(names)}) VALUES ({placeholders})"
+        # (dict key, default) per column
+        self._fields: Tuple[Tuple[str, Any], ...] = tuple(
+            (c.dict_key or c.name, c.default) for c in columns
+        )
+        keys = [key for key, _ in self._fields]
+        self._getter: Optional[Callable] = itemgetter(*keys) if keys else None
+        self._single = len(keys) == 1
+        self._hook = schema.pre_insert_hook
+        self._has_evidence_id = has_evidence_id
+
+    def build_rows(self, evidence_id: int, records: Iterable[Dict[str, Any]]) -> List[tuple]:
+        """Convert records to parameter tuples."""
+        hook = self._hook
+        getter = self._getter
+        fields = self._fields
+        single = self._single
+        prefix = (evidence_id,) if self._has_evidence_id else ()
+        rows: List[tuple] = []
+        append = rows.append
+
+        for record in records:
+            if hook:
+                record = hook(record)
+            if getter is None:
+                append(prefix)
+                continue
+            try:
+                values = getter(record)
+            except KeyError:
+                get = record.get
+                append(prefix + tuple(get(key, default) for key, default in fields))
+                continue
+            append(prefix + ((values,) if single else values))
+        return rows
+
+    def execute(self, conn: sqlite3.Connection, rows: List[tuple]) -> int:
+        """Run the INSERT for prepared rows (no transaction handling); returns rows changed."""
+        if not rows:
+            return 0
+        # rowcount excludes rows written by triggers (artifact counters, FTS)
+        return conn.executemany(self.sql, rows).rowcount
+
+
+# Compiled statements by table name; the schema object is checked on lookup
+_compiled: Dict[str, CompiledInsert] = {}
+
+
+def compile_insert(schema: TableSchema) -> CompiledInsert:
+    """Return the cached CompiledInsert for a schema."""
+    compiled = _compiled.get(schema.name)
+    if compiled is None or compiled.schema is not schema:
+        compiled = CompiledInsert(schema)
+        _compiled[schema.name] = compiled
+    return compiled
+
+
+@dataclass
+class TableWriteStats:
+    """Throughput counters for one table."""
+
+    queued: int = 0
+    inserted: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.inserted / self.seconds if self.seconds > 0 else 0.0
+
+
+class BatchWriter:
+    """
+    Accumulate rows for TableSchema tables and write them in large transactions.
+
+    Rows are held in memory (not in an open transaction), so other helpers
+    may commit on the same connection in between. Pending rows are written
+    when ``batch_size`` rows are queued across all tables, when
+    ``flush_interval`` seconds have passed since the last write, on
+    ``flush()``, and when a ``with`` block exits.
+    Tables are flushed in the order they were first used, so parents can be
+    queued before children. If a write fails, its transaction is rolled
+    back, the error is raised and the rows stay queued, so a later
+    ``flush()`` retries them (``discard()`` drops them).
+
+    Example:
+        with BatchWriter(conn, evidence_id) as writer:
+            for entry in entries:
+                writer.add("urls", [make_url_record(entry)])
+        writer.stats["urls"].rows_per_second
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        evidence_id: int,
+        *,
+        batch_size: int = 10000,
+        flush_interval: float = 5.0,
+    ):
+        self.conn = conn
+        self.evidence_id = evidence_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.stats: Dict[str, TableWriteStats] = {}
+        self._pending: Dict[str, Tuple[CompiledInsert, List[tuple]]] = {}
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+
+    def add(
+        self,
+        table: Union[str, TableSchema],
+        records: Iterable[Dict[str, Any]],
+    ) -> int:
+        """
+        Queue records for a table (by name or schema).
+
+        Errors of a write triggered here are raised; the rows stay queued.
+
+        Returns:
+            Number of records queued
+        """
+        schema = TABLE_SCHEMAS[table] if isinstance(table, str) else table
+        compiled = compile_insert(schema)
+        rows = compiled.build_rows(self.evidence_id, records)
+        if not rows:
+            return 0
+
+        entry = self._pending.get(schema.name)
+        if entry is None or entry[0] is not compiled:
+            if entry is not None:
+                self._flush_table(schema.name)
+            entry = self._pending[schema.name] = (compiled, [])
+        entry[1].extend(rows)
+        self._pending_count += len(rows)
+        self._stats(schema.name).queued += len(rows)
+
+        if (
+            self._pending_count >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+        return len(rows)
+
+    def add_row(self, table: Union[str, TableSchema], record: Dict[str, Any]) -> int:
+        """Queue a single record."""
+        return self.add(table, (record,))
+
+    @property
+    def pending(self) -> int:
+        """Number of queued rows not yet written."""
+        return self._pending_count
+
+    def flush(self) -> int:
+        """
+        Write all pending rows in one transaction.
+
+        Returns:
+            Number of rows inserted
+        """
+        if not self._pending_count:
+            self._last_flush = time.monotonic()
+            return 0
+
+        inserted = self._write(list(self._pending.items()))
+        # Cleared only once the transaction has committed
+        self._pending = {}
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+        return inserted
+
+    def _flush_table(self, table: str) -> None:
+        compiled, rows = self._pending[table]
+        self._write([(table, (compiled, rows))])
+        del self._pending[table]
+        self._pending_count -= len(rows)
+
+    def _write(self, batches: List[Tuple[str, Tuple[CompiledInsert, List[tuple]]]]) -> int:
+        """Insert the batches in one transaction; stats are updated after the commit."""
+        written = []
+        with self.conn:
+            for table, (compiled, rows) in batches:
+                started = time.perf_counter()
+                inserted = compiled.execute(self.conn, rows)
+                written.append((table, inserted, time.perf_counter() - started))
+        for table, inserted, seconds in written:
+            stats = self._stats(table)
+            stats.seconds += seconds
+            stats.inserted += inserted
+            stats.batches += 1
+        return sum(inserted for _, inserted, _ in written)
+
+    def _stats(self, table: str) -> TableWriteStats:
+        stats = self.stats.get(table)
+        if stats is None:
+            stats = self.stats[table] = TableWriteStats()
+        return stats
+
+    def discard(self) -> None:
+        """Drop pending rows without writing them."""
+        self._pending = {}
+        self._pending_count = 0
+
+    def __enter__(self) -> "BatchWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # Rows queued before an error are kept, as with per-call inserts
+        if exc_type is None:
+            self.flush()
+        else:
+            with suppress(sqlite3.Error):
+                self.flush()
@@ -158,6 +158,7 @@ def get_browser_history(
     browser: Optional[str] = None,
     profile: Optional[str] = None,
     url_filter: Optional[str] = None,
+    title_filter: Optional[str] = None,
     limit: int = 5000,
 ) -> List[Dict[str, Any]]:
     """
@@ -169,6 +170,8 @@ def get_browser_history(
         browser: Optional browser filter (exact match)
         profile: Optional profile filter (exact match)
         url_filter: Optional URL substring filter (LIKE)
+        title_filter: Optional title substring filter (LIKE, uses the
+            full-text index when built)
         limit: Maximum rows to return
 
     Returns:
@@ -181,6 +184,8 @@ def get_browser_history(
         filters["profile"] = (FilterOp.EQ, profile)
     if url_filter:
         filters["url"] = (FilterOp.LIKE, f"%{url_filter}%")
+    if title_filter:
+        filters["title"] = (FilterOp.LIKE, f"%{title_filter}%")
 
     return get_rows(
         conn,
@@ -10,12 +10,13 @@ from __future__ import annotations
 
 import sqlite3
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 __all__ = [
     "insert_download",
     "update_download_status",
     "update_download_image_metadata",
+    "update_download_image_metadata_batch",
     "get_download",
     "get_download_by_path",
     "get_downloads",
@@ -208,6 +209,59 @@ def update_download_image_metadata(
     conn.execute(sql, params)
 
 
+def update_download_image_metadata_batch(
+    conn: sqlite3.Connection,
+    evidence_id: int,
+    records: Iterable[Dict[str, Any]],
+) -> int:
+    """
+    Update image metadata for many downloads with a single executemany().
+
+    Each record holds ``download_id`` and any of ``phash``, ``exif_json``,
+    ``width``, ``height``, ``md5``, ``sha256``. As with
+    update_download_image_metadata, missing or None values leave the column
+    unchanged. Hashes only fill empty columns and never overwrite the hashes
+    recorded at download time.
+
+    Args:
+        conn: SQLite connection to evidence database
+        evidence_id: Evidence ID
+        records: Metadata records
+
+    Returns:
+        Number of records submitted
+    """
+    rows = [
+        (
+            r.get("phash"),
+            r.get("exif_json"),
+            r.get("width"),
+            r.get("height"),
+            r.get("md5"),
+            r.get("sha256"),
+            r["download_id"],
+            evidence_id,
+        )
+        for r in records
+    ]
+    if not rows:
+        return 0
+    conn.executemany(
+        """
+        UPDATE downloads SET
+            phash = COALESCE(?, phash),
+            exif_json = COALESCE(?, exif_json),
+            width = COALESCE(?, width),
+            height = COALESCE(?, height),
+            md5 = COALESCE(md5, ?),
+            sha256 = COALESCE(sha256, ?)
+        WHERE id = ? AND evidence_id = ?
+        """,
+        rows,
+    )
+    return len(rows)
+
+
 def get_download(
     conn: sqlite3.Connection,
     evidence_id: int,
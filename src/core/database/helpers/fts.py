@@ -0,0 +1,286 @@
+"""
+Full-text (FTS5 trigram) search index helpers.
+
+Substring searches such as ``url LIKE '%term%'`` cannot use a B-tree index,
+so on large evidence databases they scan the whole table. This module
+maintains optional FTS5 tables with the ``trigram`` tokenizer over the
+columns users search by substring:
+
+    urls.url, browser_history.title, file_list.file_path (+ file_name),
+    local_storage.value, autofill.value
+
+Each index is an external-content FTS5 table (``<table>_fts``) whose rowid
+is the source row id. It is built after ingestion (:func:`ensure_fts_indexes`)
+and from then on kept in sync by AFTER INSERT/DELETE/UPDATE triggers.
+
+The trigram tokenizer answers ``LIKE`` directly from the index, and SQLite
+still evaluates the LIKE against the stored value, so routing a query through
+:func:`fts_like_condition` returns exactly the rows the plain LIKE would.
+When the index is missing (not built yet, or SQLite lacks FTS5/trigram) the
+callers fall back to the plain LIKE.
+"""
+from __future__ import annotations
+
+import re
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Source table -> indexed text columns
+FTS_INDEXED_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "urls": ("url",),
+    "browser_history": ("title",),
+    "file_list": ("file_path", "file_name"),
+    "local_storage": ("value",),
+    "autofill": ("value",),
+}
+
+# Trigram queries need at least one literal run of this many characters;
+# shorter patterns scan the whole FTS table and are no faster than LIKE.
+FTS_MIN_TERM_LENGTH = 3
+
+_LIKE_WILDCARDS_RE = re.compile(r"[%_]+")
+
+_trigram_supported: Optional[bool] = None
+
+
+def fts_table_name(table: str) -> str:
+    """Return the FTS5 index table name for a source table."""
+    return f"{table}_fts"
+
+
+def _trigger_names(table: str) -> Tuple[str, str, str]:
+    base = f"trg_{table}_fts"
+    return f"{base}_ai", f"{base}_ad", f"{base}_au"
+
+
+def _check_table(table: str) -> Tuple[str, ...]:
+    try:
+        return FTS_INDEXED_COLUMNS[table]
+    except KeyError:
+        raise ValueError(f"No full-text index defined for table '{table}'") from None
+
+
+def fts_trigram_available(conn: sqlite3.Connection) -> bool:
+    """
+    Check whether the linked SQLite supports FTS5 with the trigram tokenizer.
+
+    The trigram tokenizer needs SQLite >= 3.34. The result is cached for the
+    process since every connection uses the same library.
+    """
+    global _trigram_supported
+    if _trigram_supported is None:
+        try:
+            conn.execute(
+                "CREATE VIRTUAL TABLE temp._fts_trigram_probe USING fts5(x, tokenize='trigram')"
+            )
+            conn.execute("DROP TABLE temp._fts_trigram_probe")
+            _trigram_supported = True
+        except sqlite3.OperationalError:
+            _trigram_supported = False
+    return _trigram_supported
+
+
+def has_fts_index(conn: sqlite3.Connection, table: str) -> bool:
+    """
+    Return True if a usable, trigger-maintained FTS index exists for ``table``.
+
+    An index whose triggers are gone (e.g. the source table was recreated by
+    an upgrade) may be stale and is reported as missing.
+    """
+    if table not in FTS_INDEXED_COLUMNS:
+        return False
+    insert_trigger = _trigger_names(table)[0]
+    row = conn.execute(
+        """
+        SELECT
+            (SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?),
+            (SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?)
+        """,
+        (fts_table_name(table), insert_trigger),
+    ).fetchone()
+    return bool(row and row[0] and row[1])
+
+
+def build_fts_index(conn: sqlite3.Connection, table: str) -> bool:
+    """
+    Create (or recreate) the FTS index for ``table`` and populate it.
+
+    Drops any previous index for the table, installs the sync triggers and
+    populates the index with the FTS5 ``rebuild`` command.
+
+    Args:
+        conn: Evidence database connection
+        table: Source table name (key of FTS_INDEXED_COLUMNS)
+
+    Returns:
+        True if the index was built, False if FTS5/trigram is unavailable
+    """
+    columns = _check_table(table)
+    if not fts_trigram_available(conn):
+        return False
+
+    fts = fts_table_name(table)
+    ai, ad, au = _trigger_names(table)
+    col_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+
+    with conn:
+        _drop_objects(conn, table)
+        conn.execute(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5("
+            f"{col_list}, content='{table}', content_rowid='id', tokenize='trigram')"
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER {ai} AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts}(rowid, {col_list}) VALUES (new.id, {new_values});
+            END
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER {ad} AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {col_list}) VALUES ('delete', old.id, {old_values});
+            END
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER {au} AFTER UPDATE OF {col_list} ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {col_list}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO {fts}(rowid, {col_list}) VALUES (new.id, {new_values});
+            END
+            """
+        )
+        conn.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+    return True
+
+
+def _drop_objects(conn: sqlite3.Connection, table: str) -> None:
+    for trigger in _trigger_names(table):
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    conn.execute(f"DROP TABLE IF EXISTS {fts_table_name(table)}")
+
+
+def drop_fts_index(conn: sqlite3.Connection, table: str) -> None:
+    """Remove the FTS index and its triggers for ``table`` (no-op if absent)."""
+    _check_table(table)
+    with conn:
+        _drop_objects(conn, table)
+
+
+def ensure_fts_indexes(
+    conn: sqlite3.Connection,
+    tables: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """
+    Build every missing FTS index whose source table exists.
+
+    Existing indexes are left alone; their triggers keep them current.
+    Intended to run after an ingestion batch.
+
+    Args:
+        conn: Evidence database connection
+        tables: Source tables to consider (default: all of FTS_INDEXED_COLUMNS)
+
+    Returns:
+        Names of the source tables whose index was built
+    """
+    if not fts_trigram_available(conn):
+        return []
+
+    wanted = list(tables) if tables is not None else list(FTS_INDEXED_COLUMNS)
+    existing = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    built: List[str] = []
+    for table in wanted:
+        _check_table(table)
+        if table not in existing or has_fts_index(conn, table):
+            continue
+        if build_fts_index(conn, table):
+            built.append(table)
+    return built
+
+
+def _pattern_uses_index(pattern: str) -> bool:
+    """True if a LIKE pattern has a literal run long enough for trigram lookup."""
+    return any(
+        len(part) >= FTS_MIN_TERM_LENGTH for part in _LIKE_WILDCARDS_RE.split(pattern)
+    )
+
+
+def fts_like_condition(
+    conn: sqlite3.Connection,
+    table: str,
+    column: str,
+    pattern: Optional[str],
+    *,
+    id_expr: str = "id",
+) -> Optional[str]:
+    """
+    Return an FTS-backed SQL condition equivalent to ``column LIKE ?``.
+
+    The returned fragment takes ``pattern`` as its single parameter, e.g.
+    ``"u.id IN (SELECT rowid FROM urls_fts WHERE url LIKE ?)"``.
+
+    Args:
+        conn: Evidence database connection
+        table: Source table name
+        column: Indexed column of ``table``
+        pattern: SQL LIKE pattern
+        id_expr: Expression for the source row id in the outer query
+
+    Returns:
+        SQL fragment, or None when the caller should use a plain LIKE
+        (no index, column not indexed, or pattern too short to benefit)
+    """
+    if not pattern or column not in FTS_INDEXED_COLUMNS.get(table, ()):
+        return None
+    if not _pattern_uses_index(pattern):
+        return None
+    if not has_fts_index(conn, table):
+        return None
+    return f"{id_expr} IN (SELECT rowid FROM {fts_table_name(table)} WHERE {column} LIKE ?)"
+
+
+def fts_like_any_condition(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: Tuple[str, ...],
+    pattern: Optional[str],
+    *,
+    id_expr: str = "id",
+) -> Optional[str]:
+    """
+    FTS-backed equivalent of ``(col1 LIKE ? OR col2 LIKE ? ...)``.
+
+    Each column is looked up separately and the row ids are combined with
+    UNION (an OR across FTS columns would not use the index). The fragment
+    takes ``pattern`` once per column.
+
+    Returns:
+        SQL fragment, or None when the caller should use plain LIKEs
+    """
+    if not columns or any(c not in FTS_INDEXED_COLUMNS.get(table, ()) for c in columns):
+        return None
+    if not pattern or not _pattern_uses_index(pattern) or not has_fts_index(conn, table):
+        return None
+    fts = fts_table_name(table)
+    lookups = " UNION ".join(f"SELECT rowid FROM {fts} WHERE {c} LIKE ?" for c in columns)
+    return f"{id_expr} IN ({lookups})"
+
+
+__all__ = [
+    "FTS_INDEXED_COLUMNS",
+    "FTS_MIN_TERM_LENGTH",
+    "build_fts_index",
+    "drop_fts_index",
+    "ensure_fts_indexes",
+    "fts_like_any_condition",
+    "fts_like_condition",
+    "fts_table_name",
+    "fts_trigram_available",
+    "has_fts_index",
+]
@@ -2,10 +2,11 @@
 Generic database CRUD helpers.
 
 This module provides generic operations for TableSchema-based tables:
-- insert_rows: Batch insert
+- insert_rows: Batch insert (one transaction per call)
 - insert_row: Single row insert
 - get_rows: Generic SELECT with filtering/pagination
 - delete_by_run: Run-based deletion for re-ingestion
+- bump_data_version: Mark artifact data as changed (report render cache)
 - get_distinct_values: DISTINCT column values
 - get_count: Row count with optional filters
 
@@ -17,7 +18,9 @@ from contextlib import contextmanager
 import sqlite3
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-from ..schema import ConflictAction, FilterOp, FilterSpec, OrderColumn, TableSchema
+from ..schema import FilterOp, FilterSpec, OrderColumn, TableSchema
+from .batch_writer import compile_insert
+from .fts import fts_like_condition
 
 
 @contextmanager
@@ -81,41 +84,19 @@ def insert_rows(
     evidence_id: int,
     records: Iterable[Dict[str, Any]],
 ) -> int:
-    """Generic batch insert for any artifact table."""
-    columns = [c.name for c in schema.columns if c.name != "id"]
-    placeholders = ", ".join("?" * len(columns))
-    column_names = ", ".join(columns)
-
-    if schema.conflict_action == ConflictAction.FAIL:
-        insert_sql = f"INSERT INTO {schema.name}"
-    else:
-        insert_sql = f"INSERT OR {schema.conflict_action} INTO {schema.name}"
-
-    rows = []
-    for record in records:
-        if schema.pre_insert_hook:
-            record = schema.pre_insert_hook(record)
-        row: List[Any] = []
-        for col in schema.columns:
-            if col.name == "id":
-                continue
-            if col.name == "evidence_id":
-                row.append(evidence_id)
-            else:
-                key = col.dict_key or col.name
-                row.append(record.get(key, col.default))
-        rows.append(tuple(row))
+    """
+    Generic batch insert for any artifact table.
 
+    Commits the batch in its own transaction. For many small batches use
+    BatchWriter, which shares the compiled statement but groups the writes.
+    """
+    compiled = compile_insert(schema)
+    rows = compiled.build_rows(evidence_id, records)
     if not rows:
         return 0
 
-    before = conn.total_changes
     with conn:
-        conn.executemany(
-            f"{insert_sql} ({column_names}) VALUES ({placeholders})",
-            rows,
-        )
-    return conn.total_changes - before
+        return compiled.execute(conn, rows)
 
 
 def insert_row(
@@ -127,42 +108,32 @@ def insert_row(
     commit: bool = False,
 ) -> int:
     """Generic single-row insert with optional commit."""
-    columns = [c.name for c in schema.columns if c.name != "id"]
-    placeholders = ", ".join("?" * len(columns))
-    column_names = ", ".join(columns)
-
-    if schema.conflict_action == ConflictAction.FAIL:
-        insert_sql = f"INSERT INTO {schema.name}"
-    else:
-        insert_sql = f"INSERT OR {schema.conflict_action} INTO {schema.name}"
-
-    if schema.pre_insert_hook:
-        record = schema.pre_insert_hook(record)
-
-    row: List[Any] = []
-    for col in schema.columns:
-        if col.name == "id":
-            continue
-        if col.name == "evidence_id":
-            row.append(evidence_id)
-        else:
-            key = col.dict_key or col.name
-            row.append(record.get(key, col.default))
+    compiled = compile_insert(schema)
+    row = compiled.build_rows(evidence_id, (record,))[0]
 
     if commit:
         with conn:
-            cursor = conn.execute(
-                f"{insert_sql} ({column_names}) VALUES ({placeholders})",
-                row,
-            )
+            cursor = conn.execute(compiled.sql, row)
     else:
-        cursor = conn.execute(
-            f"{insert_sql} ({column_names}) VALUES ({placeholders})",
-            row,
-        )
+        cursor = conn.execute(compiled.sql, row)
     return cursor.lastrowid
 
 
+def _filter_condition(
+    conn: sqlite3.Connection,
+    schema: TableSchema,
+    col: str,
+    op: FilterOp,
+    val: Any,
+) -> str:
+    """Build a single-parameter WHERE condition; LIKE uses the FTS index when built."""
+    if op == FilterOp.LIKE:
+        fts_condition = fts_like_condition(conn, schema.name, col, val)
+        if fts_condition:
+            return fts_condition
+    return f"{col} {op} ?"
+
+
 def get_rows(
     conn: sqlite3.Connection,
     schema: TableSchema,
@@ -197,7 +168,7 @@ def get_rows(
                 sql += f" AND {col} IN ({placeholders})"
                 params.extend(val)
             else:
-                sql += f" AND {col} {op} ?"
+                sql += f" AND {_filter_condition(conn, schema, col, op, val)}"
                 params.append(val)
 
     sql += _build_order_clause(schema, order_by, order_dir)
@@ -226,13 +197,29 @@ def delete_by_run(
     if not schema.supports_run_delete:
         raise ValueError(f"Table {schema.name} does not support run-based deletion")
 
-    before = conn.total_changes
     with conn:
-        conn.execute(
+        cursor = conn.execute(
             f"DELETE FROM {schema.name} WHERE evidence_id = ? AND run_id = ?",
             (evidence_id, run_id),
         )
-    return conn.total_changes - before
+        if cursor.rowcount > 0:
+            bump_data_version(conn)
+    return cursor.rowcount
+
+
+def bump_data_version(conn: sqlite3.Connection) -> None:
+    """
+    Bump the evidence data_version counter once for a bulk delete.
+
+    The bulk artifact tables have no per-row delete trigger; without this a
+    purge followed by re-ingestion of as many rows (reusing the same rowids)
+    would leave the report render cache key unchanged.
+    """
+    try:
+        conn.execute("UPDATE data_version SET version = version + 1 WHERE id = 1")
+    except sqlite3.OperationalError:
+        # Evidence database predates the data_version table
+        pass
 
 
 def get_distinct_values(
@@ -269,7 +256,7 @@ def get_count(
                 raise ValueError(f"Column '{col}' not filterable on table '{schema.name}'")
             if op not in allowed_filters[col]:
                 raise ValueError(f"Operator '{op}' not allowed for column '{col}'")
-            sql += f" AND {col} {op} ?"
+            sql += f" AND {_filter_condition(conn, schema, col, op, val)}"
             params.append(val)
 
     cursor = conn.execute(sql, params)
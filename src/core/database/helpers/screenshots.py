@@ -9,13 +9,14 @@ from __future__ import annotations
 
 import sqlite3
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from ..schema import FilterOp, TABLE_SCHEMAS
-from .generic import get_rows, insert_row
+from .generic import get_rows, insert_row, insert_rows
 
 __all__ = [
     "insert_screenshot",
+    "insert_screenshots",
     "update_screenshot",
     "delete_screenshot",
     "get_screenshot",
@@ -101,6 +102,38 @@ def insert_screenshot(
     return cursor.fetchone()[0]
 
 
+def insert_screenshots(
+    conn: sqlite3.Connection,
+    evidence_id: int,
+    records: Iterable[Dict[str, Any]],
+) -> int:
+    """
+    Insert several screenshot records in one transaction.
+
+    Used by bulk imports. Records take the keyword arguments of
+    insert_screenshot as keys (dest_path and filename are required).
+
+    Args:
+        conn: SQLite connection to evidence database
+        evidence_id: Evidence ID
+        records: Screenshot records
+
+    Returns:
+        Number of inserted screenshots
+    """
+    now_utc = datetime.now(timezone.utc).isoformat()
+    rows = [
+        {
+            **record,
+            "captured_at_utc": record.get("captured_at_utc") or now_utc,
+            "created_at_utc": now_utc,
+            "updated_at_utc": None,
+        }
+        for record in records
+    ]
+    return insert_rows(conn, TABLE_SCHEMAS["screenshots"], evidence_id, rows)
+
+
 def update_screenshot(
     conn: sqlite3.Connection,
     evidence_id: int,
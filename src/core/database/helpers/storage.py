@@ -107,14 +107,17 @@ def get_local_storage(
     *,
     browser: Optional[str] = None,
     origin: Optional[str] = None,
+    value: Optional[str] = None,
     limit: int = 5000,
 ) -> List[Dict[str, Any]]:
-    """Retrieve local storage entries for an evidence."""
+    """Retrieve local storage entries for an evidence (``value`` is a substring filter)."""
     filters: Dict[str, Any] = {}
     if browser:
         filters["browser"] = (FilterOp.EQ, browser)
     if origin:
         filters["origin"] = (FilterOp.LIKE, f"%{origin}%")
+    if value:
+        filters["value"] = (FilterOp.LIKE, f"%{value}%")
     return get_rows(conn, TABLE_SCHEMAS["local_storage"], evidence_id, filters=filters or None, limit=limit)
 
 
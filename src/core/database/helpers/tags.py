@@ -8,8 +8,26 @@ Created as part of CaseDataAccess refactor (Block 8).
 """
 from __future__ import annotations
 
+import re
 import sqlite3
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+# Rows per executemany() chunk for bulk tag operations. Progress and cancel
+# checks run between chunks; the surrounding transaction spans all chunks.
+BULK_TAG_CHUNK_SIZE = 5000
+
+# Max host parameters per IN (...) lookup (stays below SQLITE_MAX_VARIABLE_NUMBER
+# on old SQLite builds).
+_IN_CLAUSE_CHUNK = 900
+
+# SQLite VM instructions between cancel checks for set-based statements.
+_CANCEL_CHECK_OPS = 10_000
+
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class BulkTagCancelled(Exception):
+    """Raised when a bulk tag operation is cancelled via its cancel_check."""
 
 
 # -----------------------------------------------------------------------------
@@ -428,6 +446,299 @@ def merge_tag_associations(
     conn.execute(delete_sql, source_tag_ids)
 
 
+# -----------------------------------------------------------------------------
+# Bulk Tag Association Operations
+# -----------------------------------------------------------------------------
+
+def _chunked(values: Sequence[int], size: int) -> Iterable[Sequence[int]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _run_chunked(
+    conn: sqlite3.Connection,
+    sql: str,
+    rows_for_chunk: Callable[[Sequence[int]], Iterable[tuple]],
+    artifact_ids: Sequence[int],
+    chunk_size: int,
+    progress_callback: Optional[Callable[[int, int], None]],
+    cancel_check: Optional[Callable[[], bool]],
+) -> None:
+    """Run ``sql`` via executemany over ``artifact_ids`` in chunks."""
+    total = len(artifact_ids)
+    done = 0
+    for chunk in _chunked(artifact_ids, chunk_size):
+        if cancel_check and cancel_check():
+            raise BulkTagCancelled(f"Cancelled after {done}/{total} artifacts")
+        conn.executemany(sql, rows_for_chunk(chunk))
+        done += len(chunk)
+        if progress_callback:
+            progress_callback(done, total)
+
+
+def insert_tag_associations_bulk(
+    conn: sqlite3.Connection,
+    tag_id: int,
+    evidence_id: int,
+    artifact_type: str,
+    artifact_ids: Iterable[int],
+    tagged_by: str = "manual",
+    *,
+    chunk_size: int = BULK_TAG_CHUNK_SIZE,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_check: Optional[Callable[[], bool]] = None,
+) -> int:
+    """
+    Tag many artifacts with one tag using chunked executemany.
+
+    Uses INSERT OR IGNORE, so already-tagged artifacts are skipped. Does not
+    commit; callers wrap the call in a single transaction.
+
+    Args:
+        conn: Evidence database connection
+        tag_id: Tag ID
+        evidence_id: Evidence ID
+        artifact_type: Artifact type ('url', 'image', 'file_list', etc.)
+        artifact_ids: Artifact IDs (duplicates are collapsed)
+        tagged_by: Tagger identifier
+        chunk_size: Rows per executemany() call
+        progress_callback: Optional callback(done, total) after each chunk
+        cancel_check: Optional callable; returning True raises BulkTagCancelled
+
+    Returns:
+        Number of new associations created
+    """
+    ids = sorted(set(artifact_ids))
+    if not ids:
+        return 0
+    sql = """
+        INSERT OR IGNORE INTO tag_associations
+        (tag_id, evidence_id, artifact_type, artifact_id, tagged_by)
+        VALUES (?, ?, ?, ?, ?)
+    """
+    before = _count_tag_associations(conn, tag_id)
+    _run_chunked(
+        conn,
+        sql,
+        lambda chunk: ((tag_id, evidence_id, artifact_type, aid, tagged_by) for aid in chunk),
+        ids,
+        chunk_size,
+        progress_callback,
+        cancel_check,
+    )
+    return _count_tag_associations(conn, tag_id) - before
+
+
+def delete_tag_associations_bulk(
+    conn: sqlite3.Connection,
+    tag_id: int,
+    artifact_type: str,
+    artifact_ids: Iterable[int],
+    *,
+    chunk_size: int = BULK_TAG_CHUNK_SIZE,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_check: Optional[Callable[[], bool]] = None,
+) -> int:
+    """
+    Remove one tag from many artifacts using chunked executemany.
+
+    Does not commit; callers wrap the call in a single transaction.
+
+    Args:
+        conn: Evidence database connection
+        tag_id: Tag ID
+        artifact_type: Artifact type
+        artifact_ids: Artifact IDs
+        chunk_size: Rows per executemany() call
+        progress_callback: Optional callback(done, total) after each chunk
+        cancel_check: Optional callable; returning True raises BulkTagCancelled
+
+    Returns:
+        Number of associations removed
+    """
+    ids = sorted(set(artifact_ids))
+    if not ids:
+        return 0
+    sql = """
+        DELETE FROM tag_associations
+        WHERE tag_id = ? AND artifact_type = ? AND artifact_id = ?
+    """
+    before = _count_tag_associations(conn, tag_id)
+    _run_chunked(
+        conn,
+        sql,
+        lambda chunk: ((tag_id, artifact_type, aid) for aid in chunk),
+        ids,
+        chunk_size,
+        progress_callback,
+        cancel_check,
+    )
+    return before - _count_tag_associations(conn, tag_id)
+
+
+def _count_tag_associations(conn: sqlite3.Connection, tag_id: int) -> int:
+    row = conn.execute(
+        "SELECT COUNT(*) FROM tag_associations WHERE tag_id = ?", (tag_id,)
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+def _check_identifier(name: str) -> str:
+    if not _IDENTIFIER_RE.match(name):
+        raise ValueError(f"Invalid table name: {name!r}")
+    return name
+
+
+def _run_interruptible(
+    conn: sqlite3.Connection,
+    sql: str,
+    params: Sequence[Any],
+    cancel_check: Optional[Callable[[], bool]],
+) -> None:
+    """Execute a single set-based statement, aborting it if cancel_check fires."""
+    if cancel_check is None:
+        conn.execute(sql, params)
+        return
+    if cancel_check():
+        raise BulkTagCancelled("Cancelled before set-based tag statement")
+
+    conn.set_progress_handler(lambda: 1 if cancel_check() else 0, _CANCEL_CHECK_OPS)
+    try:
+        conn.execute(sql, params)
+    except sqlite3.OperationalError as exc:
+        if "interrupt" in str(exc).lower():
+            raise BulkTagCancelled("Cancelled during set-based tag statement") from exc
+        raise
+    finally:
+        conn.set_progress_handler(None, 0)
+
+
+def tag_artifacts_where(
+    conn: sqlite3.Connection,
+    tag_id: int,
+    evidence_id: int,
+    artifact_type: str,
+    table_name: str,
+    where_sql: str,
+    params: Sequence[Any] = (),
+    tagged_by: str = "manual",
+    *,
+    cancel_check: Optional[Callable[[], bool]] = None,
+) -> int:
+    """
+    Tag every artifact in ``table_name`` matching a filter predicate.
+
+    Runs a single ``INSERT OR IGNORE ... SELECT`` so the matching rows never
+    leave SQLite. Does not commit.
+
+    Args:
+        conn: Evidence database connection
+        tag_id: Tag ID
+        evidence_id: Evidence ID
+        artifact_type: Artifact type stored in tag_associations
+        table_name: Artifact table (rows addressed by ``id``)
+        where_sql: SQL predicate over the artifact table (alias ``a``),
+            e.g. ``"a.domain = ?"``; use placeholders for values
+        params: Parameters for ``where_sql``
+        tagged_by: Tagger identifier
+        cancel_check: Optional callable; returning True aborts the statement
+            and raises BulkTagCancelled
+
+    Returns:
+        Number of new associations created
+    """
+    table = _check_identifier(table_name)
+    sql = f"""
+        INSERT OR IGNORE INTO tag_associations
+        (tag_id, evidence_id, artifact_type, artifact_id, tagged_by)
+        SELECT ?, ?, ?, a.id, ?
+        FROM {table} a
+        WHERE a.evidence_id = ? AND ({where_sql or "1"})
+    """
+    before = _count_tag_associations(conn, tag_id)
+    _run_interruptible(
+        conn,
+        sql,
+        [tag_id, evidence_id, artifact_type, tagged_by, evidence_id, *params],
+        cancel_check,
+    )
+    return _count_tag_associations(conn, tag_id) - before
+
+
+def untag_artifacts_where(
+    conn: sqlite3.Connection,
+    tag_id: int,
+    evidence_id: int,
+    artifact_type: str,
+    table_name: str,
+    where_sql: str,
+    params: Sequence[Any] = (),
+    *,
+    cancel_check: Optional[Callable[[], bool]] = None,
+) -> int:
+    """
+    Remove a tag from every artifact in ``table_name`` matching a predicate.
+
+    Counterpart of tag_artifacts_where(); runs a single DELETE with a
+    sub-select. Does not commit.
+
+    Returns:
+        Number of associations removed
+    """
+    table = _check_identifier(table_name)
+    sql = f"""
+        DELETE FROM tag_associations
+        WHERE tag_id = ? AND artifact_type = ?
+          AND artifact_id IN (
+              SELECT a.id FROM {table} a
+              WHERE a.evidence_id = ? AND ({where_sql or "1"})
+          )
+    """
+    before = _count_tag_associations(conn, tag_id)
+    _run_interruptible(
+        conn,
+        sql,
+        [tag_id, artifact_type, evidence_id, *params],
+        cancel_check,
+    )
+    return before - _count_tag_associations(conn, tag_id)
+
+
+def get_tags_for_artifacts(
+    conn: sqlite3.Connection,
+    evidence_id: int,
+    artifact_type: str,
+    artifact_ids: Sequence[int],
+) -> List[Dict[str, Any]]:
+    """
+    Get the distinct tags applied to any of the given artifacts.
+
+    Args:
+        conn: Evidence database connection
+        evidence_id: Evidence ID
+        artifact_type: Artifact type
+        artifact_ids: Artifact IDs
+
+    Returns:
+        List of tag dicts with keys: id, name, name_normalized
+    """
+    tags: Dict[int, Dict[str, Any]] = {}
+    ids = list(artifact_ids)
+    for chunk in _chunked(ids, _IN_CLAUSE_CHUNK):
+        placeholders = ",".join("?" for _ in chunk)
+        sql = f"""
+            SELECT DISTINCT t.id, t.name, t.name_normalized
+            FROM tag_associations ta
+            JOIN tags t ON t.id = ta.tag_id
+            WHERE ta.evidence_id = ?
+              AND ta.artifact_type = ?
+              AND ta.artifact_id IN ({placeholders})
+        """
+        for row in conn.execute(sql, [evidence_id, artifact_type, *chunk]):
+            tags[row["id"]] = dict(row)
+    return sorted(tags.values(), key=lambda t: t["name"])
+
+
 # -----------------------------------------------------------------------------
 # Tag-Based Artifact Queries
 # -----------------------------------------------------------------------------
@@ -546,6 +857,14 @@ __all__ = [
     "get_tag_strings_for_artifacts",
     "get_artifacts_by_tag_id",
     "merge_tag_associations",
+    # Bulk tag associations
+    "BULK_TAG_CHUNK_SIZE",
+    "BulkTagCancelled",
+    "insert_tag_associations_bulk",
+    "delete_tag_associations_bulk",
+    "tag_artifacts_where",
+    "untag_artifacts_where",
+    "get_tags_for_artifacts",
     # Tag-based queries
     "query_artifacts_by_tags",
     "query_all_tagged_artifacts",
@@ -14,10 +14,14 @@ from __future__ import annotations
 import re
 import sqlite3
 import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional, Sequence, Set
 
+from .bulk_ingest import BULK_INGEST_TABLES, bulk_ingest, restore_deferred_indexes
 from .connection import init_db, migrate
+from .helpers.artifact_counts import ensure_artifact_counters
+from .read_pool import ReadConnectionPool
 from core.logging import get_logger
 
 __all__ = [
@@ -171,6 +175,10 @@ class DatabaseManager:
         # Key: (thread_id, db_path_str), Value: sqlite3.Connection
         self._conn_cache: Dict[tuple, sqlite3.Connection] = {}
         self._cache_lock = threading.Lock()
+        # Read-only connections for UI/report queries
+        self._read_pool = ReadConnectionPool()
+        # Evidence databases known to be created and migrated
+        self._read_ready: Set[str] = set()
         ensure_case_structure(self.case_folder)
 
     def __enter__(self) -> "DatabaseManager":
@@ -205,6 +213,54 @@ class DatabaseManager:
         db_path = self.evidence_db_path(evidence_id, label)
         return self._get_or_create_conn(db_path, init_case=False, evidence_id=evidence_id)
 
+    @contextmanager
+    def read_case_conn(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled read-only connection to the case database."""
+        key = str(self._case_db_path)
+        if key not in self._read_ready:
+            self.get_case_conn()
+            self._read_ready.add(key)
+        with self._read_pool.connection(self._case_db_path) as conn:
+            yield conn
+
+    @contextmanager
+    def read_evidence_conn(
+        self,
+        evidence_id: int,
+        label: Optional[str] = None,
+    ) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a pooled read-only connection to an evidence database.
+
+        The first use of a database goes through get_evidence_conn() so the
+        file is created and migrated before it is opened read-only.
+        """
+        if not self.enable_split:
+            with self.read_case_conn() as conn:
+                yield conn
+            return
+
+        db_path = self.evidence_db_path(evidence_id, label)
+        key = str(db_path.resolve())
+        if key not in self._read_ready:
+            self.get_evidence_conn(evidence_id, label)
+            self._read_ready.add(key)
+        with self._read_pool.connection(db_path) as conn:
+            yield conn
+
+    def evidence_bulk_ingest(
+        self,
+        evidence_id: int,
+        label: Optional[str] = None,
+        tables: Sequence[str] = BULK_INGEST_TABLES,
+    ):
+        """
+        Bulk ingest mode for the evidence connection of this thread.
+
+        Returns a context manager; see core.database.bulk_ingest.bulk_ingest.
+        """
+        return bulk_ingest(self.get_evidence_conn(evidence_id, label), tables)
+
     def evidence_db_path(
         self,
         evidence_id: int,
@@ -274,6 +330,8 @@ class DatabaseManager:
                     LOGGER.warning("Error closing connection %s: %s", key[1], e)
             for key in keys_to_remove:
                 self._conn_cache.pop(key, None)
+        self._read_pool.close_all()
+        self._read_ready.clear()
 
     def close_thread_connections(self) -> None:
         """
@@ -363,6 +421,14 @@ class DatabaseManager:
             _ensure_browser_history_forensic_columns(conn)
             # Ensure  columns exist (handles pre- upgrade path)
             _ensure_autofill_enhancement_columns(conn)
+            # Ensure file_list annotation side table + triggers exist
+            _ensure_file_list_annotations(conn)
+            # Ensure report render cache (data_version) triggers exist
+            _ensure_data_version_triggers(conn)
+            # Rebuild indexes left deferred by an interrupted bulk load
+            restore_deferred_indexes(conn)
+            # Seed artifact counters (first open) and fold rows added since the last open
+            ensure_artifact_counters(conn)
 
         # Cache the connection
         with self._cache_lock:
@@ -857,3 +923,236 @@ def _assert_evidence_baseline(conn: sqlite3.Connection, db_path: Path) -> None:
         raise RuntimeError(
             f"Evidence database {db_path} is missing baseline tables {missing}; start a fresh case."
         )
+
+
+# File list annotations: pre-aggregated tags/matches per file_list row.
+#
+# The File List tab shows a comma-joined "Matches" and "Tags" string per row.
+# Building those with GROUP_CONCAT per painted row issued thousands of tiny
+# queries per page; this side table holds the pre-joined strings so a page
+# needs a single `file_list_id IN (...)` lookup.
+#
+# Rows are sparse: a file without matches and tags has no row. Triggers on
+# file_list_matches, tag_associations (artifact_type = 'file_list'), tag
+# renames and file_list deletes recompute the affected rows, so the table is
+# always exact.
+_FILE_LIST_ANNOTATIONS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS file_list_annotations (
+    file_list_id INTEGER PRIMARY KEY,
+    evidence_id INTEGER NOT NULL,
+    matches TEXT,
+    tags TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_file_list_annotations_evidence ON file_list_annotations(evidence_id);
+"""
+
+_FILE_LIST_ANNOTATIONS_BACKFILL_SQL = """
+INSERT OR REPLACE INTO file_list_annotations (file_list_id, evidence_id, matches, tags)
+SELECT
+    fl.id,
+    fl.evidence_id,
+    (SELECT GROUP_CONCAT(m.reference_list_name) FROM file_list_matches m WHERE m.file_list_id = fl.id),
+    (SELECT GROUP_CONCAT(t.name, ', ')
+       FROM tag_associations ta JOIN tags t ON t.id = ta.tag_id
+      WHERE ta.artifact_type = 'file_list' AND ta.artifact_id = fl.id)
+FROM file_list fl
+WHERE fl.id IN (
+    SELECT file_list_id FROM file_list_matches
+    UNION
+    SELECT artifact_id FROM tag_associations WHERE artifact_type = 'file_list'
+);
+"""
+
+_FILE_LIST_ANNOTATIONS_TRIGGERS_SQL = """
+-- Match changes
+CREATE TRIGGER IF NOT EXISTS trg_file_list_annotations_match_insert
+AFTER INSERT ON file_list_matches
+BEGIN
+    DELETE FROM file_list_annotations WHERE file_list_id = NEW.file_list_id;
+    INSERT INTO file_list_annotations (file_list_id, evidence_id, matches, tags)
+    SELECT NEW.file_list_id, NEW.evidence_id, agg.matches, agg.tags
+    FROM (
+        SELECT
+            (SELECT GROUP_CONCAT(m.reference_list_name) FROM file_list_matches m
+              WHERE m.file_list_id = NEW.file_list_id) AS matches,
+            (SELECT GROUP_CONCAT(t.name, ', ')
+               FROM tag_associations ta JOIN tags t ON t.id = ta.tag_id
+              WHERE ta.artifact_type = 'file_list' AND ta.artifact_id = NEW.file_list_id) AS tags
+    ) agg
+    WHERE (agg.matches IS NOT NULL OR agg.tags IS NOT NULL)
+      AND EXISTS (SELECT 1 FROM file_list WHERE id = NEW.file_list_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_file_list_annotations_match_delete
+AFTER DELETE ON file_list_matches
+BEGIN
+    DELETE FROM file_list_annotations WHERE file_list_id = OLD.file_list_id;
+    INSERT INTO file_list_annotations (file_list_id, evidence_id, matches, tags)
+    SELECT OLD.file_list_id, OLD.evidence_id, agg.matches, agg.tags
+    FROM (
+        SELECT
+            (SELECT GROUP_CONCAT(m.reference_list_name) FROM file_list_matches m
+              WHERE m.file_list_id = OLD.file_list_id) AS matches,
+            (SELECT GROUP_CONCAT(t.name, ', ')
+               FROM tag_associations ta JOIN tags t ON t.id = ta.tag_id
+              WHERE ta.artifact_type = 'file_list' AND ta.artifact_id = OLD.file_list_id) AS tags
+    ) agg
+    WHERE (agg.matches IS NOT NULL OR agg.tags IS NOT NULL)
+      AND EXISTS (SELECT 1 FROM file_list WHERE id = OLD.file_list_id);
+END;
+
+-- Tag association changes (file_list artifacts only)
+CREATE TRIGGER IF NOT EXISTS trg_file_list_annotations_tag_insert
+AFTER INSERT ON tag_associations
+WHEN NEW.artifact_type = 'file_list'
+BEGIN
+    DELETE FROM file_list_annotations WHERE file_list_id = NEW.artifact_id;
+    INSERT INTO file_list_annotations (file_list_id, evidence_id, matches, tags)
+    SELECT NEW.artifact_id, NEW.evidence_id, agg.matches, agg.tags
+    FROM (
+        SELECT
+            (SELECT GROUP_CONCAT(m.reference_list_name) FROM file_list_matches m
+              WHERE m.file_list_id = NEW.artifact_id) AS matches,
+            (SELECT GROUP_CONCAT(t.name, ', ')
+               FROM tag_associations ta JOIN tags t ON t.id = ta.tag_id
+              WHERE ta.artifact_type = 'file_list' AND ta.artifact_id = NEW.artifact_id) AS tags
+    ) agg
+    WHERE (agg.matches IS NOT NULL OR agg.tags IS NOT NULL)
+      AND EXISTS (SELECT 1 FROM file_list WHERE id = NEW.artifact_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_file_list_annotations_tag_delete
+AFTER DELETE ON tag_associations
+WHEN OLD.artifact_type = 'file_list'
+BEGIN
+    DELETE FROM file_list_annotations WHERE file_list_id = OLD.artifact_id;
+    INSERT INTO file_list_annotations (file_list_id, evidence_id, matches, tags)
+    SELECT OLD.artifact_id, OLD.evidence_id, agg.matches, agg.tags
+    FROM (
+        SELECT
+            (SELECT GROUP_CONCAT(m.reference_list_name) FROM file_list_matches m
+              WHERE m.file_list_id = OLD.artifact_id) AS matches,
+            (SELECT GROUP_CONCAT(t.name, ', ')
+               FROM tag_associations ta JOIN tags t ON t.id = ta.tag_id
+              WHERE ta.artifact_type = 'file_list' AND ta.artifact_id = OLD.artifact_id) AS tags
+    ) agg
+    WHERE (agg.matches IS NOT NULL OR agg.tags IS NOT NULL)
+      AND EXISTS (SELECT 1 FROM file_list WHERE id = OLD.artifact_id);
+END;
+
+-- Tag renames change the joined tag string of every tagged file
+CREATE TRIGGER IF NOT EXISTS trg_file_list_annotations_tag_rename
+AFTER UPDATE OF name ON tags
+BEGIN
+    UPDATE file_list_annotations
+    SET tags = (
+        SELECT GROUP_CONCAT(t.name, ', ')
+        FROM tag_associations ta JOIN tags t ON t.id = ta.tag_id
+        WHERE ta.artifact_type = 'file_list' AND ta.artifact_id = file_list_annotations.file_list_id
+    )
+    WHERE file_list_id IN (
+        SELECT artifact_id FROM tag_associations
+        WHERE tag_id = NEW.id AND artifact_type = 'file_list'
+    );
+END;
+
+-- Removed files drop their annotation row
+CREATE TRIGGER IF NOT EXISTS trg_file_list_annotations_file_delete
+AFTER DELETE ON file_list
+BEGIN
+    DELETE FROM file_list_annotations WHERE file_list_id = OLD.id;
+END;
+"""
+
+
+def _ensure_file_list_annotations(conn: sqlite3.Connection) -> None:
+    """
+    Ensure the file_list_annotations side table and its triggers exist.
+
+    The table is created and backfilled on first use; the triggers are
+    (re)created idempotently, which also restores them after file_list was
+    recreated by _ensure_file_list_unique_index(). Skipped when the source
+    tables are missing (partial legacy schemas).
+
+    Called after migrate() to ensure the table exists before any code uses it.
+    """
+    tables = {row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table'"
+    )}
+    required = {"file_list", "file_list_matches", "tags", "tag_associations"}
+    if not required.issubset(tables):
+        LOGGER.debug("file_list annotation source tables missing, skipping side table")
+        return
+
+    if "file_list_annotations" not in tables:
+        conn.executescript(_FILE_LIST_ANNOTATIONS_TABLE_SQL)
+        with conn:
+            conn.execute(_FILE_LIST_ANNOTATIONS_BACKFILL_SQL)
+        LOGGER.info("Created file_list_annotations side table (upgrade)")
+
+    conn.executescript(_FILE_LIST_ANNOTATIONS_TRIGGERS_SQL)
+
+
+# data_version (migration 0002) keys the report render cache together with
+# the highest rowid of each table. These tables bump it when rows are edited
+# in place (None: any column).
+_DATA_VERSION_UPDATE_TABLES: Dict[str, Optional[str]] = {
+    "urls": None,
+    "images": None,
+    "downloads": None,
+    "screenshots": None,
+    # usage_count changes with tag_associations rows, which are tracked already
+    "tags": "name, name_normalized",
+    "stored_sites": None,
+}
+
+# Deletes bump it only on the small, user-edited tables. A delete trigger on
+# the bulk artifact tables would run once per row of every re-ingestion
+# purge; the render cache counts their rows instead.
+_DATA_VERSION_DELETE_TABLES = ("tags", "tag_associations", "screenshots", "downloads")
+
+_DATA_VERSION_TRIGGER_SQL = """
+CREATE TRIGGER IF NOT EXISTS {name}
+AFTER {event} ON {table}
+BEGIN
+    UPDATE data_version SET version = version + 1 WHERE id = 1;
+END;
+"""
+
+
+def _ensure_data_version_triggers(conn: sqlite3.Connection) -> None:
+    """
+    Ensure the triggers maintaining the data_version counter exist.
+
+    Triggers are (re)created idempotently for the tables present; tables
+    missing from partial legacy schemas are skipped. Delete triggers on
+    other tables (older development schemas) are dropped.
+
+    Called after migrate(), which creates the data_version table.
+    """
+    tables = {row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table'"
+    )}
+    if "data_version" not in tables:
+        return
+
+    statements = []
+    for table, columns in _DATA_VERSION_UPDATE_TABLES.items():
+        if table in tables:
+            event = f"UPDATE OF {columns}" if columns else "UPDATE"
+            statements.append(_DATA_VERSION_TRIGGER_SQL.format(
+                name=f"trg_data_version_{table}", event=event, table=table,
+            ))
+    for table in _DATA_VERSION_DELETE_TABLES:
+        if table in tables:
+            statements.append(_DATA_VERSION_TRIGGER_SQL.format(
+                name=f"trg_data_version_{table}_ad", event="DELETE", table=table,
+            ))
+    wanted = {f"trg_data_version_{table}_ad" for table in _DATA_VERSION_DELETE_TABLES}
+    for (name,) in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='trigger' AND name LIKE 'trg_data_version_%_ad'"
+    ).fetchall():
+        if name not in wanted:
+            statements.append(f"DROP TRIGGER IF EXISTS {name};")
+    conn.executescript("".join(statements))
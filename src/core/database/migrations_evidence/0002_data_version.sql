@@ -0,0 +1,16 @@
+-- Evidence data version counter (report render cache)
+--
+-- Report sections are cached per evidence and invalidated when artifact data
+-- changes. Inserts are detected from the highest rowid of each table; this
+-- counter covers rows that are edited in place (notes, tags, renames,
+-- download status, URL merges during ingestion) and deletes from the
+-- user-edited tables. Its triggers are created by
+-- core.database.manager._ensure_data_version_triggers, which skips tables
+-- missing from partial legacy schemas.
+
+CREATE TABLE IF NOT EXISTS data_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0);
@@ -0,0 +1,18 @@
+-- Per-evidence row counters for artifact tables
+--
+-- artifact_counts holds the row count of each (table, evidence) for rows up
+-- to the table's watermark in artifact_count_marks; rows above it are
+-- counted on read. Counters, watermarks and the DELETE/UPDATE triggers are
+-- created by core.database.helpers.artifact_counts.
+
+CREATE TABLE IF NOT EXISTS artifact_counts (
+    table_name TEXT NOT NULL,
+    evidence_id INTEGER NOT NULL,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (table_name, evidence_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS artifact_count_marks (
+    table_name TEXT PRIMARY KEY,
+    counted_rowid INTEGER NOT NULL
+);
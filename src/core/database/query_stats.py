@@ -0,0 +1,217 @@
+"""
+Query instrumentation for UI and report reads.
+
+This module provides:
+- QueryStats: Per-statement call counts, latency histogram and last query plan
+- QueryInstrumentation: Thread-safe registry fed by instrumented connections
+  (see core.database.read_pool)
+- get_query_instrumentation: Process-wide instance shown in the Audit tab
+
+Statements are keyed by their normalized SQL text. Latency is measured for
+``execute()``, i.e. up to the first result row; sorts, aggregates and COUNTs
+are complete at that point. Statements slower than the threshold get an
+``EXPLAIN QUERY PLAN`` (at most once per PLAN_RECHECK_SECONDS), and plans that
+read a whole table without an index are flagged as full table scans.
+"""
+from __future__ import annotations
+
+import copy
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from core.logging import get_logger
+
+__all__ = [
+    "HISTOGRAM_BOUNDS_MS",
+    "QueryStats",
+    "QueryInstrumentation",
+    "explain_query_plan",
+    "full_table_scans",
+    "get_query_instrumentation",
+    "normalize_sql",
+]
+
+LOGGER = get_logger("core.database.query_stats")
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open
+HISTOGRAM_BOUNDS_MS = (1, 5, 10, 50, 100, 500, 1000)
+
+SLOW_QUERY_SECONDS = 0.1
+PLAN_RECHECK_SECONDS = 60.0
+MAX_TRACKED_STATEMENTS = 500
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_PLACEHOLDER_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace and variable-length ``(?, ?, ...)`` lists."""
+    sql = _WHITESPACE_RE.sub(" ", sql).strip()
+    return _PLACEHOLDER_LIST_RE.sub("(?, ...)", sql)
+
+
+def explain_query_plan(conn: sqlite3.Connection, sql: str, params: Any = ()) -> List[str]:
+    """Return the EXPLAIN QUERY PLAN detail lines, indented by depth."""
+    rows = sqlite3.Connection.execute(conn, f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    depth: Dict[int, int] = {0: -1}
+    lines: List[str] = []
+    for node_id, parent, _unused, detail in rows:
+        level = depth.get(parent, -1) + 1
+        depth[node_id] = level
+        lines.append("  " * level + detail)
+    return lines
+
+
+def full_table_scans(plan: List[str]) -> List[str]:
+    """Tables (or aliases) read in full without an index."""
+    scans = []
+    for line in plan:
+        detail = line.strip()
+        if not detail.startswith("SCAN "):
+            continue
+        if " USING " in detail or "VIRTUAL TABLE" in detail or "CONSTANT ROW" in detail:
+            continue
+        name = detail[5:].split()[0]
+        if name == "TABLE":  # SQLite < 3.36: "SCAN TABLE name"
+            name = detail[11:].split()[0]
+        if not name.startswith("("):
+            scans.append(name)
+    return scans
+
+
+@dataclass
+class QueryStats:
+    """Latency and plan information for one normalized statement."""
+
+    sql: str
+    database: str
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    slow_calls: int = 0
+    histogram: List[int] = field(default_factory=lambda: [0] * (len(HISTOGRAM_BOUNDS_MS) + 1))
+    plan: Optional[List[str]] = None
+    plan_changes: int = 0
+    full_scans: List[str] = field(default_factory=list)
+    plan_checked_at: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    def percentile_seconds(self, fraction: float) -> float:
+        """Upper bound of the histogram bucket holding the given percentile."""
+        if not self.calls:
+            return 0.0
+        target = fraction * self.calls
+        seen = 0
+        for index, count in enumerate(self.histogram):
+            seen += count
+            if seen >= target:
+                if index < len(HISTOGRAM_BOUNDS_MS):
+                    return min(HISTOGRAM_BOUNDS_MS[index] / 1000.0, self.max_seconds)
+                break
+        return self.max_seconds
+
+
+class QueryInstrumentation:
+    """
+    Collect per-statement latency for instrumented connections.
+
+    Args:
+        slow_threshold: Statements at least this slow (seconds) get their
+            query plan recorded
+        max_statements: New statements beyond this many are not tracked
+    """
+
+    def __init__(
+        self,
+        slow_threshold: float = SLOW_QUERY_SECONDS,
+        *,
+        max_statements: int = MAX_TRACKED_STATEMENTS,
+    ):
+        self.slow_threshold = slow_threshold
+        self.max_statements = max_statements
+        self.enabled = True
+        self._stats: Dict[tuple, QueryStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        conn: sqlite3.Connection,
+        sql: str,
+        params: Any,
+        seconds: float,
+        database: str = "",
+    ) -> None:
+        """Add one execution; captures the plan of slow statements."""
+        if not self.enabled:
+            return
+        key = (database, normalize_sql(sql))
+        bucket = len(HISTOGRAM_BOUNDS_MS)
+        ms = seconds * 1000.0
+        for index, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if ms <= bound:
+                bucket = index
+                break
+
+        now = time.monotonic()
+        explain = False
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= self.max_statements:
+                    return
+                stats = self._stats[key] = QueryStats(sql=key[1], database=database)
+            stats.calls += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.histogram[bucket] += 1
+            if seconds >= self.slow_threshold:
+                stats.slow_calls += 1
+                if stats.plan is None or now - stats.plan_checked_at >= PLAN_RECHECK_SECONDS:
+                    stats.plan_checked_at = now
+                    explain = True
+        if not explain:
+            return
+
+        try:
+            plan = explain_query_plan(conn, sql, params)
+        except sqlite3.Error as exc:
+            LOGGER.debug("EXPLAIN QUERY PLAN failed for %s: %s", key[1][:80], exc)
+            return
+        scans = full_table_scans(plan)
+        with self._lock:
+            if stats.plan is not None and stats.plan != plan:
+                stats.plan_changes += 1
+                LOGGER.info("Query plan changed (%.3fs): %s", seconds, key[1][:200])
+            stats.plan = plan
+            stats.full_scans = scans
+        if scans:
+            LOGGER.info(
+                "Slow query (%.3fs) scans %s without an index: %s",
+                seconds, ", ".join(scans), key[1][:200],
+            )
+
+    def snapshot(self) -> List[QueryStats]:
+        """Copies of all statement stats, slowest total time first."""
+        with self._lock:
+            stats = [copy.deepcopy(s) for s in self._stats.values()]
+        return sorted(stats, key=lambda s: s.total_seconds, reverse=True)
+
+    def reset(self) -> None:
+        """Forget all recorded statements."""
+        with self._lock:
+            self._stats.clear()
+
+
+_instance = QueryInstrumentation()
+
+
+def get_query_instrumentation() -> QueryInstrumentation:
+    """Process-wide instrumentation used by the read connection pool."""
+    return _instance
@@ -0,0 +1,156 @@
+"""
+Read-only connection pool for UI and report queries.
+
+This module provides:
+- InstrumentedConnection: sqlite3.Connection whose execute() reports
+  statement latency to core.database.query_stats
+- open_read_connection: Read-only connection (``mode=ro`` URI,
+  ``PRAGMA query_only``, memory-mapped I/O)
+- ReadConnectionPool: Idle read-only connections per database file, handed
+  to one caller at a time
+
+Reads through the pool never share a connection (or an open transaction)
+with the extractor/writer connections cached by DatabaseManager. Memory
+mapping lets the pooled connections of a database read from the same OS
+page cache instead of each copying pages into its own cache.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from core.logging import get_logger
+
+from .query_stats import get_query_instrumentation
+
+__all__ = [
+    "InstrumentedConnection",
+    "ReadConnectionPool",
+    "open_read_connection",
+]
+
+LOGGER = get_logger("core.database.read_pool")
+
+READ_MMAP_SIZE = 256 * 1024 * 1024
+READ_CACHE_SIZE_KIB = 16 * 1024
+MAX_IDLE_PER_DATABASE = 4
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Connection that records the latency of execute() calls."""
+
+    database_label = ""
+
+    def execute(self, sql, parameters=(), /):  # noqa: ANN001
+        started = time.perf_counter()
+        cursor = super().execute(sql, parameters)
+        get_query_instrumentation().record(
+            self, sql, parameters, time.perf_counter() - started, self.database_label
+        )
+        return cursor
+
+
+def open_read_connection(path: Path) -> InstrumentedConnection:
+    """
+    Open a read-only, instrumented connection to an existing database.
+
+    Falls back to a read/write connection with ``query_only`` when SQLite
+    cannot open the file with ``mode=ro`` (e.g. a WAL database whose -shm
+    file cannot be created read-only).
+
+    Raises:
+        FileNotFoundError: If the database file does not exist
+    """
+    path = Path(path).resolve()
+    if not path.exists():
+        raise FileNotFoundError(f"Database not found: {path}")
+
+    conn = sqlite3.connect(
+        f"{path.as_uri()}?mode=ro",
+        uri=True,
+        check_same_thread=False,
+        factory=InstrumentedConnection,
+    )
+    try:
+        sqlite3.Connection.execute(conn, "SELECT 1 FROM sqlite_master LIMIT 1").fetchone()
+    except sqlite3.OperationalError as exc:
+        LOGGER.debug("Read-only open failed for %s (%s); using query_only", path, exc)
+        conn.close()
+        conn = sqlite3.connect(path, check_same_thread=False, factory=InstrumentedConnection)
+
+    for pragma in (
+        "PRAGMA query_only = ON",
+        "PRAGMA busy_timeout = 10000",
+        f"PRAGMA mmap_size = {READ_MMAP_SIZE}",
+        f"PRAGMA cache_size = -{READ_CACHE_SIZE_KIB}",
+        "PRAGMA temp_store = MEMORY",
+    ):
+        sqlite3.Connection.execute(conn, pragma)
+    conn.row_factory = sqlite3.Row
+    conn.database_label = path.name
+    return conn
+
+
+class ReadConnectionPool:
+    """
+    Pool of read-only connections, keyed by database file.
+
+    Example:
+        pool = ReadConnectionPool()
+        with pool.connection(db_path) as conn:
+            rows = conn.execute("SELECT ...").fetchall()
+        pool.close_all()
+    """
+
+    def __init__(self, max_idle: int = MAX_IDLE_PER_DATABASE) -> None:
+        self.max_idle = max_idle
+        self._idle: Dict[str, List[sqlite3.Connection]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self, path: Path) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection for ``path``."""
+        key = str(Path(path).resolve())
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is None:
+            conn = open_read_connection(Path(key))
+        try:
+            yield conn
+        finally:
+            self._release(key, conn)
+
+    def _release(self, key: str, conn: sqlite3.Connection) -> None:
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+            return
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def idle_count(self, path: Path) -> int:
+        """Number of idle connections for ``path``."""
+        with self._lock:
+            return len(self._idle.get(str(Path(path).resolve()), ()))
+
+    def close_all(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                try:
+                    conn.close()
+                except sqlite3.Error as e:
+                    LOGGER.warning("Error closing read connection: %s", e)
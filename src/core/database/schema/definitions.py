@@ -363,6 +363,7 @@ BROWSER_HISTORY_SCHEMA = TableSchema(
         FilterColumn("browser", [FilterOp.EQ]),
         FilterColumn("profile", [FilterOp.EQ]),
         FilterColumn("url", [FilterOp.LIKE]),
+        FilterColumn("title", [FilterOp.LIKE]),
         FilterColumn("run_id", [FilterOp.EQ]),
         FilterColumn("transition_type", [FilterOp.EQ]),
         FilterColumn("transition_type_name", [FilterOp.LIKE]),  #
@@ -748,6 +749,7 @@ AUTOFILL_SCHEMA = TableSchema(
     filterable_columns=[
         FilterColumn("browser", [FilterOp.EQ]),
         FilterColumn("name", [FilterOp.LIKE]),
+        FilterColumn("value", [FilterOp.LIKE]),
         FilterColumn("is_deleted", [FilterOp.EQ]),
     ],
     supports_run_delete=True,
@@ -1532,6 +1534,7 @@ LOCAL_STORAGE_SCHEMA = TableSchema(
         FilterColumn("browser", [FilterOp.EQ]),
         FilterColumn("origin", [FilterOp.LIKE]),
         FilterColumn("key", [FilterOp.LIKE]),
+        FilterColumn("value", [FilterOp.LIKE]),
     ],
     supports_run_delete=True,
 )
@@ -243,7 +243,7 @@ def estimate_export_size(
     # Optional: Cached artifacts (all extractor outputs and thumbnails)
     if options.include_cached_artifacts:
         # Case-level artifact directories
-        for artifact_dir in ["carved", "cache", "thumbnails", ".thumbs"]:
+        for artifact_dir in ["carved", "cache", "thumbnails", ".thumbs", "screenshot_store"]:
             artifact_path = case_folder / artifact_dir
             if artifact_path.exists():
                 files_to_scan.extend(artifact_path.rglob("*"))
@@ -255,7 +255,8 @@ def estimate_export_size(
             for evidence_subdir in evidences_dir.iterdir():
                 if evidence_subdir.is_dir():
                     for f in evidence_subdir.rglob("*"):
-                        if f.is_file() and f.suffix != ".sqlite" and not _is_sqlite_companion_file(f):
+                        if (f.is_file() and f.suffix != ".sqlite" and not _is_sqlite_companion_file(f)
+                                and not _is_extraction_store_file(f)):
                             files_to_scan.append(f)
 
     # Optional: Reports
@@ -338,6 +339,17 @@ def _is_sqlite_companion_file(path: Path) -> bool:
     return any(name.endswith(suffix) for suffix in _SQLITE_COMPANION_SUFFIXES)
 
 
+# Shared copy of extracted evidence files (extractors/_shared/extraction_store.py).
+# Every object is also hardlinked into an extractor output folder, so the
+# store itself is not exported.
+_EXTRACTION_STORE_DIRNAME = ".extraction_store"
+
+
+def _is_extraction_store_file(path: Path) -> bool:
+    """Check if a path lies inside an evidence's extraction store."""
+    return _EXTRACTION_STORE_DIRNAME in path.parts
+
+
 def _add_sqlite_with_companions(
     files_to_export: List[tuple],
     db_path: Path,
@@ -642,8 +654,8 @@ def create_export_package(
 
         # Optional: Cached artifacts (all extractor outputs and thumbnails)
         if options.include_cached_artifacts:
-            # Case-level artifact directories (carved, cache, thumbnails, .thumbs)
-            for artifact_dir_name in ["carved", "cache", "thumbnails", ".thumbs"]:
+            # Case-level artifact directories (carved, cache, thumbnails, .thumbs, screenshot_store)
+            for artifact_dir_name in ["carved", "cache", "thumbnails", ".thumbs", "screenshot_store"]:
                 artifact_dir = case_folder / artifact_dir_name
                 if artifact_dir.exists():
                     for artifact_file in artifact_dir.rglob("*"):
@@ -658,7 +670,8 @@ def create_export_package(
                 for evidence_subdir in evidences_dir.iterdir():
                     if evidence_subdir.is_dir():
                         for f in evidence_subdir.rglob("*"):
-                            if f.is_file() and f.suffix != ".sqlite" and not _is_sqlite_companion_file(f):
+                            if (f.is_file() and f.suffix != ".sqlite" and not _is_sqlite_companion_file(f)
+                                    and not _is_extraction_store_file(f)):
                                 rel_path = f.relative_to(case_folder)
                                 arcname = str(rel_path)
                                 files_to_export.append((f, arcname, "artifact"))
@@ -841,8 +854,8 @@ def create_export_package_cancellable(
                 LOGGER.warning("Failed to include source evidence files: %s", exc)
 
         if options.include_cached_artifacts:
-            # Case-level artifact directories (carved, cache, thumbnails, .thumbs)
-            for artifact_dir_name in ["carved", "cache", "thumbnails", ".thumbs"]:
+            # Case-level artifact directories (carved, cache, thumbnails, .thumbs, screenshot_store)
+            for artifact_dir_name in ["carved", "cache", "thumbnails", ".thumbs", "screenshot_store"]:
                 artifact_dir = case_folder / artifact_dir_name
                 if artifact_dir.exists():
                     for artifact_file in artifact_dir.rglob("*"):
@@ -855,7 +868,8 @@ def create_export_package_cancellable(
                 for evidence_subdir in evidences_dir.iterdir():
                     if evidence_subdir.is_dir():
                         for f in evidence_subdir.rglob("*"):
-                            if f.is_file() and f.suffix != ".sqlite" and not _is_sqlite_companion_file(f):
+                            if (f.is_file() and f.suffix != ".sqlite" and not _is_sqlite_companion_file(f)
+                                    and not _is_extraction_store_file(f)):
                                 rel_path = f.relative_to(case_folder)
                                 files_to_export.append((f, str(rel_path), "artifact"))
 
@@ -4,12 +4,14 @@ Matching module - Reference list management and pattern matching.
 This module provides:
 - ReferenceListManager: Manage reference lists (hashlists, filelists, urllists)
 - ReferenceListMatcher: Match file_list entries against reference lists
+- CompiledFileList: File list patterns compiled for fast filename matching
 - URLMatcher: Match URLs against URL reference lists
 - Hash database functions for SQLite-based hash lookup
+- HashIndex: Sorted, memory-mapped hash index for NSRL-sized sets
 
 Usage:
     from core.matching import ReferenceListManager, ReferenceListMatcher, URLMatcher
-    from core.matching import import_hash_list, lookup_hash, rebuild_hash_db
+    from core.matching import import_hash_list, lookup_hash, lookup_hashes, rebuild_hash_db
 """
 from __future__ import annotations
 
@@ -24,6 +26,7 @@ from .manager import (
 
 # Matchers for database records
 from .file_matcher import ReferenceListMatcher
+from .filename_patterns import CompiledFileList
 from .url_matcher import URLMatcher
 
 # Hash database functions
@@ -32,6 +35,7 @@ from .hash_db import (
     import_hash_list,
     rebuild_hash_db,
     lookup_hash,
+    lookup_hashes,
     list_hash_lists,
     compute_file_hash,
     parse_hash_line,
@@ -40,6 +44,9 @@ from .hash_db import (
     SHA256_PATTERN,
 )
 
+# Sorted binary hash index
+from .hash_index import HashIndex, HashIndexBuilder, hash_index_path
+
 __all__ = [
     # Manager
     "ReferenceListManager",
@@ -49,16 +56,22 @@ __all__ = [
     "MAX_HASHLIST_SIZE",
     # Matchers
     "ReferenceListMatcher",
+    "CompiledFileList",
     "URLMatcher",
     # Hash DB
     "init_hash_db",
     "import_hash_list",
     "rebuild_hash_db",
     "lookup_hash",
+    "lookup_hashes",
     "list_hash_lists",
     "compute_file_hash",
     "parse_hash_line",
     "HASH_DB_SCHEMA",
     "MD5_PATTERN",
     "SHA256_PATTERN",
+    # Hash index
+    "HashIndex",
+    "HashIndexBuilder",
+    "hash_index_path",
 ]
@@ -7,13 +7,14 @@ Matches file_list database entries against:
 """
 from __future__ import annotations
 
-import fnmatch
 import logging
-import re
 import sqlite3
 from datetime import datetime, timezone
 from typing import Callable, Optional
 
+from core.database.helpers import get_artifact_counts
+
+from .filename_patterns import CompiledFileList
 from .manager import ReferenceListManager
 
 __all__ = ["ReferenceListMatcher"]
@@ -24,6 +25,9 @@ logger = logging.getLogger(__name__)
 class ReferenceListMatcher:
     """Match file list entries against reference lists."""
 
+    # file_list rows fetched (and matches inserted) per batch
+    ROW_BATCH_SIZE = 10000
+
     def __init__(self, evidence_conn: sqlite3.Connection, evidence_id: int):
         """
         Initialize matcher.
@@ -157,82 +161,59 @@ class ReferenceListMatcher:
             logger.warning(f"File list '{filelist_name}' is empty")
             return 0
 
-        # Compile regex patterns if needed
-        compiled_patterns = []
-        if is_regex:
-            for pattern in patterns:
-                try:
-                    compiled_patterns.append(re.compile(pattern, re.IGNORECASE))
-                except re.error as e:
-                    logger.warning(f"Invalid regex pattern '{pattern}': {e}")
-            patterns = compiled_patterns
+        # Compile once: exact/prefix/suffix lookups plus one combined regex
+        compiled = CompiledFileList(patterns, is_regex)
+        total_rows = get_artifact_counts(self.evidence_conn, self.evidence_id, ["file_list"])["file_list"]
 
-        # Query all file_list entries
+        # Stream file_list entries; the full table can hold millions of rows
         cursor = self.evidence_conn.execute(
             """
-            SELECT id, file_path, file_name
+            SELECT id, file_name
             FROM file_list
             WHERE evidence_id = ?
         """,
             (self.evidence_id,),
         )
 
-        rows = cursor.fetchall()
-        total_rows = len(rows)
         match_count = 0
+        processed = 0
+        while True:
+            rows = cursor.fetchmany(self.ROW_BATCH_SIZE)
+            if not rows:
+                break
+
+            batch = []
+            for file_list_id, file_name in rows:
+                matched_value = compiled.match(file_name)
+                if matched_value is not None:
+                    batch.append((
+                        self.evidence_id,
+                        file_list_id,
+                        filelist_name,
+                        "filename",
+                        matched_value,
+                        matched_at,
+                    ))
+
+            if batch:
+                # Duplicate matches (already exist) are skipped by the unique index
+                match_count += self.evidence_conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO file_list_matches (
+                        evidence_id, file_list_id, reference_list_name,
+                        match_type, matched_value, matched_at
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                    batch,
+                ).rowcount
 
-        for idx, row in enumerate(rows):
-            file_list_id, file_path, file_name = row
-
-            # Try matching against each pattern
-            for pattern in patterns:
-                matched = False
-                matched_value = None
-
-                if is_regex:
-                    # Regex matching (pattern is compiled regex object)
-                    if pattern.search(file_name):
-                        matched = True
-                        matched_value = pattern.pattern
-                else:
-                    # Wildcard matching (case-insensitive)
-                    if self._match_wildcard(file_name, pattern):
-                        matched = True
-                        matched_value = pattern
-
-                if matched:
-                    # Insert match record
-                    try:
-                        self.evidence_conn.execute(
-                            """
-                            INSERT INTO file_list_matches (
-                                evidence_id, file_list_id, reference_list_name,
-                                match_type, matched_value, matched_at
-                            ) VALUES (?, ?, ?, ?, ?, ?)
-                        """,
-                            (
-                                self.evidence_id,
-                                file_list_id,
-                                filelist_name,
-                                "filename",
-                                matched_value,
-                                matched_at,
-                            ),
-                        )
-                        match_count += 1
-                        break  # One match per file is enough
-                    except sqlite3.IntegrityError:
-                        # Duplicate match
-                        logger.debug(f"Duplicate match for {file_path}")
-                        break
-
-            # Report progress
-            if progress_callback and (idx + 1) % 100 == 0:
-                progress_callback(idx + 1, total_rows)
+            processed += len(rows)
+            if progress_callback:
+                progress_callback(processed, max(total_rows, processed))
 
         # Final progress
         if progress_callback:
-            progress_callback(total_rows, total_rows)
+            progress_callback(processed, processed)
 
         self.evidence_conn.commit()
         logger.info(f"File list matching complete: {match_count} matches found")
@@ -242,19 +223,6 @@ class ReferenceListMatcher:
 
         return match_count
 
-    def _match_wildcard(self, filename: str, pattern: str) -> bool:
-        """
-        Case-insensitive wildcard matching.
-
-        Args:
-            filename: Filename to test
-            pattern: Wildcard pattern (* and ? supported)
-
-        Returns:
-            True if filename matches pattern
-        """
-        return fnmatch.fnmatch(filename.lower(), pattern.lower())
-
     def _rebuild_filter_cache(self) -> None:
         """
         Rebuild filter cache for this evidence.
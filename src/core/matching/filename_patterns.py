@@ -0,0 +1,226 @@
+"""
+Compiled filename pattern set for file list matching.
+
+A file list can hold thousands of patterns, matched against millions of
+file_list rows. Testing every pattern against every name with fnmatch is
+too slow for that, so patterns are sorted into lookup structures once:
+
+- Exact names (no wildcard): one dict lookup
+- Patterns ending in a literal (``*.exe``, ``setup?.msi``): dict lookup on
+  the name's suffix, per distinct suffix length
+- Patterns starting with a literal (``Frz*``): dict lookup on the name's
+  prefix, per distinct prefix length
+- Everything else (``*freeze*``): one alternation regex for the whole list
+
+A suffix or prefix lookup only finds candidates; patterns with more than
+one wildcard are then checked with their own regex.
+
+Regex lists are combined into one alternation as well. Patterns with
+capture groups (which may hold backreferences) are tested on their own.
+
+The first pattern of the list that matches wins, as with the pattern loop
+this replaces, so ``matched_value`` does not depend on which structure
+found the match.
+"""
+from __future__ import annotations
+
+import fnmatch
+import logging
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+__all__ = ["CompiledFileList"]
+
+logger = logging.getLogger(__name__)
+
+# Characters that end a literal run of a wildcard pattern (``]`` too, as
+# the text before it may belong to a character class)
+_SPECIAL_CHARS = frozenset("*?[]")
+
+# (pattern index, regex to confirm the match or None if the lookup is enough)
+_Candidate = Tuple[int, Optional[re.Pattern]]
+_AffixTables = Dict[int, Dict[str, List[_Candidate]]]
+
+
+def _literal_head(pattern: str) -> str:
+    for pos, ch in enumerate(pattern):
+        if ch in _SPECIAL_CHARS:
+            return pattern[:pos]
+    return pattern
+
+
+def _literal_tail(pattern: str) -> str:
+    return _literal_head(pattern[::-1])[::-1]
+
+
+def _glob_expression(glob: str) -> str:
+    """Regex for ``glob`` to be used with search()."""
+    expression = fnmatch.translate(glob)
+    # "*freeze*" searches for "freeze" instead of matching ".*freeze.*",
+    # which backtracks through the name once per alternative
+    if len(glob) > 1 and glob.startswith("*") and glob.endswith("*"):
+        inner = fnmatch.translate(glob.strip("*"))
+        if inner.endswith("\\Z"):
+            return inner[:-2]
+    return f"\\A{expression}"
+
+
+def _add_candidate(tables: _AffixTables, affix: str, candidate: _Candidate) -> None:
+    tables.setdefault(len(affix), {}).setdefault(affix, []).append(candidate)
+
+
+def _first_candidate(candidates: List[_Candidate], subject: str, best: int) -> int:
+    """Index of the first candidate matching ``subject``, if below ``best``."""
+    for index, regex in candidates:
+        if index >= best:
+            break
+        if regex is None or regex.match(subject):
+            return index
+    return best
+
+
+def _compile_alternation(
+    expressions: Sequence[str],
+    flags: int = 0,
+) -> Optional[re.Pattern]:
+    """Join expressions into one regex, or None if they cannot be combined."""
+    if not expressions:
+        return None
+    try:
+        return re.compile("|".join(f"(?:{expr})" for expr in expressions), flags)
+    except re.error as e:
+        # e.g. inline global flags not at the start of the expression
+        logger.debug(f"Patterns not combined into one regex: {e}")
+        return None
+
+
+class CompiledFileList:
+    """
+    Filename patterns of one file list, compiled for repeated matching.
+
+    Wildcard patterns are matched case-insensitively against the whole
+    file name (fnmatch semantics); regex patterns are searched in the file
+    name with re.IGNORECASE.
+    """
+
+    def __init__(self, patterns: Sequence[str], is_regex: bool = False):
+        """
+        Compile patterns.
+
+        Args:
+            patterns: Patterns in list order
+            is_regex: True for regex patterns, False for wildcards
+
+        Invalid regex patterns are logged and skipped.
+        """
+        self.is_regex = is_regex
+        self.patterns: List[str] = list(patterns)
+        self._exact: Dict[str, int] = {}
+        self._suffixes: _AffixTables = {}
+        self._prefixes: _AffixTables = {}
+        # (pattern index, compiled pattern), in list order
+        self._regexes: List[Tuple[int, re.Pattern]] = []
+        self._combined: Optional[re.Pattern] = None
+        self._combined_first = len(self.patterns)
+        self._single: List[Tuple[int, re.Pattern]] = []
+
+        if is_regex:
+            self._compile_regex_patterns()
+        else:
+            self._compile_wildcard_patterns()
+
+    def _compile_wildcard_patterns(self) -> None:
+        globs: List[Tuple[int, str]] = []
+        for index, pattern in enumerate(self.patterns):
+            lowered = pattern.lower()
+            head = _literal_head(lowered)
+            if head == lowered:
+                self._exact.setdefault(lowered, index)
+                continue
+
+            tail = _literal_tail(lowered)
+            # A single leading or trailing "*" needs no regex to confirm
+            if tail:
+                regex = None if lowered == f"*{tail}" else re.compile(fnmatch.translate(lowered))
+                _add_candidate(self._suffixes, tail, (index, regex))
+            elif head:
+                regex = None if lowered == f"{head}*" else re.compile(fnmatch.translate(lowered))
+                _add_candidate(self._prefixes, head, (index, regex))
+            else:
+                globs.append((index, lowered))
+
+        expressions = [_glob_expression(glob) for _, glob in globs]
+        self._regexes = [(index, re.compile(expr)) for (index, _), expr in zip(globs, expressions)]
+        self._combined = _compile_alternation(expressions)
+        if self._combined is None:
+            self._single = self._regexes
+        elif globs:
+            self._combined_first = globs[0][0]
+
+    def _compile_regex_patterns(self) -> None:
+        combinable: List[Tuple[int, re.Pattern]] = []
+        for index, pattern in enumerate(self.patterns):
+            try:
+                compiled = re.compile(pattern, re.IGNORECASE)
+            except re.error as e:
+                logger.warning(f"Invalid regex pattern '{pattern}': {e}")
+                continue
+            self._regexes.append((index, compiled))
+            if compiled.groups:
+                self._single.append((index, compiled))
+            else:
+                combinable.append((index, compiled))
+
+        self._combined = _compile_alternation(
+            [compiled.pattern for _, compiled in combinable], re.IGNORECASE
+        )
+        if self._combined is None:
+            self._single = self._regexes
+        elif combinable:
+            self._combined_first = combinable[0][0]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def match(self, file_name: str) -> Optional[str]:
+        """
+        Return the first pattern (in list order) matching ``file_name``.
+
+        Args:
+            file_name: File name to test
+
+        Returns:
+            The matching pattern as written in the list, or None
+        """
+        best = len(self.patterns)
+        subject = file_name if self.is_regex else file_name.lower()
+        if not self.is_regex:
+            index = self._exact.get(subject)
+            if index is not None:
+                best = index
+            for length, table in self._suffixes.items():
+                if length <= len(subject):
+                    candidates = table.get(subject[-length:])
+                    if candidates:
+                        best = _first_candidate(candidates, subject, best)
+            for length, table in self._prefixes.items():
+                candidates = table.get(subject[:length])
+                if candidates:
+                    best = _first_candidate(candidates, subject, best)
+
+        if self._combined is not None and self._combined_first < best and self._combined.search(subject):
+            # Find which pattern matched; only runs for matching names
+            for index, regex in self._regexes:
+                if index >= best:
+                    break
+                if regex.search(subject):
+                    best = index
+                    break
+        for index, regex in self._single:
+            if index >= best:
+                break
+            if regex.search(subject):
+                best = index
+                break
+
+        return self.patterns[best] if best < len(self.patterns) else None
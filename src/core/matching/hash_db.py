@@ -3,6 +3,8 @@ Hash Database - SQLite-based hash list storage and lookup.
 
 Provides efficient hash lookup via SQLite database instead of in-memory sets.
 Useful for large hash lists where memory usage would be prohibitive.
+Every import also updates sorted, memory-mapped index files next to the
+database (core.matching.hash_index), searched before SQLite.
 
 Database schema supports:
 - Multiple named hash lists with metadata
@@ -15,17 +17,21 @@ from __future__ import annotations
 import hashlib
 import re
 import sqlite3
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from core.logging import get_logger
 
+from .hash_index import DIGEST_SIZES, HashIndex, HashIndexBuilder, hash_index_path
+
 __all__ = [
     "init_hash_db",
     "import_hash_list",
     "rebuild_hash_db",
     "lookup_hash",
+    "lookup_hashes",
     "list_hash_lists",
     "compute_file_hash",
     "parse_hash_line",
@@ -40,6 +46,19 @@ logger = get_logger(__name__)
 MD5_PATTERN = re.compile(r'^[a-fA-F0-9]{32}$')
 SHA256_PATTERN = re.compile(r'^[a-fA-F0-9]{64}$')
 
+# Entries inserted per executemany during import
+IMPORT_BATCH_SIZE = 10000
+
+# Hashes per IN (...) query
+LOOKUP_CHUNK_SIZE = 500
+
+# Open indexes by path (index files are never modified in place)
+_index_cache: Dict[Path, HashIndex] = {}
+_index_lock = threading.Lock()
+
+# hash_lists rows by database path: (file signature, rows by id)
+_lists_cache: Dict[Path, Tuple[Tuple[int, int, bytes], Dict[int, Dict[str, Any]]]] = {}
+
 # Hash DB Schema
 HASH_DB_SCHEMA = """
 -- Global hash database schema
@@ -140,6 +159,7 @@ def import_hash_list(
     list_name: Optional[str] = None,
     category: str = "blacklist",
     description: Optional[str] = None,
+    store_entries: bool = True,
 ) -> int:
     """
     Import a text hash list into the SQLite hash database.
@@ -149,12 +169,19 @@ def import_hash_list(
         d41d8cd98f00b204e9800998ecf8427e
         098f6bcd4621d373cade4e832627b4f6, known malware
 
+    The list is also written to sorted hash index files next to the
+    database (see core.matching.hash_index), which lookup_hash and
+    lookup_hashes search instead of hash_entries.
+
     Args:
         txt_path: Path to text file containing hashes
         db_path: Path to SQLite hash database
         list_name: Human-readable list name (default: filename without extension)
         category: List category (blacklist, whitelist, reference)
         description: Optional description
+        store_entries: Also store entries (with notes) in hash_entries. Pass
+            False for NSRL-sized sets: they are only kept in the index, and
+            matches carry no note.
 
     Returns:
         Number of entries imported
@@ -171,6 +198,8 @@ def import_hash_list(
 
     conn = init_hash_db(db_path)
     now_utc = datetime.now(timezone.utc).isoformat()
+    builders: Dict[str, HashIndexBuilder] = {}
+    replaced_hash: Optional[str] = None
 
     try:
         # Check if this list already exists
@@ -196,6 +225,7 @@ def import_hash_list(
                 (txt_path.name, source_hash, now_utc, existing["id"])
             )
             list_id = existing["id"]
+            replaced_hash = existing["source_file_hash"]
         else:
             # Create new list
             cursor = conn.execute(
@@ -210,37 +240,71 @@ def import_hash_list(
             )
             list_id = cursor.lastrowid
 
-        # Parse and insert entries
-        entries_to_insert: List[Tuple[int, Optional[str], Optional[str], Optional[str]]] = []
+        builders = {
+            kind: HashIndexBuilder(hash_index_path(db_path, list_id, source_hash, kind), kind)
+            for kind in DIGEST_SIZES
+        }
+
+        # Parse entries in one streaming pass, feeding the index builders
+        # and inserting in batches
+        entry_count = 0
+        batch: List[Tuple[int, Optional[str], Optional[str], Optional[str]]] = []
 
         with open(txt_path, 'r', encoding='utf-8', errors='ignore') as f:
             for line in f:
                 parsed = parse_hash_line(line)
-                if parsed:
-                    md5_hash, sha256_hash, note = parsed
-                    entries_to_insert.append((list_id, md5_hash, sha256_hash, note))
-
-        if entries_to_insert:
+                if not parsed:
+                    continue
+                md5_hash, sha256_hash, note = parsed
+                if md5_hash:
+                    builders["md5"].add(bytes.fromhex(md5_hash), list_id)
+                else:
+                    builders["sha256"].add(bytes.fromhex(sha256_hash), list_id)
+                entry_count += 1
+                if store_entries:
+                    batch.append((list_id, md5_hash, sha256_hash, note))
+                    if len(batch) >= IMPORT_BATCH_SIZE:
+                        conn.executemany(
+                            "INSERT INTO hash_entries (list_id, hash_md5, hash_sha256, note) VALUES (?, ?, ?, ?)",
+                            batch
+                        )
+                        batch = []
+
+        if batch:
             conn.executemany(
                 "INSERT INTO hash_entries (list_id, hash_md5, hash_sha256, note) VALUES (?, ?, ?, ?)",
-                entries_to_insert
+                batch
             )
 
         # Update entry count
         conn.execute(
             "UPDATE hash_lists SET entry_count = ? WHERE id = ?",
-            (len(entries_to_insert), list_id)
+            (entry_count, list_id)
         )
 
-        conn.commit()
+        # Index files go first: the list version they belong to becomes
+        # visible with the commit
+        for builder in builders.values():
+            builder.write()
+            builder.commit()
+        try:
+            conn.commit()
+        except sqlite3.Error:
+            _remove_hash_index(db_path, list_id, source_hash)
+            raise
+        if replaced_hash:
+            _remove_hash_index(db_path, list_id, replaced_hash)
+
         logger.info(
             "Imported %d entries into hash list '%s' (version: %s)",
-            len(entries_to_insert), list_name, source_hash[:12]
+            entry_count, list_name, source_hash[:12]
         )
 
-        return len(entries_to_insert)
+        return entry_count
 
     finally:
+        for builder in builders.values():
+            builder.close()
         conn.close()
 
 
@@ -273,6 +337,183 @@ def rebuild_hash_db(hashlists_dir: Path, db_path: Path) -> int:
     return total
 
 
+def _open_hash_index(db_path: Path, list_id: int, source_hash: Optional[str], kind: str) -> Optional[HashIndex]:
+    """Open (or reuse) the index of one list version; None if it has none."""
+    if not source_hash:
+        return None
+    path = hash_index_path(db_path, list_id, source_hash, kind)
+    with _index_lock:
+        index = _index_cache.get(path)
+        if index is not None:
+            return index
+        if not path.exists():
+            return None
+        try:
+            index = HashIndex(path)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable hash index %s: %s", path.name, e)
+            return None
+        _index_cache[path] = index
+        return index
+
+
+def _remove_hash_index(db_path: Path, list_id: int, source_hash: str) -> None:
+    """Close and delete the index files of a replaced list version."""
+    for kind in DIGEST_SIZES:
+        path = hash_index_path(db_path, list_id, source_hash, kind)
+        with _index_lock:
+            index = _index_cache.pop(path, None)
+        if index is not None:
+            index.close()
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _hash_lists(db_path: Path) -> Dict[int, Dict[str, Any]]:
+    """
+    hash_lists rows by id, cached until the database file changes.
+
+    Lets lookups that miss every indexed list skip opening the database.
+    """
+    try:
+        stat = db_path.stat()
+        with open(db_path, "rb") as handle:
+            header = handle.read(28)
+    except FileNotFoundError:
+        return {}
+    # The file change counter (header bytes 24-27) changes with every
+    # commit, even within the timestamp resolution of the file system
+    signature = (stat.st_mtime_ns, stat.st_size, header[24:28])
+
+    with _index_lock:
+        cached = _lists_cache.get(db_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        lists = {
+            row["id"]: dict(row)
+            for row in conn.execute("SELECT id, name, source_file_hash, category FROM hash_lists")
+        }
+    except sqlite3.OperationalError:
+        lists = {}  # Not a hash database (e.g. legacy images table only)
+    finally:
+        conn.close()
+
+    with _index_lock:
+        _lists_cache[db_path] = (signature, lists)
+    return lists
+
+
+def _entry_rows(
+    conn: sqlite3.Connection,
+    kind: str,
+    hash_values: List[str],
+) -> Dict[str, List[sqlite3.Row]]:
+    """hash_entries rows for ``hash_values``, grouped by hash."""
+    rows: Dict[str, List[sqlite3.Row]] = {}
+    for start in range(0, len(hash_values), LOOKUP_CHUNK_SIZE):
+        chunk = hash_values[start:start + LOOKUP_CHUNK_SIZE]
+        placeholders = ", ".join("?" for _ in chunk)
+        for row in conn.execute(
+            f"SELECT hash_md5, hash_sha256, note, list_id FROM hash_entries "
+            f"WHERE hash_{kind} IN ({placeholders})",
+            chunk,
+        ):
+            rows.setdefault(row[f"hash_{kind}"], []).append(row)
+    return rows
+
+
+def lookup_hashes(
+    db_path: Path,
+    *,
+    md5s: Iterable[str] = (),
+    sha256s: Iterable[str] = (),
+) -> Dict[str, List[dict]]:
+    """
+    Look up many hashes at once (e.g. all file hashes of an evidence).
+
+    The sorted hashes are matched against the index of each list in a
+    single forward pass; only hits are read from hash_entries (for notes).
+    Lists without index files are queried in chunks.
+
+    Args:
+        db_path: Path to hash database
+        md5s: MD5 hashes to look up
+        sha256s: SHA256 hashes to look up
+
+    Returns:
+        Dict mapping each matched (lowercase) hash to match dicts with keys:
+        hash_md5, hash_sha256, note, list_name, list_version, category
+    """
+    results: Dict[str, List[dict]] = {}
+    lists = _hash_lists(db_path)
+    if not lists:
+        return results
+
+    conn: Optional[sqlite3.Connection] = None
+    try:
+        for kind, values, pattern in (("md5", md5s, MD5_PATTERN), ("sha256", sha256s, SHA256_PATTERN)):
+            wanted = sorted({v.lower() for v in values if v and pattern.match(v)})
+            if not wanted:
+                continue
+
+            digests = [bytes.fromhex(v) for v in wanted]
+            hits: Dict[str, List[int]] = {}
+            unindexed = False
+            for list_id, hash_list in lists.items():
+                index = _open_hash_index(db_path, list_id, hash_list["source_file_hash"], kind)
+                if index is None:
+                    # Imported before index files existed
+                    unindexed = True
+                    continue
+                for digest, _ in index.match_sorted(digests):
+                    hits.setdefault(digest.hex(), []).append(list_id)
+            candidates = wanted if unindexed else list(hits)
+            if not candidates:
+                continue
+
+            if conn is None:
+                conn = sqlite3.connect(db_path)
+                conn.row_factory = sqlite3.Row
+            rows = _entry_rows(conn, kind, candidates)
+            for hash_value in candidates:
+                entries = [(row["list_id"], row["hash_md5"], row["hash_sha256"], row["note"])
+                           for row in rows.get(hash_value, [])]
+                # Lists imported with store_entries=False are only in the index
+                stored = {entry[0] for entry in entries}
+                for list_id in hits.get(hash_value, []):
+                    if list_id not in stored:
+                        entries.append((
+                            list_id,
+                            hash_value if kind == "md5" else None,
+                            hash_value if kind == "sha256" else None,
+                            None,
+                        ))
+                for list_id, hash_md5, hash_sha256, note in entries:
+                    hash_list = lists.get(list_id)
+                    if hash_list is None:
+                        continue
+                    results.setdefault(hash_value, []).append({
+                        "hash_md5": hash_md5,
+                        "hash_sha256": hash_sha256,
+                        "note": note,
+                        "list_name": hash_list["name"],
+                        "list_version": hash_list["source_file_hash"],
+                        "category": hash_list["category"],
+                    })
+
+        return results
+
+    finally:
+        if conn is not None:
+            conn.close()
+
+
 def lookup_hash(
     db_path: Path,
     *,
@@ -290,40 +531,15 @@ def lookup_hash(
     Returns:
         List of match dicts with keys: hash_md5, hash_sha256, note, list_name, list_version
     """
-    if not db_path.exists():
-        return []
-
     if not md5 and not sha256:
         return []
 
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-
-    try:
-        conditions = []
-        params = []
-
-        if md5:
-            conditions.append("he.hash_md5 = ?")
-            params.append(md5.lower())
-        if sha256:
-            conditions.append("he.hash_sha256 = ?")
-            params.append(sha256.lower())
-
-        sql = f"""
-            SELECT he.hash_md5, he.hash_sha256, he.note,
-                   hl.name as list_name, hl.source_file_hash as list_version,
-                   hl.category
-            FROM hash_entries he
-            JOIN hash_lists hl ON he.list_id = hl.id
-            WHERE {' OR '.join(conditions)}
-        """
-
-        cursor = conn.execute(sql, params)
-        return [dict(row) for row in cursor.fetchall()]
-
-    finally:
-        conn.close()
+    results = lookup_hashes(
+        db_path,
+        md5s=[md5] if md5 else (),
+        sha256s=[sha256] if sha256 else (),
+    )
+    return [match for matches in results.values() for match in matches]
 
 
 def list_hash_lists(db_path: Path) -> List[dict]:
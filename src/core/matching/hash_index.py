@@ -0,0 +1,384 @@
+"""
+Hash Index - Sorted, memory-mapped hash index for large reference sets.
+
+hash_entries in the SQLite hash database is fine for lists of up to a few
+million hashes. NSRL-sized sets (hundreds of millions) are slow to insert
+and too large to index there, so import_hash_list also writes index files
+per list version and digest type, in a folder next to the database:
+
+    <db stem>.index/<list id>-<source hash>.md5.idx       16-byte digests
+    <db stem>.index/<list id>-<source hash>.sha256.idx    32-byte digests
+
+Files are never modified: a changed list gets new files (its source hash
+changes) and the old ones are removed.
+
+File layout:
+- 64-byte header (magic, digest size, record count, Bloom filter size)
+- Fixed-width records: digest + big-endian uint32 list id, sorted by
+  (digest, list id). Records compare as raw bytes, so the order on disk is
+  the order of Python bytes.
+- Optional Bloom filter (bit array), probed before searching
+
+Files are read through mmap. A lookup is a binary search touching about
+log2(n) pages; matching a sorted set of hashes is a single forward pass
+that gallops between hits.
+
+Indexes are built with an external merge sort: added records are sorted in
+runs of RUN_RECORDS, spilled to temporary files and merged into the index
+file.
+"""
+from __future__ import annotations
+
+import heapq
+import math
+import mmap
+import os
+import struct
+import tempfile
+from bisect import bisect_left
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+from core.logging import get_logger
+
+__all__ = [
+    "DIGEST_SIZES",
+    "BLOOM_BITS_PER_ENTRY",
+    "HashIndex",
+    "HashIndexBuilder",
+    "hash_index_path",
+]
+
+logger = get_logger(__name__)
+
+# Digest size (bytes) per hash kind
+DIGEST_SIZES = {"md5": 16, "sha256": 32}
+
+# Bloom filter size; 8 bits per entry with 4 probes gives
+# (1 - e^(-4/8))^4 = 2.4% false positives (6 probes would give 2.2% at 50%
+# more build time)
+BLOOM_BITS_PER_ENTRY = 8
+_MAX_BLOOM_PROBES = 4
+
+# Records sorted in memory per run (~80 MB of bytes objects for MD5)
+RUN_RECORDS = 1_000_000
+
+# Runs merged at once; more runs are merged in several passes
+MAX_MERGE_FANIN = 128
+
+_MAGIC = b"SSHIDX01"
+_HEADER = struct.Struct("<8sHHQQ")  # magic, digest size, bloom k, record count, bloom bits
+_HEADER_SIZE = 64
+_LIST_ID = struct.Struct(">I")
+_READ_RECORDS = 8192
+
+
+def hash_index_path(db_path: Path, list_id: int, source_hash: str, kind: str) -> Path:
+    """Index file of one list version for ``kind`` ('md5' or 'sha256')."""
+    return db_path.with_name(f"{db_path.stem}.index") / f"{list_id}-{source_hash[:16]}.{kind}.idx"
+
+
+def _bloom_positions(digest: bytes, bits: int, k: int) -> Iterator[int]:
+    # Digests are uniformly distributed, so they serve as their own hashes
+    # (double hashing over two 64-bit halves)
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:16], "little") | 1
+    for i in range(k):
+        yield (h1 + i * h2) % bits
+
+
+def _read_records(handle: BinaryIO, record_size: int) -> Iterator[bytes]:
+    while True:
+        block = handle.read(record_size * _READ_RECORDS)
+        if not block:
+            return
+        for offset in range(0, len(block), record_size):
+            yield block[offset:offset + record_size]
+
+
+class _DigestView:
+    """Sequence of the digests in an index, for bisect."""
+
+    def __init__(self, buffer: mmap.mmap, digest_size: int, count: int) -> None:
+        self._buffer = buffer
+        self._digest_size = digest_size
+        self._record_size = digest_size + _LIST_ID.size
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, position: int) -> bytes:
+        start = _HEADER_SIZE + position * self._record_size
+        return self._buffer[start:start + self._digest_size]
+
+
+class HashIndex:
+    """Read access to a hash index file."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Open and map an index file.
+
+        Raises:
+            ValueError: If the file is not a hash index
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as handle:
+            self._buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, digest_size, bloom_k, count, bloom_bits = _HEADER.unpack_from(self._buffer, 0)
+        if magic != _MAGIC:
+            self._buffer.close()
+            raise ValueError(f"Not a hash index: {self.path}")
+        self.digest_size = digest_size
+        self.record_size = digest_size + _LIST_ID.size
+        self.count = count
+        self._bloom_k = bloom_k
+        self._bloom_bits = bloom_bits
+        self._bloom_offset = _HEADER_SIZE + count * self.record_size
+        self._digests = _DigestView(self._buffer, digest_size, count)
+
+    def close(self) -> None:
+        self._buffer.close()
+
+    def __enter__(self) -> "HashIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def might_contain(self, digest: bytes) -> bool:
+        """Bloom filter probe (always True without a filter)."""
+        if not self._bloom_bits:
+            return True
+        buffer, offset = self._buffer, self._bloom_offset
+        return all(
+            buffer[offset + (bit >> 3)] & (1 << (bit & 7))
+            for bit in _bloom_positions(digest, self._bloom_bits, self._bloom_k)
+        )
+
+    def _list_id(self, position: int) -> int:
+        start = _HEADER_SIZE + position * self.record_size + self.digest_size
+        return _LIST_ID.unpack_from(self._buffer, start)[0]
+
+    def _collect(self, digest: bytes, position: int) -> Tuple[List[int], int]:
+        """List ids of the records equal to ``digest`` from ``position``."""
+        list_ids = []
+        while position < self.count and self._digests[position] == digest:
+            list_ids.append(self._list_id(position))
+            position += 1
+        return list_ids, position
+
+    def lookup(self, digest: bytes) -> List[int]:
+        """
+        List ids containing ``digest``.
+
+        Args:
+            digest: Raw digest bytes
+
+        Returns:
+            Sorted list ids (empty if the digest is not indexed)
+        """
+        if len(digest) != self.digest_size or not self.might_contain(digest):
+            return []
+        position = bisect_left(self._digests, digest)
+        return self._collect(digest, position)[0]
+
+    def match_sorted(self, digests: Iterable[bytes]) -> Iterator[Tuple[bytes, int]]:
+        """
+        Match ascending digests in one forward pass.
+
+        Each search starts where the previous one stopped and gallops
+        (steps 1, 2, 4, ...) before bisecting, so matching m digests costs
+        O(m log(n / m)) record reads instead of m full binary searches.
+
+        Args:
+            digests: Raw digests in ascending order
+
+        Yields:
+            (digest, list_id) for each indexed record of a matching digest
+        """
+        view, count = self._digests, self.count
+        position = 0
+        for digest in digests:
+            if position >= count:
+                return
+            if len(digest) != self.digest_size or not self.might_contain(digest):
+                continue
+            step = 1
+            high = position
+            while high < count and view[high] < digest:
+                position = high + 1
+                high = position + step
+                step *= 2
+            position = bisect_left(view, digest, position, min(high, count))
+            list_ids, position = self._collect(digest, position)
+            for list_id in list_ids:
+                yield digest, list_id
+
+    def iter_records(self) -> Iterator[Tuple[bytes, int]]:
+        """All (digest, list_id) records in index order."""
+        for position in range(self.count):
+            yield self._digests[position], self._list_id(position)
+
+
+class HashIndexBuilder:
+    """
+    Build a hash index with an external merge sort.
+
+    Records added with add() are sorted in runs and spilled to temporary
+    files next to the index. write() merges the runs into a temporary file;
+    commit() moves it into place. close() removes temporary files.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        kind: str,
+        *,
+        bloom_bits_per_entry: int = BLOOM_BITS_PER_ENTRY,
+        run_records: int = RUN_RECORDS,
+    ) -> None:
+        self.path = Path(path)
+        self.digest_size = DIGEST_SIZES[kind]
+        self.record_size = self.digest_size + _LIST_ID.size
+        self.bloom_bits_per_entry = bloom_bits_per_entry
+        self.run_records = run_records
+        self.added = 0
+        self._pending: List[bytes] = []
+        self._packed_id = (-1, b"")
+        self._runs: List[Path] = []
+        self._output: Optional[Path] = None
+
+    def __enter__(self) -> "HashIndexBuilder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add(self, digest: bytes, list_id: int) -> None:
+        """Add one record (raw digest bytes)."""
+        if len(digest) != self.digest_size:
+            raise ValueError(f"Expected {self.digest_size}-byte digest, got {len(digest)}")
+        if self._packed_id[0] != list_id:
+            self._packed_id = (list_id, _LIST_ID.pack(list_id))
+        self._pending.append(digest + self._packed_id[1])
+        self.added += 1
+        if len(self._pending) >= self.run_records:
+            self._spill()
+
+    def _temp_path(self, suffix: str) -> Path:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(dir=self.path.parent, prefix=f"{self.path.name}.", suffix=suffix)
+        os.close(fd)
+        return Path(name)
+
+    def _spill(self) -> None:
+        if not self._pending:
+            return
+        self._pending.sort()
+        run = self._temp_path(".run")
+        with open(run, "wb") as handle:
+            handle.write(b"".join(self._pending))
+        self._runs.append(run)
+        self._pending = []
+
+    def _merge_runs(self, runs: List[Path]) -> Path:
+        """Merge sorted run files into one run file."""
+        merged = self._temp_path(".run")
+        handles = [open(run, "rb") for run in runs]
+        try:
+            with open(merged, "wb", buffering=1024 * 1024) as out:
+                for record in heapq.merge(*(_read_records(h, self.record_size) for h in handles)):
+                    out.write(record)
+        finally:
+            for handle in handles:
+                handle.close()
+        for run in runs:
+            run.unlink()
+        return merged
+
+    def write(self) -> Path:
+        """
+        Merge the added records into a temporary index file.
+
+        Returns:
+            Path of the new index file (moved into place by commit())
+        """
+        self._spill()
+        while len(self._runs) > MAX_MERGE_FANIN:
+            self._runs.append(self._merge_runs(self._runs[:MAX_MERGE_FANIN]))
+            del self._runs[:MAX_MERGE_FANIN]
+
+        output = self._temp_path(".tmp")
+        self._output = output
+        handles: List[BinaryIO] = []
+        count = 0
+        try:
+            sources: List[Iterator[bytes]] = []
+            for run in self._runs:
+                handle = open(run, "rb")
+                handles.append(handle)
+                sources.append(_read_records(handle, self.record_size))
+
+            bloom_bits = 0
+            bloom_k = 0
+            if self.bloom_bits_per_entry > 0 and self.added:
+                bloom_bits = -(-self.bloom_bits_per_entry * self.added // 8) * 8
+                bloom_k = min(_MAX_BLOOM_PROBES, max(1, round(self.bloom_bits_per_entry * math.log(2))))
+            bloom = bytearray(bloom_bits // 8)
+
+            previous = None
+            block: List[bytes] = []
+            from_bytes = int.from_bytes
+            with open(output, "wb", buffering=1024 * 1024) as out:
+                out.write(b"\0" * _HEADER_SIZE)
+                for record in heapq.merge(*sources):
+                    if record == previous:
+                        continue
+                    previous = record
+                    block.append(record)
+                    if bloom_bits:
+                        # Same positions as _bloom_positions, inlined: this
+                        # loop runs once per record
+                        h1 = from_bytes(record[:8], "little")
+                        h2 = from_bytes(record[8:16], "little") | 1
+                        for i in range(bloom_k):
+                            bit = (h1 + i * h2) % bloom_bits
+                            bloom[bit >> 3] |= 1 << (bit & 7)
+                    if len(block) >= _READ_RECORDS:
+                        out.write(b"".join(block))
+                        count += len(block)
+                        block = []
+                out.write(b"".join(block))
+                count += len(block)
+                out.write(bloom)
+                out.seek(0)
+                out.write(_HEADER.pack(_MAGIC, self.digest_size, bloom_k, count, bloom_bits))
+        finally:
+            for handle in handles:
+                handle.close()
+
+        logger.debug("Wrote hash index %s: %d records", self.path.name, count)
+        return output
+
+    def commit(self) -> None:
+        """Replace the index file with the one written by write()."""
+        if self._output is None:
+            raise RuntimeError("write() must be called before commit()")
+        os.replace(self._output, self.path)
+        self._output = None
+
+    def close(self) -> None:
+        """Remove temporary files."""
+        for temp in [*self._runs, *([self._output] if self._output else [])]:
+            try:
+                temp.unlink()
+            except FileNotFoundError:
+                pass
+        self._runs = []
+        self._pending = []
+        self._output = None
@@ -20,12 +20,13 @@ from .logging import get_logger
 LOGGER = get_logger("core.phash")
 
 
-def compute_phash(image_path_or_stream: Path | BinaryIO) -> Optional[str]:
+def compute_phash(image_path_or_stream: "Path | BinaryIO | Image.Image") -> Optional[str]:
     """
     Compute perceptual hash (average hash) for an image.
 
     Args:
-        image_path_or_stream: Path to image file or opened binary stream
+        image_path_or_stream: Path to image file, opened binary stream, or an
+            already opened PIL image (avoids decoding the file twice)
 
     Returns:
         Hexadecimal string representation of the perceptual hash, or None if unavailable
@@ -40,8 +41,11 @@ def compute_phash(image_path_or_stream: Path | BinaryIO) -> Optional[str]:
         return None
 
     try:
-        ensure_pillow_heif_registered()
-        img = Image.open(image_path_or_stream)
+        if isinstance(image_path_or_stream, Image.Image):
+            img = image_path_or_stream
+        else:
+            ensure_pillow_heif_registered()
+            img = Image.open(image_path_or_stream)
         # Use average hash - good balance of speed and accuracy
         phash = imagehash.average_hash(img)
         return str(phash)
@@ -0,0 +1,359 @@
+"""
+Content-addressed store for investigator screenshots.
+
+Screenshot files are stored once per case, named by their SHA-256:
+
+    <case>/screenshot_store/<sha[:2]>/<sha256><ext>
+    <case>/screenshot_store/thumbs/<sha[:2]>/<sha256>.jpg
+
+Identical captures or imports, in the same or in different evidences, share
+one file. ``index.sqlite`` in the store keeps the hashes, size and
+dimensions of each blob and a reference count per evidence, so a blob is
+removed only when the last screenshot row using it is deleted.
+
+Screenshot rows store the blob path relative to the case folder in
+``dest_path``. Rows written before the store existed hold paths relative to
+the evidence folder (``screenshots/<file>``); resolve_screenshot_path
+handles both.
+
+Store operations are thread-safe and meant to run in a worker thread
+(hashing, image decode and thumbnail generation). All ScreenshotStore
+instances of a case share one lock, and each operation runs in a single
+``BEGIN IMMEDIATE`` transaction of ``index.sqlite``, so a release cannot
+remove a blob between the existence check and the reference insert of a
+put (also across processes).
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from .image_codecs import ensure_pillow_heif_registered
+from .logging import get_logger
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+__all__ = [
+    "STORE_DIRNAME",
+    "StoredBlob",
+    "ScreenshotStore",
+    "resolve_screenshot_path",
+]
+
+LOGGER = get_logger("core.screenshot_store")
+
+STORE_DIRNAME = "screenshot_store"
+THUMBNAIL_SIZE = (256, 256)
+
+_INDEX_NAME = "index.sqlite"
+_CHUNK_SIZE = 1024 * 1024
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    md5 TEXT NOT NULL,
+    ext TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    width INTEGER,
+    height INTEGER
+);
+CREATE TABLE IF NOT EXISTS refs (
+    sha256 TEXT NOT NULL,
+    evidence_id INTEGER NOT NULL,
+    ref_count INTEGER NOT NULL,
+    PRIMARY KEY (sha256, evidence_id)
+) WITHOUT ROWID;
+"""
+
+# One lock per store root: callers create a new ScreenshotStore per task
+_ROOT_LOCKS: Dict[str, threading.Lock] = {}
+_ROOT_LOCKS_GUARD = threading.Lock()
+
+
+def _root_lock(root: Path) -> threading.Lock:
+    key = os.path.normcase(os.path.abspath(root))
+    with _ROOT_LOCKS_GUARD:
+        return _ROOT_LOCKS.setdefault(key, threading.Lock())
+
+
+@dataclass(frozen=True)
+class StoredBlob:
+    """A file in the screenshot store."""
+
+    sha256: str
+    md5: str
+    size_bytes: int
+    width: Optional[int]
+    height: Optional[int]
+    rel_path: str  # Relative to the case folder
+    created: bool  # False when identical content was already stored
+
+    @property
+    def thumb_rel_path(self) -> str:
+        return f"{STORE_DIRNAME}/thumbs/{self.sha256[:2]}/{self.sha256}.jpg"
+
+
+def resolve_screenshot_path(
+    case_folder: Path,
+    evidence_label: str,
+    evidence_id: int,
+    dest_path: str,
+) -> Path:
+    """
+    Absolute path of a screenshot file from its ``dest_path`` column.
+
+    Store paths are relative to the case folder; older rows are relative to
+    the evidence folder.
+    """
+    if dest_path.startswith(f"{STORE_DIRNAME}/"):
+        return case_folder / dest_path
+    from .database.manager import slugify_label
+
+    return case_folder / "evidences" / slugify_label(evidence_label, evidence_id) / dest_path
+
+
+def _normalize_ext(suffix: str) -> str:
+    suffix = (suffix or "").lower()
+    if suffix and not suffix.startswith("."):
+        suffix = f".{suffix}"
+    return suffix or ".png"
+
+
+class ScreenshotStore:
+    """Content-addressed screenshot files of one case."""
+
+    def __init__(self, case_folder: Path) -> None:
+        self.case_folder = Path(case_folder)
+        self.root = self.case_folder / STORE_DIRNAME
+        self._lock = _root_lock(self.root)
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        self.root.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.root / _INDEX_NAME, timeout=30, isolation_level=None)
+        conn.executescript(_INDEX_SCHEMA)
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Hold the store lock and a write transaction on the index.
+
+        File changes made inside belong to the transaction: they happen
+        before the commit, while no other thread or process can change the
+        index.
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield conn
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+            finally:
+                conn.close()
+
+    def _blob(self, conn: sqlite3.Connection, sha256: str) -> Optional[Tuple]:
+        return conn.execute(
+            "SELECT md5, ext, size_bytes, width, height FROM blobs WHERE sha256 = ?",
+            (sha256,),
+        ).fetchone()
+
+    # ------------------------------------------------------------------
+    # Adding files
+    # ------------------------------------------------------------------
+
+    def put_bytes(self, data: bytes, suffix: str, evidence_id: int) -> StoredBlob:
+        """Store ``data`` (e.g. an encoded PNG) and add a reference for ``evidence_id``."""
+        sha256 = hashlib.sha256(data).hexdigest()
+        md5 = hashlib.md5(data).hexdigest()
+        return self._put(sha256, md5, len(data), _normalize_ext(suffix), evidence_id, data=data)
+
+    def put_file(self, source: Path, evidence_id: int) -> StoredBlob:
+        """
+        Copy ``source`` into the store and add a reference for ``evidence_id``.
+
+        The file is read once: hashing and copying share the same pass, and
+        the copy is discarded when identical content is already stored.
+        """
+        source = Path(source)
+        self.root.mkdir(parents=True, exist_ok=True)
+        sha = hashlib.sha256()
+        md5 = hashlib.md5()
+        size = 0
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as out, source.open("rb") as handle:
+                while chunk := handle.read(_CHUNK_SIZE):
+                    sha.update(chunk)
+                    md5.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+            return self._put(
+                sha.hexdigest(), md5.hexdigest(), size, _normalize_ext(source.suffix),
+                evidence_id, staged=Path(tmp_name),
+            )
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+    def _put(
+        self,
+        sha256: str,
+        md5: str,
+        size: int,
+        ext: str,
+        evidence_id: int,
+        *,
+        data: Optional[bytes] = None,
+        staged: Optional[Path] = None,
+    ) -> StoredBlob:
+        """Move content into place unless already stored, then add the reference."""
+        with self._transaction() as conn:
+            row = self._blob(conn, sha256)
+            created = row is None
+            if row is not None:
+                md5, ext, size, width, height = row
+            path = self.root / sha256[:2] / f"{sha256}{ext}"
+            if created or not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                if staged is not None:
+                    os.replace(staged, path)
+                else:
+                    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".part")
+                    with os.fdopen(fd, "wb") as handle:
+                        handle.write(data)
+                    os.replace(tmp_name, path)
+            if created:
+                width, height = self._make_thumbnail(path, sha256)
+            conn.execute(
+                "INSERT OR IGNORE INTO blobs (sha256, md5, ext, size_bytes, width, height) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (sha256, md5, ext, size, width, height),
+            )
+            conn.execute(
+                "INSERT INTO refs (sha256, evidence_id, ref_count) VALUES (?, ?, 1) "
+                "ON CONFLICT (sha256, evidence_id) DO UPDATE SET ref_count = ref_count + 1",
+                (sha256, evidence_id),
+            )
+
+        rel_path = f"{STORE_DIRNAME}/{sha256[:2]}/{sha256}{ext}"
+        if not created:
+            LOGGER.debug("Screenshot %s already stored; reusing %s", sha256[:12], rel_path)
+        return StoredBlob(sha256, md5, size, width, height, rel_path, created)
+
+    def _make_thumbnail(self, path: Path, sha256: str) -> Tuple[Optional[int], Optional[int]]:
+        """Write the JPEG thumbnail and return the image dimensions."""
+        if not HAS_PIL:
+            return None, None
+        ensure_pillow_heif_registered()
+        try:
+            with Image.open(path) as img:
+                width, height = img.size
+                img.thumbnail(THUMBNAIL_SIZE)
+                if img.mode not in ("RGB", "L"):
+                    img = img.convert("RGB")
+                thumb = self.root / "thumbs" / sha256[:2] / f"{sha256}.jpg"
+                thumb.parent.mkdir(parents=True, exist_ok=True)
+                img.save(thumb, format="JPEG", quality=85)
+            return width, height
+        except Exception as exc:
+            LOGGER.warning("Could not decode screenshot %s: %s", path.name, exc)
+            return None, None
+
+    # ------------------------------------------------------------------
+    # Lookup and removal
+    # ------------------------------------------------------------------
+
+    def thumbnail_path(self, sha256: str) -> Path:
+        return self.root / "thumbs" / sha256[:2] / f"{sha256}.jpg"
+
+    def ref_count(self, sha256: str, evidence_id: Optional[int] = None) -> int:
+        """References to a blob (from one evidence, or from all)."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                if evidence_id is None:
+                    row = conn.execute(
+                        "SELECT COALESCE(SUM(ref_count), 0) FROM refs WHERE sha256 = ?",
+                        (sha256,),
+                    ).fetchone()
+                else:
+                    row = conn.execute(
+                        "SELECT COALESCE(SUM(ref_count), 0) FROM refs WHERE sha256 = ? AND evidence_id = ?",
+                        (sha256, evidence_id),
+                    ).fetchone()
+                return row[0]
+            finally:
+                conn.close()
+
+    def release(self, sha256: str, evidence_id: int) -> bool:
+        """
+        Drop one reference of ``evidence_id`` to a blob.
+
+        Returns:
+            True if this was the last reference and the files were removed
+        """
+        with self._transaction() as conn:
+            return self._release(conn, ((sha256, evidence_id, 1),)) > 0
+
+    def release_evidence(self, evidence_id: int) -> int:
+        """
+        Drop all references of an evidence (evidence removed from the case).
+
+        Returns:
+            Number of blobs removed
+        """
+        if not (self.root / _INDEX_NAME).exists():
+            return 0
+        with self._transaction() as conn:
+            refs = conn.execute(
+                "SELECT sha256, evidence_id, ref_count FROM refs WHERE evidence_id = ?",
+                (evidence_id,),
+            ).fetchall()
+            return self._release(conn, refs)
+
+    def _release(self, conn: sqlite3.Connection, refs: Iterable[Tuple[str, int, int]]) -> int:
+        """Drop references and delete orphaned blobs; runs inside _transaction."""
+        removed = 0
+        for sha256, evidence_id, count in refs:
+            conn.execute(
+                "UPDATE refs SET ref_count = ref_count - ? WHERE sha256 = ? AND evidence_id = ?",
+                (count, sha256, evidence_id),
+            )
+            conn.execute(
+                "DELETE FROM refs WHERE sha256 = ? AND evidence_id = ? AND ref_count <= 0",
+                (sha256, evidence_id),
+            )
+            remaining = conn.execute(
+                "SELECT 1 FROM refs WHERE sha256 = ? LIMIT 1", (sha256,)
+            ).fetchone()
+            if remaining is not None:
+                continue
+            row = self._blob(conn, sha256)
+            conn.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+            if row is None:
+                continue
+            for path in (self.root / sha256[:2] / f"{sha256}{row[1]}", self.thumbnail_path(sha256)):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            removed += 1
+        return removed
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import sqlite3
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 
 from extractors.callbacks import ExtractorCallbacks
 from core.database import insert_images, delete_discoveries_by_run
@@ -38,7 +38,7 @@ def run_image_ingestion(
     Workflow:
         1. Collect carved image files
         2. Process in parallel (phash, EXIF, thumbnails)
-        3. Insert to images table with enrichment (handles duplicates)
+        3. Insert each processed batch to images table with enrichment (handles duplicates)
         4. Return statistics
 
     Args:
@@ -102,26 +102,21 @@ def run_image_ingestion(
         enable_parallel=enable_parallel,
     )
 
-    try:
-        results = processor.process_images(image_files, output_dir)
-    except Exception as exc:
-        LOGGER.warning("Parallel image ingestion failed (%s); retrying sequentially", exc)
-        callbacks.on_log("Parallel ingestion failed; retrying sequentially", level="warning")
-        processor = ParallelImageProcessor(enable_parallel=False)
-        results = processor.process_images(image_files, output_dir)
-
-    # Insert to database with enrichment support
+    # Insert to database with enrichment support, one processed batch at a time
     inserted = 0
     enriched = 0
     error_count = 0
+    phash_count = 0
 
-    callbacks.on_step(f"Inserting {len(results)} images to database")
+    callbacks.on_step(f"Inserting {total_files} images to database")
 
-    for result in results:
+    for result in _iter_processed(processor, image_files, output_dir, callbacks):
         if result.error is not None:
             error_count += 1
             LOGGER.warning("Skipping failed image %s: %s", result.path, result.error)
             continue
+        if result.phash:
+            phash_count += 1
 
         try:
             # Build image data from processing result
@@ -159,8 +154,6 @@ def run_image_ingestion(
 
     evidence_conn.commit()
 
-    # Count how many have phash
-    phash_count = sum(1 for r in results if r.error is None and r.phash)
     LOGGER.info(
         "Ingestion complete: %d inserted, %d enriched, %d errors, %d with phash",
         inserted, enriched, error_count, phash_count
@@ -175,6 +168,31 @@ def run_image_ingestion(
     }
 
 
+def _iter_processed(
+    processor: ParallelImageProcessor,
+    image_files: List[Path],
+    output_dir: Path,
+    callbacks: ExtractorCallbacks,
+) -> Iterator[ImageProcessResult]:
+    """
+    Yield processing results in input order as batches complete.
+
+    If the processor fails, the images not yet handed out are retried
+    sequentially.
+    """
+    done = 0
+    try:
+        for batch in processor.iter_batches(image_files, output_dir, total=len(image_files)):
+            done += len(batch)
+            yield from batch
+    except Exception as exc:
+        LOGGER.warning("Parallel image ingestion failed (%s); retrying sequentially", exc)
+        callbacks.on_log("Parallel ingestion failed; retrying sequentially", level="warning")
+        fallback = ParallelImageProcessor(enable_parallel=False)
+        for batch in fallback.iter_batches(image_files[done:], output_dir):
+            yield from batch
+
+
 def _collect_image_files(carved_dir: Path) -> List[Path]:
     """
     Collect all image files from carved directory.
@@ -5,18 +5,22 @@ This module provides parallel processing of images using ProcessPoolExecutor for
 operations (hashing, perceptual hashing, EXIF extraction, thumbnail generation).
 
 Maintains forensic integrity through:
-- Deterministic ordering (results sorted by input path)
+- Deterministic ordering (results sorted by input path, or streamed in input order)
 - Complete error handling and logging
 - Reproducible results independent of processing order
 """
 from __future__ import annotations
 
 import json
+import multiprocessing
+import os
+import queue
 import time
 from dataclasses import dataclass, asdict
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List
-from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED, TimeoutError as FuturesTimeoutError
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
+from concurrent.futures import Future, ProcessPoolExecutor, wait, FIRST_COMPLETED, TimeoutError as FuturesTimeoutError
 
 from PIL import Image, UnidentifiedImageError
 from PIL.Image import DecompressionBombError
@@ -31,7 +35,9 @@ LOGGER = get_logger("extractors._shared.carving.processor")
 DEFAULT_MAX_IMAGE_PIXELS = 175_000_000  # keep below Pillow default to retain safety margin
 DEFAULT_IMAGE_TIMEOUT = 30  # seconds per image - prevents hanging on corrupted files
 DEFAULT_BATCH_TIMEOUT_BUFFER = 120  # extra seconds for batch completion
-DEFAULT_STUCK_THRESHOLD = 60  # seconds without progress before considering stuck
+DEFAULT_STUCK_THRESHOLD = 60  # seconds without a finished image before considering stuck
+DEFAULT_CHUNK_SIZE = 32  # images per worker task
+_WAIT_INTERVAL = 5.0  # seconds between progress checks
 
 
 @dataclass(slots=True)
@@ -245,19 +251,82 @@ def process_image_worker(image_path: Path, out_dir: Path, thumb_size: tuple[int,
         )
 
 
+# Per-image progress channel of a pool worker (set by _init_worker)
+_PROGRESS_QUEUE = None
+
+
+def _init_worker(progress_queue) -> None:
+    """Pool initializer: report each finished image on ``progress_queue``."""
+    global _PROGRESS_QUEUE
+    _PROGRESS_QUEUE = progress_queue
+
+
+def process_image_chunk(
+    image_paths: List[Path],
+    out_dir: Path,
+    thumb_size: tuple[int, int] = (256, 256),
+) -> List[ImageProcessResult]:
+    """
+    Process a chunk of images in order (one worker task).
+
+    Top-level so it can run in a process pool. In a pool worker each result
+    is also sent to the progress queue as soon as it is ready, so the
+    parent sees progress (and keeps the finished images) while a chunk is
+    still running.
+    """
+    results = []
+    for img_path in image_paths:
+        result = process_image_worker(img_path, out_dir, thumb_size)
+        if _PROGRESS_QUEUE is not None:
+            _PROGRESS_QUEUE.put(result)
+        results.append(result)
+    return results
+
+
+def _failed_results(image_paths: List[Path], error: str) -> List[ImageProcessResult]:
+    """Error results for images whose worker task did not complete."""
+    return [
+        ImageProcessResult(
+            path=img_path,
+            rel_path=str(img_path),
+            filename=img_path.name,
+            error=error,
+        )
+        for img_path in image_paths
+    ]
+
+
+def _iter_chunks(image_paths: Iterable[Path], chunk_size: int) -> Iterator[List[Path]]:
+    """Split an iterable of paths into lists of ``chunk_size`` without materializing it."""
+    iterator = iter(image_paths)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
 class ParallelImageProcessor:
     """
     Parallel image processor using ProcessPoolExecutor.
 
     Processes multiple images in parallel while maintaining forensic integrity through
     deterministic ordering and complete error handling.
+
+    Images are dispatched in chunks of ``chunk_size`` with at most
+    ``max_in_flight`` chunks submitted or waiting to be handed out, so memory
+    use does not grow with the number of input images. ``iter_batches``
+    hands results to the caller as chunks complete; ``process_images``
+    collects them into one sorted list.
     """
 
     def __init__(
         self,
         max_workers: Optional[int] = None,
         enable_parallel: bool = True,
-        timeout_per_image: float = DEFAULT_IMAGE_TIMEOUT
+        timeout_per_image: float = DEFAULT_IMAGE_TIMEOUT,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_in_flight: Optional[int] = None,
     ):
         """
         Initialize parallel image processor.
@@ -266,10 +335,223 @@ class ParallelImageProcessor:
             max_workers: Maximum number of worker processes (None = CPU count)
             enable_parallel: If False, process sequentially for debugging
             timeout_per_image: Max seconds to wait for a single image (prevents hanging)
+            chunk_size: Images per worker task
+            max_in_flight: Max chunks in flight (None = two per worker)
         """
         self.max_workers = max_workers
         self.enable_parallel = enable_parallel
         self.timeout_per_image = timeout_per_image
+        self.chunk_size = max(1, chunk_size)
+        self.max_in_flight = max_in_flight
+
+    @property
+    def window(self) -> int:
+        """Maximum number of chunks in flight at once."""
+        if self.max_in_flight is not None:
+            return max(1, self.max_in_flight)
+        return 2 * (self.max_workers or os.cpu_count() or 1)
+
+    def iter_batches(
+        self,
+        image_paths: Iterable[Path],
+        out_dir: Path,
+        thumb_size: tuple[int, int] = (256, 256),
+        *,
+        total: Optional[int] = None,
+        ordered: bool = True,
+    ) -> Iterator[List[ImageProcessResult]]:
+        """
+        Process images and yield results one chunk at a time.
+
+        ``image_paths`` is consumed lazily, so it may be a generator.
+
+        Args:
+            image_paths: Image paths to process
+            out_dir: Output directory for carved files
+            thumb_size: Thumbnail dimensions
+            total: Number of images, if known (progress logging only)
+            ordered: Yield chunks in input order (default). If False, chunks
+                are yielded as they complete.
+
+        Yields:
+            Lists of ImageProcessResult, one per chunk. Within a chunk results
+            follow input order. Failed images have the error field set.
+        """
+        LOGGER.info("Processing %s images with parallel=%s, timeout=%ds",
+                    total if total is not None else "streamed", self.enable_parallel,
+                    self.timeout_per_image)
+
+        chunks = _iter_chunks(image_paths, self.chunk_size)
+        counts = {"completed": 0, "success": 0}
+
+        def account(batch: List[ImageProcessResult]) -> List[ImageProcessResult]:
+            before = counts["completed"]
+            counts["completed"] += len(batch)
+            counts["success"] += sum(1 for r in batch if r.error is None)
+            # Progress logging every 100 images
+            for milestone in range(before // 100 + 1, counts["completed"] // 100 + 1):
+                if total is not None:
+                    LOGGER.info("Processed %d/%d images...", milestone * 100, total)
+                else:
+                    LOGGER.info("Processed %d images...", milestone * 100)
+            return batch
+
+        if self.enable_parallel:
+            batches = self._iter_parallel(chunks, out_dir, thumb_size, ordered)
+        else:
+            # Sequential processing for debugging
+            batches = (process_image_chunk(chunk, out_dir, thumb_size) for chunk in chunks)
+
+        for batch in batches:
+            yield account(batch)
+
+        # Log statistics
+        LOGGER.info("Processed %d images: %d success, %d errors", counts["completed"],
+                    counts["success"], counts["completed"] - counts["success"])
+
+    def _iter_parallel(
+        self,
+        chunks: Iterator[List[Path]],
+        out_dir: Path,
+        thumb_size: tuple[int, int],
+        ordered: bool,
+    ) -> Iterator[List[ImageProcessResult]]:
+        """Run chunks in a process pool with a bounded window and stuck detection."""
+        window = self.window
+        in_flight: Dict[Future, Tuple[int, List[Path]]] = {}
+        ready: Dict[int, List[ImageProcessResult]] = {}
+        next_seq = 0
+        next_yield = 0
+        exhausted = False
+        inline = False  # Worker processes unavailable; run chunks in this process
+
+        try:
+            progress_queue = multiprocessing.Queue()
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(progress_queue,),
+            )
+        except PermissionError as exc:
+            LOGGER.warning("Parallel processing unavailable (%s); falling back to sequential", exc)
+            for chunk in chunks:
+                yield process_image_chunk(chunk, out_dir, thumb_size)
+            return
+
+        # Images of in-flight chunks finished so far, reported by the workers
+        finished: Dict[Path, ImageProcessResult] = {}
+        in_flight_paths: set = set()
+
+        def drain_progress() -> bool:
+            progressed = False
+            while True:
+                try:
+                    result = progress_queue.get_nowait()
+                except (queue.Empty, OSError, ValueError):
+                    return progressed
+                progressed = True
+                # Reports can trail their chunk's completion; drop those
+                if result.path in in_flight_paths:
+                    finished[result.path] = result
+
+        try:
+            last_progress_time = time.monotonic()
+            # Progress is reported per image, so a slow chunk does not look stuck
+            stuck_timeout = max(DEFAULT_STUCK_THRESHOLD, self.timeout_per_image)
+
+            while True:
+                # Top up the window; chunks completed but not yet handed out count
+                while not exhausted and len(in_flight) + len(ready) < window:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    if inline:
+                        ready[next_seq] = process_image_chunk(chunk, out_dir, thumb_size)
+                    else:
+                        try:
+                            future = executor.submit(process_image_chunk, chunk, out_dir, thumb_size)
+                        except PermissionError as exc:
+                            LOGGER.warning(
+                                "Parallel processing unavailable (%s); falling back to sequential",
+                                exc,
+                            )
+                            inline = True
+                            ready[next_seq] = process_image_chunk(chunk, out_dir, thumb_size)
+                        else:
+                            in_flight[future] = (next_seq, chunk)
+                            in_flight_paths.update(chunk)
+                    next_seq += 1
+
+                # Hand out completed chunks
+                if ordered:
+                    while next_yield in ready:
+                        yield ready.pop(next_yield)
+                        next_yield += 1
+                else:
+                    for seq in sorted(ready):
+                        yield ready.pop(seq)
+
+                if not in_flight:
+                    if exhausted and not ready:
+                        break
+                    continue
+
+                # Wait for next completion with short timeout for responsiveness
+                done, _ = wait(list(in_flight), timeout=_WAIT_INTERVAL, return_when=FIRST_COMPLETED)
+
+                if drain_progress() or done:
+                    # Made progress - reset stuck timer
+                    last_progress_time = time.monotonic()
+                if done:
+                    for future in done:
+                        seq, chunk = in_flight.pop(future)
+                        in_flight_paths.difference_update(chunk)
+                        for path in chunk:
+                            finished.pop(path, None)
+                        try:
+                            ready[seq] = future.result(timeout=1.0)  # Already done, should be instant
+                        except Exception as exc:
+                            LOGGER.error("Unexpected error processing %d images from %s: %s",
+                                         len(chunk), chunk[0], exc)
+                            ready[seq] = _failed_results(chunk, f"Unexpected: {exc}")
+                    continue
+
+                # No progress in this iteration - check if stuck
+                elapsed = time.monotonic() - last_progress_time
+                if elapsed <= stuck_timeout:
+                    # Still within timeout, log waiting status
+                    LOGGER.debug(
+                        "Waiting for %d pending chunks (%.0fs since last progress)...",
+                        len(in_flight), elapsed
+                    )
+                    continue
+
+                LOGGER.warning(
+                    "No progress for %.0fs - %d workers appear stuck, aborting remaining",
+                    elapsed, len(in_flight)
+                )
+                # Keep the images stuck chunks finished; mark the rest as failed
+                error = f"Worker stuck - no progress for {elapsed:.0f}s"
+                for future, (seq, chunk) in in_flight.items():
+                    ready[seq] = [
+                        finished.get(path) or _failed_results([path], error)[0] for path in chunk
+                    ]
+                    future.cancel()
+                in_flight.clear()
+                # Force shutdown executor - kills stuck workers
+                executor.shutdown(wait=False, cancel_futures=True)
+                for seq in sorted(ready):
+                    yield ready.pop(seq)
+                for chunk in chunks:
+                    yield _failed_results(chunk, error)
+                return
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=not in_flight, cancel_futures=True)
+            progress_queue.cancel_join_thread()
+            progress_queue.close()
 
     def process_images(
         self,
@@ -292,6 +574,7 @@ class ParallelImageProcessor:
             - Results are always returned in the same order (sorted by path)
             - Failed images return ImageProcessResult with error field set
             - Logs processing statistics (success/failure counts)
+            - Holds every result in memory; use iter_batches for large inputs
         """
         if not image_paths:
             LOGGER.debug("No images to process")
@@ -300,108 +583,7 @@ class ParallelImageProcessor:
         # Sort input for deterministic ordering
         sorted_paths = sorted(image_paths)
 
-        LOGGER.info("Processing %d images with parallel=%s, timeout=%ds",
-                    len(sorted_paths), self.enable_parallel, self.timeout_per_image)
-
-        if not self.enable_parallel:
-            # Sequential processing for debugging
-            results = [
-                process_image_worker(img_path, out_dir, thumb_size)
-                for img_path in sorted_paths
-            ]
-        else:
-            # Parallel processing with stuck detection
-            try:
-                path_to_result = {}
-                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-                    # Submit all tasks
-                    future_to_path = {
-                        executor.submit(process_image_worker, img_path, out_dir, thumb_size): img_path
-                        for img_path in sorted_paths
-                    }
-
-                    completed_count = 0
-                    last_progress_time = time.monotonic()
-                    stuck_timeout = DEFAULT_STUCK_THRESHOLD  # seconds without progress = stuck
-
-                    # Collect results with stuck detection
-                    pending = set(future_to_path.keys())
-                    while pending:
-                        # Wait for next completion with short timeout for responsiveness
-                        done, pending = wait(pending, timeout=5.0, return_when=FIRST_COMPLETED)
-
-                        if done:
-                            # Made progress - reset stuck timer
-                            last_progress_time = time.monotonic()
-
-                            for future in done:
-                                img_path = future_to_path[future]
-                                try:
-                                    result = future.result(timeout=1.0)  # Already done, should be instant
-                                    path_to_result[img_path] = result
-                                except Exception as exc:
-                                    LOGGER.error("Unexpected error processing %s: %s", img_path, exc)
-                                    path_to_result[img_path] = ImageProcessResult(
-                                        path=img_path,
-                                        rel_path=str(img_path),
-                                        filename=img_path.name,
-                                        error=f"Unexpected: {exc}",
-                                    )
-                                completed_count += 1
-                                # Progress logging every 100 images
-                                if completed_count % 100 == 0:
-                                    LOGGER.info("Processed %d/%d images...", completed_count, len(sorted_paths))
-                        else:
-                            # No progress in this iteration - check if stuck
-                            elapsed = time.monotonic() - last_progress_time
-                            if elapsed > stuck_timeout:
-                                stuck_count = len(pending)
-                                LOGGER.warning(
-                                    "No progress for %.0fs - %d workers appear stuck, aborting remaining",
-                                    elapsed, stuck_count
-                                )
-                                # Mark all pending as failed and break out
-                                for future in pending:
-                                    img_path = future_to_path[future]
-                                    path_to_result[img_path] = ImageProcessResult(
-                                        path=img_path,
-                                        rel_path=str(img_path),
-                                        filename=img_path.name,
-                                        error=f"Worker stuck - no progress for {elapsed:.0f}s",
-                                    )
-                                    future.cancel()
-                                # Force shutdown executor - kills stuck workers
-                                executor.shutdown(wait=False, cancel_futures=True)
-                                break
-                            else:
-                                # Still within timeout, log waiting status
-                                LOGGER.debug(
-                                    "Waiting for %d pending images (%.0fs since last progress)...",
-                                    len(pending), elapsed
-                                )
-
-                # Re-sort results to match input order (deterministic)
-                results = [path_to_result[img_path] for img_path in sorted_paths]
-            except PermissionError as exc:
-                LOGGER.warning(
-                    "Parallel processing unavailable (%s); falling back to sequential",
-                    exc,
-                )
-                results = [
-                    process_image_worker(img_path, out_dir, thumb_size)
-                    for img_path in sorted_paths
-                ]
-                completed_count = len(results)
-                if completed_count >= 100:
-                    LOGGER.info(
-                        "Processed %d/%d images...",
-                        min(100, completed_count),
-                        len(sorted_paths),
-                    )
-
-        # Log statistics
-        success_count = sum(1 for r in results if r.error is None)
-        error_count = len(results) - success_count
-        LOGGER.info("Processed %d images: %d success, %d errors", len(results), success_count, error_count)
-
+        results: List[ImageProcessResult] = []
+        for batch in self.iter_batches(sorted_paths, out_dir, thumb_size, total=len(sorted_paths)):
+            results.extend(batch)
         return results
@@ -0,0 +1,323 @@
+"""
+Per-evidence content-addressed store for files copied out of evidence.
+
+Several extractors copy the same source file out of the image: the Chromium
+history and downloads extractors both read ``History``, and the Firefox
+history, downloads and bookmarks extractors all read ``places.sqlite``.
+Without coordination each one reads the file through TSK again and keeps
+its own copy in the workspace.
+
+The store keeps one copy of every extracted file under
+``{case_root}/evidences/{label}/.extraction_store/``:
+
+    objects/<sha256[:2]>/<sha256>   file content, named by its SHA-256
+    index.sqlite                    source key -> sha256/md5/size
+
+A source key identifies the file in the evidence, by
+(partition, inode, size, mtime) when file_list metadata is available and by
+(partition, path) otherwise. The first extractor to ask for a key reads the
+file from evidence and stores it; later ones get a hardlink to the stored
+object (or a plain copy where hardlinks are not supported) and the hashes
+computed on the first read.
+
+SQLite companion files (WAL, journal, shm) are stored the same way but
+always copied out: SQLite rewrites ``-shm`` even on a read-only open, which
+would change the shared object under its SHA-256 name.
+
+Stored objects are shared between extractors and must be treated as
+read-only; open SQLite copies through ``safe_sqlite_connect`` (mode=ro).
+
+Usage:
+    store = ExtractionStore.for_output_dir(output_dir)
+    stored = store.materialize(
+        evidence_fs, source_path, dest_path,
+        partition_index=partition_index, inode=inode, size_bytes=size,
+    )
+    companions = store.materialize_companions(
+        evidence_fs, source_path, dest_path, partition_index=partition_index,
+    )
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+__all__ = [
+    "EXTRACTION_STORE_DIRNAME",
+    "SQLITE_COMPANION_SUFFIXES",
+    "ExtractionStore",
+    "StoredFile",
+    "source_key",
+]
+
+LOGGER = logging.getLogger(__name__)
+
+# Directory name of the store inside an evidence workspace folder
+EXTRACTION_STORE_DIRNAME = ".extraction_store"
+
+SQLITE_COMPANION_SUFFIXES = ("-wal", "-journal", "-shm")
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stored_files (
+    source_key TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    md5 TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    logical_path TEXT,
+    stored_at_utc TEXT NOT NULL
+)
+"""
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    """
+    A file held by the extraction store.
+
+    Attributes:
+        path: Location of the shared object inside the store
+        size_bytes: Content size
+        md5: MD5 of the content
+        sha256: SHA-256 of the content (also the object name)
+        reused: True if the content came from an earlier extraction
+            instead of being read from evidence
+    """
+    path: Path
+    size_bytes: int
+    md5: str
+    sha256: str
+    reused: bool = False
+
+
+def source_key(
+    partition_index: Optional[int],
+    logical_path: str,
+    *,
+    inode: Optional[Union[int, str]] = None,
+    size_bytes: Optional[int] = None,
+    mtime: Optional[Union[int, str]] = None,
+) -> str:
+    """
+    Build the store key identifying a file in the evidence.
+
+    With an inode the key is (partition, inode, size, mtime), so hardlinked
+    paths share one copy. Without one it falls back to (partition, path);
+    paths are compared case-sensitively with forward slashes.
+    """
+    partition = partition_index if partition_index is not None else 0
+    if inode not in (None, ""):
+        return f"p{partition}:i{inode}:s{size_bytes if size_bytes is not None else ''}:m{mtime or ''}"
+    normalized = logical_path.replace("\\", "/")
+    return f"p{partition}:path:{normalized}"
+
+
+class ExtractionStore:
+    """
+    Shared copy of evidence files for all extractors of one evidence.
+
+    Safe to use from several threads and processes: the key index is a small
+    SQLite database and objects are written to a temporary file and renamed
+    into place, so a concurrent duplicate copy only wastes the read.
+    """
+
+    _locks_guard = threading.Lock()
+    _root_locks: Dict[str, threading.Lock] = {}
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.index_path = self.root / "index.sqlite"
+        self.hits = 0
+        self.misses = 0
+        self._initialized = False
+
+    @classmethod
+    def for_output_dir(cls, output_dir: Path) -> "ExtractionStore":
+        """
+        Return the store for the evidence that owns an extractor output dir.
+
+        Extractor output dirs follow ``{case_root}/evidences/{label}/{name}/``,
+        so the store lives next to them in the evidence folder.
+        """
+        return cls(Path(output_dir).parent / EXTRACTION_STORE_DIRNAME)
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.objects_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.index_path, timeout=30.0)
+        if not self._initialized:
+            conn.execute(_INDEX_SCHEMA)
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def _lock(self) -> threading.Lock:
+        key = str(self.root)
+        with self._locks_guard:
+            lock = self._root_locks.get(key)
+            if lock is None:
+                lock = self._root_locks[key] = threading.Lock()
+            return lock
+
+    def object_path(self, sha256: str) -> Path:
+        """Return the object path for a content hash."""
+        return self.objects_dir / sha256[:2] / sha256
+
+    def lookup(self, key: str) -> Optional[StoredFile]:
+        """Return the stored file for ``key``, or None if not stored yet."""
+        if not self.index_path.exists():
+            return None
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT sha256, md5, size_bytes FROM stored_files WHERE source_key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        path = self.object_path(row[0])
+        if not path.is_file():
+            # Object removed behind our back; treat as not stored
+            return None
+        return StoredFile(path=path, size_bytes=row[2], md5=row[1], sha256=row[0], reused=True)
+
+    def put_bytes(self, key: str, content: bytes, logical_path: Optional[str] = None) -> StoredFile:
+        """Store ``content`` under ``key`` and return the stored file."""
+        sha256 = hashlib.sha256(content).hexdigest()
+        md5 = hashlib.md5(content).hexdigest()
+        path = self.object_path(sha256)
+
+        with closing(self._connect()) as conn:
+            if not path.is_file():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+                try:
+                    with os.fdopen(fd, "wb") as fh:
+                        fh.write(content)
+                    os.replace(tmp_name, path)
+                except BaseException:
+                    Path(tmp_name).unlink(missing_ok=True)
+                    raise
+            with conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO stored_files
+                        (source_key, sha256, md5, size_bytes, logical_path, stored_at_utc)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (key, sha256, md5, len(content), logical_path,
+                     datetime.now(timezone.utc).isoformat()),
+                )
+        return StoredFile(path=path, size_bytes=len(content), md5=md5, sha256=sha256)
+
+    # ------------------------------------------------------------------
+    # Extractor API
+    # ------------------------------------------------------------------
+
+    def materialize(
+        self,
+        evidence_fs,
+        source_path: str,
+        dest_path: Path,
+        *,
+        partition_index: Optional[int] = None,
+        inode: Optional[Union[int, str]] = None,
+        size_bytes: Optional[int] = None,
+        mtime: Optional[Union[int, str]] = None,
+        link: bool = True,
+    ) -> StoredFile:
+        """
+        Place the evidence file ``source_path`` at ``dest_path``.
+
+        Reads the file from ``evidence_fs`` only if no extractor stored it
+        before; ``dest_path`` becomes a hardlink to the stored object, or a
+        private copy with ``link=False`` (for files the reader may modify).
+
+        Raises:
+            Whatever ``evidence_fs.read_file`` raises for unreadable files
+        """
+        if partition_index is None:
+            partition_index = getattr(evidence_fs, "partition_index", 0)
+        key = source_key(
+            partition_index, source_path, inode=inode, size_bytes=size_bytes, mtime=mtime
+        )
+
+        # Serialize per store so two threads asking for the same key read it once
+        with self._lock():
+            stored = self.lookup(key)
+            if stored is None:
+                content = evidence_fs.read_file(source_path)
+                stored = self.put_bytes(key, content, logical_path=source_path)
+                self.misses += 1
+            else:
+                self.hits += 1
+                LOGGER.debug("Reusing stored copy of %s (%s)", source_path, stored.sha256[:12])
+
+        self._place(stored.path, Path(dest_path), link)
+        return stored
+
+    def materialize_companions(
+        self,
+        evidence_fs,
+        source_path: str,
+        dest_path: Path,
+        *,
+        partition_index: Optional[int] = None,
+        suffixes: Sequence[str] = SQLITE_COMPANION_SUFFIXES,
+    ) -> List[Dict[str, Any]]:
+        """
+        Materialize SQLite companion files (WAL, journal, shm) next to ``dest_path``.
+
+        Companions are copied rather than linked, since SQLite writes to
+        them on open. Missing companions are skipped.
+
+        Returns:
+            ``[{"suffix": ..., "size_bytes": ...}]`` for each companion found
+        """
+        companions = []
+        for suffix in suffixes:
+            try:
+                stored = self.materialize(
+                    evidence_fs,
+                    source_path + suffix,
+                    Path(str(dest_path) + suffix),
+                    partition_index=partition_index,
+                    link=False,
+                )
+            except Exception:
+                continue  # Companion doesn't exist
+            companions.append({"suffix": suffix, "size_bytes": stored.size_bytes})
+        return companions
+
+    @staticmethod
+    def _place(object_path: Path, dest_path: Path, link: bool) -> None:
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        if dest_path.exists() or dest_path.is_symlink():
+            try:
+                if link and os.path.samefile(object_path, dest_path):
+                    return
+            except OSError:
+                pass
+            dest_path.unlink()
+        if not link:
+            shutil.copyfile(object_path, dest_path)
+            return
+        try:
+            os.link(object_path, dest_path)
+        except OSError:
+            # Cross-device workspace or filesystem without hardlinks
+            shutil.copyfile(object_path, dest_path)
@@ -25,8 +25,8 @@ from urllib.parse import urlparse
 
 from core.logging import get_logger
 from core.database import (
+    BatchWriter,
     insert_image_with_discovery,
-    insert_urls,
     insert_browser_inventory,
     update_inventory_ingestion_status,
 )
@@ -445,64 +445,66 @@ def ingest_appcache_directory(
                 if base_forensic_path and base_logical_path:
                     break
 
-        # First: insert all URLs from the SQLite Index (authoritative source)
-        for response_id, entry_info in response_id_to_entry.items():
-            url = entry_info["url"]
-            if not is_cache_url(url):
-                continue
+        # First: insert all URLs from the SQLite Index (authoritative source),
+        # written in batches
+        with BatchWriter(evidence_conn, evidence_id) as url_writer:
+            for response_id, entry_info in response_id_to_entry.items():
+                url = entry_info["url"]
+                if not is_cache_url(url):
+                    continue
 
-            parsed_url = urlparse(url)
+                parsed_url = urlparse(url)
 
-            # Determine timestamp from the group
-            group_time = None
-            for group in index_data["groups"]:
-                if group.get("group_id") == entry_info.get("cache_id"):
-                    group_time = group.get("last_access_time") or group.get("creation_time")
-                    break
+                # Determine timestamp from the group
+                group_time = None
+                for group in index_data["groups"]:
+                    if group.get("group_id") == entry_info.get("cache_id"):
+                        group_time = group.get("last_access_time") or group.get("creation_time")
+                        break
 
-            timestamp_str = group_time.isoformat() if group_time else datetime.now(timezone.utc).isoformat()
-
-            has_body = response_id in blockfile_response_ids
-            source_path = str(index_path) if not base_forensic_path else base_forensic_path
-
-            url_record = {
-                "url": url,
-                "domain": parsed_url.netloc,
-                "scheme": parsed_url.scheme,
-                "discovered_by": discovered_by,
-                "first_seen_utc": timestamp_str,
-                "last_seen_utc": timestamp_str,
-                "source_path": source_path,
-                "notes": (
-                    f"Application Cache entry (response_id={response_id}, "
-                    f"size={entry_info.get('response_size', 0)})"
-                ),
-                "context": entry_info.get("manifest_url"),
-                "run_id": run_id,
-                "cache_key": str(response_id),
-                "cache_filename": f"response_id_{response_id}",
-                "response_code": None,
-                "content_type": None,
-                "tags": json.dumps({
-                    "cache_backend": "appcache",
-                    "response_id": response_id,
-                    "response_size": entry_info.get("response_size"),
-                    "flags": entry_info.get("flags"),
-                    "origin": entry_info.get("origin"),
-                    "manifest_url": entry_info.get("manifest_url"),
-                    "body_in_blockfile": has_body,
-                    "forensic_path": base_forensic_path,
-                    "logical_path": base_logical_path,
-                }),
-            }
+                timestamp_str = group_time.isoformat() if group_time else datetime.now(timezone.utc).isoformat()
 
-            try:
-                insert_urls(evidence_conn, evidence_id, [url_record])
-                stats["urls"] += 1
-                stats["records"] += 1
-            except Exception as e:
-                if "UNIQUE constraint" not in str(e):
-                    LOGGER.warning("Failed to insert AppCache URL %s: %s", url[:80], e)
+                has_body = response_id in blockfile_response_ids
+                source_path = str(index_path) if not base_forensic_path else base_forensic_path
+
+                url_record = {
+                    "url": url,
+                    "domain": parsed_url.netloc,
+                    "scheme": parsed_url.scheme,
+                    "discovered_by": discovered_by,
+                    "first_seen_utc": timestamp_str,
+                    "last_seen_utc": timestamp_str,
+                    "source_path": source_path,
+                    "notes": (
+                        f"Application Cache entry (response_id={response_id}, "
+                        f"size={entry_info.get('response_size', 0)})"
+                    ),
+                    "context": entry_info.get("manifest_url"),
+                    "run_id": run_id,
+                    "cache_key": str(response_id),
+                    "cache_filename": f"response_id_{response_id}",
+                    "response_code": None,
+                    "content_type": None,
+                    "tags": json.dumps({
+                        "cache_backend": "appcache",
+                        "response_id": response_id,
+                        "response_size": entry_info.get("response_size"),
+                        "flags": entry_info.get("flags"),
+                        "origin": entry_info.get("origin"),
+                        "manifest_url": entry_info.get("manifest_url"),
+                        "body_in_blockfile": has_body,
+                        "forensic_path": base_forensic_path,
+                        "logical_path": base_logical_path,
+                    }),
+                }
+
+                try:
+                    url_writer.add("urls", [url_record])
+                    stats["urls"] += 1
+                    stats["records"] += 1
+                except Exception as e:
+                    if "UNIQUE constraint" not in str(e):
+                        LOGGER.warning("Failed to insert AppCache URL %s: %s", url[:80], e)
 
         # Step 4: Process blockfile entries for body data (images, HTTP headers)
         if entries:
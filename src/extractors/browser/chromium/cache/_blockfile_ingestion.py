@@ -14,6 +14,7 @@ from urllib.parse import urlparse
 
 from core.logging import get_logger
 from core.database import (
+    BatchWriter,
     insert_image_with_discovery,
     insert_urls,
     insert_browser_inventory,
@@ -266,25 +267,27 @@ def ingest_blockfile_directory(
                 if base_forensic_path and base_logical_path:
                     break
 
-        # Process each entry
-        for entry in entries:
-            try:
-                _process_blockfile_entry(
-                    evidence_conn=evidence_conn,
-                    evidence_id=evidence_id,
-                    entry=entry,
-                    cache_dir=cache_dir,
-                    extraction_dir=extraction_dir,
-                    run_id=run_id,
-                    extractor_version=extractor_version,
-                    discovered_by=discovered_by,
-                    warning_collector=warning_collector,
-                    stats=stats,
-                    base_forensic_path=base_forensic_path,
-                    base_logical_path=base_logical_path,
-                )
-            except Exception as e:
-                LOGGER.warning("Failed to process blockfile entry %s: %s", entry.url[:50], e)
+        # Process each entry; URL rows are written in batches
+        with BatchWriter(evidence_conn, evidence_id) as url_writer:
+            for entry in entries:
+                try:
+                    _process_blockfile_entry(
+                        evidence_conn=evidence_conn,
+                        evidence_id=evidence_id,
+                        entry=entry,
+                        cache_dir=cache_dir,
+                        extraction_dir=extraction_dir,
+                        run_id=run_id,
+                        extractor_version=extractor_version,
+                        discovered_by=discovered_by,
+                        warning_collector=warning_collector,
+                        stats=stats,
+                        base_forensic_path=base_forensic_path,
+                        base_logical_path=base_logical_path,
+                        url_writer=url_writer,
+                    )
+                except Exception as e:
+                    LOGGER.warning("Failed to process blockfile entry %s: %s", entry.url[:50], e)
 
         # Update inventory status.
         # The index file entry carries the directory-level totals;
@@ -337,6 +340,7 @@ def _process_blockfile_entry(
     stats: Dict[str, int],
     base_forensic_path: Optional[str] = None,
     base_logical_path: Optional[str] = None,
+    url_writer: Optional[BatchWriter] = None,
 ) -> None:
     """Process a single blockfile cache entry."""
     timestamp = entry.last_used_time or entry.creation_time
@@ -396,7 +400,10 @@ def _process_blockfile_entry(
             }),
         }
 
-        insert_urls(evidence_conn, evidence_id, [url_record])
+        if url_writer is not None:
+            url_writer.add("urls", [url_record])
+        else:
+            insert_urls(evidence_conn, evidence_id, [url_record])
         stats["urls"] += 1
         stats["records"] += 1
     else:
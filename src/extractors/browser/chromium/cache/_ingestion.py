@@ -16,6 +16,7 @@ from urllib.parse import urlparse
 
 from core.logging import get_logger
 from core.database import (
+    BatchWriter,
     insert_image_with_discovery,
     insert_urls,
     insert_browser_inventory,
@@ -144,6 +145,7 @@ def parse_and_ingest_cache_file(
     index_lookup: Optional[Dict[int, IndexEntry]] = None,
     *,
     warning_collector: Optional["ExtractionWarningCollector"] = None,
+    url_writer: Optional[BatchWriter] = None,
 ) -> Dict[str, int]:
     """
     Parse a single cache file and insert URLs/images into database.
@@ -158,6 +160,8 @@ def parse_and_ingest_cache_file(
         extractor_version: Version string for discovered_by
         index_lookup: Optional index entry lookup table
         warning_collector: Optional warning collector
+        url_writer: Optional BatchWriter that queues the URL row instead of
+            inserting it immediately
 
     Returns:
         Dict with urls, images, records counts
@@ -261,7 +265,10 @@ def parse_and_ingest_cache_file(
                 }),
             }
 
-            insert_urls(evidence_conn, evidence_id, [url_record])
+            if url_writer is not None:
+                url_writer.add("urls", [url_record])
+            else:
+                insert_urls(evidence_conn, evidence_id, [url_record])
             stats["urls"] += 1
             stats["records"] += 1
         else:
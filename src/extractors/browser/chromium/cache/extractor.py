@@ -83,6 +83,7 @@ from ...._shared.extraction_warnings import (
 )
 from core.logging import get_logger
 from core.database import (
+    BatchWriter,
     insert_image_with_discovery,
     insert_urls,
     insert_browser_inventory,
@@ -1331,60 +1332,63 @@ class CacheSimpleExtractor(BaseExtractor):
         # Phase 2: Parse cache entry files
         callbacks.on_progress(0, len(files), "Parsing cache files")
 
-        for i, file_entry in enumerate(files):
-            extracted_path = file_entry.get("extracted_path", "")
+        # URL rows from all cache files are written in batches
+        with BatchWriter(evidence_conn, evidence_id) as url_writer:
+            for i, file_entry in enumerate(files):
+                extracted_path = file_entry.get("extracted_path", "")
 
-            if extracted_path in blockfile_processed_files:
-                callbacks.on_progress(i + 1, len(files), "Parsing cache files")
-                continue
-
-            try:
-                inventory_id = self._register_inventory_entry(
-                    evidence_conn,
-                    evidence_id,
-                    run_id,
-                    manifest_data,
-                    file_entry,
-                )
-                stats["inventory_entries"] += 1
+                if extracted_path in blockfile_processed_files:
+                    callbacks.on_progress(i + 1, len(files), "Parsing cache files")
+                    continue
 
-                parse_result = self._parse_and_ingest_cache_file(
-                    evidence_conn,
-                    evidence_id,
-                    run_id,
-                    file_entry,
-                    output_dir,
-                    callbacks,
-                    index_lookup=index_lookup,
-                    warning_collector=warning_collector,
-                )
+                try:
+                    inventory_id = self._register_inventory_entry(
+                        evidence_conn,
+                        evidence_id,
+                        run_id,
+                        manifest_data,
+                        file_entry,
+                    )
+                    stats["inventory_entries"] += 1
 
-                stats["urls"] += parse_result["urls"]
-                stats["images"] += parse_result["images"]
-                stats["records"] += parse_result["records"]
-
-                update_inventory_ingestion_status(
-                    evidence_conn,
-                    inventory_id,
-                    status="ok",
-                    urls_parsed=parse_result["urls"],
-                    records_parsed=parse_result["records"],
-                    notes=parse_result.get("notes"),
-                )
+                    parse_result = self._parse_and_ingest_cache_file(
+                        evidence_conn,
+                        evidence_id,
+                        run_id,
+                        file_entry,
+                        output_dir,
+                        callbacks,
+                        index_lookup=index_lookup,
+                        warning_collector=warning_collector,
+                        url_writer=url_writer,
+                    )
 
-            except Exception as e:
-                error_msg = f"Failed to ingest {file_entry.get('extracted_path')}: {e}"
-                LOGGER.error(error_msg, exc_info=True)
+                    stats["urls"] += parse_result["urls"]
+                    stats["images"] += parse_result["images"]
+                    stats["records"] += parse_result["records"]
 
-                if 'inventory_id' in locals():
                     update_inventory_ingestion_status(
                         evidence_conn,
                         inventory_id,
-                        status="failed",
-                        notes=error_msg,
+                        status="ok",
+                        urls_parsed=parse_result["urls"],
+                        records_parsed=parse_result["records"],
+                        notes=parse_result.get("notes"),
                     )
 
-            callbacks.on_progress(i + 1, len(files), "Parsing cache files")
+                except Exception as e:
+                    error_msg = f"Failed to ingest {file_entry.get('extracted_path')}: {e}"
+                    LOGGER.error(error_msg, exc_info=True)
+
+                    if 'inventory_id' in locals():
+                        update_inventory_ingestion_status(
+                            evidence_conn,
+                            inventory_id,
+                            status="failed",
+                            notes=error_msg,
+                        )
+
+                callbacks.on_progress(i + 1, len(files), "Parsing cache files")
 
         LOGGER.info(
             "Ingestion complete: %d inventory entries, %d URLs, %d images, %d blockfile entries",
@@ -1469,6 +1473,7 @@ class CacheSimpleExtractor(BaseExtractor):
         index_lookup: Optional[Dict[int, IndexEntry]] = None,
         *,
         warning_collector: Optional[ExtractionWarningCollector] = None,
+        url_writer: Optional[BatchWriter] = None,
     ) -> Dict[str, int]:
         """Parse cache file and insert into database."""
         return parse_and_ingest_cache_file(
@@ -1481,6 +1486,7 @@ class CacheSimpleExtractor(BaseExtractor):
             extractor_version=self.metadata.version,
             index_lookup=index_lookup,
             warning_collector=warning_collector,
+            url_writer=url_writer,
         )
 
     def _build_index_lookup(
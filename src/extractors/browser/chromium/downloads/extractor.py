@@ -39,6 +39,7 @@ from ....base import BaseExtractor, ExtractorMetadata
 from ....callbacks import ExtractorCallbacks
 from ....widgets import BrowserConfigWidget
 from ...._shared.sqlite_helpers import safe_sqlite_connect, SQLiteReadError
+from ...._shared.extraction_store import ExtractionStore
 from ...._shared.extraction_warnings import (
     ExtractionWarningCollector,
     discover_unknown_tables,
@@ -736,29 +737,25 @@ class ChromiumDownloadsExtractor(BaseExtractor):
         filename = f"{browser}_{safe_profile}_p{partition_index}_History"
         dest_path = output_dir / filename
 
-        # Read and write file
-        file_content = evidence_fs.read_file(source_path)
-        dest_path.write_bytes(file_content)
-
-        # Calculate hashes
-        md5_hash = hashlib.md5(file_content).hexdigest()
-        sha256_hash = hashlib.sha256(file_content).hexdigest()
-        size = len(file_content)
+        # Copy via the shared extraction store (History is also read by
+        # the history extractor; only the first one reads the evidence)
+        store = ExtractionStore.for_output_dir(output_dir)
+        stored = store.materialize(
+            evidence_fs,
+            source_path,
+            dest_path,
+            partition_index=partition_index,
+            inode=file_info.get("inode"),
+            size_bytes=file_info.get("size_bytes"),
+        )
+        md5_hash = stored.md5
+        sha256_hash = stored.sha256
+        size = stored.size_bytes
 
         # Copy companion files (WAL, journal, shm) for SQLite recovery
-        companion_files = []
-        for suffix in ["-wal", "-journal", "-shm"]:
-            companion_path = source_path + suffix
-            try:
-                companion_content = evidence_fs.read_file(companion_path)
-                companion_dest = Path(str(dest_path) + suffix)
-                companion_dest.write_bytes(companion_content)
-                companion_files.append({
-                    "suffix": suffix,
-                    "size_bytes": len(companion_content),
-                })
-            except Exception:
-                pass  # Companion doesn't exist
+        companion_files = store.materialize_companions(
+            evidence_fs, source_path, dest_path, partition_index=partition_index
+        )
 
         return {
             "copy_status": "ok",
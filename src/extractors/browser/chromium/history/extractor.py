@@ -32,6 +32,7 @@ from ....callbacks import ExtractorCallbacks
 from ....widgets import BrowserConfigWidget
 from ...._shared.timestamps import webkit_to_iso
 from ...._shared.sqlite_helpers import safe_sqlite_connect, SQLiteReadError
+from ...._shared.extraction_store import ExtractionStore
 from ...._shared.file_list_discovery import (
     discover_from_file_list,
     check_file_list_available,
@@ -780,37 +781,32 @@ class ChromiumHistoryExtractor(BaseExtractor):
 
         callbacks.on_log(f"Copying {source_path} to {dest_path.name}", "info")
 
-        # Read and write file
-        file_content = evidence_fs.read_file(source_path)
-        dest_path.write_bytes(file_content)
-
-        # Calculate hashes
-        md5 = hashlib.md5(file_content).hexdigest()
-        sha256 = hashlib.sha256(file_content).hexdigest()
-        size = len(file_content)
+        # Copy via the shared extraction store (History is also read by
+        # the downloads extractor; only the first one reads the evidence)
+        store = ExtractionStore.for_output_dir(output_dir)
+        stored = store.materialize(
+            evidence_fs,
+            source_path,
+            dest_path,
+            partition_index=partition_index,
+            inode=file_info.get("inode"),
+            size_bytes=file_info.get("size_bytes"),
+        )
+        size = stored.size_bytes
 
         # Copy companion files (WAL, journal, shm)
-        companion_files = []
-        for suffix in ["-wal", "-journal", "-shm"]:
-            companion_path = source_path + suffix
-            try:
-                companion_content = evidence_fs.read_file(companion_path)
-                companion_dest = Path(str(dest_path) + suffix)
-                companion_dest.write_bytes(companion_content)
-                companion_files.append({
-                    "suffix": suffix,
-                    "size_bytes": len(companion_content),
-                })
-                callbacks.on_log(f"Copied companion: {companion_path}", "info")
-            except Exception:
-                pass  # Companion doesn't exist
+        companion_files = store.materialize_companions(
+            evidence_fs, source_path, dest_path, partition_index=partition_index
+        )
+        for companion in companion_files:
+            callbacks.on_log(f"Copied companion: {source_path}{companion['suffix']}", "info")
 
         return {
             "copy_status": "ok",
             "size_bytes": size,
             "file_size_bytes": size,
-            "md5": md5,
-            "sha256": sha256,
+            "md5": stored.md5,
+            "sha256": stored.sha256,
             "extracted_path": str(dest_path),
             "browser": browser,
             "profile": profile,
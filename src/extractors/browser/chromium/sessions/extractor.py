@@ -47,15 +47,19 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List
 
 from PySide6.QtWidgets import QWidget, QLabel
 
 from ....base import BaseExtractor, ExtractorMetadata
-from .snss_parser import parse_snss_data, SNSSParseResult
+from .snss_parser import parse_snss_file, SNSSParseResult
 from ....callbacks import ExtractorCallbacks
 from ....widgets import BrowserConfigWidget
 from ...._shared.file_list_discovery import (
@@ -94,6 +98,14 @@ from core.database import (
 
 LOGGER = get_logger("extractors.browser.chromium.sessions")
 
+# Session URL events are cross-posted to the urls table in batches of this size
+URL_INSERT_BATCH = 5000
+
+
+def _parse_session_file(file_path: str) -> SNSSParseResult:
+    """Parse one SNSS file (top-level so it can run in a process pool)."""
+    return parse_snss_file(Path(file_path))
+
 
 class ChromiumSessionsExtractor(BaseExtractor):
     """
@@ -430,82 +442,105 @@ class ChromiumSessionsExtractor(BaseExtractor):
 
         callbacks.on_progress(0, len(files), "Parsing session files")
 
+        jobs = []
         for i, file_entry in enumerate(files):
-            if callbacks.is_cancelled():
-                break
-
             if file_entry.get("copy_status") == "error":
                 callbacks.on_log(f"Skipping failed extraction: {file_entry.get('error_message', 'unknown')}", "warning")
                 continue
 
-            callbacks.on_progress(i + 1, len(files), f"Parsing {file_entry['browser']} session")
-
+            db_path = Path(file_entry["extracted_path"])
+            if not db_path.is_absolute():
+                # Try local_filename first (new format), then extracted_path
+                local_filename = file_entry.get("local_filename")
+                if local_filename:
+                    db_path = output_dir / local_filename
+                else:
+                    db_path = output_dir / db_path.name
+            jobs.append((i, file_entry, db_path))
+
+        def flush_url_data() -> None:
+            # Cross-post session URLs to unified urls table
+            # Each URL+timestamp is a distinct forensic event for timeline reconstruction
+            if not all_url_data:
+                return
             try:
-                inventory_id = insert_browser_inventory(
-                    evidence_conn,
-                    evidence_id=evidence_id,
-                    browser=file_entry["browser"],
-                    artifact_type="sessions",
-                    run_id=run_id,
-                    extracted_path=file_entry["extracted_path"],
-                    extraction_status="ok",
-                    extraction_timestamp_utc=manifest_data["extraction_timestamp_utc"],
-                    logical_path=file_entry["logical_path"],
-                    profile=file_entry.get("profile"),
-                    partition_index=file_entry.get("partition_index"),
-                    fs_type=file_entry.get("fs_type"),
-                    forensic_path=file_entry.get("forensic_path"),
-                    extraction_tool=manifest_data.get("extraction_tool"),
-                    file_size_bytes=file_entry.get("file_size_bytes"),
-                    file_md5=file_entry.get("md5"),
-                    file_sha256=file_entry.get("sha256"),
-                )
-
-                db_path = Path(file_entry["extracted_path"])
-                if not db_path.is_absolute():
-                    # Try local_filename first (new format), then extracted_path
-                    local_filename = file_entry.get("local_filename")
-                    if local_filename:
-                        db_path = output_dir / local_filename
-                    else:
-                        db_path = output_dir / db_path.name
-
-                counts, file_url_data = self._parse_snss_file(
-                    db_path,
-                    file_entry,
-                    run_id,
-                    evidence_id,
-                    evidence_conn,
-                    callbacks,
-                    warning_collector=warning_collector,
-                )
+                insert_urls(evidence_conn, evidence_id, all_url_data)
+                evidence_conn.commit()
+                LOGGER.info("Cross-posted %d session URL events to urls table", len(all_url_data))
+            except Exception as e:
+                LOGGER.debug("Failed to cross-post session URLs: %s", e)
+            all_url_data.clear()
 
-                total_windows += counts.get("windows", 0)
-                total_tabs += counts.get("tabs", 0)
+        parsed_files = self._iter_parsed_session_files(jobs, config, callbacks)
+        try:
+            for (i, file_entry, db_path), parse_result in parsed_files:
+                callbacks.on_progress(i + 1, len(files), f"Parsing {file_entry['browser']} session")
+                inventory_id = None
 
-                # Accumulate URL data (no deduplication - all events preserved)
-                all_url_data.extend(file_url_data)
+                try:
+                    inventory_id = insert_browser_inventory(
+                        evidence_conn,
+                        evidence_id=evidence_id,
+                        browser=file_entry["browser"],
+                        artifact_type="sessions",
+                        run_id=run_id,
+                        extracted_path=file_entry["extracted_path"],
+                        extraction_status="ok",
+                        extraction_timestamp_utc=manifest_data["extraction_timestamp_utc"],
+                        logical_path=file_entry["logical_path"],
+                        profile=file_entry.get("profile"),
+                        partition_index=file_entry.get("partition_index"),
+                        fs_type=file_entry.get("fs_type"),
+                        forensic_path=file_entry.get("forensic_path"),
+                        extraction_tool=manifest_data.get("extraction_tool"),
+                        file_size_bytes=file_entry.get("file_size_bytes"),
+                        file_md5=file_entry.get("md5"),
+                        file_sha256=file_entry.get("sha256"),
+                    )
+                    if isinstance(parse_result, Exception):
+                        raise parse_result
+
+                    counts, file_url_data = self._parse_snss_file(
+                        db_path,
+                        file_entry,
+                        run_id,
+                        evidence_id,
+                        evidence_conn,
+                        callbacks,
+                        warning_collector=warning_collector,
+                        parse_result=parse_result,
+                    )
 
-                update_inventory_ingestion_status(
-                    evidence_conn,
-                    inventory_id=inventory_id,
-                    status="ok",
-                    records_parsed=counts.get("tabs", 0),
-                )
+                    total_windows += counts.get("windows", 0)
+                    total_tabs += counts.get("tabs", 0)
 
-            except Exception as e:
-                error_msg = f"Failed to ingest {file_entry['extracted_path']}: {e}"
-                LOGGER.error(error_msg, exc_info=True)
-                callbacks.on_error(error_msg, "")
+                    # Accumulate URL data (no deduplication - all events preserved)
+                    all_url_data.extend(file_url_data)
+                    if len(all_url_data) >= URL_INSERT_BATCH:
+                        flush_url_data()
 
-                if 'inventory_id' in locals():
                     update_inventory_ingestion_status(
                         evidence_conn,
                         inventory_id=inventory_id,
-                        status="error",
-                        notes=str(e),
+                        status="ok",
+                        records_parsed=counts.get("tabs", 0),
                     )
 
+                except Exception as e:
+                    error_msg = f"Failed to ingest {file_entry['extracted_path']}: {e}"
+                    LOGGER.error(error_msg, exc_info=True)
+                    callbacks.on_error(error_msg, "")
+
+                    if inventory_id is not None:
+                        update_inventory_ingestion_status(
+                            evidence_conn,
+                            inventory_id=inventory_id,
+                            status="error",
+                            notes=str(e),
+                        )
+        finally:
+            parsed_files.close()
+
         # Flush schema warnings to database
         warning_count = warning_collector.flush_to_database(evidence_conn)
         if warning_count > 0:
@@ -513,15 +548,7 @@ class ChromiumSessionsExtractor(BaseExtractor):
 
         evidence_conn.commit()
 
-        # Cross-post all session URLs to unified urls table
-        # Each URL+timestamp is a distinct forensic event for timeline reconstruction
-        if all_url_data:
-            try:
-                insert_urls(evidence_conn, evidence_id, all_url_data)
-                evidence_conn.commit()
-                LOGGER.info("Cross-posted %d session URL events to urls table", len(all_url_data))
-            except Exception as e:
-                LOGGER.debug("Failed to cross-post session URLs: %s", e)
+        flush_url_data()
 
         # Report ingested counts and finish
         if stats:
@@ -857,10 +884,14 @@ class ChromiumSessionsExtractor(BaseExtractor):
         callbacks: ExtractorCallbacks,
         *,
         warning_collector: Optional[ExtractionWarningCollector] = None,
+        parse_result: Optional[SNSSParseResult] = None,
     ) -> tuple[Dict[str, int], List[Dict]]:
         """
         Parse Chromium SNSS session file using proper command-based parsing.
 
+        ``parse_result`` is the already parsed file (from the worker pool);
+        without it the file is parsed here.
+
         Extracts:
         - URLs (all schemes, not just http/https)
         - Page titles
@@ -880,10 +911,13 @@ class ChromiumSessionsExtractor(BaseExtractor):
         url_data_for_aggregation: List[Dict] = []
         source_file = file_entry.get("logical_path", str(file_path))
 
-        try:
-            data = file_path.read_bytes()
-        except Exception as e:
-            LOGGER.error("Failed to read SNSS file: %s", e)
+        if parse_result is None:
+            # Stream the file through the SNSS command reader
+            parse_result = parse_snss_file(file_path)
+
+        read_error = next((e for e in parse_result.errors if e.startswith("Failed to read file")), None)
+        if read_error:
+            LOGGER.error("Failed to read SNSS file: %s", read_error)
             if warning_collector:
                 warning_collector.add_warning(
                     warning_type=WARNING_TYPE_BINARY_FORMAT_ERROR,
@@ -892,13 +926,10 @@ class ChromiumSessionsExtractor(BaseExtractor):
                     artifact_type="sessions",
                     source_file=source_file,
                     item_name="file_read_error",
-                    item_value=str(e),
+                    item_value=read_error,
                 )
             return counts, url_data_for_aggregation
 
-        # Parse using the proper SNSS parser (now returns extended info)
-        parse_result = parse_snss_data(data)
-
         # Report schema warnings from parse result
         if warning_collector:
             # Report encryption (if detected)
@@ -1120,6 +1151,72 @@ class ChromiumSessionsExtractor(BaseExtractor):
 
         return counts, url_data_for_aggregation
 
+    def _iter_parsed_session_files(
+        self,
+        jobs: List[tuple],
+        config: Dict[str, Any],
+        callbacks: ExtractorCallbacks,
+    ) -> Iterator[tuple]:
+        """
+        Yield ``(job, SNSSParseResult)`` for ``(index, file_entry, path)`` jobs, in order.
+
+        Files of all profiles are parsed in a process pool with a bounded
+        number in flight, so parsing overlaps with database inserts. A single
+        file, ``enable_parallel: False`` or a sandbox without process support
+        parses in this process. Stops early when cancelled.
+
+        If a worker fails (e.g. it crashed and broke the pool), the exception
+        is yielded in place of the parse result for that job, and a broken
+        pool's remaining files are parsed in this process.
+        """
+        executor = None
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+        if config.get("enable_parallel", True) and max_workers > 1:
+            try:
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+            except PermissionError as e:
+                LOGGER.warning("Parallel session parsing unavailable (%s); parsing sequentially", e)
+
+        if executor is None:
+            for job in jobs:
+                if callbacks.is_cancelled():
+                    return
+                yield job, parse_snss_file(job[2])
+            return
+
+        window = max_workers * 2
+        in_flight: deque = deque()
+        next_index = 0
+        with executor:
+            try:
+                while next_index < len(jobs) or in_flight:
+                    if callbacks.is_cancelled():
+                        return
+                    while next_index < len(jobs) and len(in_flight) < window:
+                        job = jobs[next_index]
+                        in_flight.append((job, executor.submit(_parse_session_file, str(job[2]))))
+                        next_index += 1
+                    job, future = in_flight.popleft()
+                    try:
+                        parse_result = future.result()
+                    except Exception as e:
+                        LOGGER.error("Session parse worker failed for %s: %s", job[2], e)
+                        yield job, e
+                        if not isinstance(e, BrokenProcessPool):
+                            continue
+                        LOGGER.warning("Session parse pool broke; parsing remaining files sequentially")
+                        remaining = [pending for pending, _ in in_flight] + jobs[next_index:]
+                        in_flight.clear()
+                        for job in remaining:
+                            if callbacks.is_cancelled():
+                                return
+                            yield job, parse_snss_file(job[2])
+                        return
+                    yield job, parse_result
+            finally:
+                for _, future in in_flight:
+                    future.cancel()
+
     def _map_transition_type(self, transition: int) -> str:
         """Map Chromium transition type integer to descriptive string.
 
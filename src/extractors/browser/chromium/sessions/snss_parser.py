@@ -43,7 +43,7 @@ from __future__ import annotations
 import struct
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional, List, Iterator
+from typing import BinaryIO, Optional, List, Iterator
 from pathlib import Path
 
 from core.logging import get_logger
@@ -138,6 +138,11 @@ KNOWN_COMMAND_IDS = {
     CMD_INITIAL_STATE_MARKER,
 }
 
+# Buffer size for streamed file parsing
+STREAM_BUFFER_SIZE = 1024 * 1024
+
+_COMMAND_SIZE = struct.Struct('<H')
+
 # Windows epoch offset (microseconds from 1601-01-01 to 1970-01-01)
 WINDOWS_EPOCH_OFFSET_MICROS = 11644473600000000
 
@@ -510,78 +515,70 @@ def _read_commands(data: bytes) -> Iterator[tuple[int, bytes]]:
         yield (command_id, payload)
 
 
-def parse_snss_file(file_path: Path) -> SNSSParseResult:
+def iter_snss_commands(stream: BinaryIO) -> Iterator[tuple[int, bytes]]:
     """
-    Parse a Chromium SNSS session file.
+    Read commands incrementally from a stream positioned after the header.
 
-    Args:
-        file_path: Path to the SNSS file
+    Works on any object with ``read(n)`` (buffered file, mmap). Only the
+    current command is held in memory; commands are at most 64 KiB.
 
-    Returns:
-        SNSSParseResult with parsed data
+    Yields (command_id, payload) tuples, stopping at a zero-size or
+    truncated command like ``_read_commands``.
     """
-    result = SNSSParseResult()
+    read = stream.read
+    unpack_size = _COMMAND_SIZE.unpack
 
-    try:
-        data = file_path.read_bytes()
-    except Exception as e:
-        result.errors.append(f"Failed to read file: {e}")
-        return result
-
-    return parse_snss_data(data)
+    while True:
+        size_bytes = read(2)
+        if len(size_bytes) < 2:
+            break
+        command_size = unpack_size(size_bytes)[0]
+        if command_size == 0:
+            # Empty command indicates end or error
+            break
 
+        body = read(command_size)
+        if len(body) < command_size:
+            # Incomplete command
+            break
 
-def parse_snss_data(data: bytes) -> SNSSParseResult:
-    """
-    Parse SNSS data from bytes.
+        yield (body[0], body[1:])
 
-    Args:
-        data: Raw SNSS file data
 
-    Returns:
-        SNSSParseResult with parsed data
+class SNSSSessionBuilder:
     """
-    result = SNSSParseResult()
+    Aggregates SNSS commands into tabs and windows as they are decoded.
 
-    if len(data) < 8:
-        result.errors.append("File too small for header")
-        return result
-
-    # Parse header
-    signature, version = struct.unpack_from('<II', data, 0)
-
-    if signature != SNSS_SIGNATURE:
-        result.errors.append(f"Invalid signature: 0x{signature:08X}, expected 0x{SNSS_SIGNATURE:08X}")
-        return result
-
-    result.version = version
-    result.is_encrypted = version in (ENCRYPTED_FILE_VERSION, ENCRYPTED_FILE_VERSION_WITH_MARKER)
-
-    if result.is_encrypted:
-        result.errors.append("Encrypted SNSS files are not supported")
-        return result
-
-    if version not in (FILE_VERSION_1, FILE_VERSION_WITH_MARKER, ENCRYPTED_FILE_VERSION, ENCRYPTED_FILE_VERSION_WITH_MARKER):
-        result.errors.append(f"Unknown SNSS version: {version}")
-        return result
-
-    result.is_valid = True
-
-    # Data structures for aggregation
-    tabs: dict[int, TabInfo] = {}
-    windows: dict[int, WindowInfo] = {}
-    all_navigation_entries: List[NavigationEntry] = []
-    unknown_commands: set = set()
-
-    # Parse commands
-    command_data = data[8:]  # Skip header
+    Tab state is only final at the end of the file (later commands close
+    tabs or change the selected navigation), so results are produced by
+    ``finish()``.
+    """
 
-    for command_id, payload in _read_commands(command_data):
+    def __init__(self, result: SNSSParseResult):
+        self.result = result
+        self.tabs: dict[int, TabInfo] = {}
+        self.windows: dict[int, WindowInfo] = {}
+
+    def _tab(self, tab_id: int) -> TabInfo:
+        tab = self.tabs.get(tab_id)
+        if tab is None:
+            tab = self.tabs[tab_id] = TabInfo(tab_id=tab_id)
+        return tab
+
+    def _window(self, window_id: int) -> WindowInfo:
+        window = self.windows.get(window_id)
+        if window is None:
+            window = self.windows[window_id] = WindowInfo(window_id=window_id)
+        return window
+
+    def feed(self, command_id: int, payload: bytes) -> None:
+        """Apply one command."""
+        result = self.result
         result.total_commands += 1
 
         # Track unknown command IDs for schema warnings
         if command_id not in KNOWN_COMMAND_IDS:
-            unknown_commands.add(command_id)
+            result.unknown_commands.add(command_id)
 
         try:
             # Navigation entries: command 6 in Session_* files, command 1 in Tabs_* files
@@ -589,84 +586,159 @@ def parse_snss_data(data: bytes) -> SNSSParseResult:
                 parsed = parse_navigation_entry(payload, 0)
                 if parsed:
                     tab_id, entry = parsed
-                    if tab_id not in tabs:
-                        tabs[tab_id] = TabInfo(tab_id=tab_id)
-                    tabs[tab_id].navigations.append(entry)
-                    all_navigation_entries.append(entry)
+                    self._tab(tab_id).navigations.append(entry)
+                    result.navigation_entries.append(entry)
 
             # Tab-window association: command 0 in Session_* files, command 4 in Tabs_* files
             elif command_id in (CMD_SET_TAB_WINDOW, CMD_TAB_SET_TAB_WINDOW):
                 parsed = parse_set_tab_window(payload)
                 if parsed:
                     window_id, tab_id = parsed
-                    if tab_id not in tabs:
-                        tabs[tab_id] = TabInfo(tab_id=tab_id)
-                    tabs[tab_id].window_id = window_id
-                    if window_id not in windows:
-                        windows[window_id] = WindowInfo(window_id=window_id)
+                    self._tab(tab_id).window_id = window_id
+                    self._window(window_id)
 
             elif command_id == CMD_SET_TAB_INDEX_IN_WINDOW:
                 parsed = parse_set_tab_index_in_window(payload)
                 if parsed:
                     tab_id, index = parsed
-                    if tab_id not in tabs:
-                        tabs[tab_id] = TabInfo(tab_id=tab_id)
-                    tabs[tab_id].index_in_window = index
+                    self._tab(tab_id).index_in_window = index
 
             elif command_id == CMD_SET_PINNED_STATE:
                 parsed = parse_set_pinned_state(payload)
                 if parsed:
                     tab_id, is_pinned = parsed
-                    if tab_id not in tabs:
-                        tabs[tab_id] = TabInfo(tab_id=tab_id)
-                    tabs[tab_id].pinned = is_pinned
+                    self._tab(tab_id).pinned = is_pinned
 
             elif command_id == CMD_SET_SELECTED_NAVIGATION_INDEX:
                 parsed = parse_selected_navigation_index(payload)
                 if parsed:
                     tab_id, index = parsed
-                    if tab_id not in tabs:
-                        tabs[tab_id] = TabInfo(tab_id=tab_id)
-                    tabs[tab_id].current_navigation_index = index
+                    self._tab(tab_id).current_navigation_index = index
 
             elif command_id == CMD_SET_SELECTED_TAB_IN_INDEX:
                 parsed = parse_selected_tab_in_index(payload)
                 if parsed:
                     window_id, index = parsed
-                    if window_id not in windows:
-                        windows[window_id] = WindowInfo(window_id=window_id)
-                    windows[window_id].selected_tab_index = index
+                    self._window(window_id).selected_tab_index = index
 
             elif command_id == CMD_LAST_ACTIVE_TIME:
                 parsed = parse_last_active_time(payload)
                 if parsed:
                     tab_id, last_active = parsed
-                    if tab_id not in tabs:
-                        tabs[tab_id] = TabInfo(tab_id=tab_id)
-                    tabs[tab_id].last_active_time = last_active
+                    self._tab(tab_id).last_active_time = last_active
 
             elif command_id == CMD_TAB_CLOSED:
                 parsed = parse_closed(payload)
                 if parsed:
                     tab_id, _ = parsed
-                    tabs.pop(tab_id, None)
+                    self.tabs.pop(tab_id, None)
 
             elif command_id == CMD_WINDOW_CLOSED:
                 parsed = parse_closed(payload)
                 if parsed:
                     window_id, _ = parsed
-                    windows.pop(window_id, None)
+                    self.windows.pop(window_id, None)
 
         except Exception as e:
             LOGGER.debug("Error parsing command %d: %s", command_id, e)
 
-    # Convert to lists and populate result
-    result.tabs = list(tabs.values())
-    result.windows = list(windows.values())
-    result.navigation_entries = all_navigation_entries
-    result.unknown_commands = unknown_commands
+    def finish(self) -> SNSSParseResult:
+        """Populate and return the result."""
+        self.result.tabs = list(self.tabs.values())
+        self.result.windows = list(self.windows.values())
+        return self.result
+
+
+def _parse_header(header: bytes, result: SNSSParseResult) -> bool:
+    """
+    Validate the 8-byte file header and record version info in ``result``.
+
+    Returns True when the commands that follow can be parsed.
+    """
+    if len(header) < 8:
+        result.errors.append("File too small for header")
+        return False
+
+    signature, version = struct.unpack_from('<II', header, 0)
+
+    if signature != SNSS_SIGNATURE:
+        result.errors.append(f"Invalid signature: 0x{signature:08X}, expected 0x{SNSS_SIGNATURE:08X}")
+        return False
+
+    result.version = version
+    result.is_encrypted = version in (ENCRYPTED_FILE_VERSION, ENCRYPTED_FILE_VERSION_WITH_MARKER)
+
+    if result.is_encrypted:
+        result.errors.append("Encrypted SNSS files are not supported")
+        return False
+
+    if version not in (FILE_VERSION_1, FILE_VERSION_WITH_MARKER, ENCRYPTED_FILE_VERSION, ENCRYPTED_FILE_VERSION_WITH_MARKER):
+        result.errors.append(f"Unknown SNSS version: {version}")
+        return False
+
+    result.is_valid = True
+    return True
+
+
+def parse_snss_stream(stream: BinaryIO) -> SNSSParseResult:
+    """
+    Parse SNSS data from a stream, decoding commands as they are read.
+
+    Args:
+        stream: Binary stream (buffered file or mmap) at the file start
+
+    Returns:
+        SNSSParseResult with parsed data
+    """
+    result = SNSSParseResult()
+    if not _parse_header(stream.read(8), result):
+        return result
+
+    builder = SNSSSessionBuilder(result)
+    for command_id, payload in iter_snss_commands(stream):
+        builder.feed(command_id, payload)
+    return builder.finish()
+
+
+def parse_snss_file(file_path: Path) -> SNSSParseResult:
+    """
+    Parse a Chromium SNSS session file.
+
+    The file is streamed; it is never read into memory as a whole.
+
+    Args:
+        file_path: Path to the SNSS file
+
+    Returns:
+        SNSSParseResult with parsed data
+    """
+    try:
+        with open(file_path, "rb", buffering=STREAM_BUFFER_SIZE) as stream:
+            return parse_snss_stream(stream)
+    except OSError as e:
+        result = SNSSParseResult()
+        result.errors.append(f"Failed to read file: {e}")
+        return result
+
+
+def parse_snss_data(data: bytes) -> SNSSParseResult:
+    """
+    Parse SNSS data from bytes.
+
+    Args:
+        data: Raw SNSS file data
+
+    Returns:
+        SNSSParseResult with parsed data
+    """
+    result = SNSSParseResult()
+    if not _parse_header(data[:8], result):
+        return result
 
-    return result
+    builder = SNSSSessionBuilder(result)
+    for command_id, payload in _read_commands(data[8:]):
+        builder.feed(command_id, payload)
+    return builder.finish()
 
 
 def extract_urls_with_metadata(data: bytes, max_urls: int = 0) -> List[dict]:
@@ -9,6 +9,7 @@ Architecture:
 - manifest.py: Incremental JSONL part-file manifest writer
 - strategies/: Pluggable extraction strategies (icat, concurrent, sequential)
 - ingestion.py: Database ingestion with image carving
+- _entries.py: Parallel cache2 entry parsing (URL/image rows for ingestion)
 - image_carver.py: Image extraction and perceptual hashing
 
 This is the canonical location for Firefox cache parsing.
@@ -23,6 +24,7 @@ from .extractor import CacheFirefoxExtractor, FirefoxCacheExtractor
 # Parser module exports
 from .parser import (
     parse_cache2_entry,
+    parse_cache2_metadata,
     parse_elements,
     extract_http_metadata,
     extract_url_from_key,
@@ -98,6 +100,7 @@ __all__ = [
     "FirefoxCacheExtractor",
     # Parser
     "parse_cache2_entry",
+    "parse_cache2_metadata",
     "parse_elements",
     "extract_http_metadata",
     "extract_url_from_key",
@@ -0,0 +1,355 @@
+"""
+Firefox Cache2 Entry Processing
+
+Turns the cache2 entry files listed in an extraction manifest into URL and
+image rows for ingestion.
+
+Entries are handled in chunks (``process_entry_chunk``) that run in worker
+processes with a bounded number of chunks in flight. Each entry file is
+memory-mapped: parsing reads only the trailing metadata offset and the
+metadata region, and the response body is only read when an image is carved
+from it. Workers return rows; the ingesting process is the only database
+writer.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from core.logging import get_logger
+
+from .image_carver import carve_image_from_cache_entry
+from .parser import Cache2ParseResult, parse_cache2_entry
+
+LOGGER = get_logger("extractors.cache_firefox.entries")
+
+# Entries per worker task
+ENTRY_CHUNK_SIZE = 256
+
+# Fewer entries than this are processed in the ingesting process
+PARALLEL_MIN_ENTRIES = 2 * ENTRY_CHUNK_SIZE
+
+# Outcome status values
+STATUS_PARSED = "parsed"
+STATUS_SKIPPED_FAILED = "skipped_failed"
+STATUS_SKIPPED_SUPPORTING = "skipped_supporting"
+STATUS_ERROR = "error"
+
+
+@dataclass
+class EntryOutcome:
+    """Result of processing one manifest file entry."""
+    index: int
+    status: str
+    parse_result: Optional[Cache2ParseResult] = None
+    url_record: Optional[Dict[str, Any]] = None
+    image_data: Optional[Dict[str, Any]] = None
+    discovery_data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+def build_url_record(
+    parse_result: Cache2ParseResult,
+    file_entry: Dict[str, Any],
+    run_id: str,
+    cache_filename: str,
+    extractor_version: str,
+) -> Dict[str, Any]:
+    """Build URL record for database insertion."""
+    parsed_url = urlparse(parse_result.url)
+    meta = parse_result.metadata
+
+    # Derive timestamps
+    first_seen = None
+    last_seen = None
+    if meta.get("last_fetched"):
+        last_seen = meta["last_fetched"]
+        first_seen = meta.get("last_modified") or last_seen
+
+    # Build tags from metadata
+    tags_parts = []
+    if meta.get("fetch_count"):
+        tags_parts.append(f"fetch_count:{meta['fetch_count']}")
+    if meta.get("frecency"):
+        tags_parts.append(f"frecency:{meta['frecency']}")
+    if meta.get("expiration"):
+        tags_parts.append(f"expiration:{meta['expiration']}")
+    cache_tags = ",".join(tags_parts) if tags_parts else None
+
+    return {
+        "url": parse_result.url,
+        "domain": parsed_url.netloc or None,
+        "scheme": parsed_url.scheme or None,
+        "discovered_by": f"cache_firefox:{extractor_version}:{run_id}",
+        "first_seen_utc": first_seen,
+        "last_seen_utc": last_seen,
+        "source_path": file_entry.get("logical_path", file_entry.get("source_path")),
+        "notes": None,
+        "context": None,
+        "run_id": run_id,
+        "cache_key": parse_result.cache_key,
+        "cache_filename": cache_filename,
+        "response_code": parse_result.response_code,
+        "content_type": parse_result.content_type,
+        "tags": cache_tags,
+    }
+
+
+def build_image_rows(
+    carved_result: Dict[str, Any],
+    parse_result: Cache2ParseResult,
+    run_id: str,
+    cache_filename: str,
+    extractor_version: str,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Build the (image_data, discovery_data) pair for insert_image_with_discovery.
+
+    Args:
+        carved_result: Result of carve_image_from_cache_entry
+        parse_result: Parsed cache2 entry
+        run_id: Run identifier
+        cache_filename: Cache entry filename
+        extractor_version: Extractor version string
+
+    Returns:
+        Tuple of (image_data, discovery_data) dicts
+    """
+    meta = parse_result.metadata
+    image_ts = meta.get("last_fetched") or meta.get("last_modified")
+
+    image_data = {
+        "rel_path": carved_result["rel_path"],
+        "filename": carved_result["filename"],
+        "md5": carved_result["md5"],
+        "sha256": carved_result["sha256"],
+        "phash": carved_result["phash"],
+        "ts_utc": image_ts,
+        "notes": f"Carved from Firefox cache2 entry {cache_filename}",
+        "size_bytes": carved_result["size_bytes"],
+    }
+
+    # Source metadata for forensic context
+    elements = parse_result.elements
+    source_metadata = {
+        "response_code": parse_result.response_code,
+        "content_type": parse_result.content_type,
+        "content_encoding": parse_result.content_encoding,
+        "body_size": parse_result.body_size,
+        "fetch_count": meta.get("fetch_count"),
+        "frecency": meta.get("frecency"),
+        "last_fetched": meta.get("last_fetched"),
+        "last_modified": meta.get("last_modified"),
+        "response_head": elements.get("response-head"),
+        "request_method": elements.get("request-method"),
+        "body_storage_path": carved_result["rel_path"],
+    }
+
+    discovery_data = {
+        "discovered_by": "cache_firefox",
+        "run_id": run_id,
+        "extractor_version": extractor_version,
+        "cache_url": parse_result.url,
+        "cache_key": parse_result.cache_key,
+        "cache_filename": cache_filename,
+        "cache_response_time": meta.get("last_fetched"),
+        "source_metadata_json": json.dumps(source_metadata),
+    }
+    return image_data, discovery_data
+
+
+def carve_entry_image(
+    extracted_path: Path,
+    parse_result: Cache2ParseResult,
+    run_dir: Path,
+    cache_filename: str,
+) -> Optional[Dict[str, Any]]:
+    """Carve the response body of a memory-mapped entry file as an image."""
+    with open(extracted_path, "rb") as fh:
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return carve_image_from_cache_entry(
+                data=mapped,
+                meta_offset=parse_result.body_size,
+                content_encoding=parse_result.content_encoding,
+                content_type=parse_result.content_type,
+                run_dir=run_dir,
+                cache_filename=cache_filename,
+            )
+
+
+def _skip_status(file_entry: Dict[str, Any]) -> Optional[str]:
+    """Status of a manifest entry that is not parsed, or None."""
+    # Skip failed extractions (success=False or no extracted_path)
+    if not file_entry.get("success", True) or not file_entry.get("extracted_path"):
+        return STATUS_SKIPPED_FAILED
+
+    # Skip supporting files (index, doomed, trash)
+    if file_entry.get("artifact_type", "cache_firefox") != "cache_firefox":
+        return STATUS_SKIPPED_SUPPORTING
+    return None
+
+
+def _failed_chunk_outcomes(chunk: List[Tuple[int, Dict[str, Any]]], error: str) -> List[EntryOutcome]:
+    """Outcomes for a chunk whose worker task did not complete."""
+    outcomes = []
+    for index, file_entry in chunk:
+        skip_status = _skip_status(file_entry)
+        if skip_status is not None:
+            outcomes.append(EntryOutcome(index=index, status=skip_status))
+        else:
+            outcomes.append(EntryOutcome(index=index, status=STATUS_ERROR, error=error))
+    return outcomes
+
+
+def process_entry(
+    index: int,
+    file_entry: Dict[str, Any],
+    run_dir: Path,
+    run_id: str,
+    extractor_version: str,
+) -> EntryOutcome:
+    """
+    Parse one manifest file entry and build its URL and image rows.
+
+    Supporting files (index, doomed, trash) and failed extractions are
+    skipped. Errors are returned in the outcome instead of raised.
+    """
+    skip_status = _skip_status(file_entry)
+    if skip_status is not None:
+        return EntryOutcome(index=index, status=skip_status)
+
+    try:
+        # Use run_dir (not output_dir) since extracted_path is just the filename
+        extracted_path = run_dir / file_entry["extracted_path"]
+        cache_filename = file_entry.get(
+            "cache_filename",
+            Path(file_entry.get("source_path", "")).name
+        )
+
+        if not extracted_path.exists():
+            raise FileNotFoundError(f"Extracted file missing: {extracted_path}")
+
+        parse_result = parse_cache2_entry(extracted_path, file_entry)
+        outcome = EntryOutcome(index=index, status=STATUS_PARSED, parse_result=parse_result)
+
+        if parse_result.url:
+            outcome.url_record = build_url_record(
+                parse_result, file_entry, run_id, cache_filename, extractor_version
+            )
+
+        # Carve images from response body
+        if parse_result.is_image and parse_result.body_size > 0:
+            carved = carve_entry_image(extracted_path, parse_result, run_dir, cache_filename)
+            if carved:
+                outcome.image_data, outcome.discovery_data = build_image_rows(
+                    carved, parse_result, run_id, cache_filename, extractor_version
+                )
+        return outcome
+    except Exception as e:
+        LOGGER.debug("Failed to process cache entry %s", file_entry.get("source_path"), exc_info=True)
+        return EntryOutcome(index=index, status=STATUS_ERROR, error=str(e))
+
+
+def process_entry_chunk(
+    run_dir: str,
+    run_id: str,
+    extractor_version: str,
+    chunk: List[Tuple[int, Dict[str, Any]]],
+) -> List[EntryOutcome]:
+    """
+    Process ``(index, file_entry)`` pairs in order.
+
+    Top-level so it can run in a process pool.
+    """
+    base = Path(run_dir)
+    return [
+        process_entry(index, file_entry, base, run_id, extractor_version)
+        for index, file_entry in chunk
+    ]
+
+
+def iter_entry_outcomes(
+    files: List[Dict[str, Any]],
+    run_dir: Path,
+    run_id: str,
+    extractor_version: str,
+    *,
+    enable_parallel: bool = True,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+    chunk_size: int = ENTRY_CHUNK_SIZE,
+) -> Iterator[EntryOutcome]:
+    """
+    Yield an EntryOutcome per manifest file entry, in manifest order.
+
+    Chunks of entries are processed in a process pool with at most two
+    chunks per worker in flight. Small manifests, ``enable_parallel=False``
+    or a sandbox without process support are processed in this process.
+    Stops early when cancelled.
+
+    If a worker task fails (e.g. a worker crashed and broke the pool), the
+    entries of its chunk get STATUS_ERROR outcomes; a broken pool's
+    remaining chunks are processed in this process.
+    """
+    chunks = [
+        list(enumerate(files[start:start + chunk_size], start))
+        for start in range(0, len(files), chunk_size)
+    ]
+
+    executor = None
+    max_workers = min(len(chunks), os.cpu_count() or 1)
+    if enable_parallel and len(files) >= PARALLEL_MIN_ENTRIES and max_workers > 1:
+        try:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        except PermissionError as e:
+            LOGGER.warning("Parallel cache2 parsing unavailable (%s); parsing sequentially", e)
+
+    if executor is None:
+        for index, file_entry in enumerate(files):
+            if is_cancelled is not None and is_cancelled():
+                return
+            yield process_entry(index, file_entry, run_dir, run_id, extractor_version)
+        return
+
+    window = max_workers * 2
+    in_flight: Deque = deque()
+    next_chunk = 0
+    with executor:
+        try:
+            while next_chunk < len(chunks) or in_flight:
+                if is_cancelled is not None and is_cancelled():
+                    return
+                while next_chunk < len(chunks) and len(in_flight) < window:
+                    in_flight.append((next_chunk, executor.submit(
+                        process_entry_chunk, str(run_dir), run_id, extractor_version, chunks[next_chunk]
+                    )))
+                    next_chunk += 1
+                chunk_index, future = in_flight.popleft()
+                try:
+                    outcomes = future.result()
+                except Exception as e:
+                    LOGGER.error("cache2 worker failed on %d entries: %s", len(chunks[chunk_index]), e)
+                    yield from _failed_chunk_outcomes(chunks[chunk_index], f"Worker failed: {e}")
+                    if not isinstance(e, BrokenProcessPool):
+                        continue
+                    LOGGER.warning("cache2 worker pool broke; processing remaining entries sequentially")
+                    remaining = [index for index, _ in in_flight] + list(range(next_chunk, len(chunks)))
+                    in_flight.clear()
+                    for index in remaining:
+                        for entry_index, file_entry in chunks[index]:
+                            if is_cancelled is not None and is_cancelled():
+                                return
+                            yield process_entry(entry_index, file_entry, run_dir, run_id, extractor_version)
+                    return
+                yield from outcomes
+        finally:
+            for _, future in in_flight:
+                future.cancel()
@@ -10,6 +10,10 @@ for every cache entry — including entries whose content has been evicted or
 marked for deletion.  This metadata can prove site visits even when the
 cached content is gone.
 
+The record region is decoded in one ``struct.iter_unpack`` pass into a
+:class:`CacheIndexRecords` sequence of tuples; ``CacheIndexEntry`` objects
+are only built when individual entries are accessed.
+
 Reference:
     - CacheIndex.h  (mozilla-central): header/record struct, flag masks
     - CacheIndex.cpp (mozilla-central): kIndexVersion, serialisation logic
@@ -20,7 +24,9 @@ from __future__ import annotations
 import struct
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import (
+    Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING,
+)
 from dataclasses import dataclass
 
 if TYPE_CHECKING:
@@ -41,6 +47,10 @@ HEADER_SIZE = {INDEX_VERSION_9: 12, INDEX_VERSION_A: 16}
 # Record size: 20(hash) + 4 + 8 + 2 + 2 + 1 + 4 = 41 bytes
 RECORD_SIZE = 41
 
+# hash, mFrecency, mOriginAttrsHash, mOnStartTime, mOnStopTime,
+# mContentType, mFlags (network byte order, no padding)
+RECORD_STRUCT = struct.Struct("!20sIQHHBI")
+
 # Trailing CRC hash size
 CRC_SIZE = 4
 
@@ -124,6 +134,59 @@ class CacheIndexEntry:
         return CONTENT_TYPES.get(self.content_type, f"unknown({self.content_type})")
 
 
+class CacheIndexRecords(Sequence[CacheIndexEntry]):
+    """Decoded ``CacheIndexRecord`` region.
+
+    Records are stored as the raw tuples from :data:`RECORD_STRUCT`;
+    indexing and iteration build :class:`CacheIndexEntry` objects on
+    access.  Bulk consumers should use :func:`iter_index_fields` or
+    :attr:`raw` instead.
+    """
+
+    __slots__ = ("_records",)
+
+    def __init__(self, records: Optional[List[tuple]] = None):
+        self._records: List[tuple] = records if records is not None else []
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0, count: Optional[int] = None) -> "CacheIndexRecords":
+        """Decode ``count`` records (default: all whole records) from ``offset``."""
+        if count is None:
+            count = max(len(data) - offset, 0) // RECORD_SIZE
+        region = memoryview(data)[offset:offset + count * RECORD_SIZE]
+        return cls(list(RECORD_STRUCT.iter_unpack(region)))
+
+    @property
+    def raw(self) -> List[tuple]:
+        """Record tuples ``(hash_bytes, frecency, origin_attrs_hash, on_start_time,
+        on_stop_time, content_type, flags)``."""
+        return self._records
+
+    def removed_count(self) -> int:
+        return sum(1 for r in self._records if r[6] & FLAG_REMOVED)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, item: Union[int, slice]):  # type: ignore[override]
+        if isinstance(item, slice):
+            return CacheIndexRecords(self._records[item])
+        return _entry_from_record(self._records[item])
+
+    def __iter__(self) -> Iterator[CacheIndexEntry]:
+        return map(_entry_from_record, self._records)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CacheIndexRecords):
+            return self._records == other._records
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CacheIndexRecords({len(self._records)} records)"
+
+
 @dataclass
 class CacheIndex:
     """Represents a parsed Firefox cache2 index."""
@@ -132,7 +195,7 @@ class CacheIndex:
     timestamp: int              # Unix timestamp (seconds)
     is_dirty: bool
     kb_written: Optional[int]   # None for version 9
-    entries: List[CacheIndexEntry]
+    entries: Sequence[CacheIndexEntry]
     crc_valid: Optional[bool]   # None if not checked
 
 
@@ -272,34 +335,18 @@ def parse_cache_index(
         )
 
     # ------------------------------------------------------------------
-    # Parse records
+    # Parse records (whole region in one pass)
     # ------------------------------------------------------------------
-    entries: List[CacheIndexEntry] = []
-    offset = header_size
     entry_count = entries_data_size // RECORD_SIZE
-    unknown_content_types_seen: set = set()
-    unknown_flag_bits_seen: set = set()
-
-    for i in range(entry_count):
-        try:
-            entry = _parse_index_record(data[offset : offset + RECORD_SIZE])
-            if entry is not None:
-                entries.append(entry)
-                # Track unknown content types
-                if entry.content_type > MAX_KNOWN_CONTENT_TYPE:
-                    unknown_content_types_seen.add(entry.content_type)
-                # Track unknown flag bits
-                unknown_bits = entry.flags & ~ALL_KNOWN_FLAGS
-                if unknown_bits:
-                    unknown_flag_bits_seen.add(f"0x{unknown_bits:08X}")
-        except Exception as e:
-            _warn(
-                "binary_format_error",
-                "warning",
-                f"Failed to parse record {i} at offset {offset}: {e}",
-                {"record_index": i, "offset": offset},
-            )
-        offset += RECORD_SIZE
+    entries = CacheIndexRecords.from_bytes(data, header_size, entry_count)
+    unknown_content_types_seen = {
+        r[5] for r in entries.raw if r[5] > MAX_KNOWN_CONTENT_TYPE
+    }
+    unknown_flag_bits_seen = {
+        f"0x{bits:08X}"
+        for bits in {r[6] & ~ALL_KNOWN_FLAGS for r in entries.raw}
+        if bits
+    }
 
     # Emit aggregated warnings (once, not per-record)
     if unknown_content_types_seen:
@@ -351,7 +398,7 @@ def parse_cache_index(
         "Parsed cache index v0x%X: %d entries, %d removed, dirty=%s",
         version,
         len(entries),
-        sum(1 for e in entries if e.is_removed),
+        entries.removed_count(),
         is_dirty,
     )
 
@@ -361,7 +408,7 @@ def parse_cache_index(
 def parse_journal(
     journal_path: Path,
     warning_collector: Optional["ExtractionWarningCollector"] = None,
-) -> Tuple[List[CacheIndexEntry], List[str]]:
+) -> Tuple[Sequence[CacheIndexEntry], List[str]]:
     """Parse Firefox cache2 journal file (``index.log``).
 
     The journal uses the same 41-byte ``CacheIndexRecord`` format as the
@@ -373,7 +420,7 @@ def parse_journal(
         warning_collector: Optional warning collector.
 
     Returns:
-        Tuple of ``(list[CacheIndexEntry], list[str])``.
+        Tuple of ``(CacheIndexRecords, list[str])``.
     """
     warnings: List[str] = []
     source = str(journal_path)
@@ -404,7 +451,7 @@ def parse_journal(
             data = f.read()
     except Exception as e:
         _warn("file_corrupt", "error", f"Failed to read journal: {e}")
-        return [], warnings
+        return CacheIndexRecords(), warnings
 
     if len(data) < CRC_SIZE:
         _warn(
@@ -412,7 +459,7 @@ def parse_journal(
             "error",
             f"Journal file too small ({len(data)} bytes)",
         )
-        return [], warnings
+        return CacheIndexRecords(), warnings
 
     entries_data_size = len(data) - CRC_SIZE
 
@@ -426,23 +473,7 @@ def parse_journal(
             {"region_size": entries_data_size, "remainder": remainder},
         )
 
-    entries: List[CacheIndexEntry] = []
-    entry_count = entries_data_size // RECORD_SIZE
-    offset = 0
-
-    for i in range(entry_count):
-        try:
-            entry = _parse_index_record(data[offset : offset + RECORD_SIZE])
-            if entry is not None:
-                entries.append(entry)
-        except Exception as e:
-            _warn(
-                "binary_format_error",
-                "warning",
-                f"Failed to parse journal record {i} at offset {offset}: {e}",
-                {"record_index": i, "offset": offset},
-            )
-        offset += RECORD_SIZE
+    entries = CacheIndexRecords.from_bytes(data, 0, entries_data_size // RECORD_SIZE)
 
     LOGGER.info("Parsed cache journal: %d entries", len(entries))
     return entries, warnings
@@ -451,6 +482,56 @@ def parse_journal(
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
+def iter_index_fields(entries: Sequence[CacheIndexEntry]) -> Iterator[Dict[str, Any]]:
+    """Yield one field dict per index record without building dataclasses.
+
+    Keys: ``hash``, ``frecency``, ``origin_attrs_hash``, ``on_start_time``,
+    ``on_stop_time``, ``content_type``, ``content_type_name``,
+    ``file_size_kb``, ``raw_flags`` and the ``is_*``/``has_alt_data`` flags.
+    Plain lists of :class:`CacheIndexEntry` are accepted as well.
+    """
+    if isinstance(entries, CacheIndexRecords):
+        records = entries.raw
+    else:
+        records = [
+            (bytes.fromhex(e.hash), e.frecency, e.origin_attrs_hash, e.on_start_time,
+             e.on_stop_time, e.content_type, e.flags)
+            for e in entries
+        ]
+    content_type_names = CONTENT_TYPES
+    for raw_hash, frecency, origin_attrs_hash, on_start, on_stop, content_type, flags in records:
+        yield {
+            "hash": raw_hash.hex().upper(),
+            "frecency": frecency,
+            "origin_attrs_hash": origin_attrs_hash,
+            "on_start_time": on_start,
+            "on_stop_time": on_stop,
+            "content_type": content_type,
+            "content_type_name": content_type_names.get(content_type)
+            or f"unknown({content_type})",
+            "file_size_kb": flags & FLAG_FILE_SIZE_MASK,
+            "raw_flags": flags,
+            "is_initialized": bool(flags & FLAG_INITIALIZED),
+            "is_anonymous": bool(flags & FLAG_ANONYMOUS),
+            "is_removed": bool(flags & FLAG_REMOVED),
+            "is_pinned": bool(flags & FLAG_PINNED),
+            "has_alt_data": bool(flags & FLAG_HAS_ALT_DATA),
+        }
+
+
+def _entry_from_record(record: tuple) -> CacheIndexEntry:
+    raw_hash, frecency, origin_attrs_hash, on_start, on_stop, content_type, flags = record
+    return CacheIndexEntry(
+        hash=raw_hash.hex().upper(),
+        frecency=frecency,
+        origin_attrs_hash=origin_attrs_hash,
+        on_start_time=on_start,
+        on_stop_time=on_stop,
+        content_type=content_type,
+        flags=flags,
+    )
+
+
 def _parse_index_record(data: bytes) -> Optional[CacheIndexEntry]:
     """Parse a single 41-byte CacheIndexRecord.
 
@@ -466,21 +547,4 @@ def _parse_index_record(data: bytes) -> Optional[CacheIndexEntry]:
     """
     if len(data) < RECORD_SIZE:
         return None
-
-    hash_hex = data[0:20].hex().upper()
-    frecency = struct.unpack("!I", data[20:24])[0]
-    origin_attrs_hash = struct.unpack("!Q", data[24:32])[0]
-    on_start_time = struct.unpack("!H", data[32:34])[0]
-    on_stop_time = struct.unpack("!H", data[34:36])[0]
-    content_type = data[36]
-    flags = struct.unpack("!I", data[37:41])[0]
-
-    return CacheIndexEntry(
-        hash=hash_hex,
-        frecency=frecency,
-        origin_attrs_hash=origin_attrs_hash,
-        on_start_time=on_start_time,
-        on_stop_time=on_stop_time,
-        content_type=content_type,
-        flags=flags,
-    )
+    return _entry_from_record(RECORD_STRUCT.unpack_from(data))
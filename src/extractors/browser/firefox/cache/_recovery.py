@@ -13,9 +13,9 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Sequence, Tuple
 
-from ._index import CacheIndexEntry
+from ._index import CacheIndexEntry, iter_index_fields
 
 LOGGER = logging.getLogger(__name__)
 
@@ -70,17 +70,19 @@ def discover_all_cache_entries(
 
 
 def correlate_index_with_files(
-    index_entries: List[CacheIndexEntry],
+    index_entries: Sequence[CacheIndexEntry],
     discovered_files: Dict[str, List[Path]],
 ) -> List[Dict[str, Any]]:
     """Correlate index entries with discovered entry files.
 
     For each index record, determines whether a corresponding entry file
     exists and, if so, in which directory (``entries``, ``doomed``, or
-    ``trash``).
+    ``trash``).  This is a hash join on the SHA-1 key: discovered files are
+    keyed by file name once, then each index record is a single lookup.
 
     Args:
-        index_entries: Parsed ``CacheIndexEntry`` objects from the index.
+        index_entries: Parsed index records (``CacheIndexRecords`` or a list
+            of ``CacheIndexEntry``).
         discovered_files: Output of :func:`discover_all_cache_entries`.
 
     Returns:
@@ -97,37 +99,25 @@ def correlate_index_with_files(
             file_lookup[file_hash] = (source, path)
 
     results: List[Dict[str, Any]] = []
-    for entry in index_entries:
-        file_info = file_lookup.get(entry.hash)
-
-        results.append({
-            "hash": entry.hash,
-            "frecency": entry.frecency,
-            "origin_attrs_hash": entry.origin_attrs_hash,
-            "on_start_time": entry.on_start_time,
-            "on_stop_time": entry.on_stop_time,
-            "content_type": entry.content_type,
-            "content_type_name": entry.content_type_name,
-            "file_size_kb": entry.file_size_kb,
-            "raw_flags": entry.flags,
-            "is_initialized": entry.is_initialized,
-            "is_anonymous": entry.is_anonymous,
-            "is_removed": entry.is_removed,
-            "is_pinned": entry.is_pinned,
-            "has_alt_data": entry.has_alt_data,
-            "has_file": file_info is not None,
-            "file_source": file_info[0] if file_info else None,
-            "file_path": file_info[1] if file_info else None,
-        })
-
-    # Report statistics
-    total = len(results)
-    with_files = sum(1 for r in results if r["has_file"])
-    removed = sum(1 for r in results if r["is_removed"])
+    with_files = 0
+    removed = 0
+    for fields in iter_index_fields(index_entries):
+        file_info = file_lookup.get(fields["hash"])
+        if file_info is None:
+            fields["has_file"] = False
+            fields["file_source"] = None
+            fields["file_path"] = None
+        else:
+            fields["has_file"] = True
+            fields["file_source"], fields["file_path"] = file_info
+            with_files += 1
+        if fields["is_removed"]:
+            removed += 1
+        results.append(fields)
 
     LOGGER.info(
         "Cache index correlation: %d entries, %d with files, %d marked removed",
-        total,
+        len(results),
         with_files,
         removed,
     )
@@ -11,7 +11,6 @@ import hashlib
 import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
 
 from core.logging import get_logger
 from core.database import (
@@ -33,9 +32,15 @@ from ...._shared.extraction_warnings import (
 from ....callbacks import ExtractorCallbacks
 
 from .parser import parse_cache2_entry
-from .image_carver import carve_image_from_cache_entry
+from ._entries import (
+    EntryOutcome,
+    STATUS_ERROR,
+    STATUS_SKIPPED_FAILED,
+    STATUS_SKIPPED_SUPPORTING,
+    iter_entry_outcomes,
+)
 from .strategies import CHUNK_SIZE
-from ._index import parse_cache_index, parse_journal, CacheIndex
+from ._index import parse_cache_index, parse_journal, iter_index_fields, CacheIndex
 from ._recovery import discover_all_cache_entries, correlate_index_with_files
 from ._schemas import (
     KNOWN_ELEMENT_KEYS,
@@ -48,6 +53,9 @@ from ._schemas import (
 
 LOGGER = get_logger("extractors.cache_firefox.ingestion")
 
+# URL rows per insert_urls call
+URL_INSERT_BATCH = 5000
+
 
 class CacheIngestionHandler:
     """
@@ -163,6 +171,10 @@ class CacheIngestionHandler:
             manifest, manifest_path, run_dir, callbacks
         )
 
+        # Entry hash -> URL, filled while parsing entries and joined
+        # against the cache index afterwards
+        entry_urls: Dict[str, Optional[str]] = {}
+
         try:
             # Process files
             stats = self._process_files(
@@ -175,6 +187,8 @@ class CacheIngestionHandler:
                 callbacks=callbacks,
                 stats=stats,
                 warning_collector=warning_collector,
+                enable_parallel=config.get("enable_parallel", True),
+                entry_urls=entry_urls,
             )
 
             # Process cache index file and doomed/trash entries
@@ -186,6 +200,7 @@ class CacheIngestionHandler:
                 evidence_id=evidence_id,
                 callbacks=callbacks,
                 warning_collector=warning_collector,
+                entry_urls=entry_urls,
             )
             stats["index_entries"] = index_stats.get("index_entries_inserted", 0)
             stats["doomed_entries"] = index_stats.get("doomed_count", 0)
@@ -351,10 +366,16 @@ class CacheIngestionHandler:
         stats: Dict[str, Any],
         *,
         warning_collector: Optional[ExtractionWarningCollector] = None,
+        enable_parallel: bool = True,
+        entry_urls: Optional[Dict[str, Optional[str]]] = None,
     ) -> Dict[str, Any]:
         """
         Process extracted files from manifest.
 
+        Entries are parsed and images carved in worker processes (see
+        _entries.iter_entry_outcomes); this method only writes the returned
+        URL, image and inventory rows.
+
         Args:
             manifest: Manifest dict with files list
             output_dir: Base output directory
@@ -365,6 +386,9 @@ class CacheIngestionHandler:
             callbacks: Progress callbacks
             stats: Statistics dict to update
             warning_collector: Optional warning collector for schema discovery
+            enable_parallel: Parse entries in a process pool
+            entry_urls: Optional dict filled with entry hash -> URL for
+                every parsed entry
 
         Returns:
             Updated statistics dict
@@ -374,54 +398,68 @@ class CacheIngestionHandler:
 
         files = manifest.get("files", [])
         total_files = len(files)
-
-        for idx, file_entry in enumerate(files):
-            if callbacks.is_cancelled():
-                callbacks.on_log("Ingestion cancelled by user")
-                break
-
-            try:
-                result = self._process_single_file(
-                    file_entry=file_entry,
-                    output_dir=output_dir,
-                    run_dir=run_dir,
-                    run_id=run_id,
-                    evidence_conn=evidence_conn,
-                    evidence_id=evidence_id,
-                    manifest=manifest,
-                    stats=stats,
-                    warning_collector=warning_collector,
-                )
-
-                if result.get("url_record"):
-                    url_batch.append(result["url_record"])
-
-                if result.get("inventory_entry"):
-                    inventory_batch.append(result["inventory_entry"])
+        processed = 0
+
+        for outcome in iter_entry_outcomes(
+            files,
+            run_dir,
+            run_id,
+            self.extractor_version,
+            enable_parallel=enable_parallel,
+            is_cancelled=callbacks.is_cancelled,
+        ):
+            file_entry = files[outcome.index]
+            processed += 1
+
+            if outcome.status == STATUS_SKIPPED_FAILED:
+                stats["failed_extractions_skipped"] += 1
+            elif outcome.status == STATUS_SKIPPED_SUPPORTING:
+                stats["supporting_files_skipped"] += 1
+            elif outcome.status == STATUS_ERROR:
+                error_msg = f"Failed to parse {file_entry.get('source_path', 'unknown')}: {outcome.error}"
+                LOGGER.warning(error_msg)
+                callbacks.on_log(error_msg)
+                stats["errors"].append(error_msg)
+            else:
+                try:
+                    inventory_entry = self._write_entry(
+                        outcome=outcome,
+                        file_entry=file_entry,
+                        run_id=run_id,
+                        evidence_conn=evidence_conn,
+                        evidence_id=evidence_id,
+                        manifest=manifest,
+                        stats=stats,
+                        warning_collector=warning_collector,
+                    )
+                except Exception as e:
+                    error_msg = f"Failed to parse {file_entry.get('source_path', 'unknown')}: {e}"
+                    LOGGER.warning(error_msg, exc_info=True)
+                    callbacks.on_log(error_msg)
+                    stats["errors"].append(error_msg)
+                else:
+                    if outcome.url_record:
+                        url_batch.append(outcome.url_record)
+                        if len(url_batch) >= URL_INSERT_BATCH:
+                            stats["urls_inserted"] += insert_urls(evidence_conn, evidence_id, url_batch)
+                            url_batch.clear()
+                    inventory_batch.append(inventory_entry)
                     stats["inventory_entries"] += 1
-
-                if result.get("parsed"):
                     stats["entries_parsed"] += 1
+                    if entry_urls is not None:
+                        entry_hash = Path(file_entry.get("source_path", "")).name.upper()
+                        entry_urls[entry_hash] = outcome.parse_result.url
 
-                if result.get("skipped_supporting"):
-                    stats["supporting_files_skipped"] += 1
-
-                if result.get("skipped_failed"):
-                    stats["failed_extractions_skipped"] += 1
-
-            except Exception as e:
-                error_msg = f"Failed to parse {file_entry.get('source_path', 'unknown')}: {e}"
-                LOGGER.warning(error_msg, exc_info=True)
-                callbacks.on_log(error_msg)
-                stats["errors"].append(error_msg)
+            callbacks.on_progress(processed, total_files)
 
-            callbacks.on_progress(idx + 1, total_files)
+        if processed < total_files:
+            callbacks.on_log("Ingestion cancelled by user")
 
-        # Batch insert URLs
+        # Insert remaining URLs
         if url_batch:
-            insert_urls(evidence_conn, evidence_id, url_batch)
-            stats["urls_inserted"] = len(url_batch)
-            callbacks.on_log(f"Inserted {len(url_batch)} URLs")
+            stats["urls_inserted"] += insert_urls(evidence_conn, evidence_id, url_batch)
+        if stats["urls_inserted"]:
+            callbacks.on_log(f"Inserted {stats['urls_inserted']} URLs")
 
         # Report image count
         if stats.get("images_inserted", 0) > 0:
@@ -443,11 +481,10 @@ class CacheIngestionHandler:
 
         return stats
 
-    def _process_single_file(
+    def _write_entry(
         self,
+        outcome: EntryOutcome,
         file_entry: Dict[str, Any],
-        output_dir: Path,
-        run_dir: Path,
         run_id: str,
         evidence_conn,
         evidence_id: int,
@@ -457,60 +494,27 @@ class CacheIngestionHandler:
         warning_collector: Optional[ExtractionWarningCollector] = None,
     ) -> Dict[str, Any]:
         """
-        Process a single extracted cache file.
+        Write the image and inventory rows of a parsed entry.
 
         Args:
+            outcome: Parsed entry from iter_entry_outcomes
             file_entry: File entry from manifest
-            output_dir: Base output directory
-            run_dir: Run-specific directory
             run_id: Run identifier
             evidence_conn: Database connection
             evidence_id: Evidence ID
             manifest: Full manifest dict
             stats: Statistics dict to update
+            warning_collector: Optional warning collector for schema discovery
 
         Returns:
-            Dict with processing results
+            Inventory entry dict (id, has_url, is_image)
         """
-        result = {
-            "parsed": False,
-            "skipped_supporting": False,
-            "skipped_failed": False,
-            "url_record": None,
-            "inventory_entry": None,
-        }
-
-        # Skip failed extractions (success=False in manifest)
-        if not file_entry.get("success", True):
-            result["skipped_failed"] = True
-            LOGGER.debug("Skipping failed extraction: %s", file_entry.get("source_path", "unknown"))
-            return result
-
-        # Skip entries without extracted_path (failed extractions)
-        if not file_entry.get("extracted_path"):
-            result["skipped_failed"] = True
-            LOGGER.debug("Skipping entry without extracted_path: %s", file_entry.get("source_path", "unknown"))
-            return result
-
-        # Skip supporting files (index, doomed, trash)
-        artifact_type = file_entry.get("artifact_type", "cache_firefox")
-        if artifact_type != "cache_firefox":
-            result["skipped_supporting"] = True
-            return result
-
-        # Use run_dir (not output_dir) since extracted_path is just the filename
-        extracted_path = run_dir / file_entry["extracted_path"]
+        parse_result = outcome.parse_result
         cache_filename = file_entry.get(
             "cache_filename",
             Path(file_entry.get("source_path", "")).name
         )
 
-        if not extracted_path.exists():
-            raise FileNotFoundError(f"Extracted file missing: {extracted_path}")
-
-        # Parse cache2 entry
-        parse_result = parse_cache2_entry(extracted_path, file_entry)
-
         # Collect schema warnings for unknown elements and headers
         if warning_collector:
             self._collect_schema_warnings(
@@ -519,28 +523,15 @@ class CacheIngestionHandler:
                 warning_collector=warning_collector,
             )
 
-        # Build URL record if URL found
-        if parse_result.url:
-            result["url_record"] = self._build_url_record(
-                parse_result=parse_result,
-                file_entry=file_entry,
-                run_id=run_id,
-                cache_filename=cache_filename,
-            )
-
-        # Carve images from response body
-        if parse_result.is_image and parse_result.body_size > 0:
-            carved = self._carve_and_insert_image(
-                extracted_path=extracted_path,
-                parse_result=parse_result,
-                run_dir=run_dir,
-                run_id=run_id,
-                cache_filename=cache_filename,
-                evidence_conn=evidence_conn,
-                evidence_id=evidence_id,
-            )
-            if carved:
+        if outcome.image_data:
+            try:
+                insert_image_with_discovery(
+                    evidence_conn, evidence_id, outcome.image_data, outcome.discovery_data
+                )
                 stats["images_inserted"] = stats.get("images_inserted", 0) + 1
+            except Exception as img_err:
+                if "UNIQUE constraint" not in str(img_err):
+                    LOGGER.warning("Failed to insert carved image: %s", img_err)
 
         # Register in inventory
         inventory_id = insert_browser_inventory(
@@ -564,142 +555,12 @@ class CacheIngestionHandler:
             file_sha256=file_entry.get("sha256"),
         )
 
-        result["inventory_entry"] = {
+        return {
             "id": inventory_id,
             "has_url": bool(parse_result.url),
             "is_image": parse_result.is_image,
         }
 
-        result["parsed"] = True
-        return result
-
-    def _build_url_record(
-        self,
-        parse_result,
-        file_entry: Dict[str, Any],
-        run_id: str,
-        cache_filename: str,
-    ) -> Dict[str, Any]:
-        """Build URL record for database insertion."""
-        parsed_url = urlparse(parse_result.url)
-        meta = parse_result.metadata
-
-        # Derive timestamps
-        first_seen = None
-        last_seen = None
-        if meta.get("last_fetched"):
-            last_seen = meta["last_fetched"]
-            first_seen = meta.get("last_modified") or last_seen
-
-        # Build tags from metadata
-        tags_parts = []
-        if meta.get("fetch_count"):
-            tags_parts.append(f"fetch_count:{meta['fetch_count']}")
-        if meta.get("frecency"):
-            tags_parts.append(f"frecency:{meta['frecency']}")
-        if meta.get("expiration"):
-            tags_parts.append(f"expiration:{meta['expiration']}")
-        cache_tags = ",".join(tags_parts) if tags_parts else None
-
-        return {
-            "url": parse_result.url,
-            "domain": parsed_url.netloc or None,
-            "scheme": parsed_url.scheme or None,
-            "discovered_by": f"cache_firefox:{self.extractor_version}:{run_id}",
-            "first_seen_utc": first_seen,
-            "last_seen_utc": last_seen,
-            "source_path": file_entry.get("logical_path", file_entry.get("source_path")),
-            "notes": None,
-            "context": None,
-            "run_id": run_id,
-            "cache_key": parse_result.cache_key,
-            "cache_filename": cache_filename,
-            "response_code": parse_result.response_code,
-            "content_type": parse_result.content_type,
-            "tags": cache_tags,
-        }
-
-    def _carve_and_insert_image(
-        self,
-        extracted_path: Path,
-        parse_result,
-        run_dir: Path,
-        run_id: str,
-        cache_filename: str,
-        evidence_conn,
-        evidence_id: int,
-    ) -> bool:
-        """
-        Carve image from cache entry and insert into database.
-
-        Returns:
-            True if image was successfully carved and inserted
-        """
-        data = extracted_path.read_bytes()
-
-        carved_result = carve_image_from_cache_entry(
-            data=data,
-            meta_offset=parse_result.body_size,
-            content_encoding=parse_result.content_encoding,
-            content_type=parse_result.content_type,
-            run_dir=run_dir,
-            cache_filename=cache_filename,
-        )
-
-        if not carved_result:
-            return False
-
-        meta = parse_result.metadata
-        image_ts = meta.get("last_fetched") or meta.get("last_modified")
-
-        image_data = {
-            "rel_path": carved_result["rel_path"],
-            "filename": carved_result["filename"],
-            "md5": carved_result["md5"],
-            "sha256": carved_result["sha256"],
-            "phash": carved_result["phash"],
-            "ts_utc": image_ts,
-            "notes": f"Carved from Firefox cache2 entry {cache_filename}",
-            "size_bytes": carved_result["size_bytes"],
-        }
-
-        # Source metadata for forensic context
-        elements = parse_result.elements
-        source_metadata = {
-            "response_code": parse_result.response_code,
-            "content_type": parse_result.content_type,
-            "content_encoding": parse_result.content_encoding,
-            "body_size": parse_result.body_size,
-            "fetch_count": meta.get("fetch_count"),
-            "frecency": meta.get("frecency"),
-            "last_fetched": meta.get("last_fetched"),
-            "last_modified": meta.get("last_modified"),
-            "response_head": elements.get("response-head"),
-            "request_method": elements.get("request-method"),
-            "body_storage_path": carved_result["rel_path"],
-        }
-
-        discovery_data = {
-            "discovered_by": "cache_firefox",
-            "run_id": run_id,
-            "extractor_version": self.extractor_version,
-            "cache_url": parse_result.url,
-            "cache_key": parse_result.cache_key,
-            "cache_filename": cache_filename,
-            "cache_response_time": meta.get("last_fetched"),
-            "source_metadata_json": json.dumps(source_metadata),
-        }
-
-        try:
-            insert_image_with_discovery(
-                evidence_conn, evidence_id, image_data, discovery_data
-            )
-            return True
-        except Exception as img_err:
-            if "UNIQUE constraint" not in str(img_err):
-                LOGGER.warning("Failed to insert carved image: %s", img_err)
-            return False
-
     def _collect_schema_warnings(
         self,
         parse_result,
@@ -823,6 +684,7 @@ class CacheIngestionHandler:
         evidence_id: int,
         callbacks: ExtractorCallbacks,
         warning_collector: Optional[ExtractionWarningCollector] = None,
+        entry_urls: Optional[Dict[str, Optional[str]]] = None,
     ) -> Dict[str, Any]:
         """Parse the cache2 index and correlate with extracted entry files.
 
@@ -840,10 +702,15 @@ class CacheIngestionHandler:
             evidence_id: Evidence ID.
             callbacks: Progress/log callbacks.
             warning_collector: Optional warning collector.
+            entry_urls: Entry hash -> URL of entries already parsed by
+                _process_files; other entries (doomed/trash) are parsed
+                on demand.
 
         Returns:
             Statistics dict with index/doomed/trash counts.
         """
+        if entry_urls is None:
+            entry_urls = {}
         stats: Dict[str, Any] = {
             "index_entries_inserted": 0,
             "journal_entries": 0,
@@ -934,7 +801,7 @@ class CacheIngestionHandler:
             partition_index = idx_entry.get("partition_index", 0)
 
             total_entries = len(index_result.entries)
-            for entry_idx, entry in enumerate(index_result.entries):
+            for entry_idx, fields in enumerate(iter_index_fields(index_result.entries)):
                 # --- Cancellation check (every 200 entries) ---
                 if entry_idx % 200 == 0:
                     if callbacks.is_cancelled():
@@ -948,38 +815,32 @@ class CacheIngestionHandler:
                             f"Correlating index entries ({entry_idx}/{total_entries})",
                         )
 
-                file_source = entry_file_lookup.get(entry.hash)
-                # O(1) URL lookup via pre-built hash map
-                url = self._find_url_for_hash_fast(
-                    entry.hash, _hash_to_file_entry, run_dir,
+                # Hash join on the SHA-1 key
+                entry_hash = fields.pop("hash")
+                file_source = entry_file_lookup.get(entry_hash)
+                if entry_hash in entry_urls:
+                    url = entry_urls[entry_hash]
+                elif file_source is not None:
+                    url = self._find_url_for_hash_fast(
+                        entry_hash, _hash_to_file_entry, run_dir,
+                    )
+                else:
+                    url = None
+                fields.update(
+                    run_id=run_id,
+                    partition_index=partition_index,
+                    source_path=source_path,
+                    entry_hash=entry_hash,
+                    index_version=index_result.version,
+                    index_timestamp=index_result.timestamp,
+                    index_dirty=index_result.is_dirty,
+                    has_entry_file=file_source is not None,
+                    entry_source=file_source,
+                    url=url,
+                    browser="firefox",
+                    profile_path=profile_path,
                 )
-                all_db_rows.append({
-                    "run_id": run_id,
-                    "partition_index": partition_index,
-                    "source_path": source_path,
-                    "entry_hash": entry.hash,
-                    "frecency": entry.frecency,
-                    "origin_attrs_hash": entry.origin_attrs_hash,
-                    "on_start_time": entry.on_start_time,
-                    "on_stop_time": entry.on_stop_time,
-                    "content_type": entry.content_type,
-                    "content_type_name": entry.content_type_name,
-                    "file_size_kb": entry.file_size_kb,
-                    "raw_flags": entry.flags,
-                    "is_initialized": entry.is_initialized,
-                    "is_anonymous": entry.is_anonymous,
-                    "is_removed": entry.is_removed,
-                    "is_pinned": entry.is_pinned,
-                    "has_alt_data": entry.has_alt_data,
-                    "index_version": index_result.version,
-                    "index_timestamp": index_result.timestamp,
-                    "index_dirty": index_result.is_dirty,
-                    "has_entry_file": file_source is not None,
-                    "entry_source": file_source,
-                    "url": url,
-                    "browser": "firefox",
-                    "profile_path": profile_path,
-                })
+                all_db_rows.append(fields)
             else:
                 # Only emit completion if loop wasn't broken by cancel
                 if total_entries > 0:
@@ -1006,8 +867,7 @@ class CacheIngestionHandler:
                 profile_path = jnl_entry.get("profile")
                 partition_index = jnl_entry.get("partition_index", 0)
 
-                total_jnl = len(journal_entries)
-                for jnl_idx, entry in enumerate(journal_entries):
+                for jnl_idx, fields in enumerate(iter_index_fields(journal_entries)):
                     # --- Cancellation check (every 200 entries) ---
                     if jnl_idx % 200 == 0 and callbacks.is_cancelled():
                         callbacks.on_log(
@@ -1015,34 +875,23 @@ class CacheIngestionHandler:
                         )
                         break
 
-                    file_source = entry_file_lookup.get(entry.hash)
-                    all_db_rows.append({
-                        "run_id": run_id,
-                        "partition_index": partition_index,
-                        "source_path": source_path,
-                        "entry_hash": entry.hash,
-                        "frecency": entry.frecency,
-                        "origin_attrs_hash": entry.origin_attrs_hash,
-                        "on_start_time": entry.on_start_time,
-                        "on_stop_time": entry.on_stop_time,
-                        "content_type": entry.content_type,
-                        "content_type_name": entry.content_type_name,
-                        "file_size_kb": entry.file_size_kb,
-                        "raw_flags": entry.flags,
-                        "is_initialized": entry.is_initialized,
-                        "is_anonymous": entry.is_anonymous,
-                        "is_removed": entry.is_removed,
-                        "is_pinned": entry.is_pinned,
-                        "has_alt_data": entry.has_alt_data,
-                        "index_version": None,  # Journal has no header
-                        "index_timestamp": None,
-                        "index_dirty": None,
-                        "has_entry_file": file_source is not None,
-                        "entry_source": "journal" if file_source is None else file_source,
-                        "url": None,
-                        "browser": "firefox",
-                        "profile_path": profile_path,
-                    })
+                    entry_hash = fields.pop("hash")
+                    file_source = entry_file_lookup.get(entry_hash)
+                    fields.update(
+                        run_id=run_id,
+                        partition_index=partition_index,
+                        source_path=source_path,
+                        entry_hash=entry_hash,
+                        index_version=None,  # Journal has no header
+                        index_timestamp=None,
+                        index_dirty=None,
+                        has_entry_file=file_source is not None,
+                        entry_source="journal" if file_source is None else file_source,
+                        url=None,
+                        browser="firefox",
+                        profile_path=profile_path,
+                    )
+                    all_db_rows.append(fields)
 
                 stats["journal_entries"] += len(journal_entries)
 
@@ -28,6 +28,8 @@ Reference:
 
 from __future__ import annotations
 
+import mmap
+import os
 import re
 import struct
 from dataclasses import dataclass, field
@@ -105,6 +107,9 @@ def parse_cache2_entry(file_path: Path, file_entry: Optional[dict] = None) -> Ca
     """
     Parse Firefox cache2 entry file (metadata at END, big-endian).
 
+    The file is memory-mapped and only the last 4 bytes and the metadata
+    region are read; the response body is never loaded.
+
     Args:
         file_path: Path to extracted cache entry file
         file_entry: Optional manifest entry dict (for context)
@@ -113,147 +118,168 @@ def parse_cache2_entry(file_path: Path, file_entry: Optional[dict] = None) -> Ca
         Cache2ParseResult with parsed data
     """
     try:
-        data = file_path.read_bytes()
-        file_size = len(data)
-
-        # Minimum size: at least 4 bytes for meta_offset
-        if file_size < 4:
-            LOGGER.warning("Cache2 entry too small: %s (%d bytes)", file_path, file_size)
-            return Cache2ParseResult()
-
-        # 1. Read metadata offset from LAST 4 bytes (BIG ENDIAN)
-        meta_offset = struct.unpack(">I", data[-4:])[0]
-
-        # Validate meta_offset
-        if meta_offset == 0:
-            # Empty body - metadata starts at 0
-            LOGGER.debug("Empty body in cache entry: %s", file_path)
-        elif meta_offset >= file_size - 4:
-            # meta_offset should point within file before the last 4 bytes
-            LOGGER.warning("Invalid meta_offset %d for file size %d: %s",
-                          meta_offset, file_size, file_path)
-            return Cache2ParseResult()
-
-        # 2. Body is from 0 to meta_offset
-        body_size = meta_offset
-
-        # 3. Calculate hash array size
-        hash_count = (meta_offset + CACHE2_CHUNK_SIZE - 1) // CACHE2_CHUNK_SIZE if meta_offset > 0 else 0
-        hashes_len = hash_count * 2
-
-        # 4. Calculate offsets for metadata components
-        checksum_offset = meta_offset
-        hashes_offset = checksum_offset + 4
-        header_offset = hashes_offset + hashes_len
-
-        # Check if we have enough data for minimum header
-        min_required = header_offset + 28  # 28-byte minimum header
-        if file_size < min_required + 4:  # +4 for meta_offset at end
-            LOGGER.warning("Not enough data for header in %s", file_path)
-            return Cache2ParseResult()
-
-        # 5. Parse header (BIG ENDIAN)
-        header_data = data[header_offset:header_offset + 32]
-        if len(header_data) < 28:
-            LOGGER.warning("Incomplete header in %s", file_path)
-            return Cache2ParseResult()
+        with open(file_path, "rb") as fh:
+            file_size = os.fstat(fh.fileno()).st_size
 
-        try:
-            version = struct.unpack(">I", header_data[0:4])[0]
-        except struct.error:
-            LOGGER.warning("Failed to read version from %s", file_path)
-            return Cache2ParseResult()
+            # Minimum size: at least 4 bytes for meta_offset
+            if file_size < 4:
+                LOGGER.warning("Cache2 entry too small: %s (%d bytes)", file_path, file_size)
+                return Cache2ParseResult()
 
-        # Version 1: 28-byte header (no flags)
-        # Version 2+: 32-byte header (with flags)
-        header_size = 28 if version == 1 else 32
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # 1. Read metadata offset from LAST 4 bytes (BIG ENDIAN)
+                meta_offset = struct.unpack(">I", mapped[-4:])[0]
 
-        if version not in CACHE2_VERSIONS:
-            LOGGER.debug("Unusual cache2 version %d in %s (continuing anyway)", version, file_path)
+                # Validate meta_offset
+                if meta_offset == 0:
+                    # Empty body - metadata starts at 0
+                    LOGGER.debug("Empty body in cache entry: %s", file_path)
+                elif meta_offset >= file_size - 4:
+                    # meta_offset should point within file before the last 4 bytes
+                    LOGGER.warning("Invalid meta_offset %d for file size %d: %s",
+                                  meta_offset, file_size, file_path)
+                    return Cache2ParseResult()
 
-        try:
-            (
-                version,
-                fetch_count,
-                last_fetched,
-                last_modified,
-                frecency,
-                expiration,
-                key_size,
-            ) = struct.unpack(">7I", header_data[0:28])
-        except struct.error as e:
-            LOGGER.warning("Failed to parse cache2 header: %s: %s", file_path, e)
-            return Cache2ParseResult()
-
-        flags = 0
-        if version >= 2 and len(header_data) >= 32:
-            flags = struct.unpack(">I", header_data[28:32])[0]
-
-        # 6. Extract key (URL)
-        key_offset = header_offset + header_size
-
-        # Validate key_size
-        if key_size == 0:
-            LOGGER.debug("Zero key_size in %s", file_path)
-            return Cache2ParseResult()
-
-        if key_offset + key_size > file_size - 4:
-            LOGGER.warning("key_size %d exceeds file bounds in %s", key_size, file_path)
-            return Cache2ParseResult()
-
-        key_bytes = data[key_offset:key_offset + key_size]
-        cache_key = key_bytes.rstrip(b'\x00').decode('utf-8', errors='replace')
-
-        # Extract URL from cache key
-        url = extract_url_from_key(cache_key)
-
-        # 7. Parse elements (key\0value\0 pairs)
-        elements_offset = key_offset + key_size + 1  # +1 for null terminator
-        elements_end = file_size - 4  # Before the meta_offset field
-        elements = parse_elements(data[elements_offset:elements_end])
-
-        # 8. Extract HTTP metadata from elements
-        http_meta = extract_http_metadata(elements)
-
-        # Determine if image based on content type or URL extension
-        is_image = _is_image_content(http_meta.content_type, url)
-
-        # Convert timestamps to ISO format
-        metadata = {
-            "version": version,
-            "fetch_count": fetch_count,
-            "frecency": frecency,
-            "flags": flags,
-        }
+                meta = mapped[meta_offset:]
 
-        if last_fetched > 0 and last_fetched < 2000000000:  # Reasonable Unix timestamp
-            metadata["last_fetched"] = datetime.fromtimestamp(last_fetched, tz=timezone.utc).isoformat()
-            metadata["last_fetched_unix"] = last_fetched
-        if last_modified > 0 and last_modified < 2000000000:
-            metadata["last_modified"] = datetime.fromtimestamp(last_modified, tz=timezone.utc).isoformat()
-            metadata["last_modified_unix"] = last_modified
-        if expiration > 0 and expiration != 0xFFFFFFFF and expiration < 2000000000:
-            metadata["expiration"] = datetime.fromtimestamp(expiration, tz=timezone.utc).isoformat()
-            metadata["expiration_unix"] = expiration
-
-        return Cache2ParseResult(
-            url=url,
-            cache_key=cache_key,
-            metadata=metadata,
-            elements=elements,
-            is_image=is_image,
-            content_type=http_meta.content_type,
-            content_encoding=http_meta.content_encoding,
-            response_code=http_meta.response_code,
-            body_offset=0,
-            body_size=body_size,
-        )
+        return parse_cache2_metadata(meta, meta_offset, file_path)
 
     except Exception as e:
         LOGGER.error("Failed to parse cache2 entry %s: %s", file_path, e, exc_info=True)
         return Cache2ParseResult()
 
 
+def parse_cache2_metadata(meta: bytes, meta_offset: int, file_path: Any = "") -> Cache2ParseResult:
+    """
+    Parse the metadata region of a cache2 entry.
+
+    Args:
+        meta: Bytes from ``meta_offset`` to the end of the file, including
+            the trailing 4-byte metadata offset
+        meta_offset: Offset where metadata begins (= body size)
+        file_path: Entry path, for log messages only
+
+    Returns:
+        Cache2ParseResult with parsed data
+    """
+    meta_size = len(meta)
+
+    # 2. Body is from 0 to meta_offset
+    body_size = meta_offset
+
+    # 3. Calculate hash array size
+    hash_count = (meta_offset + CACHE2_CHUNK_SIZE - 1) // CACHE2_CHUNK_SIZE if meta_offset > 0 else 0
+    hashes_len = hash_count * 2
+
+    # 4. Calculate offsets for metadata components (relative to meta_offset)
+    checksum_offset = 0
+    hashes_offset = checksum_offset + 4
+    header_offset = hashes_offset + hashes_len
+
+    # Check if we have enough data for minimum header
+    min_required = header_offset + 28  # 28-byte minimum header
+    if meta_size < min_required + 4:  # +4 for meta_offset at end
+        LOGGER.warning("Not enough data for header in %s", file_path)
+        return Cache2ParseResult()
+
+    # 5. Parse header (BIG ENDIAN)
+    header_data = meta[header_offset:header_offset + 32]
+    if len(header_data) < 28:
+        LOGGER.warning("Incomplete header in %s", file_path)
+        return Cache2ParseResult()
+
+    try:
+        version = struct.unpack(">I", header_data[0:4])[0]
+    except struct.error:
+        LOGGER.warning("Failed to read version from %s", file_path)
+        return Cache2ParseResult()
+
+    # Version 1: 28-byte header (no flags)
+    # Version 2+: 32-byte header (with flags)
+    header_size = 28 if version == 1 else 32
+
+    if version not in CACHE2_VERSIONS:
+        LOGGER.debug("Unusual cache2 version %d in %s (continuing anyway)", version, file_path)
+
+    try:
+        (
+            version,
+            fetch_count,
+            last_fetched,
+            last_modified,
+            frecency,
+            expiration,
+            key_size,
+        ) = struct.unpack(">7I", header_data[0:28])
+    except struct.error as e:
+        LOGGER.warning("Failed to parse cache2 header: %s: %s", file_path, e)
+        return Cache2ParseResult()
+
+    flags = 0
+    if version >= 2 and len(header_data) >= 32:
+        flags = struct.unpack(">I", header_data[28:32])[0]
+
+    # 6. Extract key (URL)
+    key_offset = header_offset + header_size
+
+    # Validate key_size
+    if key_size == 0:
+        LOGGER.debug("Zero key_size in %s", file_path)
+        return Cache2ParseResult()
+
+    if key_offset + key_size > meta_size - 4:
+        LOGGER.warning("key_size %d exceeds file bounds in %s", key_size, file_path)
+        return Cache2ParseResult()
+
+    key_bytes = meta[key_offset:key_offset + key_size]
+    cache_key = key_bytes.rstrip(b'\x00').decode('utf-8', errors='replace')
+
+    # Extract URL from cache key
+    url = extract_url_from_key(cache_key)
+
+    # 7. Parse elements (key\0value\0 pairs)
+    elements_offset = key_offset + key_size + 1  # +1 for null terminator
+    elements_end = meta_size - 4  # Before the meta_offset field
+    elements = parse_elements(meta[elements_offset:elements_end])
+
+    # 8. Extract HTTP metadata from elements
+    http_meta = extract_http_metadata(elements)
+
+    # Determine if image based on content type or URL extension
+    is_image = _is_image_content(http_meta.content_type, url)
+
+    # Convert timestamps to ISO format
+    metadata = {
+        "version": version,
+        "fetch_count": fetch_count,
+        "frecency": frecency,
+        "flags": flags,
+    }
+
+    if last_fetched > 0 and last_fetched < 2000000000:  # Reasonable Unix timestamp
+        metadata["last_fetched"] = datetime.fromtimestamp(last_fetched, tz=timezone.utc).isoformat()
+        metadata["last_fetched_unix"] = last_fetched
+    if last_modified > 0 and last_modified < 2000000000:
+        metadata["last_modified"] = datetime.fromtimestamp(last_modified, tz=timezone.utc).isoformat()
+        metadata["last_modified_unix"] = last_modified
+    if expiration > 0 and expiration != 0xFFFFFFFF and expiration < 2000000000:
+        metadata["expiration"] = datetime.fromtimestamp(expiration, tz=timezone.utc).isoformat()
+        metadata["expiration_unix"] = expiration
+
+    return Cache2ParseResult(
+        url=url,
+        cache_key=cache_key,
+        metadata=metadata,
+        elements=elements,
+        is_image=is_image,
+        content_type=http_meta.content_type,
+        content_encoding=http_meta.content_encoding,
+        response_code=http_meta.response_code,
+        body_offset=0,
+        body_size=body_size,
+    )
+
+
 def parse_elements(data: bytes) -> Dict[str, str]:
     """
     Parse cache2 elements section (key\\0value\\0 pairs).
@@ -37,6 +37,7 @@ from PySide6.QtWidgets import QWidget, QLabel
 from ....base import BaseExtractor, ExtractorMetadata
 from ....callbacks import ExtractorCallbacks
 from ....widgets import BrowserConfigWidget
+from ...._shared.extraction_store import ExtractionStore
 from ...._shared.file_list_discovery import (
     discover_from_file_list,
     check_file_list_available,
@@ -782,14 +783,21 @@ class FirefoxHistoryExtractor(BaseExtractor):
 
         callbacks.on_log(f"Copying {source_path} to {dest_path.name}", "info")
 
-        # Read and write file
-        file_content = evidence_fs.read_file(source_path)
-        dest_path.write_bytes(file_content)
-
-        # Calculate hashes
-        md5 = hashlib.md5(file_content).hexdigest()
-        sha256 = hashlib.sha256(file_content).hexdigest()
-        size = len(file_content)
+        # Copy via the shared extraction store (places.sqlite is read by the
+        # history, downloads and bookmarks extractors; only the first one reads
+        # the evidence)
+        store = ExtractionStore.for_output_dir(output_dir)
+        stored = store.materialize(
+            evidence_fs,
+            source_path,
+            dest_path,
+            partition_index=partition_index,
+            inode=file_info.get("inode"),
+            size_bytes=file_info.get("size_bytes"),
+        )
+        md5 = stored.md5
+        sha256 = stored.sha256
+        size = stored.size_bytes
 
         # Get filesystem type
         fs_type = getattr(evidence_fs, "fs_type", "unknown")
@@ -797,20 +805,12 @@ class FirefoxHistoryExtractor(BaseExtractor):
             fs_type = "unknown"
 
         # Copy companion files (WAL, journal, shm)
-        companion_files = []
-        for suffix in ["-wal", "-journal", "-shm"]:
-            companion_path = source_path + suffix
-            try:
-                companion_content = evidence_fs.read_file(companion_path)
-                companion_dest = Path(str(dest_path) + suffix)
-                companion_dest.write_bytes(companion_content)
-                companion_files.append({
-                    "suffix": suffix,
-                    "size_bytes": len(companion_content),
-                })
-                callbacks.on_log(f"Copied companion: {companion_path}", "info")
-            except Exception:
-                pass  # Companion doesn't exist
+        companion_files = store.materialize_companions(
+            evidence_fs, source_path, dest_path,
+            partition_index=partition_index,
+        )
+        for companion in companion_files:
+            callbacks.on_log(f"Copied companion: {source_path}{companion['suffix']}", "info")
 
         return {
             "copy_status": "ok",
@@ -5,6 +5,8 @@ This module contains the parsing logic for Firefox session files,
 separated from the main extractor for maintainability.
 
 Functions:
+- iter_session_records: Stream records from a session file without
+  building the JSON tree
 - parse_session_data: Parse decompressed session JSON into records
 - collect_all_urls: Collect ALL URLs from session data (no deduplication)
 - extract_form_data: Extract form field values from session entries
@@ -17,8 +19,9 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
 from urllib.parse import urlparse
 
 if TYPE_CHECKING:
@@ -58,25 +61,26 @@ def ms_to_iso8601(ms: Optional[int]) -> Optional[str]:
 # Decompression
 # =============================================================================
 
-def decompress_session_file(
+def read_session_text(
     file_path: "Path",
     file_type: str,
     warning_collector: Optional["ExtractionWarningCollector"] = None,
-) -> Optional[Dict[str, Any]]:
+) -> Optional[str]:
     """
-    Decompress and parse Firefox session file.
+    Read a Firefox session file and return its JSON text.
 
-    Handles multiple formats:
-    - .jsonlz4/.baklz4: Mozilla LZ4 compressed JSON (Firefox 56+)
-    - .js: Uncompressed JSON with optional 'sessionstore =' prefix (Firefox < 56)
+    mozLz4 files hold a single LZ4 block (not an LZ4 frame), so the block
+    is decompressed in one call, straight from the file buffer; the
+    compressed and decompressed buffers are released as soon as the text
+    is decoded.
 
     Args:
         file_path: Path to session file
         file_type: Classified file type (e.g., "sessionstore_jsonlz4")
-        warning_collector: Optional collector for parse errors
+        warning_collector: Optional collector for read/decompression errors
 
     Returns:
-        Parsed session data dict, or None if parsing failed
+        JSON text, or None if the file could not be read or decompressed
     """
     try:
         data = file_path.read_bytes()
@@ -98,8 +102,7 @@ def decompress_session_file(
         # Mozilla LZ4 compressed format
         try:
             import lz4.block
-            json_data = lz4.block.decompress(data[8:])
-            return json.loads(json_data)
+            data = lz4.block.decompress(memoryview(data)[8:])
         except ImportError:
             LOGGER.error("lz4 module not available for decompression")
             if warning_collector:
@@ -121,42 +124,59 @@ def decompress_session_file(
                 )
             return None
 
-    elif file_type.endswith("_js") or str(file_path).endswith(".js"):
-        # Legacy uncompressed format
-        try:
-            text_data = data.decode("utf-8", errors="replace")
-            # Strip legacy "sessionstore = " prefix if present
-            if text_data.startswith("sessionstore"):
-                json_start = text_data.find("{")
-                if json_start != -1:
-                    text_data = text_data[json_start:]
-            return json.loads(text_data)
-        except json.JSONDecodeError as e:
-            LOGGER.error("Failed to parse legacy session JSON: %s", e)
-            if warning_collector:
-                warning_collector.add_json_parse_error(
-                    filename=str(file_path),
-                    error=str(e),
-                )
-            return None
-
-    else:
-        # Try LZ4 first, fall back to plain JSON
+    elif not (file_type.endswith("_js") or str(file_path).endswith(".js")):
+        # Unknown: try LZ4 first, fall back to plain JSON
         try:
             import lz4.block
-            json_data = lz4.block.decompress(data[8:])
-            return json.loads(json_data)
+            data = lz4.block.decompress(memoryview(data)[8:])
         except Exception:
-            try:
-                return json.loads(data.decode("utf-8", errors="replace"))
-            except Exception as e:
-                LOGGER.warning("Unknown session format in %s: %s", file_path, e)
-                if warning_collector:
-                    warning_collector.add_json_parse_error(
-                        filename=str(file_path),
-                        error=f"Unknown format: {e}",
-                    )
-                return None
+            pass
+
+    text = data.decode("utf-8", errors="replace")
+    del data
+    # Strip legacy "sessionstore = " prefix if present
+    if text.startswith("sessionstore"):
+        json_start = text.find("{")
+        if json_start != -1:
+            text = text[json_start:]
+    return text
+
+
+def decompress_session_file(
+    file_path: "Path",
+    file_type: str,
+    warning_collector: Optional["ExtractionWarningCollector"] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Decompress and parse Firefox session file.
+
+    Handles multiple formats:
+    - .jsonlz4/.baklz4: Mozilla LZ4 compressed JSON (Firefox 56+)
+    - .js: Uncompressed JSON with optional 'sessionstore =' prefix (Firefox < 56)
+
+    Builds the whole JSON tree; ingestion uses iter_session_records instead.
+
+    Args:
+        file_path: Path to session file
+        file_type: Classified file type (e.g., "sessionstore_jsonlz4")
+        warning_collector: Optional collector for parse errors
+
+    Returns:
+        Parsed session data dict, or None if parsing failed
+    """
+    text = read_session_text(file_path, file_type, warning_collector)
+    if text is None:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError as e:
+        LOGGER.error("Failed to parse session JSON %s: %s", file_path, e)
+        if warning_collector:
+            warning_collector.add_json_parse_error(
+                filename=str(file_path),
+                error=str(e),
+            )
+        return None
 
 
 # =============================================================================
@@ -171,6 +191,31 @@ def _should_ignore_key(key: str) -> bool:
     return False
 
 
+def _report_unknown_keys(
+    level: str,
+    key_types: Iterable[Tuple[str, str]],
+    known_keys: Collection[str],
+    source_file: str,
+    warning_collector: "ExtractionWarningCollector",
+) -> None:
+    """Report (key, type name) pairs of one JSON object that are not in known_keys."""
+    for key, type_name in key_types:
+        if key not in known_keys and not _should_ignore_key(key):
+            warning_collector.add_warning(
+                warning_type="json_unknown_key",
+                item_name=f"{level}.{key}",
+                item_value=type_name,
+                severity="info",
+                category="json",
+                artifact_type="sessions",
+                source_file=source_file,
+            )
+
+
+def _key_types(obj: Dict[str, Any]) -> List[Tuple[str, str]]:
+    return [(key, type(value).__name__) for key, value in obj.items()]
+
+
 def discover_unknown_session_keys(
     session_data: Dict[str, Any],
     source_file: str,
@@ -186,62 +231,37 @@ def discover_unknown_session_keys(
         return
 
     # Check top-level keys
-    for key in session_data.keys():
-        if key not in KNOWN_SESSION_KEYS and not _should_ignore_key(key):
-            warning_collector.add_warning(
-                warning_type="json_unknown_key",
-                item_name=f"session.{key}",
-                item_value=str(type(session_data[key]).__name__),
-                severity="info",
-                category="json",
-                artifact_type="sessions",
-                source_file=source_file,
-            )
+    _report_unknown_keys(
+        "session", _key_types(session_data), KNOWN_SESSION_KEYS, source_file, warning_collector
+    )
 
     # Check window keys (sample first window)
     windows = session_data.get("windows", [])
     if windows:
-        for key in windows[0].keys():
-            if key not in KNOWN_WINDOW_KEYS and not _should_ignore_key(key):
-                warning_collector.add_warning(
-                    warning_type="json_unknown_key",
-                    item_name=f"window.{key}",
-                    item_value=str(type(windows[0][key]).__name__),
-                    severity="info",
-                    category="json",
-                    artifact_type="sessions",
-                    source_file=source_file,
-                )
+        _report_unknown_keys(
+            "window", _key_types(windows[0]), KNOWN_WINDOW_KEYS, source_file, warning_collector
+        )
 
         # Check tab keys (sample first tab)
         tabs = windows[0].get("tabs", [])
         if tabs:
-            for key in tabs[0].keys():
-                if key not in KNOWN_TAB_KEYS and not _should_ignore_key(key):
-                    warning_collector.add_warning(
-                        warning_type="json_unknown_key",
-                        item_name=f"tab.{key}",
-                        item_value=str(type(tabs[0][key]).__name__),
-                        severity="info",
-                        category="json",
-                        artifact_type="sessions",
-                        source_file=source_file,
-                    )
+            _report_tab_keys(tabs[0], source_file, warning_collector)
+
 
-            # Check entry keys (sample first entry of first tab)
-            entries = tabs[0].get("entries", [])
-            if entries:
-                for key in entries[0].keys():
-                    if key not in KNOWN_ENTRY_KEYS and not _should_ignore_key(key):
-                        warning_collector.add_warning(
-                            warning_type="json_unknown_key",
-                            item_name=f"entry.{key}",
-                            item_value=str(type(entries[0][key]).__name__),
-                            severity="info",
-                            category="json",
-                            artifact_type="sessions",
-                            source_file=source_file,
-                        )
+def _report_tab_keys(
+    tab: Dict[str, Any],
+    source_file: str,
+    warning_collector: "ExtractionWarningCollector",
+) -> None:
+    """Report unknown keys of a sampled tab and of its first entry."""
+    _report_unknown_keys("tab", _key_types(tab), KNOWN_TAB_KEYS, source_file, warning_collector)
+
+    # Check entry keys (sample first entry of first tab)
+    entries = tab.get("entries", [])
+    if entries:
+        _report_unknown_keys(
+            "entry", _key_types(entries[0]), KNOWN_ENTRY_KEYS, source_file, warning_collector
+        )
 
 
 # =============================================================================
@@ -410,102 +430,22 @@ def parse_session_data(
 
     # Parse active windows
     windows = session_data.get("windows", [])
+    context = (browser, profile, run_id, discovered_by, file_entry)
 
     for window_idx, window in enumerate(windows):
         # Window record
-        result["windows"].append({
-            "browser": browser,
-            "profile": profile,
-            "window_id": window_idx,
-            "selected_tab_index": window.get("selected", 0) - 1,  # Firefox is 1-indexed
-            "window_type": "normal",
-            "session_type": "current",
-            "run_id": run_id,
-            "source_path": file_entry.get("logical_path", ""),
-            "discovered_by": discovered_by,
-            "partition_index": file_entry.get("partition_index"),
-            "fs_type": file_entry.get("fs_type"),
-            "logical_path": file_entry.get("logical_path", ""),
-            "forensic_path": file_entry.get("forensic_path"),
-        })
+        result["windows"].append(_make_window_record(window_idx, window.get("selected", 0), *context))
 
         # Parse tabs in window
         for tab_idx, tab in enumerate(window.get("tabs", [])):
-            entries = tab.get("entries", [])
-            current_idx = tab.get("index", 1) - 1  # Firefox is 1-indexed
-
-            # Get current entry
-            current_entry = entries[current_idx] if 0 <= current_idx < len(entries) else {}
-            tab_url = current_entry.get("url", "")
-
-            # Tab-level timestamps
-            tab_last_accessed = ms_to_iso8601(tab.get("lastAccessed"))
-            tab_created_at = ms_to_iso8601(tab.get("createdAt"))
-
-            result["tabs"].append({
-                "browser": browser,
-                "profile": profile,
-                "window_id": window_idx,
-                "tab_index": tab_idx,
-                "url": tab_url,
-                "title": current_entry.get("title", ""),
-                "pinned": 1 if tab.get("pinned", False) else 0,
-                "group_id": tab.get("groupId"),
-                "last_accessed_utc": tab_last_accessed,
-                "created_at_utc": tab_created_at,
-                "user_context_id": tab.get("userContextId"),  # Container ID
-                "run_id": run_id,
-                "source_path": file_entry.get("logical_path", ""),
-                "discovered_by": discovered_by,
-                "partition_index": file_entry.get("partition_index"),
-                "fs_type": file_entry.get("fs_type"),
-                "logical_path": file_entry.get("logical_path", ""),
-                "forensic_path": file_entry.get("forensic_path"),
-            })
-
-            # Parse navigation history for this tab
-            for nav_idx, entry in enumerate(entries):
-                entry_timestamp = None
-                if entry.get("lastAccessed"):
-                    entry_timestamp = ms_to_iso8601(entry.get("lastAccessed"))
-                elif entry.get("lastModified"):
-                    entry_timestamp = ms_to_iso8601(entry.get("lastModified"))
-
-                result["history"].append({
-                    "browser": browser,
-                    "profile": profile,
-                    "tab_id": None,  # Resolved after tab insert
-                    "_window_id": window_idx,
-                    "_tab_index": tab_idx,
-                    "nav_index": nav_idx,
-                    "url": entry.get("url", ""),
-                    "title": entry.get("title", ""),
-                    "transition_type": entry.get("triggeringPrincipal_base64"),
-                    "timestamp_utc": entry_timestamp,
-                    "run_id": run_id,
-                    "source_path": file_entry.get("logical_path", ""),
-                    "discovered_by": discovered_by,
-                    "partition_index": file_entry.get("partition_index"),
-                    "fs_type": file_entry.get("fs_type"),
-                    "logical_path": file_entry.get("logical_path", ""),
-                    "forensic_path": file_entry.get("forensic_path"),
-                })
-
-                # Extract form data from this entry
-                form_records = extract_form_data_from_entry(
-                    entry, tab_url, browser, profile,
-                    run_id, discovered_by, file_entry,
-                )
-                result["form_data"].extend(form_records)
+            for kind, record in _iter_tab_records(tab, window_idx, tab_idx, *context):
+                result[kind].append(record)
 
         # Parse recently closed tabs from this window
         for closed_tab_entry in window.get("_closedTabs", []):
             tab_state = closed_tab_entry.get("state", {})
             closed_at = closed_tab_entry.get("closedAt")
-            record = _make_closed_tab_record(
-                tab_state, closed_at, browser, profile,
-                run_id, discovered_by, file_entry,
-            )
+            record = _make_closed_tab_record(tab_state, closed_at, *context)
             if record:
                 result["closed_tabs"].append(record)
 
@@ -514,16 +454,119 @@ def parse_session_data(
         window_closed_at = closed_window.get("closedAt")
         for tab in closed_window.get("tabs", []):
             tab_closed_at = tab.get("closedAt") or window_closed_at
-            record = _make_closed_tab_record(
-                tab, tab_closed_at, browser, profile,
-                run_id, discovered_by, file_entry,
-            )
+            record = _make_closed_tab_record(tab, tab_closed_at, *context)
             if record:
                 result["closed_tabs"].append(record)
 
     return result
 
 
+def _make_window_record(
+    window_idx: int,
+    selected: int,
+    browser: str,
+    profile: str,
+    run_id: str,
+    discovered_by: str,
+    file_entry: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Create a session window record."""
+    return {
+        "browser": browser,
+        "profile": profile,
+        "window_id": window_idx,
+        "selected_tab_index": selected - 1,  # Firefox is 1-indexed
+        "window_type": "normal",
+        "session_type": "current",
+        "run_id": run_id,
+        "source_path": file_entry.get("logical_path", ""),
+        "discovered_by": discovered_by,
+        "partition_index": file_entry.get("partition_index"),
+        "fs_type": file_entry.get("fs_type"),
+        "logical_path": file_entry.get("logical_path", ""),
+        "forensic_path": file_entry.get("forensic_path"),
+    }
+
+
+def _iter_tab_records(
+    tab: Dict[str, Any],
+    window_idx: int,
+    tab_idx: int,
+    browser: str,
+    profile: str,
+    run_id: str,
+    discovered_by: str,
+    file_entry: Dict[str, Any],
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield the tab record, then (history, form_data) records of each entry."""
+    entries = tab.get("entries", [])
+    current_idx = tab.get("index", 1) - 1  # Firefox is 1-indexed
+
+    # Get current entry
+    current_entry = entries[current_idx] if 0 <= current_idx < len(entries) else {}
+    tab_url = current_entry.get("url", "")
+
+    # Tab-level timestamps
+    tab_last_accessed = ms_to_iso8601(tab.get("lastAccessed"))
+    tab_created_at = ms_to_iso8601(tab.get("createdAt"))
+
+    yield "tabs", {
+        "browser": browser,
+        "profile": profile,
+        "window_id": window_idx,
+        "tab_index": tab_idx,
+        "url": tab_url,
+        "title": current_entry.get("title", ""),
+        "pinned": 1 if tab.get("pinned", False) else 0,
+        "group_id": tab.get("groupId"),
+        "last_accessed_utc": tab_last_accessed,
+        "created_at_utc": tab_created_at,
+        "user_context_id": tab.get("userContextId"),  # Container ID
+        "run_id": run_id,
+        "source_path": file_entry.get("logical_path", ""),
+        "discovered_by": discovered_by,
+        "partition_index": file_entry.get("partition_index"),
+        "fs_type": file_entry.get("fs_type"),
+        "logical_path": file_entry.get("logical_path", ""),
+        "forensic_path": file_entry.get("forensic_path"),
+    }
+
+    # Parse navigation history for this tab
+    for nav_idx, entry in enumerate(entries):
+        entry_timestamp = None
+        if entry.get("lastAccessed"):
+            entry_timestamp = ms_to_iso8601(entry.get("lastAccessed"))
+        elif entry.get("lastModified"):
+            entry_timestamp = ms_to_iso8601(entry.get("lastModified"))
+
+        yield "history", {
+            "browser": browser,
+            "profile": profile,
+            "tab_id": None,  # Resolved after tab insert
+            "_window_id": window_idx,
+            "_tab_index": tab_idx,
+            "nav_index": nav_idx,
+            "url": entry.get("url", ""),
+            "title": entry.get("title", ""),
+            "transition_type": entry.get("triggeringPrincipal_base64"),
+            "timestamp_utc": entry_timestamp,
+            "run_id": run_id,
+            "source_path": file_entry.get("logical_path", ""),
+            "discovered_by": discovered_by,
+            "partition_index": file_entry.get("partition_index"),
+            "fs_type": file_entry.get("fs_type"),
+            "logical_path": file_entry.get("logical_path", ""),
+            "forensic_path": file_entry.get("forensic_path"),
+        }
+
+        # Extract form data from this entry
+        for form_record in extract_form_data_from_entry(
+            entry, tab_url, browser, profile,
+            run_id, discovered_by, file_entry,
+        ):
+            yield "form_data", form_record
+
+
 def _make_closed_tab_record(
     tab_data: Dict[str, Any],
     closed_at_ms: Optional[int],
@@ -559,6 +602,233 @@ def _make_closed_tab_record(
     }
 
 
+# =============================================================================
+# Streaming Parse
+# =============================================================================
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JsonCursor:
+    """
+    Pull reader over JSON text.
+
+    Walks objects and arrays member by member; only values that are asked
+    for (or skipped over) are decoded, one at a time, with the stdlib
+    decoder. Raises ValueError on malformed or truncated JSON.
+    """
+
+    __slots__ = ("text", "pos", "_decode")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.pos = 0
+        self._decode = json.JSONDecoder().raw_decode
+
+    def peek(self) -> str:
+        """Next significant character ('' at end of text)."""
+        self.pos = _WHITESPACE.match(self.text, self.pos).end()
+        return self.text[self.pos:self.pos + 1]
+
+    def value(self) -> Any:
+        """Decode the next value."""
+        self.peek()
+        value, self.pos = self._decode(self.text, self.pos)
+        return value
+
+    def _expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}")
+        self.pos += 1
+
+    def _close(self, end: str) -> bool:
+        """Consume ',' (more members follow) or ``end`` (container done)."""
+        sep = self.peek()
+        self.pos += 1
+        if sep == end:
+            return True
+        if sep != ",":
+            raise ValueError(f"Expected ',' or {end!r} at offset {self.pos - 1}")
+        return False
+
+    def members(self) -> Iterator[str]:
+        """
+        Iterate the keys of the object at the cursor.
+
+        After each key the cursor is at its value; a value the caller did
+        not read is skipped.
+        """
+        self._expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError(f"Expected object key at offset {self.pos}")
+            self._expect(":")
+            self.peek()
+            start = self.pos
+            yield key
+            if self.pos == start:
+                self.value()
+            if self._close("}"):
+                return
+
+    def items(self) -> Iterator[int]:
+        """Iterate the array at the cursor (same contract as members)."""
+        self._expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        index = 0
+        while True:
+            self.peek()
+            start = self.pos
+            yield index
+            if self.pos == start:
+                self.value()
+            if self._close("]"):
+                return
+            index += 1
+
+
+def iter_session_records(
+    file_path: "Path",
+    file_type: str,
+    file_entry: Dict[str, Any],
+    run_id: str,
+    browser: str,
+    profile: str,
+    discovered_by: str,
+    warning_collector: Optional["ExtractionWarningCollector"] = None,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Stream records from a Firefox session file.
+
+    Yields (kind, record) pairs, kind being one of the keys returned by
+    parse_session_data (windows, tabs, history, closed_tabs, form_data).
+    Records match parse_session_data, but only one tab (or closed tab) is
+    decoded at a time: the JSON tree of the whole session, including large
+    ``_closedWindows`` and form data histories, is never built. A window
+    record is yielded after the window's tabs.
+
+    Malformed or truncated JSON is reported to the warning collector;
+    records before the damaged part are still yielded.
+
+    Args:
+        file_path: Path to session file
+        file_type: Classified file type (e.g., "sessionstore_jsonlz4")
+        file_entry: File metadata from manifest
+        run_id: Extraction run ID
+        browser: Browser key
+        profile: Profile name
+        discovered_by: Discovery provenance string
+        warning_collector: Optional schema/parse warning collector
+    """
+    text = read_session_text(file_path, file_type, warning_collector)
+    if text is None:
+        return
+
+    cursor = _JsonCursor(text)
+    del text
+    context = (browser, profile, run_id, discovered_by, file_entry)
+    source_file = file_entry.get("logical_path", "")
+    session_keys: List[Tuple[str, str]] = []
+    first_window = True
+
+    try:
+        if cursor.peek() != "{":
+            raise ValueError("Session data is not a JSON object")
+        for key in cursor.members():
+            if key in ("windows", "_closedWindows") and cursor.peek() == "[":
+                session_keys.append((key, "list"))
+                for window_idx in cursor.items():
+                    if cursor.peek() != "{":
+                        continue
+                    if key == "windows":
+                        sample = warning_collector if first_window else None
+                        first_window = False
+                        yield from _iter_window(cursor, window_idx, context, source_file, sample)
+                    else:
+                        yield from _iter_closed_window(cursor, context)
+            else:
+                session_keys.append((key, type(cursor.value()).__name__))
+    except ValueError as e:
+        LOGGER.error("Failed to parse session JSON %s at offset %d: %s", file_path, cursor.pos, e)
+        if warning_collector:
+            warning_collector.add_json_parse_error(
+                filename=str(file_path),
+                error=f"{e} (offset {cursor.pos})",
+            )
+
+    if warning_collector:
+        _report_unknown_keys("session", session_keys, KNOWN_SESSION_KEYS, source_file, warning_collector)
+
+
+def _iter_window(
+    cursor: _JsonCursor,
+    window_idx: int,
+    context: tuple,
+    source_file: str,
+    warning_collector: Optional["ExtractionWarningCollector"],
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Stream one window object; warning_collector is set for the sampled first window."""
+    selected = 0
+    window_keys: List[Tuple[str, str]] = []
+    for key in cursor.members():
+        if key in ("tabs", "_closedTabs") and cursor.peek() == "[":
+            window_keys.append((key, "list"))
+            for tab_idx in cursor.items():
+                item = cursor.value()
+                if not isinstance(item, dict):
+                    continue
+                if key == "tabs":
+                    if warning_collector and tab_idx == 0:
+                        _report_tab_keys(item, source_file, warning_collector)
+                    yield from _iter_tab_records(item, window_idx, tab_idx, *context)
+                else:
+                    record = _make_closed_tab_record(
+                        item.get("state", {}), item.get("closedAt"), *context
+                    )
+                    if record:
+                        yield "closed_tabs", record
+        else:
+            value = cursor.value()
+            window_keys.append((key, type(value).__name__))
+            if key == "selected":
+                selected = value
+    if warning_collector:
+        _report_unknown_keys("window", window_keys, KNOWN_WINDOW_KEYS, source_file, warning_collector)
+    yield "windows", _make_window_record(window_idx, selected, *context)
+
+
+def _iter_closed_window(
+    cursor: _JsonCursor,
+    context: tuple,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Stream the tabs of one closed window as closed tab records."""
+    window_closed_at = None
+    # The window's closedAt (used by tabs without their own) may follow the
+    # tabs, so its closed tab records are yielded at the end of the window
+    records: List[Tuple[Dict[str, Any], bool]] = []
+    for key in cursor.members():
+        if key == "tabs" and cursor.peek() == "[":
+            for _ in cursor.items():
+                tab = cursor.value()
+                if not isinstance(tab, dict):
+                    continue
+                record = _make_closed_tab_record(tab, tab.get("closedAt"), *context)
+                if record:
+                    records.append((record, bool(tab.get("closedAt"))))
+        elif key == "closedAt":
+            window_closed_at = cursor.value()
+    for record, has_closed_at in records:
+        if not has_closed_at:
+            record["closed_at_utc"] = ms_to_iso8601(window_closed_at) if window_closed_at else None
+        yield "closed_tabs", record
+
+
 # =============================================================================
 # URL Collection (No Deduplication)
 # =============================================================================
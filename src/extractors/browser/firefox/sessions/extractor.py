@@ -59,8 +59,7 @@ from ...._shared.file_list_discovery import (
 )
 from .._patterns import FIREFOX_BROWSERS, get_artifact_patterns
 from ._parsers import (
-    decompress_session_file,
-    parse_session_data,
+    iter_session_records,
     collect_all_urls,
 )
 from core.logging import get_logger
@@ -103,6 +102,7 @@ class FirefoxSessionsExtractor(BaseExtractor):
     """
 
     SUPPORTED_BROWSERS = list(FIREFOX_BROWSERS.keys())
+    RECORD_BATCH_SIZE = 5000  # Streamed records written per batch
 
     @property
     def metadata(self) -> ExtractorMetadata:
@@ -761,7 +761,12 @@ class FirefoxSessionsExtractor(BaseExtractor):
         *,
         warning_collector: Optional[ExtractionWarningCollector] = None,
     ) -> Dict[str, int]:
-        """Parse Firefox session file and insert records."""
+        """
+        Parse Firefox session file and insert records.
+
+        Records are streamed from the file and written in batches of
+        RECORD_BATCH_SIZE, so memory use does not grow with the session size.
+        """
         counts = {"windows": 0, "tabs": 0, "history": 0, "closed_tabs": 0, "urls": 0, "form_data": 0}
 
         file_type = file_entry.get("file_type", "")
@@ -769,62 +774,89 @@ class FirefoxSessionsExtractor(BaseExtractor):
         profile = file_entry.get("profile", "default")
         discovered_by = f"{self.metadata.name}:{self.metadata.version}:{run_id}"
 
-        # Decompress and parse session file
-        session_data = decompress_session_file(file_path, file_type, warning_collector)
-
-        if not session_data:
-            LOGGER.warning("No session data parsed from %s", file_path)
-            return counts
-
-        # Parse session data into records
-        parsed = parse_session_data(
-            session_data,
+        records = iter_session_records(
+            file_path,
+            file_type,
             file_entry,
             run_id,
-            evidence_id,
             browser,
             profile,
             discovered_by,
             warning_collector,
         )
 
-        # Insert window records
-        if parsed["windows"]:
-            counts["windows"] = insert_session_windows(evidence_conn, evidence_id, parsed["windows"])
-
-        # Insert tab records
-        if parsed["tabs"]:
-            counts["tabs"] = insert_session_tabs(evidence_conn, evidence_id, parsed["tabs"])
-
-            # Resolve tab_ids for history records
-            if parsed["history"]:
-                cursor = evidence_conn.execute(
-                    "SELECT id, window_id, tab_index FROM session_tabs WHERE evidence_id = ? AND run_id = ?",
-                    (evidence_id, run_id)
+        batch: Dict[str, List[Dict]] = {kind: [] for kind in counts if kind != "urls"}
+        tab_ids: Dict[tuple, int] = {}  # (window_id, tab_index) -> session_tabs.id
+        pending = 0
+        for kind, record in records:
+            batch[kind].append(record)
+            pending += 1
+            if pending >= self.RECORD_BATCH_SIZE:
+                self._flush_session_records(
+                    evidence_conn, evidence_id, run_id, batch, tab_ids, counts,
+                    browser, profile, discovered_by, file_entry,
                 )
-                tab_id_map = {(row[1], row[2]): row[0] for row in cursor.fetchall()}
+                pending = 0
+        self._flush_session_records(
+            evidence_conn, evidence_id, run_id, batch, tab_ids, counts,
+            browser, profile, discovered_by, file_entry,
+        )
 
-                for hr in parsed["history"]:
-                    key = (hr.pop("_window_id", None), hr.pop("_tab_index", None))
-                    hr["tab_id"] = tab_id_map.get(key)
+        if not (counts["windows"] or counts["closed_tabs"]):
+            LOGGER.warning("No session data parsed from %s", file_path)
 
-        # Insert history records
-        if parsed["history"]:
-            counts["history"] = insert_session_tab_histories(evidence_conn, evidence_id, parsed["history"])
+        return counts
+
+    def _flush_session_records(
+        self,
+        evidence_conn,
+        evidence_id: int,
+        run_id: str,
+        batch: Dict[str, List[Dict]],
+        tab_ids: Dict[tuple, int],
+        counts: Dict[str, int],
+        browser: str,
+        profile: str,
+        discovered_by: str,
+        file_entry: Dict,
+    ) -> None:
+        """Insert one batch of streamed session records, then clear the batch."""
+        # Insert window records
+        if batch["windows"]:
+            counts["windows"] += insert_session_windows(evidence_conn, evidence_id, batch["windows"])
+
+        # Insert tab records and remember their ids. A tab always precedes
+        # its history entries in the stream, so it is in this batch or an
+        # earlier one.
+        if batch["tabs"]:
+            last_id = evidence_conn.execute("SELECT COALESCE(MAX(id), 0) FROM session_tabs").fetchone()[0]
+            counts["tabs"] += insert_session_tabs(evidence_conn, evidence_id, batch["tabs"])
+            cursor = evidence_conn.execute(
+                "SELECT id, window_id, tab_index FROM session_tabs WHERE id > ? AND evidence_id = ? AND run_id = ?",
+                (last_id, evidence_id, run_id)
+            )
+            tab_ids.update({(row[1], row[2]): row[0] for row in cursor.fetchall()})
+
+        # Resolve tab_ids for history records and insert them
+        if batch["history"]:
+            for hr in batch["history"]:
+                key = (hr.pop("_window_id", None), hr.pop("_tab_index", None))
+                hr["tab_id"] = tab_ids.get(key)
+            counts["history"] += insert_session_tab_histories(evidence_conn, evidence_id, batch["history"])
 
         # Insert closed tab records
-        if parsed["closed_tabs"]:
-            counts["closed_tabs"] = insert_closed_tabs(evidence_conn, evidence_id, parsed["closed_tabs"])
+        if batch["closed_tabs"]:
+            counts["closed_tabs"] += insert_closed_tabs(evidence_conn, evidence_id, batch["closed_tabs"])
 
         # Insert form data records
-        if parsed["form_data"]:
-            counts["form_data"] = self._insert_form_data(evidence_conn, evidence_id, parsed["form_data"])
+        if batch["form_data"]:
+            counts["form_data"] += self._insert_form_data(evidence_conn, evidence_id, batch["form_data"])
 
         # Collect ALL URLs (no deduplication) and insert
         url_records = collect_all_urls(
-            parsed["tabs"],
-            parsed["history"],
-            parsed["closed_tabs"],
+            batch["tabs"],
+            batch["history"],
+            batch["closed_tabs"],
             browser,
             profile,
             run_id,
@@ -832,9 +864,10 @@ class FirefoxSessionsExtractor(BaseExtractor):
             file_entry,
         )
         if url_records:
-            counts["urls"] = insert_urls(evidence_conn, evidence_id, url_records)
+            counts["urls"] += insert_urls(evidence_conn, evidence_id, url_records)
 
-        return counts
+        for records in batch.values():
+            records.clear()
 
     def _insert_form_data(
         self,
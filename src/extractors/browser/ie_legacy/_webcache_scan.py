@@ -0,0 +1,378 @@
+"""
+Shared single-pass scan of IE/Edge WebCacheV01.dat.
+
+The IE history, cookies, downloads and cache_metadata extractors all read
+the same WebCacheV01.dat copies produced by IEWebCacheExtractor. Opened
+separately, every extractor walks the Containers table and scans its
+container tables again, which is slow through the pure-Python
+dissect.esedb backend.
+
+WebCacheScan opens each database once, reads the Containers table once and
+iterates every container table any WebCache artifact needs once. Records
+are kept in a normalized intermediate SQLite file next to the database
+(``<db>.scan.sqlite``), so the extractors that run after the first one read
+plain SQLite instead of ESE. The cache is tied to the size and mtime of the
+database file and rebuilt when either changes.
+
+Usage (drop-in for WebCacheReader in the ingestion code):
+    with WebCacheScan(db_path) as reader:
+        for container in reader.get_containers():
+            ...
+        for record in reader.read_table("Container_5"):
+            ...
+
+Or dispatch one pass to several per-artifact consumers:
+    scan = WebCacheScan(db_path)
+    scan.dispatch([
+        WebCacheConsumer("history", WEBCACHE_CONTAINER_FILTERS["history"], on_history),
+        WebCacheConsumer("cookies", WEBCACHE_CONTAINER_FILTERS["cookies"], on_cookie),
+    ])
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from core.logging import get_logger
+
+from ._ese_reader import ESERecord, WebCacheReader
+
+__all__ = [
+    "SCAN_FORMAT_VERSION",
+    "WEBCACHE_CONTAINER_FILTERS",
+    "WebCacheConsumer",
+    "WebCacheScan",
+    "scan_cache_path",
+]
+
+LOGGER = get_logger("extractors.browser.ie_legacy.webcache_scan")
+
+# Bump when the cached record layout changes
+SCAN_FORMAT_VERSION = "1"
+
+# Container name predicates of the WebCache artifact extractors. The scan
+# reads every container matched by at least one of them.
+WEBCACHE_CONTAINER_FILTERS: Dict[str, Callable[[str], bool]] = {
+    "history": lambda name: name == "History",
+    "cookies": lambda name: "cookie" in name.lower(),
+    "downloads": lambda name: name == "iedownload",
+    "cache_metadata": lambda name: name.lower().startswith("content") or "cache" in name.lower(),
+}
+
+_SCAN_SCHEMA = """
+CREATE TABLE scan_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE containers (
+    seq INTEGER PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE records (
+    table_name TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (table_name, seq)
+) WITHOUT ROWID;
+"""
+
+_build_locks_guard = threading.Lock()
+_build_locks: Dict[str, threading.Lock] = {}
+
+
+@dataclass
+class WebCacheConsumer:
+    """
+    A per-artifact receiver of WebCache records.
+
+    Attributes:
+        name: Artifact name (for logging)
+        wants: Predicate on the container name
+        handle: Called as ``handle(container, record)`` for every record
+            of a wanted container
+    """
+    name: str
+    wants: Callable[[str], bool]
+    handle: Callable[[Dict[str, Any], ESERecord], None]
+
+
+def scan_cache_path(db_path: Union[str, Path]) -> Path:
+    """Return the intermediate scan file used for a WebCache database."""
+    db_path = Path(db_path)
+    return db_path.with_name(db_path.name + ".scan.sqlite")
+
+
+def _wanted_by_any(name: Optional[str]) -> bool:
+    return bool(name) and any(f(name) for f in WEBCACHE_CONTAINER_FILTERS.values())
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"$b": base64.b64encode(bytes(value)).decode("ascii")}
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "$b" in value:
+            return base64.b64decode(value["$b"])
+        if "$dt" in value:
+            return datetime.fromisoformat(value["$dt"])
+    return value
+
+
+def _encode_record(values: Dict[str, Any]) -> str:
+    return json.dumps({k: _encode_value(v) for k, v in values.items()}, separators=(",", ":"))
+
+
+def _decode_record(data: str) -> Dict[str, Any]:
+    return {k: _decode_value(v) for k, v in json.loads(data).items()}
+
+
+class WebCacheScan:
+    """
+    One-pass, cached view of a WebCacheV01.dat database.
+
+    Exposes the subset of the WebCacheReader API the WebCache extractors
+    use (``tables``, ``get_containers``, ``read_table``), served from the
+    intermediate scan file.
+    """
+
+    def __init__(self, db_path: Union[str, Path], *, persist: bool = True):
+        """
+        Args:
+            db_path: Path to the extracted WebCacheV01.dat
+            persist: Keep the intermediate table on disk next to the
+                database (False: in memory, for this instance only)
+        """
+        self.db_path = Path(db_path)
+        self.persist = persist
+        self.cache_path = scan_cache_path(self.db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._tables: List[str] = []
+        self._scanned: set = set()
+        self.scanned_from_ese = False
+
+    def __enter__(self) -> "WebCacheScan":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def open(self) -> None:
+        """Load the scan, scanning the ESE database if no fresh cache exists."""
+        if self._conn is not None:
+            return
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"ESE database not found: {self.db_path}")
+
+        if not self.persist:
+            self._conn = sqlite3.connect(":memory:")
+            self._conn.executescript(_SCAN_SCHEMA)
+            self._scan_into(self._conn)
+            self.scanned_from_ese = True
+        else:
+            with self._build_lock():
+                if not self._cache_is_fresh():
+                    self._build_cache()
+                    self.scanned_from_ese = True
+            self._conn = sqlite3.connect(f"file:{self.cache_path}?mode=ro", uri=True)
+
+        meta = dict(self._conn.execute("SELECT key, value FROM scan_meta"))
+        self._tables = json.loads(meta.get("tables", "[]"))
+        self._scanned = set(json.loads(meta.get("scanned_tables", "[]")))
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _build_lock(self) -> threading.Lock:
+        key = str(self.cache_path)
+        with _build_locks_guard:
+            lock = _build_locks.get(key)
+            if lock is None:
+                lock = _build_locks[key] = threading.Lock()
+            return lock
+
+    def _source_signature(self) -> Dict[str, str]:
+        stat = self.db_path.stat()
+        return {
+            "format_version": SCAN_FORMAT_VERSION,
+            "source_size": str(stat.st_size),
+            "source_mtime_ns": str(stat.st_mtime_ns),
+        }
+
+    def _cache_is_fresh(self) -> bool:
+        if not self.cache_path.exists():
+            return False
+        try:
+            conn = sqlite3.connect(f"file:{self.cache_path}?mode=ro", uri=True)
+            try:
+                meta = dict(conn.execute("SELECT key, value FROM scan_meta"))
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return False
+        return all(meta.get(k) == v for k, v in self._source_signature().items())
+
+    def _build_cache(self) -> None:
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        tmp_path.unlink(missing_ok=True)
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.executescript(_SCAN_SCHEMA)
+            self._scan_into(conn)
+            conn.close()
+            os.replace(tmp_path, self.cache_path)
+        except BaseException:
+            conn.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _scan_into(self, conn: sqlite3.Connection) -> None:
+        """Read Containers and every wanted container table once."""
+        scanned: List[str] = []
+        record_count = 0
+        with WebCacheReader(self.db_path) as reader:
+            tables = reader.tables()
+            table_set = set(tables)
+            containers = reader.get_containers()
+            conn.executemany(
+                "INSERT INTO containers (seq, data) VALUES (?, ?)",
+                ((i, _encode_record(c)) for i, c in enumerate(containers)),
+            )
+
+            for container in containers:
+                table_name = f"Container_{container.get('container_id')}"
+                if table_name not in table_set or table_name in scanned:
+                    continue
+                if not _wanted_by_any(container.get("name")):
+                    continue
+                rows = (
+                    (table_name, seq, _encode_record(record.values))
+                    for seq, record in enumerate(reader.read_table(table_name))
+                )
+                before = conn.total_changes
+                conn.executemany(
+                    "INSERT INTO records (table_name, seq, data) VALUES (?, ?, ?)", rows
+                )
+                record_count += conn.total_changes - before
+                scanned.append(table_name)
+
+        meta = dict(self._source_signature())
+        meta["tables"] = json.dumps(tables)
+        meta["scanned_tables"] = json.dumps(scanned)
+        conn.executemany("INSERT INTO scan_meta (key, value) VALUES (?, ?)", meta.items())
+        conn.commit()
+        LOGGER.debug(
+            "Scanned %s: %d container table(s), %d record(s)",
+            self.db_path.name, len(scanned), record_count,
+        )
+
+    # ------------------------------------------------------------------
+    # WebCacheReader-compatible API
+    # ------------------------------------------------------------------
+
+    def _require_open(self) -> sqlite3.Connection:
+        if self._conn is None:
+            raise RuntimeError("Scan not open")
+        return self._conn
+
+    def tables(self) -> List[str]:
+        """Table names of the source database."""
+        self._require_open()
+        return list(self._tables)
+
+    def get_containers(self) -> List[Dict[str, Any]]:
+        """Rows of the Containers table (same keys as WebCacheReader.get_containers)."""
+        conn = self._require_open()
+        return [
+            _decode_record(data)
+            for (data,) in conn.execute("SELECT data FROM containers ORDER BY seq")
+        ]
+
+    def read_table(
+        self,
+        table_name: str,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[ESERecord]:
+        """
+        Records of a container table, in source order.
+
+        Tables outside the scanned set (containers no WebCache artifact
+        uses) are read from the ESE database directly.
+        """
+        conn = self._require_open()
+        if table_name not in self._scanned:
+            with WebCacheReader(self.db_path) as reader:
+                yield from reader.read_table(table_name, columns=columns, limit=limit)
+            return
+
+        sql = "SELECT data FROM records WHERE table_name = ? ORDER BY seq"
+        params: tuple = (table_name,)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+        for (data,) in conn.execute(sql, params):
+            values = _decode_record(data)
+            if columns is not None:
+                values = {c: values[c] for c in columns if c in values}
+            yield ESERecord(table_name=table_name, values=values)
+
+    # ------------------------------------------------------------------
+    # Consumer dispatch
+    # ------------------------------------------------------------------
+
+    def dispatch(self, consumers: Iterable[WebCacheConsumer]) -> Dict[str, int]:
+        """
+        Feed every wanted container's records to the consumers in one pass.
+
+        Each container table is iterated once no matter how many consumers
+        want it.
+
+        Returns:
+            Number of records delivered per consumer name
+        """
+        consumers = list(consumers)
+        delivered = {c.name: 0 for c in consumers}
+        opened_here = self._conn is None
+        if opened_here:
+            self.open()
+        try:
+            table_set = set(self._tables)
+            for container in self.get_containers():
+                name = container.get("name") or ""
+                targets = [c for c in consumers if c.wants(name)]
+                table_name = f"Container_{container.get('container_id')}"
+                if not targets or table_name not in table_set:
+                    continue
+                for record in self.read_table(table_name):
+                    for consumer in targets:
+                        consumer.handle(container, record)
+                        delivered[consumer.name] += 1
+        finally:
+            if opened_here:
+                self.close()
+        return delivered
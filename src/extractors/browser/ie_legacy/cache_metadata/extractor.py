@@ -34,9 +34,9 @@ from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout
 from ....base import BaseExtractor, ExtractorMetadata
 from ....callbacks import ExtractorCallbacks
 from .._ese_reader import (
-    WebCacheReader,
     check_ese_available,
 )
+from .._webcache_scan import WebCacheScan
 from .._timestamps import filetime_to_iso
 from core.logging import get_logger
 from core.database import (
@@ -313,7 +313,7 @@ class IECacheMetadataExtractor(BaseExtractor):
         url_records = []
 
         try:
-            with WebCacheReader(db_path) as reader:
+            with WebCacheScan(db_path) as reader:
                 containers = reader.get_containers()
 
                 # Find Content containers
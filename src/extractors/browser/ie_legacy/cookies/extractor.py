@@ -55,9 +55,9 @@ from .._patterns import (
 )
 from .._ese_reader import (
     ESE_AVAILABLE,
-    WebCacheReader,
     check_ese_available,
 )
+from .._webcache_scan import WebCacheScan
 from .._timestamps import filetime_to_iso, filetime_to_datetime
 from core.logging import get_logger
 from core.database import (
@@ -198,7 +198,7 @@ class IECookiesExtractor(BaseExtractor):
         Workflow:
             1. Read manifest.json from WebCache extraction
             2. For each WebCache database file:
-               - Open ESE database with WebCacheReader
+               - Open the shared single-pass WebCache scan
                - Find all cookie containers
                - Parse cookie entries
                - Insert into cookies table
@@ -378,7 +378,7 @@ class IECookiesExtractor(BaseExtractor):
         total_cookies = 0
 
         try:
-            with WebCacheReader(db_path) as reader:
+            with WebCacheScan(db_path) as reader:
                 # Get all containers
                 containers = reader.get_containers()
 
@@ -42,9 +42,9 @@ from .._patterns import (
 )
 from .._ese_reader import (
     ESE_AVAILABLE,
-    WebCacheReader,
     check_ese_available,
 )
+from .._webcache_scan import WebCacheScan
 from .._timestamps import filetime_to_iso, filetime_to_datetime
 from core.logging import get_logger
 from core.database import (
@@ -186,7 +186,7 @@ class IEDownloadsExtractor(BaseExtractor):
         Workflow:
             1. Read manifest.json from WebCache extraction
             2. For each WebCache database file:
-               - Open ESE database with WebCacheReader
+               - Open the shared single-pass WebCache scan
                - Find iedownload container
                - Parse download entries
                - Insert into browser_downloads table
@@ -368,7 +368,7 @@ class IEDownloadsExtractor(BaseExtractor):
         seen_urls = set()  # Deduplicate URLs
 
         try:
-            with WebCacheReader(db_path) as reader:
+            with WebCacheScan(db_path) as reader:
                 # Get containers to find iedownload
                 containers = reader.get_containers()
                 download_container = None
@@ -40,9 +40,9 @@ from .._patterns import (
 )
 from .._ese_reader import (
     ESE_AVAILABLE,
-    WebCacheReader,
     check_ese_available,
 )
+from .._webcache_scan import WebCacheScan
 from .._timestamps import filetime_to_iso, filetime_to_datetime
 from core.logging import get_logger
 from core.database import (
@@ -185,7 +185,7 @@ class IEHistoryExtractor(BaseExtractor):
         Workflow:
             1. Read manifest.json from WebCache extraction
             2. For each WebCache database file:
-               - Open ESE database with WebCacheReader
+               - Open the shared single-pass WebCache scan
                - Find History container
                - Parse history entries
                - Insert into browser_history table
@@ -370,7 +370,7 @@ class IEHistoryExtractor(BaseExtractor):
         url_set = set()
 
         try:
-            with WebCacheReader(db_path) as reader:
+            with WebCacheScan(db_path) as reader:
                 # Log available tables
                 tables = reader.tables()
                 LOGGER.debug("WebCache tables: %s", tables)
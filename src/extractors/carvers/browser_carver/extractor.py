@@ -64,6 +64,14 @@ INGESTED_EXTENSIONS = {'.sqlite', '.db', ''}  # Empty string = no extension (SQL
 PRUNABLE_DIRS = {'ldblog', 'sst', 'ldb'}
 
 
+def _recovery_note(row: Dict[str, Any]) -> str:
+    """Ingestion note for a carved row, naming deleted-record sources."""
+    source = row.get("_recovered_from")
+    if source:
+        return f"Recovered from unallocated space ({source} record)"
+    return "Recovered from unallocated space"
+
+
 class BrowserCarverConfigWidget(QWidget):
     """Configuration widget for browser carver."""
 
@@ -127,6 +135,14 @@ class BrowserCarverConfigWidget(QWidget):
         self.cb_raw_scan.setChecked(True)
         options_layout.addWidget(self.cb_raw_scan)
 
+        self.cb_unalloc_scan = QCheckBox("Stream-scan unallocated space of the image (URLs, e-mails, SQLite headers)")
+        self.cb_unalloc_scan.setChecked(False)
+        self.cb_unalloc_scan.setToolTip(
+            "Reads the image directly in parallel chunks, restricted to unallocated\n"
+            "clusters when the filesystem can be read. Resumes if interrupted."
+        )
+        options_layout.addWidget(self.cb_unalloc_scan)
+
         self.cb_prune = QCheckBox("Auto-prune non-ingested file types (recommended)")
         self.cb_prune.setChecked(True)
         self.cb_prune.setToolTip(
@@ -188,6 +204,7 @@ class BrowserCarverConfigWidget(QWidget):
             "recover_cookies": self.cb_cookies.isChecked(),
             "recover_cache": self.cb_cache.isChecked(),
             "raw_url_scan": self.cb_raw_scan.isChecked(),
+            "native_unalloc_scan": self.cb_unalloc_scan.isChecked(),
             "prune_non_ingested": self.cb_prune.isChecked(),
             "max_carved_size_mb": self.max_size_spin.value() * 1024,  # Convert GB to MB
             "max_carved_files": self.max_files_spin.value(),
@@ -435,6 +452,15 @@ class BrowserCarverExtractor(BaseExtractor):
                 raw_urls_path = output_dir / "raw_urls.txt"
                 raw_urls_path.write_text('\n'.join(sorted(set(raw_urls))))
 
+        # Stream-scan unallocated space of the image itself
+        if config.get("native_unalloc_scan", False) and not callbacks.is_cancelled():
+            callbacks.on_step("Scanning unallocated space")
+            scan_info = self._scan_unallocated(evidence_fs, image_path, output_dir, callbacks)
+            manifest_data["unalloc_scan"] = scan_info
+            manifest_data["notes"].extend(scan_info.pop("notes", []))
+            if scan_info.get("cancelled"):
+                manifest_data["status"] = "cancelled"
+
         callbacks.on_step("Writing manifest")
         self._write_manifest(manifest_data, output_dir)
 
@@ -895,6 +921,68 @@ class BrowserCarverExtractor(BaseExtractor):
         callbacks.on_log(f"Found {len(all_urls)} raw URLs in carved files", "info")
         return all_urls
 
+    def _scan_unallocated(
+        self,
+        evidence_fs,
+        image_path: Path,
+        output_dir: Path,
+        callbacks: ExtractorCallbacks
+    ) -> Dict[str, Any]:
+        """
+        Stream-scan unallocated space of the image for URLs, e-mails and SQLite headers.
+
+        URLs found are merged into raw_urls.txt so they are ingested with
+        the carved-file URLs. Returns the manifest entry for the scan.
+        """
+        from .unalloc_scanner import UnallocatedScanner, iter_hits, list_unallocated_ranges
+        from extractors._shared.file_list_discovery import get_ewf_paths_from_evidence_fs
+
+        notes: List[str] = []
+        ewf_paths = get_ewf_paths_from_evidence_fs(evidence_fs)
+        try:
+            if ewf_paths:
+                source_spec = ("ewf", [str(p) for p in ewf_paths])
+                try:
+                    ranges, notes = list_unallocated_ranges(ewf_paths)
+                except Exception as e:
+                    LOGGER.warning("Could not map unallocated space: %s", e)
+                    ranges = None
+                    notes.append(f"Unallocated map unavailable ({e}), scanning whole image")
+            else:
+                source_spec = ("raw", str(image_path))
+                ranges = None
+                notes.append("Not an EWF image, scanning whole image")
+
+            scanner = UnallocatedScanner(source_spec, ranges, output_dir / "unalloc_scan")
+
+            def on_progress(done: int, total: int, mb_per_s: float) -> None:
+                callbacks.on_progress(
+                    done // (1024 * 1024), max(1, total // (1024 * 1024)),
+                    f"Unallocated scan: {mb_per_s:.1f} MB/s",
+                )
+
+            result = scanner.run(progress=on_progress, is_cancelled=callbacks.is_cancelled)
+        except Exception as e:
+            LOGGER.warning("Unallocated scan failed: %s", e)
+            return {"status": "error", "error": str(e), "notes": notes + [f"Unallocated scan failed: {e}"]}
+
+        urls = {hit["value"] for hit in iter_hits(Path(result.hits_path), kind="url")}
+        if urls:
+            raw_urls_path = output_dir / "raw_urls.txt"
+            if raw_urls_path.exists():
+                urls.update(u.strip() for u in raw_urls_path.read_text().splitlines() if u.strip())
+            raw_urls_path.write_text('\n'.join(sorted(urls)))
+
+        callbacks.on_log(
+            f"Unallocated scan: {result.bytes_scanned / (1024 * 1024):.0f} MB at "
+            f"{result.mb_per_second:.1f} MB/s, hits {result.hits}",
+            "info",
+        )
+        info = result.to_dict()
+        info["status"] = "cancelled" if result.cancelled else "ok"
+        info["notes"] = notes
+        return info
+
     def _ingest_raw_urls(
         self,
         urls_path: Path,
@@ -943,7 +1031,7 @@ class BrowserCarverExtractor(BaseExtractor):
         callbacks: ExtractorCallbacks
     ) -> int:
         """Ingest Chromium History database."""
-        data = parse_sqlite_best_effort(db_path)
+        data = parse_sqlite_best_effort(db_path, db_type="history", recover_deleted=True)
 
         if not data:
             return 0
@@ -963,7 +1051,7 @@ class BrowserCarverExtractor(BaseExtractor):
                     "source_path": "[carved/unallocated]",
                     "discovered_by": discovered_by,
                     "run_id": run_id,
-                    "notes": "Recovered from unallocated space",
+                    "notes": _recovery_note(row),
                 })
 
         if records:
@@ -982,7 +1070,7 @@ class BrowserCarverExtractor(BaseExtractor):
         callbacks: ExtractorCallbacks
     ) -> int:
         """Ingest Chromium Cookies database."""
-        data = parse_sqlite_best_effort(db_path)
+        data = parse_sqlite_best_effort(db_path, db_type="cookies", recover_deleted=True)
 
         if not data or "cookies" not in data:
             return 0
@@ -1020,7 +1108,7 @@ class BrowserCarverExtractor(BaseExtractor):
         callbacks: ExtractorCallbacks
     ) -> int:
         """Ingest Firefox places.sqlite database."""
-        data = parse_sqlite_best_effort(db_path)
+        data = parse_sqlite_best_effort(db_path, db_type="places", recover_deleted=True)
 
         if not data:
             return 0
@@ -1038,7 +1126,7 @@ class BrowserCarverExtractor(BaseExtractor):
                     "source_path": "[carved/unallocated]",
                     "discovered_by": discovered_by,
                     "run_id": run_id,
-                    "notes": "Recovered from unallocated space",
+                    "notes": _recovery_note(row),
                 })
 
         if records:
@@ -7,12 +7,13 @@ recovered from unallocated space.
 Recovery levels:
 1. Standard sqlite3 open
 2. sqlite3 with PRAGMA ignore_check_constraints
-3. Raw string scanning for URLs
-4. Raw page scanning (deep scan)
+3. Page-level record recovery without sqlite3 (sqlite_pages)
+4. Raw string scanning for URLs
 """
 
 from __future__ import annotations
 
+import mmap
 import re
 import sqlite3
 from pathlib import Path
@@ -20,8 +21,13 @@ from typing import Dict, List, Any, Optional
 
 from core.logging import get_logger
 
+from .sqlite_pages import SOURCE_LIVE, recover_records
+
 LOGGER = get_logger("extractors.browser_carver.resilient_sqlite")
 
+# Row cap per table, shared by every recovery level
+MAX_ROWS_PER_TABLE = 10000
+
 
 # URL pattern for raw scanning
 URL_PATTERN = re.compile(
@@ -30,34 +36,73 @@ URL_PATTERN = re.compile(
 )
 
 
-def parse_sqlite_best_effort(filepath: Path) -> Dict[str, List[Dict[str, Any]]]:
+def parse_sqlite_best_effort(
+    filepath: Path,
+    db_type: Optional[str] = None,
+    recover_deleted: bool = False,
+) -> Dict[str, List[Dict[str, Any]]]:
     """
     Attempt to read SQLite with increasing levels of recovery.
 
     Args:
         filepath: Path to SQLite database
+        db_type: Browser DB type from identify_browser_db, guiding the
+            page-level decoder when the schema page is lost
+        recover_deleted: Also add records recovered from freeblocks and
+            freelist pages when sqlite3 can open the file
 
     Returns:
-        Dictionary mapping table names to list of row dicts
+        Dictionary mapping table names to list of row dicts. Recovered
+        rows carry a ``_recovered_from`` key (freeblock, freelist, ...).
     """
     # Level 1: Standard open
     result = _try_standard_open(filepath)
+
+    # Level 2: With pragma tweaks
+    if not result:
+        result = _try_pragma_open(filepath)
+
     if result:
+        if recover_deleted:
+            _add_page_records(result, filepath, db_type, include_live=False)
         return result
 
-    # Level 2: With pragma tweaks
-    result = _try_pragma_open(filepath)
+    # Level 3: Page-level decoding
+    result = {}
+    _add_page_records(result, filepath, db_type, include_live=True)
     if result:
         return result
 
-    # Level 3: Raw URL scanning
-    urls = scan_for_urls(filepath.read_bytes())
+    # Level 4: Raw URL scanning
+    urls = _scan_file_for_urls(filepath)
     if urls:
         return {"raw_urls": [{"url": u} for u in urls]}
 
     return {}
 
 
+def _add_page_records(
+    result: Dict[str, List[Dict[str, Any]]],
+    filepath: Path,
+    db_type: Optional[str],
+    include_live: bool,
+) -> None:
+    """Merge records decoded by the page walker into ``result``."""
+    try:
+        for record in recover_records(filepath, db_type, include_live=include_live):
+            if record.table is None:
+                continue
+            rows = result.setdefault(record.table, [])
+            if len(rows) >= MAX_ROWS_PER_TABLE:
+                continue
+            row = dict(record.values)
+            if record.source != SOURCE_LIVE:
+                row["_recovered_from"] = record.source
+            rows.append(row)
+    except (OSError, ValueError) as e:
+        LOGGER.debug("Page-level recovery failed for %s: %s", filepath, e)
+
+
 def _try_standard_open(filepath: Path) -> Optional[Dict[str, List[Dict[str, Any]]]]:
     """Try standard sqlite3 open."""
     try:
@@ -72,7 +117,7 @@ def _try_standard_open(filepath: Path) -> Optional[Dict[str, List[Dict[str, Any]
         result = {}
         for table in tables:
             try:
-                cursor.execute(f"SELECT * FROM {table} LIMIT 10000")
+                cursor.execute(f"SELECT * FROM {table} LIMIT {MAX_ROWS_PER_TABLE}")
                 rows = [dict(row) for row in cursor.fetchall()]
                 result[table] = rows
             except sqlite3.DatabaseError:
@@ -111,7 +156,7 @@ def _try_pragma_open(filepath: Path) -> Optional[Dict[str, List[Dict[str, Any]]]
         result = {}
         for table in tables:
             try:
-                cursor.execute(f"SELECT * FROM {table} LIMIT 10000")
+                cursor.execute(f"SELECT * FROM {table} LIMIT {MAX_ROWS_PER_TABLE}")
                 rows = [dict(row) for row in cursor.fetchall()]
                 result[table] = rows
             except sqlite3.DatabaseError:
@@ -130,7 +175,7 @@ def scan_for_urls(data: bytes) -> List[str]:
     Scan raw bytes for HTTP/HTTPS URL patterns.
 
     Args:
-        data: Raw file bytes
+        data: Raw file bytes (any buffer, e.g. an mmap)
 
     Returns:
         List of discovered URLs
@@ -151,6 +196,19 @@ def scan_for_urls(data: bytes) -> List[str]:
     return urls
 
 
+def _scan_file_for_urls(filepath: Path) -> List[str]:
+    """Scan a file for URLs through mmap instead of reading it into memory."""
+    try:
+        with open(filepath, "rb") as fh:
+            if fh.seek(0, 2) == 0:
+                return []
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return scan_for_urls(mm)
+    except (OSError, ValueError) as e:
+        LOGGER.debug("URL scan failed for %s: %s", filepath, e)
+        return []
+
+
 def _is_noise_url(url: str) -> bool:
     """Check if URL is likely noise/garbage."""
     # Too many repeating chars
@@ -0,0 +1,836 @@
+"""
+Streaming page-level SQLite record recovery for Browser Carver.
+
+Decodes SQLite files page by page without the SQLite library, for carved
+databases sqlite3 refuses to open and for deleted records sqlite3 never
+returns:
+
+- live cells of table b-tree leaf pages
+- freeblocks inside leaf pages (deleted cells whose first four bytes were
+  overwritten by the freeblock header)
+- freelist pages (whole pages released by DELETE/VACUUM that still hold
+  their old cells)
+- leaf pages no table b-tree reaches (stale pages, or every page of a
+  fragment that lost page 1)
+
+The file is memory-mapped and walked in page order, so resident memory
+stays flat for multi-GB inputs: the only per-file state is one byte per
+page recording which table (or the freelist) the page belongs to.
+
+Table names and columns come from sqlite_master when page 1 survived.
+When it did not, records are matched against the column layouts of known
+browser tables (the same schemas ``identify_browser_db`` recognizes),
+selected by ``db_type``.
+
+Usage:
+    for record in recover_records(path, db_type="history"):
+        if record.table == "urls":
+            ...
+"""
+
+from __future__ import annotations
+
+import mmap
+import re
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from core.logging import get_logger
+
+LOGGER = get_logger("extractors.browser_carver.sqlite_pages")
+
+SQLITE_MAGIC = b"SQLite format 3\x00"
+
+# Page types (first byte of the b-tree page header)
+PAGE_INTERIOR_INDEX = 0x02
+PAGE_INTERIOR_TABLE = 0x05
+PAGE_LEAF_INDEX = 0x0A
+PAGE_LEAF_TABLE = 0x0D
+
+# Record sources
+SOURCE_LIVE = "live"
+SOURCE_FREEBLOCK = "freeblock"
+SOURCE_FREELIST = "freelist"
+SOURCE_UNMAPPED = "unmapped"
+
+# Page map markers (table ids are 0..MAX_MAPPED_TABLES-1)
+_UNMAPPED = 0xFF
+_FREELIST = 0xFE
+_SCHEMA = 0xFD
+MAX_MAPPED_TABLES = 0xFD
+
+# Upper bound on a reassembled payload; longer records are truncated
+MAX_PAYLOAD_BYTES = 16 * 1024 * 1024
+
+_CANDIDATE_PAGE_SIZES = (4096, 32768, 1024, 2048, 8192, 16384, 65536, 512)
+
+# Column layouts of browser tables, used when sqlite_master is gone.
+# Newer browser versions append columns, so a record may carry more
+# columns than listed (named c<N>) but not fewer than ``min_columns``.
+KNOWN_TABLE_LAYOUTS: Dict[str, Dict[str, Tuple[Sequence[str], int]]] = {
+    "history": {
+        "urls": (("id", "url", "title", "visit_count", "typed_count", "last_visit_time", "hidden"), 6),
+    },
+    "places": {
+        "moz_places": (
+            ("id", "url", "title", "rev_host", "visit_count", "hidden", "typed",
+             "frecency", "last_visit_date", "guid", "foreign_count", "url_hash"),
+            9,
+        ),
+    },
+    "cookies": {
+        "cookies": (
+            ("creation_utc", "host_key", "top_frame_site_key", "name", "value",
+             "encrypted_value", "path", "expires_utc", "is_secure", "is_httponly"),
+            10,
+        ),
+        "moz_cookies": (
+            ("id", "originAttributes", "name", "value", "host", "path", "expiry",
+             "lastAccessed", "creationTime", "isSecure", "isHttpOnly"),
+            10,
+        ),
+    },
+}
+
+# Column whose text value identifies a record as belonging to the table
+_LAYOUT_KEY_COLUMNS = {"urls": "url", "moz_places": "url", "cookies": "host_key", "moz_cookies": "host"}
+
+# Value checks for the columns of known browser tables, applied to every
+# recovered record on top of the declared column affinities: "url" and
+# "host" values are required, "text" and "int" may be NULL
+_KNOWN_COLUMN_CHECKS: Dict[str, Dict[str, str]] = {
+    "urls": {
+        "url": "url", "title": "text", "visit_count": "int", "typed_count": "int",
+        "last_visit_time": "int", "hidden": "int",
+    },
+    "moz_places": {
+        "url": "url", "title": "text", "rev_host": "text", "visit_count": "int",
+        "hidden": "int", "typed": "int", "frecency": "int", "last_visit_date": "int",
+    },
+    "cookies": {
+        "creation_utc": "int", "host_key": "host", "name": "text", "value": "text",
+        "path": "text", "expires_utc": "int", "is_secure": "int", "is_httponly": "int",
+    },
+    "moz_cookies": {
+        "name": "text", "value": "text", "host": "host", "path": "text", "expiry": "int",
+        "lastAccessed": "int", "creationTime": "int", "isSecure": "int", "isHttpOnly": "int",
+    },
+}
+
+# Schemes that require an authority (scheme://host...)
+_HIERARCHICAL_SCHEMES = {"http", "https", "ftp", "ws", "wss"}
+_URL_RE = re.compile(r"([A-Za-z][A-Za-z0-9+.\-]*):(\S+)\Z")
+
+_CONSTRAINT_WORDS = {"primary", "unique", "check", "foreign", "constraint"}
+_COLUMN_CONSTRAINT_WORDS = _CONSTRAINT_WORDS | {
+    "not", "null", "default", "references", "collate", "generated", "as",
+}
+
+
+@dataclass
+class RecoveredRecord:
+    """
+    A record decoded from a table b-tree cell.
+
+    Attributes:
+        table: Table name, or None if the record matched no known table
+        rowid: Row id (None when overwritten, as for the first record of a freeblock)
+        values: Column name -> decoded value (int, float, str, bytes or None)
+        page: 1-based page number the cell was found on
+        offset: Absolute file offset of the cell
+        source: SOURCE_LIVE, SOURCE_FREEBLOCK, SOURCE_FREELIST or SOURCE_UNMAPPED
+    """
+    table: Optional[str]
+    rowid: Optional[int]
+    values: Dict[str, Any]
+    page: int
+    offset: int
+    source: str
+
+
+@dataclass
+class _TableInfo:
+    name: str
+    root_page: int
+    columns: List[str] = field(default_factory=list)
+    rowid_alias: Optional[int] = None
+    affinities: List[str] = field(default_factory=list)
+
+
+# ============================================================================
+# Primitive decoding
+# ============================================================================
+
+def read_varint(buf, pos: int) -> Tuple[int, int]:
+    """Decode a SQLite varint at ``pos``. Returns (value, next_pos)."""
+    value = 0
+    for i in range(8):
+        byte = buf[pos + i]
+        value = (value << 7) | (byte & 0x7F)
+        if byte < 0x80:
+            return value, pos + i + 1
+    return (value << 8) | buf[pos + 8], pos + 9
+
+
+def serial_type_size(serial_type: int) -> int:
+    """Content size in bytes of a record serial type (-1 for reserved types)."""
+    if serial_type >= 12:
+        return (serial_type - 12) >> 1
+    return (0, 1, 2, 3, 4, 6, 8, 8, 0, 0, -1, -1)[serial_type]
+
+
+def _decode_value(serial_type: int, raw: bytes, encoding: str) -> Any:
+    if serial_type == 0:
+        return None
+    if serial_type <= 6:
+        return int.from_bytes(raw, "big", signed=True)
+    if serial_type == 7:
+        return struct.unpack(">d", raw)[0]
+    if serial_type == 8:
+        return 0
+    if serial_type == 9:
+        return 1
+    if serial_type & 1:
+        return raw.decode(encoding, errors="replace")
+    return bytes(raw)
+
+
+def _parse_serial_types(buf, pos: int, end: int, count: Optional[int] = None) -> Optional[List[int]]:
+    """Read serial types from pos up to end (or ``count`` of them)."""
+    types: List[int] = []
+    while pos < end and (count is None or len(types) < count):
+        try:
+            serial_type, pos = read_varint(buf, pos)
+        except IndexError:
+            return None
+        if serial_type in (10, 11):
+            return None
+        types.append(serial_type)
+    if count is None and pos != end:
+        return None
+    return types
+
+
+def decode_record(payload: bytes, encoding: str = "utf-8") -> Optional[List[Any]]:
+    """Decode a complete record payload into column values."""
+    try:
+        header_size, pos = read_varint(payload, 0)
+    except IndexError:
+        return None
+    if header_size < 1 or header_size > len(payload):
+        return None
+    types = _parse_serial_types(payload, pos, header_size)
+    if types is None:
+        return None
+    return _decode_body(payload, header_size, types, encoding)
+
+
+def _decode_body(buf, pos: int, types: Sequence[int], encoding: str) -> Optional[List[Any]]:
+    values: List[Any] = []
+    for serial_type in types:
+        size = serial_type_size(serial_type)
+        raw = buf[pos:pos + size]
+        if len(raw) < size:
+            # Truncated record (payload cut by the size cap or a broken chain)
+            values.append(None)
+            continue
+        values.append(_decode_value(serial_type, raw, encoding))
+        pos += size
+    return values
+
+
+def _plausible_values(values: List[Any]) -> bool:
+    """Reject decodes of overwritten bytes: browser rows carry clean text."""
+    has_text = False
+    for value in values:
+        if isinstance(value, str):
+            if "\ufffd" in value or any(ord(c) < 9 for c in value):
+                return False
+            has_text = True
+    return has_text
+
+
+# ============================================================================
+# Schema helpers
+# ============================================================================
+
+def column_affinity(declared_type: str) -> str:
+    """SQLite type affinity (INTEGER, TEXT, BLOB, REAL or NUMERIC) of a declared column type."""
+    upper = declared_type.upper()
+    if "INT" in upper:
+        return "INTEGER"
+    if "CHAR" in upper or "CLOB" in upper or "TEXT" in upper:
+        return "TEXT"
+    if not upper or "BLOB" in upper:
+        return "BLOB"
+    if "REAL" in upper or "FLOA" in upper or "DOUB" in upper:
+        return "REAL"
+    return "NUMERIC"
+
+
+def _fits_affinity(value: Any, affinity: str) -> bool:
+    # Values SQLite itself would never store in a column of this affinity
+    if value is None:
+        return True
+    if affinity == "TEXT":
+        return isinstance(value, str)
+    if affinity == "INTEGER":
+        return isinstance(value, int)
+    if affinity == "REAL":
+        return isinstance(value, (int, float))
+    return True
+
+
+def _looks_like_url(value: Any) -> bool:
+    if not isinstance(value, str):
+        return False
+    match = _URL_RE.match(value)
+    if match is None:
+        return False
+    if match.group(1).lower() in _HIERARCHICAL_SCHEMES:
+        rest = match.group(2)
+        return rest.startswith("//") and len(rest) > 2 and rest[2] not in "/?#"
+    return True
+
+
+def _passes_check(value: Any, check: str) -> bool:
+    if check == "url":
+        return _looks_like_url(value)
+    if check == "host":
+        return isinstance(value, str) and bool(value) and not any(c.isspace() for c in value)
+    if check == "text":
+        return value is None or isinstance(value, str)
+    if check == "int":
+        return value is None or isinstance(value, int)
+    return True
+
+
+def parse_create_table_columns(sql: str) -> Tuple[List[str], Optional[int]]:
+    """
+    Column names of a CREATE TABLE statement and the INTEGER PRIMARY KEY
+    column index (the rowid alias, stored as NULL in records).
+    """
+    columns, rowid_alias, _affinities = _parse_column_definitions(sql)
+    return columns, rowid_alias
+
+
+def _parse_column_definitions(sql: str) -> Tuple[List[str], Optional[int], List[str]]:
+    """Column names, rowid alias index and column affinities of a CREATE TABLE statement."""
+    start = sql.find("(")
+    end = sql.rfind(")")
+    if start < 0 or end <= start:
+        return [], None, []
+    body = sql[start + 1:end]
+    parts: List[str] = []
+    depth = 0
+    current = []
+    for ch in body:
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        if ch == "," and depth == 0:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+    parts.append("".join(current))
+
+    columns: List[str] = []
+    affinities: List[str] = []
+    rowid_alias = None
+    for part in parts:
+        tokens = part.strip().split()
+        if not tokens or tokens[0].lower() in _CONSTRAINT_WORDS:
+            continue
+        name = tokens[0].strip('"`[]')
+        if re.search(r"\binteger\s+primary\s+key\b", part, re.IGNORECASE) and rowid_alias is None:
+            rowid_alias = len(columns)
+        columns.append(name)
+        # The declared type runs up to the first constraint keyword
+        type_words = []
+        for token in tokens[1:]:
+            if token.lower() in _COLUMN_CONSTRAINT_WORDS or token.startswith("("):
+                break
+            type_words.append(token)
+        affinities.append(column_affinity(" ".join(type_words)))
+    return columns, rowid_alias, affinities
+
+
+# ============================================================================
+# Page walker
+# ============================================================================
+
+class SqlitePageWalker:
+    """
+    Memory-mapped, page-ordered reader of one SQLite file.
+
+    Works on intact databases, on databases with damaged pages and on
+    fragments that lost page 1 (page size is then guessed from the page
+    headers).
+    """
+
+    def __init__(self, path: Path, db_type: Optional[str] = None):
+        """
+        Args:
+            path: SQLite file (possibly carved/truncated)
+            db_type: Browser DB type from ``identify_browser_db`` (history,
+                places, cookies...) selecting the fallback table layouts
+        """
+        self.path = Path(path)
+        self.db_type = db_type
+        self._fh = None
+        self._mm: Optional[mmap.mmap] = None
+        self.page_size = 4096
+        self.usable_size = 4096
+        self.page_count = 0
+        self.encoding = "utf-8"
+        self.has_header = False
+        self.tables: List[_TableInfo] = []
+        self._tables_by_name: Dict[str, _TableInfo] = {}
+        self._page_map: Optional[bytearray] = None
+
+    def __enter__(self) -> "SqlitePageWalker":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def open(self) -> None:
+        self._fh = open(self.path, "rb")
+        size = self.path.stat().st_size
+        if size == 0:
+            raise ValueError(f"Empty file: {self.path}")
+        self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._read_header()
+        self.page_count = size // self.page_size
+        self._page_map = bytearray([_UNMAPPED]) * (self.page_count + 1)
+        if self.has_header:
+            self._load_schema()
+            self._map_tables()
+            self._map_freelist()
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    # ------------------------------------------------------------------
+    # Header and layout
+    # ------------------------------------------------------------------
+
+    def _read_header(self) -> None:
+        mm = self._mm
+        if mm[:16] == SQLITE_MAGIC and len(mm) >= 100:
+            raw_size = int.from_bytes(mm[16:18], "big")
+            page_size = 65536 if raw_size == 1 else raw_size
+            if page_size >= 512 and page_size & (page_size - 1) == 0:
+                self.has_header = True
+                self.page_size = page_size
+                self.usable_size = page_size - mm[20]
+                self.encoding = {2: "utf-16-le", 3: "utf-16-be"}.get(
+                    int.from_bytes(mm[56:60], "big"), "utf-8"
+                )
+                return
+        self.page_size = self._guess_page_size()
+        self.usable_size = self.page_size
+        LOGGER.debug("%s: no usable header, guessed page size %d", self.path.name, self.page_size)
+
+    def _guess_page_size(self) -> int:
+        best, best_score = 4096, -1
+        for candidate in _CANDIDATE_PAGE_SIZES:
+            pages = min(len(self._mm) // candidate, 64)
+            score = sum(
+                1 for n in range(pages)
+                if self._plausible_btree_page(n * candidate, candidate)
+            )
+            if score > best_score:
+                best, best_score = candidate, score
+        return best
+
+    def _plausible_btree_page(self, base: int, page_size: int) -> bool:
+        mm = self._mm
+        page_type = mm[base]
+        if page_type not in (PAGE_INTERIOR_INDEX, PAGE_INTERIOR_TABLE, PAGE_LEAF_INDEX, PAGE_LEAF_TABLE):
+            return False
+        cells = int.from_bytes(mm[base + 3:base + 5], "big")
+        content = int.from_bytes(mm[base + 5:base + 7], "big") or 65536
+        return 0 < cells < page_size // 4 and content <= page_size
+
+    def page_offset(self, page_no: int) -> int:
+        return (page_no - 1) * self.page_size
+
+    def _header_offset(self, page_no: int) -> int:
+        # Page 1 starts with the 100-byte file header
+        base = self.page_offset(page_no)
+        return base + 100 if page_no == 1 and self.has_header else base
+
+    # ------------------------------------------------------------------
+    # Schema and page ownership
+    # ------------------------------------------------------------------
+
+    def _load_schema(self) -> None:
+        for _page_no, _rowid, values in self._walk_table_tree(1):
+            if len(values) < 5 or values[0] != "table" or not isinstance(values[3], int):
+                continue
+            columns, rowid_alias, affinities = _parse_column_definitions(values[4] or "")
+            self.tables.append(_TableInfo(str(values[1]), values[3], columns, rowid_alias, affinities))
+        self._tables_by_name = {table.name: table for table in self.tables}
+        LOGGER.debug("%s: %d table(s) in sqlite_master", self.path.name, len(self.tables))
+
+    def _walk_table_tree(self, root: int) -> Iterator[Tuple[int, Optional[int], List[Any]]]:
+        """Live records of the sqlite_master b-tree; marks its pages in the page map."""
+        stack = [root]
+        while stack:
+            page_no = stack.pop()
+            if not 1 <= page_no <= self.page_count or self._page_map[page_no] != _UNMAPPED:
+                continue
+            page_type = self._mm[self._header_offset(page_no)]
+            if page_type == PAGE_INTERIOR_TABLE:
+                self._page_map[page_no] = _SCHEMA
+                stack.extend(self._child_pages(page_no))
+            elif page_type == PAGE_LEAF_TABLE:
+                self._page_map[page_no] = _SCHEMA
+                for _offset, rowid, values in self._leaf_cells(page_no):
+                    yield page_no, rowid, values
+
+    def _child_pages(self, page_no: int) -> List[int]:
+        mm = self._mm
+        hdr = self._header_offset(page_no)
+        base = self.page_offset(page_no)
+        cells = int.from_bytes(mm[hdr + 3:hdr + 5], "big")
+        children = [int.from_bytes(mm[hdr + 8:hdr + 12], "big")]
+        for i in range(cells):
+            ptr = int.from_bytes(mm[hdr + 12 + 2 * i:hdr + 14 + 2 * i], "big")
+            if ptr + 4 <= self.page_size:
+                children.append(int.from_bytes(mm[base + ptr:base + ptr + 4], "big"))
+        return children
+
+    def _map_tables(self) -> None:
+        page_map = self._page_map
+        for table_id, table in enumerate(self.tables[:MAX_MAPPED_TABLES]):
+            stack = [table.root_page]
+            while stack:
+                page_no = stack.pop()
+                if not 1 <= page_no <= self.page_count or page_map[page_no] != _UNMAPPED:
+                    continue
+                page_type = self._mm[self._header_offset(page_no)]
+                if page_type == PAGE_INTERIOR_TABLE:
+                    page_map[page_no] = table_id
+                    stack.extend(self._child_pages(page_no))
+                elif page_type == PAGE_LEAF_TABLE:
+                    page_map[page_no] = table_id
+
+    def _map_freelist(self) -> None:
+        mm = self._mm
+        trunk = int.from_bytes(mm[32:36], "big")
+        page_map = self._page_map
+        while 1 <= trunk <= self.page_count and page_map[trunk] != _FREELIST:
+            page_map[trunk] = _FREELIST
+            base = self.page_offset(trunk)
+            count = int.from_bytes(mm[base + 4:base + 8], "big")
+            for i in range(min(count, (self.usable_size - 8) // 4)):
+                leaf = int.from_bytes(mm[base + 8 + 4 * i:base + 12 + 4 * i], "big")
+                if 1 <= leaf <= self.page_count:
+                    page_map[leaf] = _FREELIST
+            trunk = int.from_bytes(mm[base:base + 4], "big")
+
+    # ------------------------------------------------------------------
+    # Cell decoding
+    # ------------------------------------------------------------------
+
+    def _payload(self, start: int, payload_len: int, page_end: int) -> bytes:
+        """Local payload plus overflow chain, capped at MAX_PAYLOAD_BYTES."""
+        usable = self.usable_size
+        max_local = usable - 35
+        if payload_len <= max_local:
+            return self._mm[start:min(start + payload_len, page_end)]
+        min_local = ((usable - 12) * 32 // 255) - 23
+        local = min_local + (payload_len - min_local) % (usable - 4)
+        if local > max_local:
+            local = min_local
+        parts = [self._mm[start:min(start + local, page_end)]]
+        remaining = min(payload_len, MAX_PAYLOAD_BYTES) - local
+        overflow = int.from_bytes(self._mm[start + local:start + local + 4], "big")
+        hops = 0
+        while remaining > 0 and 1 <= overflow <= self.page_count and hops < self.page_count:
+            base = self.page_offset(overflow)
+            take = min(remaining, usable - 4)
+            parts.append(self._mm[base + 4:base + 4 + take])
+            remaining -= take
+            overflow = int.from_bytes(self._mm[base:base + 4], "big")
+            hops += 1
+        return b"".join(parts)
+
+    def _leaf_cells(self, page_no: int) -> Iterator[Tuple[int, int, List[Any]]]:
+        """(offset, rowid, values) of the live cells of a table leaf page."""
+        mm = self._mm
+        base = self.page_offset(page_no)
+        hdr = self._header_offset(page_no)
+        page_end = base + self.usable_size
+        cells = int.from_bytes(mm[hdr + 3:hdr + 5], "big")
+        for i in range(min(cells, self.page_size // 2)):
+            ptr = int.from_bytes(mm[hdr + 8 + 2 * i:hdr + 10 + 2 * i], "big")
+            cell = base + ptr
+            if not hdr + 8 <= cell < page_end:
+                continue
+            try:
+                payload_len, pos = read_varint(mm, cell)
+                rowid, pos = read_varint(mm, pos)
+            except IndexError:
+                continue
+            values = decode_record(self._payload(pos, payload_len, page_end), self.encoding)
+            if values is not None:
+                yield cell, rowid, values
+
+    def _freeblock_cells(
+        self, page_no: int, table: Optional[_TableInfo] = None
+    ) -> Iterator[Tuple[int, Optional[int], List[Any]]]:
+        """(offset, rowid, values) of deleted cells recoverable from freeblocks."""
+        mm = self._mm
+        base = self.page_offset(page_no)
+        hdr = self._header_offset(page_no)
+        page_end = base + self.usable_size
+        counts = self._column_counts(table)
+        freeblock = int.from_bytes(mm[hdr + 1:hdr + 3], "big")
+        hops = 0
+        while freeblock and hops < self.page_size // 4:
+            start = base + freeblock
+            if not hdr + 8 <= start < page_end - 4:
+                break
+            size = int.from_bytes(mm[start + 2:start + 4], "big")
+            end = min(start + size, page_end)
+            carved = self._carve_freeblock_head(start, end, counts)
+            if carved is not None:
+                values, pos = carved
+                yield start, None, values
+                # Adjacent deleted cells merged into this freeblock are intact
+                while pos < end:
+                    cell = self._decode_cell_at(pos, end, counts)
+                    if cell is None:
+                        break
+                    rowid, values, next_pos = cell
+                    yield pos, rowid, values
+                    pos = next_pos
+            freeblock = int.from_bytes(mm[start:start + 2], "big")
+            hops += 1
+
+    def _column_counts(self, table: Optional[_TableInfo]) -> Optional[set]:
+        """Column counts a deleted record on a page of ``table`` may have."""
+        if table is not None:
+            return {len(table.columns)} if table.columns else None
+        layouts = KNOWN_TABLE_LAYOUTS.get(self.db_type or "")
+        if not layouts:
+            return None
+        counts = set()
+        for columns, min_columns in layouts.values():
+            counts.update(range(min_columns, len(columns) + 8))
+        return counts
+
+    def _carve_freeblock_head(
+        self, start: int, end: int, counts: Optional[set]
+    ) -> Optional[Tuple[List[Any], int]]:
+        """
+        Decode the deleted record at the start of a freeblock.
+
+        The freeblock header overwrote the first four cell bytes: payload
+        length and rowid, and sometimes the header-size byte and the first
+        serial type. A surviving header-size byte must match the serial
+        types that follow it; without one, the serial types are read right
+        after the freeblock header for each expected column count.
+
+        Returns:
+            (values, end offset of the record) or None
+        """
+        mm = self._mm
+        for header_pos in range(start + 4, min(start + 14, end)):
+            header_size = mm[header_pos]
+            if not 2 <= header_size < 0x80 or header_pos + header_size > end:
+                continue
+            types = _parse_serial_types(mm, header_pos + 1, header_pos + header_size)
+            if not types or (counts is not None and len(types) not in counts):
+                continue
+            decoded = self._decode_checked(header_pos + header_size, end, types)
+            if decoded is not None:
+                return decoded
+
+        for count in sorted(counts or ()):
+            for lost_first in (False, True):
+                types, pos = [], start + 4
+                try:
+                    while len(types) < count - lost_first and pos < end:
+                        serial_type, pos = read_varint(mm, pos)
+                        types.append(serial_type)
+                except IndexError:
+                    continue
+                if len(types) != count - lost_first or any(t in (10, 11) for t in types):
+                    continue
+                decoded = self._decode_checked(pos, end, types)
+                if decoded is not None:
+                    values, record_end = decoded
+                    if lost_first:
+                        # Usually the INTEGER PRIMARY KEY, stored as NULL anyway
+                        values.insert(0, None)
+                    return values, record_end
+        return None
+
+    def _decode_cell_at(
+        self, pos: int, end: int, counts: Optional[set]
+    ) -> Optional[Tuple[int, List[Any], int]]:
+        """Decode a complete (not overwritten) cell. Returns (rowid, values, end)."""
+        try:
+            payload_len, body = read_varint(self._mm, pos)
+            rowid, body = read_varint(self._mm, body)
+        except IndexError:
+            return None
+        if payload_len < 2 or body + payload_len > end:
+            return None
+        values = decode_record(self._mm[body:body + payload_len], self.encoding)
+        if values is None or (counts is not None and len(values) not in counts):
+            return None
+        if not _plausible_values(values):
+            return None
+        return rowid, values, body + payload_len
+
+    def _decode_checked(self, body: int, end: int, types: List[int]) -> Optional[Tuple[List[Any], int]]:
+        body_len = sum(serial_type_size(t) for t in types)
+        if body + body_len > end:
+            return None
+        values = _decode_body(self._mm, body, types, self.encoding)
+        if values is None or not _plausible_values(values):
+            return None
+        return values, body + body_len
+
+    # ------------------------------------------------------------------
+    # Record naming
+    # ------------------------------------------------------------------
+
+    def _name_values(
+        self, table: Optional[_TableInfo], rowid: Optional[int], values: List[Any]
+    ) -> Tuple[Optional[str], Dict[str, Any]]:
+        if table is None:
+            table_name, columns, alias = self._match_layout(values)
+        else:
+            table_name, columns, alias = table.name, table.columns, table.rowid_alias
+        named = {
+            (columns[i] if i < len(columns) else f"c{i}"): value
+            for i, value in enumerate(values)
+        }
+        if alias is not None and alias < len(values) and values[alias] is None and rowid is not None:
+            named[columns[alias]] = rowid
+        return table_name, named
+
+    def _fits_schema(self, table_name: Optional[str], named: Dict[str, Any]) -> bool:
+        """
+        Check a recovered record against its table.
+
+        A deleted cell decoded at the wrong offset still yields a
+        well-formed record, only with values shifted into the wrong
+        columns (an integer url, a blob title). Such records fail the
+        declared column affinities or the value checks of known browser
+        tables.
+        """
+        if table_name is None:
+            return True
+        table = self._tables_by_name.get(table_name)
+        if table is not None:
+            for column, affinity in zip(table.columns, table.affinities):
+                if not _fits_affinity(named.get(column), affinity):
+                    return False
+        for column, check in _KNOWN_COLUMN_CHECKS.get(table_name, {}).items():
+            if not _passes_check(named.get(column), check):
+                return False
+        return True
+
+    def _match_layout(self, values: List[Any]) -> Tuple[Optional[str], List[str], Optional[int]]:
+        """Match an unowned record to a schema table or a known browser layout."""
+        for table in self.tables:
+            if table.columns and len(values) == len(table.columns):
+                return table.name, table.columns, table.rowid_alias
+        layouts = KNOWN_TABLE_LAYOUTS.get(self.db_type or "", {})
+        for name, (columns, min_columns) in layouts.items():
+            if len(values) < min_columns:
+                continue
+            key = _LAYOUT_KEY_COLUMNS.get(name)
+            key_index = columns.index(key) if key in columns else None
+            if key_index is not None and not isinstance(values[key_index], str):
+                continue
+            alias = 0 if columns[0] == "id" else None
+            return name, list(columns), alias
+        return None, [], None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def iter_records(self, *, include_live: bool = True, include_deleted: bool = True) -> Iterator[RecoveredRecord]:
+        """
+        Yield records in page order.
+
+        Args:
+            include_live: Decode live cells of in-use leaf pages
+            include_deleted: Decode freeblocks, freelist and unmapped pages
+        """
+        mm = self._mm
+        page_map = self._page_map
+        tables = self.tables
+        for page_no in range(1, self.page_count + 1):
+            owner = page_map[page_no]
+            if owner == _SCHEMA or mm[self._header_offset(page_no)] != PAGE_LEAF_TABLE:
+                continue
+            table = None
+            if owner == _FREELIST:
+                source = SOURCE_FREELIST
+            elif owner == _UNMAPPED:
+                source = SOURCE_UNMAPPED
+            else:
+                source = SOURCE_LIVE
+                table = tables[owner]
+
+            if include_live if source == SOURCE_LIVE else include_deleted:
+                for offset, rowid, values in self._safe(self._leaf_cells, page_no):
+                    name, named = self._name_values(table, rowid, values)
+                    # Live cells of a table's own pages are what sqlite3 returns
+                    if source == SOURCE_LIVE or self._fits_schema(name, named):
+                        yield RecoveredRecord(name, rowid, named, page_no, offset, source)
+
+            if include_deleted and owner != _FREELIST:
+                for offset, rowid, values in self._safe(self._freeblock_cells, page_no, table):
+                    name, named = self._name_values(table, rowid, values)
+                    if self._fits_schema(name, named):
+                        yield RecoveredRecord(name, rowid, named, page_no, offset, SOURCE_FREEBLOCK)
+
+    def _safe(self, walker, page_no: int, *args) -> Iterator:
+        # A damaged page must not end the walk of the remaining pages
+        try:
+            yield from walker(page_no, *args)
+        except (IndexError, ValueError, struct.error) as exc:
+            LOGGER.debug("%s: page %d undecodable: %s", self.path.name, page_no, exc)
+
+
+def recover_records(
+    path: Path,
+    db_type: Optional[str] = None,
+    *,
+    include_live: bool = True,
+    include_deleted: bool = True,
+) -> Iterator[RecoveredRecord]:
+    """
+    Stream records recovered from a (possibly damaged) SQLite file.
+
+    Args:
+        path: SQLite file
+        db_type: Browser DB type (``identify_browser_db`` result) guiding
+            table matching when sqlite_master is missing
+        include_live: Include live cells
+        include_deleted: Include freeblock, freelist and unmapped-page records
+    """
+    with SqlitePageWalker(path, db_type=db_type) as walker:
+        yield from walker.iter_records(include_live=include_live, include_deleted=include_deleted)
@@ -0,0 +1,632 @@
+"""
+Streaming unallocated-space scanner for raw browser artifacts.
+
+Scans the raw media of an evidence image for URLs, e-mail addresses and
+SQLite database headers without carving files first:
+
+- The image is read through pyewf (E01) or directly (raw/dd) in large
+  aligned chunks. Each chunk is read with a small overlap on both sides so
+  matches crossing a chunk boundary (up to the overlap in length) are found
+  exactly once: a match belongs to the chunk its first byte falls in.
+- Only unallocated space is scanned when a map is available: unallocated
+  filesystem blocks from the TSK allocation bitmap (``blkls -l -A``) plus
+  disk areas outside every partition.
+- All artifact types are matched by one compiled multi-pattern byte regex,
+  so every chunk is scanned once.
+- Chunks are fanned out to a process pool; each worker opens its own image
+  handle (pyewf handles cannot be shared between processes).
+- Progress is checkpointed, so an interrupted scan resumes where it
+  stopped, and the result reports throughput in MB/s.
+
+Hits are written as JSON lines ``{"kind", "offset", "value"}`` where offset
+is the absolute byte offset in the media.
+
+Usage:
+    source = ("ewf", [str(p) for p in ewf_paths])
+    ranges = list_unallocated_ranges(ewf_paths)
+    scanner = UnallocatedScanner(source, ranges, output_dir / "unalloc_scan")
+    result = scanner.run(progress=..., is_cancelled=...)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from core.logging import get_logger
+
+from .resilient_sqlite import _is_noise_url
+
+LOGGER = get_logger("extractors.browser_carver.unalloc_scanner")
+
+# Hit kinds
+HIT_URL = "url"
+HIT_EMAIL = "email"
+HIT_SQLITE_HEADER = "sqlite_header"
+
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+# Longest match we keep intact across chunk boundaries (URLs are capped at 2048)
+DEFAULT_OVERLAP = 4096
+ALIGNMENT = 4096
+CHECKPOINT_INTERVAL = 5.0
+
+MAX_URL_LENGTH = 2048
+
+# One pass finds every artifact type; the SQLite magic is case-sensitive
+SCAN_PATTERN = re.compile(
+    rb"(?P<url>https?://[a-zA-Z0-9][a-zA-Z0-9\-._~:/?#\[\]@!$&'()*+,;=%]+)"
+    rb"|(?P<email>[a-zA-Z0-9._%+\-]{1,64}@[a-zA-Z0-9\-]{1,63}(?:\.[a-zA-Z0-9\-]{1,63})*\.[a-zA-Z]{2,24})"
+    rb"|(?P<sqlite_header>(?-i:SQLite format 3\x00))",
+    re.IGNORECASE,
+)
+
+# (kind, absolute offset, value)
+Hit = Tuple[str, int, Any]
+ByteRange = Tuple[int, int]
+SourceSpec = Tuple[str, Any]
+
+
+# ============================================================================
+# Byte sources
+# ============================================================================
+
+class RawImageSource:
+    """Raw (dd) image or any plain file."""
+
+    def __init__(self, path: str):
+        self._fh = open(path, "rb")
+        self.size = os.fstat(self._fh.fileno()).st_size
+
+    def read(self, offset: int, length: int) -> bytes:
+        self._fh.seek(offset)
+        return self._fh.read(length)
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+class EwfImageSource:
+    """E01 image read through pyewf."""
+
+    def __init__(self, segment_paths: Sequence[str]):
+        try:
+            import pyewf  # type: ignore
+        except ModuleNotFoundError as exc:  # pragma: no cover - dependency guard
+            raise RuntimeError("EwfImageSource requires pyewf to be installed.") from exc
+        segments = [str(p) for p in segment_paths]
+        if len(segments) == 1:
+            # First segment only: let libewf find the rest (E02, E03, ...)
+            segments = pyewf.glob(segments[0])
+        self._handle = pyewf.handle()
+        self._handle.open(segments)
+        self.size = self._handle.get_media_size()
+
+    def read(self, offset: int, length: int) -> bytes:
+        self._handle.seek(offset)
+        return self._handle.read(length)
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+def open_byte_source(spec: SourceSpec):
+    """Open a byte source from a picklable spec: ("raw", path) or ("ewf", [segments])."""
+    kind, arg = spec
+    if kind == "raw":
+        return RawImageSource(arg)
+    if kind == "ewf":
+        return EwfImageSource(arg)
+    raise ValueError(f"Unknown byte source kind: {kind}")
+
+
+# ============================================================================
+# Matching
+# ============================================================================
+
+def _sqlite_page_size(data: bytes, header_end: int) -> Optional[int]:
+    raw = data[header_end:header_end + 2]
+    if len(raw) < 2:
+        return None
+    size = int.from_bytes(raw, "big")
+    if size == 1:
+        return 65536
+    if size >= 512 and size & (size - 1) == 0:
+        return size
+    return None
+
+
+def scan_window(data: bytes, window_offset: int, start: int, end: int) -> List[Hit]:
+    """
+    Match all artifact patterns in ``data``.
+
+    Args:
+        data: Bytes read from ``window_offset``
+        window_offset: Absolute offset of ``data[0]``
+        start, end: Absolute range owned by this chunk; only matches whose
+            first byte lies in [start, end) are returned
+
+    Returns:
+        List of (kind, absolute_offset, value) hits
+    """
+    hits: List[Hit] = []
+    lo = max(0, start - window_offset)
+    hi = end - window_offset
+    # Matching from the window start (not from ``lo``) lets a match owned by
+    # the previous chunk consume its bytes; starting at ``lo`` would report
+    # its cut-off tail ("thsonian@example.com") a second time
+    for match in SCAN_PATTERN.finditer(data):
+        pos = match.start()
+        if pos >= hi:
+            break
+        if pos < lo:
+            continue
+        kind = match.lastgroup
+        if kind == HIT_URL:
+            url = match.group().decode("utf-8", errors="ignore")
+            if 10 < len(url) < MAX_URL_LENGTH and not _is_noise_url(url):
+                hits.append((HIT_URL, window_offset + pos, url))
+        elif kind == HIT_EMAIL:
+            hits.append((HIT_EMAIL, window_offset + pos, match.group().decode("ascii", errors="ignore")))
+        else:
+            hits.append((HIT_SQLITE_HEADER, window_offset + pos, _sqlite_page_size(data, match.end())))
+    return hits
+
+
+# ============================================================================
+# Unallocated space map
+# ============================================================================
+
+def merge_ranges(ranges: Iterable[ByteRange]) -> List[ByteRange]:
+    """Sort and coalesce overlapping/adjacent [start, end) ranges."""
+    merged: List[ByteRange] = []
+    for start, end in sorted(r for r in ranges if r[1] > r[0]):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def parse_blkls_list(lines: Iterable[str], block_size: int, base_offset: int = 0) -> List[ByteRange]:
+    """
+    Convert ``blkls -l -A`` output into unallocated byte ranges.
+
+    blkls list mode prints ``addr|a`` / ``addr|f`` lines after a short
+    header; ``f`` (free) blocks are coalesced into contiguous runs.
+    """
+    ranges: List[ByteRange] = []
+    run_start = run_end = None
+    for line in lines:
+        addr_str, sep, flag = line.strip().partition("|")
+        if not sep or not addr_str.isdigit() or flag[:1] != "f":
+            continue
+        addr = int(addr_str)
+        if run_end is not None and addr == run_end:
+            run_end += 1
+            continue
+        if run_start is not None:
+            ranges.append((base_offset + run_start * block_size, base_offset + run_end * block_size))
+        run_start, run_end = addr, addr + 1
+    if run_start is not None:
+        ranges.append((base_offset + run_start * block_size, base_offset + run_end * block_size))
+    return ranges
+
+
+def _fs_block_size(ewf_paths: Sequence[Path], offset: int) -> Optional[int]:
+    try:
+        import pyewf  # type: ignore
+        import pytsk3  # type: ignore
+        from core.evidence_fs import _PyEwfImgInfo
+    except ImportError:
+        return None
+    handle = pyewf.handle()
+    handle.open([str(p) for p in ewf_paths])
+    try:
+        fs = pytsk3.FS_Info(_PyEwfImgInfo(handle, pytsk3), offset=offset)
+        return int(fs.info.block_size)
+    except Exception:
+        return None
+    finally:
+        handle.close()
+
+
+def list_unallocated_ranges(
+    ewf_paths: Sequence[Path],
+    partitions: Optional[List[Dict[str, Any]]] = None,
+    media_size: Optional[int] = None,
+) -> Tuple[List[ByteRange], List[str]]:
+    """
+    Build the unallocated-space map of an E01 image.
+
+    Unallocated filesystem blocks come from the TSK allocation bitmap via
+    ``blkls -l -A``. Space outside every partition is unallocated as well.
+    A partition whose bitmap cannot be read is scanned in full.
+
+    Returns:
+        (ranges, notes)
+    """
+    notes: List[str] = []
+    if partitions is None:
+        from core.evidence_fs import list_ewf_partitions
+        partitions = list_ewf_partitions(list(ewf_paths))
+    if media_size is None:
+        source = EwfImageSource([str(p) for p in ewf_paths])
+        media_size = source.size
+        source.close()
+
+    blkls = shutil.which("blkls")
+    ranges: List[ByteRange] = []
+    covered: List[ByteRange] = []
+
+    for part in partitions:
+        offset = int(part.get("offset") or 0)
+        length = int(part.get("length") or 0) or (media_size - offset)
+        sector_size = int(part.get("block_size") or 512)
+        covered.append((offset, offset + length))
+
+        block_size = _fs_block_size(ewf_paths, offset) if part.get("filesystem_readable") else None
+        if blkls is None or block_size is None:
+            reason = "blkls not found" if blkls is None else "filesystem not readable"
+            notes.append(f"Partition {part.get('index')}: {reason}, scanning whole partition")
+            ranges.append((offset, offset + length))
+            continue
+
+        cmd = [blkls, "-l", "-A", "-o", str(offset // sector_size), *[str(p) for p in ewf_paths]]
+        try:
+            proc = subprocess.run(cmd, capture_output=True, text=True, errors="replace", check=True)
+        except (OSError, subprocess.CalledProcessError) as exc:
+            notes.append(f"Partition {part.get('index')}: blkls failed ({exc}), scanning whole partition")
+            ranges.append((offset, offset + length))
+            continue
+        part_ranges = parse_blkls_list(proc.stdout.splitlines(), block_size, base_offset=offset)
+        ranges.extend(part_ranges)
+        LOGGER.info(
+            "Partition %s: %d unallocated run(s), %.1f MB",
+            part.get("index"), len(part_ranges),
+            sum(e - s for s, e in part_ranges) / (1024 * 1024),
+        )
+
+    # Disk areas outside every partition (slack between/after partitions)
+    position = 0
+    for start, end in merge_ranges(covered):
+        if start > position:
+            ranges.append((position, start))
+        position = max(position, end)
+    if position < media_size:
+        ranges.append((position, media_size))
+
+    return merge_ranges(ranges), notes
+
+
+# ============================================================================
+# Chunk planning and checkpoints
+# ============================================================================
+
+def plan_chunks(ranges: Sequence[ByteRange], chunk_size: int) -> List[ByteRange]:
+    """Split ranges into chunks whose interior boundaries are aligned to chunk_size."""
+    if chunk_size % ALIGNMENT:
+        raise ValueError(f"chunk_size must be a multiple of {ALIGNMENT}")
+    chunks: List[ByteRange] = []
+    for start, end in merge_ranges(ranges):
+        pos = start
+        while pos < end:
+            boundary = (pos // chunk_size + 1) * chunk_size
+            chunk_end = min(end, boundary)
+            chunks.append((pos, chunk_end))
+            pos = chunk_end
+    return chunks
+
+
+@dataclass
+class ScanResult:
+    """Outcome of an unallocated-space scan."""
+    bytes_total: int = 0
+    bytes_scanned: int = 0
+    bytes_resumed: int = 0
+    chunks_total: int = 0
+    chunks_scanned: int = 0
+    hits: Dict[str, int] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+    mb_per_second: float = 0.0
+    cancelled: bool = False
+    resumed: bool = False
+    hits_path: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class _Checkpoint:
+    """Completed-chunk bookkeeping persisted as JSON."""
+
+    def __init__(self, path: Path, fingerprint: str):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.done_below = 0  # every chunk index < done_below is complete
+        self.done: set = set()
+        self.hits_bytes = 0
+        self.hit_counts: Dict[str, int] = {}
+
+    def load(self) -> bool:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return False
+        if data.get("fingerprint") != self.fingerprint:
+            return False
+        self.done_below = int(data.get("done_below", 0))
+        self.done = set(data.get("done", []))
+        self.hits_bytes = int(data.get("hits_bytes", 0))
+        self.hit_counts = dict(data.get("hit_counts", {}))
+        return True
+
+    def is_done(self, index: int) -> bool:
+        return index < self.done_below or index in self.done
+
+    def mark(self, index: int) -> None:
+        self.done.add(index)
+        while self.done_below in self.done:
+            self.done.discard(self.done_below)
+            self.done_below += 1
+
+    def save(self) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({
+            "fingerprint": self.fingerprint,
+            "done_below": self.done_below,
+            "done": sorted(self.done),
+            "hits_bytes": self.hits_bytes,
+            "hit_counts": self.hit_counts,
+        }))
+        os.replace(tmp, self.path)
+
+
+# ============================================================================
+# Worker side
+# ============================================================================
+
+_WORKER_SOURCE = None
+
+
+def _init_worker(spec: SourceSpec) -> None:
+    global _WORKER_SOURCE
+    _WORKER_SOURCE = open_byte_source(spec)
+
+
+def _read_and_scan(source, index: int, start: int, end: int, overlap: int) -> Tuple[int, int, List[Hit]]:
+    window_start = max(0, start - overlap)
+    window_end = min(source.size, end + overlap)
+    data = source.read(window_start, window_end - window_start)
+    return index, end - start, scan_window(data, window_start, start, end)
+
+
+def _scan_chunk_worker(index: int, start: int, end: int, overlap: int) -> Tuple[int, int, List[Hit]]:
+    """Process pool entry point (top-level so it pickles)."""
+    return _read_and_scan(_WORKER_SOURCE, index, start, end, overlap)
+
+
+# ============================================================================
+# Scanner
+# ============================================================================
+
+class UnallocatedScanner:
+    """
+    Chunked, resumable multi-pattern scanner over raw media.
+
+    Output files in ``output_dir``:
+        hits.jsonl         one JSON object per hit
+        checkpoint.json    resume state (removed once the scan completes)
+    """
+
+    def __init__(
+        self,
+        source_spec: SourceSpec,
+        ranges: Optional[Sequence[ByteRange]],
+        output_dir: Path,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        overlap: int = DEFAULT_OVERLAP,
+        max_workers: Optional[int] = None,
+        enable_parallel: bool = True,
+    ):
+        """
+        Args:
+            source_spec: ("ewf", [segments]) or ("raw", path)
+            ranges: Byte ranges to scan (None = whole media)
+            output_dir: Directory for hits and checkpoint files
+            chunk_size: Bytes per task, multiple of 4096
+            overlap: Bytes read beyond each side of a chunk
+            max_workers: Worker processes (None = CPU count)
+            enable_parallel: If False, scan in-process (debugging/tests)
+        """
+        self.source_spec = source_spec
+        self.output_dir = Path(output_dir)
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.enable_parallel = enable_parallel
+
+        source = open_byte_source(source_spec)
+        try:
+            self.media_size = source.size
+        finally:
+            source.close()
+        if ranges is None:
+            ranges = [(0, self.media_size)]
+        self.ranges = merge_ranges((max(0, s), min(e, self.media_size)) for s, e in ranges)
+        self.chunks = plan_chunks(self.ranges, chunk_size)
+
+        self.hits_path = self.output_dir / "hits.jsonl"
+        self.checkpoint_path = self.output_dir / "checkpoint.json"
+
+    def _fingerprint(self) -> str:
+        payload = json.dumps(
+            [self.media_size, self.chunk_size, self.overlap, self.ranges], separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def run(
+        self,
+        progress: Optional[Callable[[int, int, float], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> ScanResult:
+        """
+        Scan all planned chunks not completed by an earlier run.
+
+        Args:
+            progress: Called as progress(bytes_done, bytes_total, mb_per_s)
+            is_cancelled: Polled between chunks; a cancelled scan keeps its
+                checkpoint so the next run resumes
+
+        Returns:
+            ScanResult with per-kind hit counts and throughput
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        checkpoint = _Checkpoint(self.checkpoint_path, self._fingerprint())
+        result = ScanResult(
+            bytes_total=sum(e - s for s, e in self.chunks),
+            chunks_total=len(self.chunks),
+            hits_path=str(self.hits_path),
+        )
+
+        if checkpoint.load() and self.hits_path.exists():
+            # Drop hits written after the last checkpoint; those chunks rerun
+            with open(self.hits_path, "r+b") as fh:
+                fh.truncate(checkpoint.hits_bytes)
+            result.resumed = True
+        else:
+            checkpoint = _Checkpoint(self.checkpoint_path, self._fingerprint())
+            self.hits_path.write_bytes(b"")
+
+        pending = [(i, s, e) for i, (s, e) in enumerate(self.chunks) if not checkpoint.is_done(i)]
+        result.bytes_resumed = result.bytes_total - sum(e - s for _, s, e in pending)
+        result.hits = dict(checkpoint.hit_counts)
+        if result.resumed:
+            LOGGER.info(
+                "Resuming unallocated scan: %d/%d chunks already done",
+                len(self.chunks) - len(pending), len(self.chunks),
+            )
+
+        started = time.monotonic()
+        last_checkpoint = started
+        cancelled = is_cancelled or (lambda: False)
+
+        with open(self.hits_path, "ab") as hits_fh:
+            def record(index: int, nbytes: int, hits: List[Hit]) -> None:
+                nonlocal last_checkpoint
+                for kind, offset, value in hits:
+                    hits_fh.write(json.dumps(
+                        {"kind": kind, "offset": offset, "value": value}, ensure_ascii=False
+                    ).encode("utf-8") + b"\n")
+                    result.hits[kind] = result.hits.get(kind, 0) + 1
+                checkpoint.mark(index)
+                result.chunks_scanned += 1
+                result.bytes_scanned += nbytes
+                elapsed = time.monotonic() - started
+                rate = result.bytes_scanned / (1024 * 1024) / elapsed if elapsed > 0 else 0.0
+                if progress:
+                    progress(result.bytes_resumed + result.bytes_scanned, result.bytes_total, rate)
+                now = time.monotonic()
+                if now - last_checkpoint >= CHECKPOINT_INTERVAL:
+                    hits_fh.flush()
+                    checkpoint.hits_bytes = hits_fh.tell()
+                    checkpoint.hit_counts = dict(result.hits)
+                    checkpoint.save()
+                    last_checkpoint = now
+
+            try:
+                if self.enable_parallel and self.max_workers > 1 and len(pending) > 1:
+                    try:
+                        self._run_parallel(pending, record, cancelled, result)
+                    except PermissionError as exc:
+                        LOGGER.warning("Parallel scan unavailable (%s); falling back to sequential", exc)
+                        self._run_sequential(
+                            [p for p in pending if not checkpoint.is_done(p[0])], record, cancelled, result
+                        )
+                else:
+                    self._run_sequential(pending, record, cancelled, result)
+            finally:
+                hits_fh.flush()
+                checkpoint.hits_bytes = hits_fh.tell()
+                checkpoint.hit_counts = dict(result.hits)
+
+        if result.cancelled:
+            checkpoint.save()
+        else:
+            self.checkpoint_path.unlink(missing_ok=True)
+
+        result.elapsed_seconds = time.monotonic() - started
+        if result.elapsed_seconds > 0:
+            result.mb_per_second = result.bytes_scanned / (1024 * 1024) / result.elapsed_seconds
+        LOGGER.info(
+            "Unallocated scan: %.1f MB in %.1fs (%.1f MB/s), hits=%s%s",
+            result.bytes_scanned / (1024 * 1024), result.elapsed_seconds,
+            result.mb_per_second, result.hits, " [cancelled]" if result.cancelled else "",
+        )
+        return result
+
+    def _run_sequential(self, pending, record, cancelled, result: ScanResult) -> None:
+        source = open_byte_source(self.source_spec)
+        try:
+            for index, start, end in pending:
+                if cancelled():
+                    result.cancelled = True
+                    return
+                record(*_read_and_scan(source, index, start, end, self.overlap))
+        finally:
+            source.close()
+
+    def _run_parallel(self, pending, record, cancelled, result: ScanResult) -> None:
+        # Bounded number of chunks in flight keeps memory at
+        # ~2 * workers * (chunk_size + 2 * overlap)
+        window = self.max_workers * 2
+        tasks: Iterator = iter(pending)
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(self.source_spec,),
+        ) as executor:
+            in_flight = set()
+            exhausted = False
+            while in_flight or not exhausted:
+                while not exhausted and len(in_flight) < window:
+                    task = next(tasks, None)
+                    if task is None:
+                        exhausted = True
+                        break
+                    in_flight.add(executor.submit(_scan_chunk_worker, *task, self.overlap))
+                if not in_flight:
+                    break
+                done, in_flight = wait(in_flight, timeout=1.0, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record(*future.result())
+                if cancelled():
+                    result.cancelled = True
+                    for future in in_flight:
+                        future.cancel()
+                    # Keep what already finished; cancelled chunks rerun on resume
+                    for future in in_flight:
+                        if not future.cancelled():
+                            record(*future.result())
+                    return
+
+
+def iter_hits(hits_path: Path, kind: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Read hits written by UnallocatedScanner, optionally of one kind."""
+    with open(hits_path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            hit = json.loads(line)
+            if kind is None or hit["kind"] == kind:
+                yield hit
@@ -1,10 +1,12 @@
 """bulk_extractor modular extractor implementation."""
 
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 import json
 from pathlib import Path
-from typing import Any, Dict, Optional, List
-from urllib.parse import urlparse
+from typing import Any, Deque, Dict, Iterator, Optional, List
 import subprocess
 import os
 import time
@@ -15,6 +17,7 @@ from ...base import BaseExtractor, ExtractorMetadata, ExtractorCallbacks
 from core.tool_discovery import discover_tools
 from core.logging import get_logger
 from core.database import (
+    bulk_ingest,
     insert_urls,
     insert_emails,
     insert_domains,
@@ -29,6 +32,13 @@ from extractors._shared.carving.processor import ParallelImageProcessor
 from extractors._shared.carving.enrichment import ingest_with_enrichment
 from extractors._shared.extracted_files_audit import record_carved_files
 from core.statistics_collector import StatisticsCollector
+from .feature_parser import (
+    build_artifact_record,
+    normalize_feature,
+    parse_feature_line,
+    parse_feature_range,
+    split_byte_ranges,
+)
 
 LOGGER = get_logger("extractors.bulk_extractor")
 
@@ -36,6 +46,13 @@ LOGGER = get_logger("extractors.bulk_extractor")
 DEFAULT_SCANNERS = ["email", "accts"]  # email produces url.txt, accts produces telephone.txt etc.
 DEFAULT_CARVE_IMAGES = True  # Enable jpeg_carve by default
 
+# Feature file ingestion: bytes per parse task, rows per insert batch
+FEATURE_RANGE_BYTES = 8 * 1024 * 1024
+FEATURE_INSERT_BATCH = 20000
+# url.txt files at least this large load with the urls indexes deferred
+# (about core.database.BULK_INGEST_MIN_ROWS lines)
+FEATURE_BULK_INGEST_BYTES = 16 * 1024 * 1024
+
 # Mapping of bulk_extractor output files to artifact types
 BULK_EXTRACTOR_OUTPUT_FILES = {
     "url.txt": "url",
@@ -49,6 +66,14 @@ BULK_EXTRACTOR_OUTPUT_FILES = {
 }
 
 
+class _ParallelUnavailable(Exception):
+    """Process pool could not be used; ``completed`` ranges were already yielded."""
+
+    def __init__(self, message: str, completed: int):
+        super().__init__(message)
+        self.completed = completed
+
+
 class BulkExtractorExtractor(BaseExtractor):
     """
     bulk_extractor forensic tool extractor.
@@ -650,7 +675,7 @@ class BulkExtractorExtractor(BaseExtractor):
 
         enable_parallel = config.get("enable_parallel", True)
         processor = ParallelImageProcessor(enable_parallel=enable_parallel)
-        results = processor.process_images(image_files, output_dir)
+        total = len(image_files)
 
         run_id = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         discovered_by = "bulk_extractor"
@@ -665,14 +690,20 @@ class BulkExtractorExtractor(BaseExtractor):
         enriched = 0
         error_count = 0
 
+        # Results are handed over batch by batch as workers finish them
+        results = (
+            result
+            for batch in processor.iter_batches(image_files, output_dir, total=total)
+            for result in batch
+        )
         for i, result in enumerate(results):
             if callbacks.is_cancelled():
                 callbacks.on_log("Image ingestion cancelled by user", "warning")
                 break
 
             # Progress update
-            if (i + 1) % 100 == 0 or i == len(results) - 1:
-                callbacks.on_progress(i + 1, len(results), f"Image {i+1}/{len(results)}")
+            if (i + 1) % 100 == 0 or i == total - 1:
+                callbacks.on_progress(i + 1, total, f"Image {i+1}/{total}")
 
             if result.error is not None:
                 error_count += 1
@@ -818,6 +849,10 @@ class BulkExtractorExtractor(BaseExtractor):
         Example:
             17940236<tab>http://example.com/path<tab><binary context>
 
+        The file is split into line-aligned byte ranges that are parsed in
+        a process pool; this process only inserts, in file order. Progress
+        is reported in bytes.
+
         Routes artifacts to appropriate tables:
             - url → urls table
             - email → emails table
@@ -830,83 +865,58 @@ class BulkExtractorExtractor(BaseExtractor):
         """
         callbacks.on_log(f"Parsing {file_path.name}...", "info")
 
-        artifacts_batch = []
-        batch_size = 1000  # Insert every 1000 items
+        total_bytes = file_path.stat().st_size
+        total_mb = total_bytes / (1024 * 1024)
+        pending: List[Dict[str, Any]] = []
         total_imported = 0
         line_count = 0
         skipped_count = 0
+        bytes_done = 0
+        started = time.monotonic()
 
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    if callbacks.is_cancelled():
-                        callbacks.on_log("Import cancelled by user", "warning")
-                        break
-
-                    line_count += 1
-
-                    # Progress update every 10000 lines
-                    if line_count % 10000 == 0:
-                        callbacks.on_log(
-                            f"  Processed {line_count:,} lines, imported {total_imported:,} {artifact_type} records...",
-                            "info"
-                        )
-
-                    # Skip comments and empty lines
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        skipped_count += 1
-                        continue
-
-                    # Parse bulk_extractor line format
-                    parsed = self._parse_bulk_extractor_line(line, artifact_type, file_path.name)
-                    if not parsed:
-                        skipped_count += 1
-                        continue
-
-                    # Build record for appropriate table
-                    record = self._build_artifact_record(parsed, artifact_type, file_path.name)
-                    if record:
-                        artifacts_batch.append(record)
-                    else:
-                        skipped_count += 1
-
-                    # Batch insert
-                    if len(artifacts_batch) >= batch_size:
-                        callbacks.on_log(
-                            f"  Inserting batch of {len(artifacts_batch)} {artifact_type} records...",
-                            "info"
-                        )
-                        inserted = self._insert_artifact_batch(
-                            evidence_conn, evidence_id, artifact_type, artifacts_batch
-                        )
-                        total_imported += inserted
-                        if inserted < len(artifacts_batch):
-                            callbacks.on_log(
-                                f"    Skipped {len(artifacts_batch) - inserted} duplicate {artifact_type} records (already in database)",
-                                "info"
-                            )
-                        artifacts_batch.clear()
-
-                        # Report progress (use 0 for unknown total)
-                        callbacks.on_progress(line_count, 0, "")
-
-            # Insert remaining batch
-            if artifacts_batch:
+        def flush() -> int:
+            inserted = self._insert_artifact_batch(evidence_conn, evidence_id, artifact_type, pending)
+            if inserted < len(pending):
                 callbacks.on_log(
-                    f"  Inserting final batch of {len(artifacts_batch)} {artifact_type} records...",
+                    f"    Skipped {len(pending) - inserted} duplicate {artifact_type} records (already in database)",
                     "info"
                 )
-                inserted = self._insert_artifact_batch(
-                    evidence_conn, evidence_id, artifact_type, artifacts_batch
-                )
-                total_imported += inserted
-                if inserted < len(artifacts_batch):
-                    callbacks.on_log(
-                        f"    Skipped {len(artifacts_batch) - inserted} duplicate {artifact_type} records (already in database)",
-                        "info"
+            pending.clear()
+            return inserted
+
+        try:
+            bulk = (
+                bulk_ingest(evidence_conn, ("urls",))
+                if artifact_type == "url" and total_bytes >= FEATURE_BULK_INGEST_BYTES
+                else nullcontext()
+            )
+            with bulk:
+                ranges = split_byte_ranges(file_path, FEATURE_RANGE_BYTES)
+                for (start, end), (records, lines, skipped) in self._parse_feature_ranges(
+                    file_path, artifact_type, ranges, callbacks
+                ):
+                    line_count += lines
+                    skipped_count += skipped
+                    bytes_done += end - start
+                    pending.extend(records)
+                    if len(pending) >= FEATURE_INSERT_BATCH:
+                        total_imported += flush()
+
+                    elapsed = time.monotonic() - started
+                    rate = bytes_done / (1024 * 1024) / elapsed if elapsed > 0 else 0.0
+                    callbacks.on_progress(
+                        bytes_done,
+                        total_bytes,
+                        f"{file_path.name}: {bytes_done / (1024 * 1024):,.0f} / {total_mb:,.0f} MB ({rate:.1f} MB/s)",
                     )
 
+                if callbacks.is_cancelled():
+                    callbacks.on_log("Import cancelled by user", "warning")
+
+                # Insert remaining batch
+                if pending:
+                    total_imported += flush()
+
             callbacks.on_log(
                 f"✓ Processed {line_count:,} lines from {file_path.name}",
                 "info"
@@ -917,7 +927,7 @@ class BulkExtractorExtractor(BaseExtractor):
             )
             if skipped_count > 0:
                 callbacks.on_log(
-                    f"  Skipped: {skipped_count:,} lines (comments, empty, invalid)",
+                    f"  Skipped: {skipped_count:,} lines (comments, empty, invalid, repeated)",
                     "info"
                 )
             callbacks.on_log(f"✓ Processed {line_count:,} lines, imported {total_imported:,} {artifact_type} items", "info")
@@ -928,6 +938,75 @@ class BulkExtractorExtractor(BaseExtractor):
             LOGGER.exception(f"Import error for {file_path}")
             return total_imported  # Return what we managed to import
 
+    def _parse_feature_ranges(
+        self,
+        file_path: Path,
+        artifact_type: str,
+        ranges: List[tuple],
+        callbacks: ExtractorCallbacks,
+    ) -> Iterator[tuple]:
+        """
+        Yield ``((start, end), (records, lines, skipped))`` per range, in file order.
+
+        Ranges are parsed in a process pool with a bounded number in flight;
+        a single range (small file) or a sandbox without process support is
+        parsed in this process.
+        """
+        if len(ranges) > 1:
+            try:
+                yield from self._parse_feature_ranges_parallel(file_path, artifact_type, ranges, callbacks)
+                return
+            except _ParallelUnavailable as exc:
+                LOGGER.warning("Parallel feature parsing unavailable (%s); parsing sequentially", exc)
+                ranges = ranges[exc.completed:]
+
+        for start, end in ranges:
+            if callbacks.is_cancelled():
+                return
+            yield (start, end), parse_feature_range(
+                str(file_path), start, end, artifact_type, callbacks.is_cancelled
+            )
+
+    def _parse_feature_ranges_parallel(
+        self,
+        file_path: Path,
+        artifact_type: str,
+        ranges: List[tuple],
+        callbacks: ExtractorCallbacks,
+    ) -> Iterator[tuple]:
+        max_workers = min(len(ranges), os.cpu_count() or 1)
+        window = max_workers * 2
+        completed = 0
+        try:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        except PermissionError as exc:
+            raise _ParallelUnavailable(str(exc), completed) from exc
+
+        with executor:
+            in_flight: Deque = deque()
+            next_index = 0
+            while next_index < len(ranges) or in_flight:
+                while next_index < len(ranges) and len(in_flight) < window:
+                    start, end = ranges[next_index]
+                    try:
+                        future = executor.submit(
+                            parse_feature_range, str(file_path), start, end, artifact_type
+                        )
+                    except PermissionError as exc:
+                        for pending_future in in_flight:
+                            pending_future[1].cancel()
+                        raise _ParallelUnavailable(str(exc), completed) from exc
+                    in_flight.append(((start, end), future))
+                    next_index += 1
+
+                byte_range, future = in_flight.popleft()
+                yield byte_range, future.result()
+                completed += 1
+
+                if callbacks.is_cancelled():
+                    for _, pending_future in in_flight:
+                        pending_future.cancel()
+                    return
 
     def _build_artifact_record(
         self,
@@ -938,78 +1017,10 @@ class BulkExtractorExtractor(BaseExtractor):
         """
         Build a database record for the parsed artifact.
 
-        Different artifact types require different record structures.
-
-        Note: context column exists in schema but insert functions don't use it yet.
-        TODO(post-beta): Update insert functions to include context parameter.
-        See docs/developer/DEFERRED_FEATURES.md
+        Different artifact types require different record structures
+        (see feature_parser.build_artifact_record).
         """
-        base_record = {
-            "discovered_by": f"bulk_extractor:{artifact_type}",
-            "first_seen_utc": None,
-            "last_seen_utc": None,
-            "source_path": f"{source_filename}:{parsed['offset']}",
-            "tags": None,
-            "notes": None,
-            # "context": parsed["context"],  # TODO(post-beta): Add when insert functions support it
-        }
-
-        if artifact_type == "url":
-            return {
-                **base_record,
-                "url": parsed["value"],
-                "domain": parsed["domain"],
-                "scheme": parsed["scheme"],
-                "context": parsed["context"],  # URLs table insert function DOES support context
-            }
-
-        elif artifact_type == "email":
-            return {
-                **base_record,
-                "email": parsed["value"],
-                "domain": parsed["domain"],
-            }
-
-        elif artifact_type == "domain":
-            return {
-                **base_record,
-                "domain": parsed["value"],
-            }
-
-        elif artifact_type == "ip":
-            return {
-                **base_record,
-                "ip_address": parsed["value"],
-                "ip_version": "IPv4",  # bulk_extractor doesn't distinguish, assume IPv4
-            }
-
-        elif artifact_type == "bitcoin":
-            return {
-                **base_record,
-                "address": parsed["value"],
-            }
-
-        elif artifact_type == "ether":
-            return {
-                **base_record,
-                "address": parsed["value"],
-            }
-
-        elif artifact_type == "telephone":
-            return {
-                **base_record,
-                "phone_number": parsed["value"],
-                "country_code": None,  # bulk_extractor doesn't parse country code separately
-            }
-
-        elif artifact_type == "ccn":
-            # CCNs are detected but not stored for PII reasons
-            return None
-
-        else:
-            # Unknown artifact type
-            LOGGER.warning(f"Unknown artifact type: {artifact_type}")
-            return None
+        return build_artifact_record(parsed, artifact_type, source_filename)
 
 
     def _insert_artifact_batch(
@@ -1033,7 +1044,7 @@ class BulkExtractorExtractor(BaseExtractor):
         if not artifacts_batch:
             return 0
 
-        before_changes = evidence_conn.total_changes  # Track actual inserts (INSERT OR IGNORE safe)
+        inserted = 0  # Actual inserts as reported by the helpers (INSERT OR IGNORE safe)
 
         # Table mapping for logging
         table_map = {
@@ -1050,25 +1061,25 @@ class BulkExtractorExtractor(BaseExtractor):
 
         try:
             if artifact_type == "url":
-                insert_urls(evidence_conn, evidence_id, artifacts_batch)
+                inserted = insert_urls(evidence_conn, evidence_id, artifacts_batch)
 
             elif artifact_type == "email":
-                insert_emails(evidence_conn, evidence_id, artifacts_batch)
+                inserted = insert_emails(evidence_conn, evidence_id, artifacts_batch)
 
             elif artifact_type == "domain":
-                insert_domains(evidence_conn, evidence_id, artifacts_batch)
+                inserted = insert_domains(evidence_conn, evidence_id, artifacts_batch)
 
             elif artifact_type == "ip":
-                insert_ip_addresses(evidence_conn, evidence_id, artifacts_batch)
+                inserted = insert_ip_addresses(evidence_conn, evidence_id, artifacts_batch)
 
             elif artifact_type == "bitcoin":
-                insert_bitcoin_addresses(evidence_conn, evidence_id, artifacts_batch)
+                inserted = insert_bitcoin_addresses(evidence_conn, evidence_id, artifacts_batch)
 
             elif artifact_type == "ether":
-                insert_ethereum_addresses(evidence_conn, evidence_id, artifacts_batch)
+                inserted = insert_ethereum_addresses(evidence_conn, evidence_id, artifacts_batch)
 
             elif artifact_type == "telephone":
-                insert_telephone_numbers(evidence_conn, evidence_id, artifacts_batch)
+                inserted = insert_telephone_numbers(evidence_conn, evidence_id, artifacts_batch)
 
             else:
                 LOGGER.warning(f"No insert function for artifact type: {artifact_type}")
@@ -1077,7 +1088,7 @@ class BulkExtractorExtractor(BaseExtractor):
             LOGGER.error(f"Error inserting {artifact_type} batch: {e}")
             raise
 
-        return evidence_conn.total_changes - before_changes
+        return inserted
 
 
     def _parse_bulk_extractor_line(
@@ -1101,57 +1112,11 @@ class BulkExtractorExtractor(BaseExtractor):
         Returns None if line cannot be parsed.
         """
         try:
-            # Split on tab
-            parts = line.split('\t', 2)  # Max 3 parts: offset, feature, context
-
-            if len(parts) < 2:
-                return None  # Invalid format
-
-            offset_str = parts[0].strip()
-            feature = parts[1].strip()
-            context = parts[2] if len(parts) > 2 else ""
-
-            # Parse offset
-            try:
-                offset = int(offset_str)
-            except ValueError:
-                return None  # Invalid offset
-
-            # Normalize the feature based on artifact type
-            value = self._normalize_feature(feature, artifact_type)
-            if not value:
-                return None
-
-            # Extract domain and scheme (for URLs and emails)
-            domain = None
-            scheme = None
-
-            if artifact_type == "url":
-                try:
-                    parsed_url = urlparse(value)
-                    scheme = parsed_url.scheme or None
-                    domain = parsed_url.netloc or None
-                except Exception:
-                    pass
-
-            elif artifact_type == "email":
-                # Extract domain from email address
-                if "@" in value:
-                    domain = value.split("@", 1)[1]
-
-            return {
-                "offset": offset,
-                "value": value,
-                "domain": domain,
-                "scheme": scheme,
-                "context": context[:500] if context else None,  # Limit context size
-            }
-
+            return parse_feature_line(line.strip(), artifact_type)
         except Exception as e:
             LOGGER.debug(f"Failed to parse line from {source_filename}: {e}")
             return None
 
-
     def _normalize_feature(self, feature: str, artifact_type: str) -> Optional[str]:
         """
         Normalize a bulk_extractor feature based on artifact type.
@@ -1163,49 +1128,4 @@ class BulkExtractorExtractor(BaseExtractor):
         Returns:
             Normalized feature string, or None if invalid
         """
-        if not feature:
-            return None
-
-        feature = feature.strip()
-
-        # Handle different artifact types
-        if artifact_type == "url":
-            # Already a URL, just validate it looks reasonable
-            if not any(feature.startswith(prefix) for prefix in ["http://", "https://", "ftp://", "file://"]):
-                # Try to add http:// if it looks like a URL without scheme
-                if "." in feature and " " not in feature:
-                    feature = "http://" + feature
-                else:
-                    return None  # Not a valid URL
-            return feature
-
-        elif artifact_type == "email":
-            # Return plain email address (not mailto: URL)
-            if "@" in feature and " " not in feature:
-                # Strip mailto: prefix if present
-                if feature.startswith("mailto:"):
-                    return feature[7:]  # Remove "mailto:"
-                return feature
-            return None
-
-        elif artifact_type == "domain":
-            # Return plain domain (not as http:// URL)
-            if "." in feature and " " not in feature:
-                # Strip any protocol prefix
-                for prefix in ["http://", "https://", "ftp://"]:
-                    if feature.startswith(prefix):
-                        feature = feature[len(prefix):]
-                return feature
-            return None
-
-        elif artifact_type == "ip":
-            # Return plain IP address
-            return feature
-
-        elif artifact_type in ["bitcoin", "ether", "telephone", "ccn"]:
-            # Return as-is for other types
-            return feature
-
-        else:
-            # Unknown type, return as-is
-            return feature
+        return normalize_feature(feature, artifact_type)
@@ -0,0 +1,257 @@
+"""
+bulk_extractor feature file parsing.
+
+Feature files (url.txt, email.txt, ...) hold one tab-separated feature per
+line::
+
+    offset<tab>feature<tab>context
+
+Large files are split into byte ranges that end on line boundaries and the
+ranges are parsed in worker processes (``parse_feature_range``). Workers
+return ready-to-insert records, so the ingesting process only writes.
+
+Parsing avoids ``urllib.parse.urlparse`` for the URL domain and scheme:
+feature URLs are already normalized to ``scheme://netloc...`` and a
+``str.find`` based split gives the same scheme/netloc for them.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Target size of one parse task
+DEFAULT_RANGE_BYTES = 8 * 1024 * 1024
+
+# Context column is truncated to this many characters
+MAX_CONTEXT_CHARS = 500
+
+_URL_PREFIXES = ("http://", "https://", "ftp://", "file://")
+_DOMAIN_STRIP_PREFIXES = ("http://", "https://", "ftp://")
+
+
+def normalize_feature(feature: str, artifact_type: str) -> Optional[str]:
+    """
+    Normalize a bulk_extractor feature based on artifact type.
+
+    Args:
+        feature: Raw feature string from bulk_extractor
+        artifact_type: Type of artifact (url, email, domain, etc.)
+
+    Returns:
+        Normalized feature string, or None if invalid
+    """
+    if not feature:
+        return None
+
+    feature = feature.strip()
+
+    if artifact_type == "url":
+        # Already a URL, just validate it looks reasonable
+        if not feature.startswith(_URL_PREFIXES):
+            # Try to add http:// if it looks like a URL without scheme
+            if "." in feature and " " not in feature:
+                feature = "http://" + feature
+            else:
+                return None
+        return feature
+
+    if artifact_type == "email":
+        # Return plain email address (not mailto: URL)
+        if "@" in feature and " " not in feature:
+            if feature.startswith("mailto:"):
+                return feature[7:]
+            return feature
+        return None
+
+    if artifact_type == "domain":
+        # Return plain domain (not as http:// URL)
+        if "." in feature and " " not in feature:
+            for prefix in _DOMAIN_STRIP_PREFIXES:
+                if feature.startswith(prefix):
+                    feature = feature[len(prefix):]
+            return feature
+        return None
+
+    # ip, bitcoin, ether, telephone, ccn and unknown types: as-is
+    return feature
+
+
+def split_url(url: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return (scheme, netloc) of a ``scheme://netloc/...`` URL.
+
+    Equivalent to ``urlparse(url).scheme/netloc`` for normalized feature
+    URLs, without urlparse's general-case overhead.
+    """
+    sep = url.find("://")
+    if sep <= 0:
+        return None, None
+    scheme = url[:sep].lower()
+    start = sep + 3
+    end = len(url)
+    for ch in "/?#":
+        pos = url.find(ch, start)
+        if 0 <= pos < end:
+            end = pos
+    return scheme, url[start:end] or None
+
+
+def parse_feature_line(line: str, artifact_type: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a single bulk_extractor output line.
+
+    Returns dict with offset, value, domain, scheme and context, or None if
+    the line cannot be parsed.
+    """
+    parts = line.split("\t", 2)
+    if len(parts) < 2:
+        return None
+
+    try:
+        offset = int(parts[0])
+    except ValueError:
+        return None
+
+    value = normalize_feature(parts[1], artifact_type)
+    if not value:
+        return None
+
+    domain = None
+    scheme = None
+    if artifact_type == "url":
+        scheme, domain = split_url(value)
+    elif artifact_type == "email":
+        at = value.find("@")
+        if at >= 0:
+            domain = value[at + 1:]
+
+    context = parts[2] if len(parts) > 2 else ""
+    return {
+        "offset": offset,
+        "value": value,
+        "domain": domain,
+        "scheme": scheme,
+        "context": context[:MAX_CONTEXT_CHARS] if context else None,
+    }
+
+
+def build_artifact_record(
+    parsed: Dict[str, Any],
+    artifact_type: str,
+    source_filename: str,
+) -> Optional[Dict[str, Any]]:
+    """
+    Build the database record for a parsed feature.
+
+    Returns None for artifact types that are not stored (ccn, unknown).
+    """
+    base_record = {
+        "discovered_by": f"bulk_extractor:{artifact_type}",
+        "first_seen_utc": None,
+        "last_seen_utc": None,
+        "source_path": f"{source_filename}:{parsed['offset']}",
+        "tags": None,
+        "notes": None,
+    }
+    value = parsed["value"]
+
+    if artifact_type == "url":
+        return {
+            **base_record,
+            "url": value,
+            "domain": parsed["domain"],
+            "scheme": parsed["scheme"],
+            "context": parsed["context"],
+        }
+    if artifact_type == "email":
+        return {**base_record, "email": value, "domain": parsed["domain"]}
+    if artifact_type == "domain":
+        return {**base_record, "domain": value}
+    if artifact_type == "ip":
+        # bulk_extractor doesn't distinguish, assume IPv4
+        return {**base_record, "ip_address": value, "ip_version": "IPv4"}
+    if artifact_type in ("bitcoin", "ether"):
+        return {**base_record, "address": value}
+    if artifact_type == "telephone":
+        return {**base_record, "phone_number": value, "country_code": None}
+    # ccn: detected but not stored for PII reasons
+    return None
+
+
+def split_byte_ranges(path: Path, range_bytes: int = DEFAULT_RANGE_BYTES) -> List[Tuple[int, int]]:
+    """
+    Split a file into [start, end) byte ranges that end on line boundaries.
+
+    Every range but the last ends just after a newline, so each line lies
+    in exactly one range.
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    ranges: List[Tuple[int, int]] = []
+    start = 0
+    with open(path, "rb") as fh:
+        while start < size:
+            target = start + range_bytes
+            if target >= size:
+                ranges.append((start, size))
+                break
+            fh.seek(target)
+            fh.readline()  # Move to the end of the line containing target
+            end = min(fh.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def parse_feature_range(
+    path: str,
+    start: int,
+    end: int,
+    artifact_type: str,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+) -> Tuple[List[Dict[str, Any]], int, int]:
+    """
+    Parse the lines in [start, end) of a feature file.
+
+    Top-level so it can run in a process pool. Features repeated at the
+    same offset within the range are kept once. ``is_cancelled`` (in-process
+    use only) is polled per line and stops the parse early.
+
+    Returns:
+        (records, line_count, skipped_count)
+    """
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        data = fh.read(end - start)
+
+    source_filename = os.path.basename(path)
+    records: List[Dict[str, Any]] = []
+    seen = set()
+    line_count = 0
+    skipped = 0
+    for line in data.decode("utf-8", errors="ignore").splitlines():
+        if is_cancelled is not None and is_cancelled():
+            break
+        line_count += 1
+        line = line.strip()
+        if not line or line[0] == "#":
+            skipped += 1
+            continue
+        parsed = parse_feature_line(line, artifact_type)
+        if parsed is None:
+            skipped += 1
+            continue
+        key = (parsed["offset"], parsed["value"])
+        if key in seen:
+            skipped += 1
+            continue
+        seen.add(key)
+        record = build_artifact_record(parsed, artifact_type, source_filename)
+        if record is None:
+            skipped += 1
+            continue
+        records.append(record)
+    return records, line_count, skipped
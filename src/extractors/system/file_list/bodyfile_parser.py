@@ -19,6 +19,7 @@ import logging
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import PurePosixPath
 from typing import Iterator, Optional
 
@@ -27,6 +28,17 @@ __all__ = ["BodyfileParser", "BodyfileEntry"]
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=65536)
+def _format_epoch(epoch: int) -> str:
+    # MAC times of one file (and of files written together) are usually
+    # identical, so most lookups hit the cache.
+    dt = datetime.fromtimestamp(epoch, tz=timezone.utc)
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
+    )
+
+
 @dataclass
 class BodyfileEntry:
     """
@@ -280,8 +292,7 @@ class BodyfileParser:
             # Handle overflow for very large timestamps
             if epoch > 32503680000:  # Year 3000
                 return None
-            dt = datetime.fromtimestamp(epoch, tz=timezone.utc)
-            return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+            return _format_epoch(epoch)
         except (ValueError, OSError, OverflowError):
             return None
 
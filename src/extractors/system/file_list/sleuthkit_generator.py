@@ -20,15 +20,21 @@ See Also:
 from __future__ import annotations
 
 import logging
+import os
+import queue
 import re
 import sqlite3
 import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable, List, Optional
 
+from core.database import bulk_ingest, defer_indexes, restore_deferred_indexes
+
 from .bodyfile_parser import BodyfileEntry, BodyfileParser
 from .sleuthkit_utils import get_sleuthkit_bin
 
@@ -37,18 +43,17 @@ __all__ = ["SleuthKitFileListGenerator", "GenerationResult"]
 logger = logging.getLogger(__name__)
 
 
-# Indexes to drop before bulk insert and recreate after
-# NOTE: idx_file_list_unique_path is NOT included because it's required for
-# INSERT OR IGNORE to work correctly. Without the unique constraint,
-# INSERT OR IGNORE won't detect duplicates and will insert them anyway.
-FILE_LIST_INDEXES = [
-    "idx_file_list_extension",
-    "idx_file_list_evidence_extension",
-    "idx_file_list_partition",
-    "idx_file_list_name",
-    "idx_file_list_path",
-    # "idx_file_list_unique_path",  # Keep this! Required for INSERT OR IGNORE
-]
+# file_list columns written by the generator (order matches _entry_row())
+_FILE_LIST_COLUMNS = (
+    "evidence_id, file_path, file_name, extension, "
+    "size_bytes, created_ts, modified_ts, accessed_ts, "
+    "md5_hash, sha1_hash, sha256_hash, file_type, "
+    "deleted, metadata, import_source, import_timestamp, "
+    "partition_index, inode"
+)
+
+# TEMP table holding deleted-pass rows until the partition's allocated pass is done
+_DELETED_STAGING_TABLE = "fls_deleted_staging"
 
 
 @dataclass
@@ -76,6 +81,50 @@ class GenerationResult:
     fls_errors: list = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class _FlsJob:
+    """One fls pass (allocated or deleted) over one partition."""
+    partition_index: int
+    sector_offset: int
+    block_size: int
+    is_ntfs: bool
+    deleted_only: bool
+
+    @property
+    def pass_type(self) -> str:
+        return "deleted" if self.deleted_only else "allocated"
+
+
+@dataclass
+class _FlsPassOutcome:
+    """Result of a finished fls pass, reported by its worker thread."""
+    parsed: int
+    parser_stats: dict
+    error: Optional[dict] = None
+
+
+def _queue_put(out_queue: "queue.Queue[tuple]", item: tuple, stop_event: threading.Event) -> bool:
+    """Put on a bounded queue, giving up once generation is being stopped."""
+    while not stop_event.is_set():
+        try:
+            out_queue.put(item, timeout=0.2)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _terminate_process(process: subprocess.Popen) -> None:
+    """Terminate a still-running fls process (kill after 5s)."""
+    if process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
 class SleuthKitFileListGenerator:
     """
     Generate file list from EWF image using SleuthKit fls.
@@ -86,6 +135,8 @@ class SleuthKitFileListGenerator:
 
     Features:
     - Automatic partition enumeration via list_ewf_partitions()
+    - Concurrent fls runs across partitions and allocated/deleted passes,
+      with a single writer for the database inserts
     - Block size detection for 4K sector support
     - Deferred index creation for faster bulk inserts
     - Progress callbacks for UI integration
@@ -101,12 +152,14 @@ class SleuthKitFileListGenerator:
     """
 
     BATCH_SIZE = 5000  # Rows per batch insert (larger than CSV importer for speed)
+    MAX_PARALLEL_FLS = 4  # Upper bound for concurrent fls processes
 
     def __init__(
         self,
         evidence_conn: sqlite3.Connection,
         evidence_id: int,
         ewf_paths: List[Path],
+        max_parallel_fls: Optional[int] = None,
     ):
         """
         Initialize generator.
@@ -115,10 +168,13 @@ class SleuthKitFileListGenerator:
             evidence_conn: SQLite connection to evidence database
             evidence_id: Evidence ID for file_list records
             ewf_paths: List of EWF segment paths (E01, E02, etc.)
+            max_parallel_fls: Concurrent fls processes (default: CPU count,
+                capped at MAX_PARALLEL_FLS)
         """
         self.evidence_conn = evidence_conn
         self.evidence_id = evidence_id
         self.ewf_paths = ewf_paths
+        self.max_parallel_fls = max_parallel_fls or min(self.MAX_PARALLEL_FLS, os.cpu_count() or 1)
         self._fls_path = get_sleuthkit_bin("fls")
         self._mmls_path = get_sleuthkit_bin("mmls")
 
@@ -295,9 +351,10 @@ class SleuthKitFileListGenerator:
         This method:
         1. Enumerates all readable partitions (via mmls)
         2. Drops indexes for faster bulk inserts
-        3. Runs fls on each partition, streaming output
-        4. Parses bodyfile output and inserts into file_list
-        5. Recreates indexes after completion
+        3. Runs the allocated and deleted fls passes of all partitions
+           concurrently (up to ``max_parallel_fls`` processes)
+        4. Inserts parsed rows from a single writer (the calling thread)
+        5. Rebuilds the indexes and runs ANALYZE after completion
 
         Args:
             progress_callback: Optional callback(files_processed, partition_index, message)
@@ -326,13 +383,12 @@ class SleuthKitFileListGenerator:
         start_time = datetime.now(timezone.utc)
         import_timestamp = start_time.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        # Track state for partial progress reporting
-        total_files = 0
-        partition_stats = {}
-        partitions_completed = 0
+        # Track state for partial progress reporting (filled in by _run_fls_jobs)
+        partition_stats: dict = {}
         fls_errors: List[dict] = []
         cancelled = False
         error_message: Optional[str] = None
+        bulk = ExitStack()
 
         try:
             # Get partition info via mmls (avoids pyewf threading issues)
@@ -359,35 +415,35 @@ class SleuthKitFileListGenerator:
             # This is critical for INSERT OR IGNORE to work correctly.
             self._ensure_unique_index()
 
-            # Drop non-unique indexes for faster bulk insert
-            self._drop_indexes()
+            # Drop non-unique indexes and tune the connection for the load
+            bulk.enter_context(bulk_ingest(self.evidence_conn, ("file_list",)))
 
+            jobs: List[_FlsJob] = []
             for part in readable_partitions:
-                partition_index = part['index']
-
-                if progress_callback:
-                    progress_callback(
-                        total_files,
-                        partition_index,
-                        f"Processing partition {partition_index}..."
-                    )
-
-                files_in_partition, pass_errors = self._process_partition(
-                    part,
-                    import_timestamp,
-                    progress_callback,
+                block_size = part.get('block_size', 512)
+                for deleted_only in (False, True):
+                    jobs.append(_FlsJob(
+                        partition_index=part['index'],
+                        sector_offset=part['offset'] // block_size,
+                        block_size=block_size,
+                        is_ntfs=self._partition_is_ntfs(part),
+                        deleted_only=deleted_only,
+                    ))
+
+            if progress_callback:
+                progress_callback(
+                    0,
+                    readable_partitions[0]['index'],
+                    f"Processing {len(readable_partitions)} partition(s)..."
                 )
 
-                total_files += files_in_partition
-                partition_stats[partition_index] = files_in_partition
-                fls_errors.extend(pass_errors)
-                partitions_completed += 1
-
-                logger.info(
-                    "Partition %d: %d files",
-                    partition_index,
-                    files_in_partition
-                )
+            self._run_fls_jobs(
+                jobs,
+                import_timestamp,
+                progress_callback,
+                partition_stats,
+                fls_errors,
+            )
 
             # Check for fls errors - treat as failure if any critical errors
             if fls_errors:
@@ -401,8 +457,8 @@ class SleuthKitFileListGenerator:
 
             logger.info(
                 "File list generation complete: %d files from %d partition(s) in %.2fs",
-                total_files,
-                partitions_completed,
+                sum(partition_stats.values()),
+                len(partition_stats),
                 (datetime.now(timezone.utc) - start_time).total_seconds(),
             )
 
@@ -411,7 +467,7 @@ class SleuthKitFileListGenerator:
             cancelled = True
             error_message = "Generation cancelled by user"
             logger.info("File list generation cancelled after %d files from %d partition(s)",
-                       total_files, partitions_completed)
+                       sum(partition_stats.values()), len(partition_stats))
 
         except Exception as e:
             logger.exception("File list generation failed")
@@ -420,6 +476,7 @@ class SleuthKitFileListGenerator:
         finally:
             # Always recreate indexes
             try:
+                bulk.close()
                 self._create_indexes()
             except Exception as idx_err:
                 logger.warning("Failed to recreate indexes: %s", idx_err)
@@ -429,8 +486,8 @@ class SleuthKitFileListGenerator:
         # Build result with partial progress info
         result = GenerationResult(
             success=(not cancelled and error_message is None),
-            total_files=total_files,
-            partitions_processed=partitions_completed,
+            total_files=sum(partition_stats.values()),
+            partitions_processed=len(partition_stats),
             duration_seconds=duration,
             error_message=error_message,
             partition_stats=partition_stats,
@@ -444,135 +501,45 @@ class SleuthKitFileListGenerator:
 
         return result
 
-    def _process_partition(
-        self,
-        partition: dict,
-        import_timestamp: str,
-        progress_callback: Optional[Callable],
-    ) -> tuple[int, List[dict]]:
+    @staticmethod
+    def _partition_is_ntfs(partition: dict) -> bool:
         """
-        Process single partition with fls.
-
-        Runs fls twice to enumerate both allocated and deleted files:
-        1. First pass: allocated files (no -d flag)
-        2. Second pass: deleted files only (-d flag)
-
-        Args:
-            partition: Partition info dict from list_ewf_partitions()
-            import_timestamp: ISO timestamp for this import
-            progress_callback: Optional progress callback
-
-        Returns:
-            Tuple of (files_processed, list of error dicts)
-
-        Raises:
-            InterruptedError: If cancelled via progress_callback
+        Decide whether NTFS metadata filtering applies to a partition.
+
+        Checks the mmls description for NTFS or common Windows filesystem
+        identifiers. Defaults to True when the filesystem cannot be
+        determined; NTFS filtering doesn't harm non-NTFS filesystems (just
+        won't match anything). This covers:
+        - Empty description
+        - "Direct filesystem" fallback (raw NTFS without partition table)
+        - Unknown partition types
         """
-        partition_index = partition['index']
-        block_size = partition.get('block_size', 512)
-        offset = partition['offset']
-
-        # Calculate sector offset
-        sector_offset = offset // block_size
-
-        # Determine if NTFS metadata filtering should be applied
-        # Check description for NTFS or common Windows filesystem identifiers
         description = partition.get('description', '').upper()
-        is_ntfs = 'NTFS' in description or 'EXFAT' in description or '0X07' in description
-
-        # Default to True for safety when we can't determine filesystem type
-        # NTFS filtering doesn't harm non-NTFS filesystems (just won't match anything)
-        # This covers:
-        # - Empty description
-        # - "Direct filesystem" fallback (raw NTFS without partition table)
-        # - Unknown partition types
-        if not is_ntfs:
-            # Non-Windows filesystems we can confidently skip filtering for
-            # Includes Apple-specific labels (e.g. _DS_DEV_DISK_X_, Apple_HFS)
-            non_windows_fs = [
-                'EXT', 'HFS', 'APFS', 'LINUX', 'SWAP', 'BSD', 'UFS',
-                'APPLE', '_DS_DEV_', 'CORESTORAGE',
-            ]
-            is_non_windows = any(fs in description for fs in non_windows_fs)
-            if not is_non_windows:
-                logger.debug(
-                    "Enabling NTFS metadata filtering for partition %d (description: %r)",
-                    partition_index, partition.get('description', '')
-                )
-                is_ntfs = True
-
-        total_files = 0
-        all_errors: List[dict] = []
-
-        # Pass 1: Enumerate allocated files
-        allocated_count, alloc_errors = self._run_fls_pass(
-            partition_index=partition_index,
-            sector_offset=sector_offset,
-            block_size=block_size,
-            is_ntfs=is_ntfs,
-            deleted_only=False,
-            import_timestamp=import_timestamp,
-            progress_callback=progress_callback,
-            current_total=total_files,
-        )
-        total_files += allocated_count
-        all_errors.extend(alloc_errors)
-
-        # Pass 2: Enumerate deleted files
-        deleted_count, del_errors = self._run_fls_pass(
-            partition_index=partition_index,
-            sector_offset=sector_offset,
-            block_size=block_size,
-            is_ntfs=is_ntfs,
-            deleted_only=True,
-            import_timestamp=import_timestamp,
-            progress_callback=progress_callback,
-            current_total=total_files,
-        )
-        total_files += deleted_count
-        all_errors.extend(del_errors)
-
-        logger.info(
-            "Partition %d: %d allocated + %d deleted = %d total files",
-            partition_index,
-            allocated_count,
-            deleted_count,
-            total_files,
-        )
+        if 'NTFS' in description or 'EXFAT' in description or '0X07' in description:
+            return True
+
+        # Non-Windows filesystems we can confidently skip filtering for
+        # Includes Apple-specific labels (e.g. _DS_DEV_DISK_X_, Apple_HFS)
+        non_windows_fs = [
+            'EXT', 'HFS', 'APFS', 'LINUX', 'SWAP', 'BSD', 'UFS',
+            'APPLE', '_DS_DEV_', 'CORESTORAGE',
+        ]
+        if any(fs in description for fs in non_windows_fs):
+            return False
 
-        return total_files, all_errors
+        logger.debug(
+            "Enabling NTFS metadata filtering for partition %d (description: %r)",
+            partition.get('index', 0), partition.get('description', '')
+        )
+        return True
 
-    def _run_fls_pass(
+    def _build_fls_command(
         self,
-        partition_index: int,
         sector_offset: int,
         block_size: int,
-        is_ntfs: bool,
         deleted_only: bool,
-        import_timestamp: str,
-        progress_callback: Optional[Callable],
-        current_total: int,
-    ) -> tuple[int, List[dict]]:
-        """
-        Run a single fls pass (allocated or deleted files).
-
-        Args:
-            partition_index: Partition index for tagging entries
-            sector_offset: Sector offset for -o flag
-            block_size: Block size for -b flag
-            is_ntfs: Whether to apply NTFS metadata filtering
-            deleted_only: If True, use -d flag for deleted files only
-            import_timestamp: ISO timestamp for records
-            progress_callback: Optional progress callback
-            current_total: Current total files for progress reporting
-
-        Returns:
-            Tuple of (files_processed, list of error dicts)
-
-        Raises:
-            InterruptedError: If cancelled via progress_callback
-        """
-        # Build fls command
+    ) -> List[str]:
+        """Build the fls command line for one pass over one partition."""
         cmd = [
             self._fls_path,
             "-r",  # Recursive
@@ -594,16 +561,166 @@ class SleuthKitFileListGenerator:
 
         # Add image path (first segment)
         cmd.append(str(self.ewf_paths[0]))
+        return cmd
 
-        pass_type = "deleted" if deleted_only else "allocated"
-        logger.info("Running fls (%s): %s", pass_type, " ".join(cmd))
+    def _run_fls_jobs(
+        self,
+        jobs: List["_FlsJob"],
+        import_timestamp: str,
+        progress_callback: Optional[Callable],
+        partition_stats: dict,
+        fls_errors: List[dict],
+    ) -> None:
+        """
+        Run fls passes concurrently and write their rows from this thread.
 
-        # Run fls with stderr going to /dev/null to avoid deadlock
-        # We check exit code for errors instead
-        process: Optional[subprocess.Popen] = None
-        stderr_lines: List[str] = []
-        errors: List[dict] = []
+        Each pass runs in a worker thread that spawns fls, parses the
+        bodyfile stream and puts row batches on a bounded queue. The calling
+        thread is the only writer: allocated-pass batches go straight into
+        file_list, deleted-pass batches are staged in a TEMP table and merged
+        with INSERT OR IGNORE once both passes of the partition finished, so
+        an allocated entry always wins over a deleted entry with the same path
+        (same result as the former sequential allocated-then-deleted order).
+
+        ``partition_stats`` and ``fls_errors`` are updated in place as
+        partitions complete, so partial results survive cancellation.
+
+        Raises:
+            InterruptedError: If cancelled via progress_callback
+        """
+        workers = max(1, min(self.max_parallel_fls, len(jobs)))
+        out_queue: "queue.Queue[tuple]" = queue.Queue(maxsize=workers * 4)
+        stop_event = threading.Event()
+        processes: List[subprocess.Popen] = []
+        processes_lock = threading.Lock()
+
+        pending_passes: dict = {}
+        inserted: dict = {}
+        for job in jobs:
+            pending_passes.setdefault(job.partition_index, set()).add(job.pass_type)
+            inserted.setdefault(job.partition_index, {"allocated": 0, "deleted": 0})
+
+        self._create_deleted_staging()
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fls")
+        futures = []
+        parsed_total = 0
+        try:
+            for job in jobs:
+                futures.append(executor.submit(
+                    self._fls_worker, job, import_timestamp,
+                    out_queue, stop_event, processes, processes_lock,
+                ))
+
+            remaining = len(jobs)
+            while remaining:
+                kind, job, payload = out_queue.get()
+
+                if kind == "error":
+                    raise payload
+
+                if kind == "rows":
+                    if job.deleted_only:
+                        self._stage_deleted_rows(payload)
+                    else:
+                        inserted[job.partition_index]["allocated"] += self._insert_rows(payload)
+                    parsed_total += len(payload)
+
+                    # Report progress - may raise InterruptedError
+                    if progress_callback:
+                        progress_callback(
+                            parsed_total,
+                            job.partition_index,
+                            f"Partition {job.partition_index} ({job.pass_type}): "
+                            f"{parsed_total:,} records parsed..."
+                        )
+                    continue
+
+                # kind == "done"
+                remaining -= 1
+                outcome: _FlsPassOutcome = payload
+                if outcome.error:
+                    fls_errors.append(outcome.error)
+                logger.info(
+                    "Parser stats for partition %d (%s): %s",
+                    job.partition_index, job.pass_type, outcome.parser_stats
+                )
+
+                passes = pending_passes[job.partition_index]
+                passes.discard(job.pass_type)
+                if passes:
+                    continue
+
+                # Both passes finished: merge deferred deleted entries
+                counts = inserted[job.partition_index]
+                counts["deleted"] = self._merge_deleted_rows(job.partition_index)
+                partition_stats[job.partition_index] = counts["allocated"] + counts["deleted"]
+                logger.info(
+                    "Partition %d: %d allocated + %d deleted = %d total files",
+                    job.partition_index,
+                    counts["allocated"],
+                    counts["deleted"],
+                    partition_stats[job.partition_index],
+                )
+        except InterruptedError:
+            logger.info("Cancellation requested, terminating fls processes")
+            raise
+        finally:
+            stop_event.set()
+            with processes_lock:
+                running = list(processes)
+            for process in running:
+                _terminate_process(process)
+            # Unblock workers waiting on a full queue, then wait for them
+            while not all(f.done() for f in futures):
+                try:
+                    out_queue.get(timeout=0.05)
+                except queue.Empty:
+                    pass
+            executor.shutdown(wait=True)
+            self._drop_deleted_staging()
 
+    def _fls_worker(
+        self,
+        job: "_FlsJob",
+        import_timestamp: str,
+        out_queue: "queue.Queue[tuple]",
+        stop_event: threading.Event,
+        processes: List[subprocess.Popen],
+        processes_lock: threading.Lock,
+    ) -> None:
+        """Worker thread body: run one fls pass and queue its row batches."""
+        try:
+            outcome = self._run_fls_pass(
+                job, import_timestamp, out_queue, stop_event, processes, processes_lock
+            )
+        except BaseException as exc:  # Propagate to the writer thread
+            _queue_put(out_queue, ("error", job, exc), stop_event)
+            return
+        _queue_put(out_queue, ("done", job, outcome), stop_event)
+
+    def _run_fls_pass(
+        self,
+        job: "_FlsJob",
+        import_timestamp: str,
+        out_queue: "queue.Queue[tuple]",
+        stop_event: threading.Event,
+        processes: List[subprocess.Popen],
+        processes_lock: threading.Lock,
+    ) -> "_FlsPassOutcome":
+        """
+        Run a single fls pass (allocated or deleted files) and stream rows.
+
+        Parsed entries are converted to file_list row tuples in this thread
+        and queued in batches of BATCH_SIZE; no database access happens here.
+
+        Returns:
+            _FlsPassOutcome with parsed row count, parser stats and the
+            error dict if fls exited non-zero
+        """
+        cmd = self._build_fls_command(job.sector_offset, job.block_size, job.deleted_only)
+        logger.info("Running fls (%s): %s", job.pass_type, " ".join(cmd))
+
+        stderr_lines: List[str] = []
         try:
             process = subprocess.Popen(
                 cmd,
@@ -617,6 +734,9 @@ class SleuthKitFileListGenerator:
         except PermissionError:
             raise RuntimeError(f"Permission denied running fls at {self._fls_path}")
 
+        with processes_lock:
+            processes.append(process)
+
         # Start a thread to drain stderr to avoid deadlock
         # fls can write warnings/errors to stderr while outputting to stdout
         def drain_stderr():
@@ -629,130 +749,83 @@ class SleuthKitFileListGenerator:
         stderr_thread = threading.Thread(target=drain_stderr, daemon=True)
         stderr_thread.start()
 
-        # Track how many new rows were actually inserted into SQLite.
-        # IMPORTANT: The schema enforces a unique path per evidence+partition:
-        #   idx_file_list_unique_path (evidence_id, COALESCE(partition_index,-1), file_path)
-        # and we use INSERT OR IGNORE, so many parsed entries (especially deleted)
-        # will be ignored as duplicates. Returning inserted counts keeps UI/manifest
-        # consistent with what's actually stored in the DB.
-        before_count = 0
-        try:
-            before_count = self.evidence_conn.execute(
-                "SELECT COUNT(*) FROM file_list WHERE evidence_id = ? AND partition_index = ?",
-                (self.evidence_id, partition_index),
-            ).fetchone()[0]
-        except Exception:
-            # Best-effort only; generation should not fail due to a COUNT() issue.
-            before_count = 0
-
         parser = BodyfileParser(
-            partition_index=partition_index,
-            skip_ntfs_metadata=is_ntfs,
+            partition_index=job.partition_index,
+            skip_ntfs_metadata=job.is_ntfs,
         )
-        batch: List[BodyfileEntry] = []
-        parsed_in_pass = 0
+        batch: List[tuple] = []
+        parsed = 0
 
         try:
             # Stream and parse fls output
             for entry in parser.parse_lines(iter(process.stdout.readline, '')):
-                batch.append(entry)
-
+                batch.append(self._entry_row(entry, import_timestamp))
                 if len(batch) >= self.BATCH_SIZE:
-                    self._insert_batch(batch, import_timestamp)
-                    parsed_in_pass += len(batch)
-
-                    # Report progress - may raise InterruptedError
-                    if progress_callback:
-                        progress_callback(
-                            current_total + parsed_in_pass,
-                            partition_index,
-                            f"Partition {partition_index} ({pass_type}): {current_total + parsed_in_pass:,} records parsed..."
-                        )
-
+                    if not _queue_put(out_queue, ("rows", job, batch), stop_event):
+                        break
+                    parsed += len(batch)
                     batch = []
 
-            # Insert remaining batch
-            if batch:
-                self._insert_batch(batch, import_timestamp)
-                parsed_in_pass += len(batch)
-
-        except InterruptedError:
-            # Cancellation requested - terminate fls and re-raise
-            logger.info("Cancellation requested, terminating fls process")
-            if process:
-                process.terminate()
-                try:
-                    process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    process.kill()
-                    process.wait()
-            raise
+            if batch and _queue_put(out_queue, ("rows", job, batch), stop_event):
+                parsed += len(batch)
 
+            if not stop_event.is_set():
+                process.wait()
         finally:
             # Ensure process is cleaned up
-            if process and process.poll() is None:
-                process.terminate()
-                try:
-                    process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    process.kill()
-                    process.wait()
+            _terminate_process(process)
 
         # Wait for stderr thread to finish
         stderr_thread.join(timeout=2)
 
-        after_count = before_count
-        try:
-            after_count = self.evidence_conn.execute(
-                "SELECT COUNT(*) FROM file_list WHERE evidence_id = ? AND partition_index = ?",
-                (self.evidence_id, partition_index),
-            ).fetchone()[0]
-        except Exception:
-            after_count = before_count
-
-        inserted_in_pass = max(0, after_count - before_count)
-        ignored_as_duplicates = max(0, parsed_in_pass - inserted_in_pass)
-
-        # Check exit code
-        if process.returncode != 0:
+        error = None
+        if process.returncode != 0 and not stop_event.is_set():
             stderr_text = '\n'.join(stderr_lines) if stderr_lines else "(no stderr)"
             logger.warning(
                 "fls (%s) exited with code %d: %s",
-                pass_type,
+                job.pass_type,
                 process.returncode,
                 stderr_text[:500]  # Truncate long stderr
             )
-            errors.append({
-                'partition': partition_index,
-                'pass_type': pass_type,
+            error = {
+                'partition': job.partition_index,
+                'pass_type': job.pass_type,
                 'exit_code': process.returncode,
                 'stderr': stderr_text[:500],
-            })
-
-        logger.info(
-            "Parser stats for partition %d (%s): %s",
-            partition_index, pass_type, parser.stats
+            }
+
+        return _FlsPassOutcome(parsed=parsed, parser_stats=parser.stats, error=error)
+
+    def _entry_row(self, e: BodyfileEntry, import_timestamp: str) -> tuple:
+        """Convert a parsed bodyfile entry to a file_list row tuple."""
+        return (
+            self.evidence_id,
+            e.file_path,
+            e.file_name,
+            e.extension,
+            e.size_bytes,
+            e.created_ts,
+            e.modified_ts,
+            e.accessed_ts,
+            e.md5_hash,
+            None,  # sha1_hash - not computed by fls
+            None,  # sha256_hash - not computed by fls
+            None,  # file_type
+            1 if e.deleted else 0,
+            None,  # metadata
+            "fls",  # import_source
+            import_timestamp,
+            e.partition_index,
+            e.inode,
         )
 
-        if ignored_as_duplicates:
-            logger.info(
-                "Partition %d (%s): %d parsed, %d inserted, %d ignored (duplicate file_path)",
-                partition_index,
-                pass_type,
-                parsed_in_pass,
-                inserted_in_pass,
-                ignored_as_duplicates,
-            )
-
-        return inserted_in_pass, errors
-
-    def _insert_batch(self, entries: List[BodyfileEntry], import_timestamp: str) -> None:
+    def _insert_batch(self, entries: List[BodyfileEntry], import_timestamp: str) -> int:
         """
         Insert batch of entries using executemany.
 
         Uses INSERT OR IGNORE which means:
         - First occurrence of a (evidence_id, partition_index, file_path) wins
-        - Since allocated files are processed before deleted files, allocated wins
+        - Since deleted-pass rows are merged after the allocated pass, allocated wins
         - A deleted file with same path as an allocated file is silently skipped
 
         This is acceptable because:
@@ -763,44 +836,21 @@ class SleuthKitFileListGenerator:
         Args:
             entries: List of BodyfileEntry objects
             import_timestamp: ISO timestamp for this import
+
+        Returns:
+            Number of rows actually inserted (duplicates excluded)
         """
         if not entries:
-            return
-
-        rows = [
-            (
-                self.evidence_id,
-                e.file_path,
-                e.file_name,
-                e.extension,
-                e.size_bytes,
-                e.created_ts,
-                e.modified_ts,
-                e.accessed_ts,
-                e.md5_hash,
-                None,  # sha1_hash - not computed by fls
-                None,  # sha256_hash - not computed by fls
-                None,  # file_type
-                1 if e.deleted else 0,
-                None,  # metadata
-                "fls",  # import_source
-                import_timestamp,
-                e.partition_index,
-                e.inode,
-            )
-            for e in entries
-        ]
+            return 0
+        return self._insert_rows([self._entry_row(e, import_timestamp) for e in entries])
 
+    def _insert_rows(self, rows: List[tuple]) -> int:
+        """INSERT OR IGNORE row tuples into file_list; returns rows inserted."""
         try:
-            self.evidence_conn.executemany(
-                """
-                INSERT OR IGNORE INTO file_list (
-                    evidence_id, file_path, file_name, extension,
-                    size_bytes, created_ts, modified_ts, accessed_ts,
-                    md5_hash, sha1_hash, sha256_hash, file_type,
-                    deleted, metadata, import_source, import_timestamp,
-                    partition_index, inode
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            cursor = self.evidence_conn.executemany(
+                f"""
+                INSERT OR IGNORE INTO file_list ({_FILE_LIST_COLUMNS})
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 rows,
             )
@@ -808,15 +858,57 @@ class SleuthKitFileListGenerator:
         except sqlite3.Error as e:
             logger.error("Batch insert failed: %s", e)
             raise
+        # rowcount excludes changes made by triggers on file_list
+        return max(0, cursor.rowcount)
+
+    def _create_deleted_staging(self) -> None:
+        """Create the TEMP table holding deferred deleted-pass rows."""
+        self.evidence_conn.execute(f"DROP TABLE IF EXISTS temp.{_DELETED_STAGING_TABLE}")
+        self.evidence_conn.execute(
+            f"CREATE TEMP TABLE {_DELETED_STAGING_TABLE} ("
+            f"seq INTEGER PRIMARY KEY, {_FILE_LIST_COLUMNS})"
+        )
+
+    def _stage_deleted_rows(self, rows: List[tuple]) -> None:
+        """Append deleted-pass rows to the staging table (parse order kept in seq)."""
+        self.evidence_conn.executemany(
+            f"""
+            INSERT INTO temp.{_DELETED_STAGING_TABLE} ({_FILE_LIST_COLUMNS})
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        self.evidence_conn.commit()
+
+    def _merge_deleted_rows(self, partition_index: int) -> int:
+        """Move staged deleted rows of a partition into file_list; returns rows inserted."""
+        cursor = self.evidence_conn.execute(
+            f"""
+            INSERT OR IGNORE INTO file_list ({_FILE_LIST_COLUMNS})
+            SELECT {_FILE_LIST_COLUMNS} FROM temp.{_DELETED_STAGING_TABLE}
+            WHERE partition_index = ?
+            ORDER BY seq
+            """,
+            (partition_index,),
+        )
+        merged = max(0, cursor.rowcount)
+        self.evidence_conn.execute(
+            f"DELETE FROM temp.{_DELETED_STAGING_TABLE} WHERE partition_index = ?",
+            (partition_index,),
+        )
+        self.evidence_conn.commit()
+        return merged
+
+    def _drop_deleted_staging(self) -> None:
+        try:
+            self.evidence_conn.execute(f"DROP TABLE IF EXISTS temp.{_DELETED_STAGING_TABLE}")
+            self.evidence_conn.commit()
+        except sqlite3.Error as e:
+            logger.debug("Could not drop deleted staging table: %s", e)
 
     def _drop_indexes(self) -> None:
         """Drop indexes for faster bulk insert (except unique constraint)."""
-        for index_name in FILE_LIST_INDEXES:
-            try:
-                self.evidence_conn.execute(f"DROP INDEX IF EXISTS {index_name}")
-            except sqlite3.Error:
-                pass  # Index may not exist
-        self.evidence_conn.commit()
+        defer_indexes(self.evidence_conn, ["file_list"])
         logger.debug("Dropped file_list indexes for bulk insert (kept unique constraint)")
 
     def _ensure_unique_index(self) -> None:
@@ -836,21 +928,11 @@ class SleuthKitFileListGenerator:
 
     def _create_indexes(self) -> None:
         """Recreate indexes after bulk insert."""
-        index_definitions = [
-            "CREATE INDEX IF NOT EXISTS idx_file_list_extension ON file_list(extension)",
-            "CREATE INDEX IF NOT EXISTS idx_file_list_evidence_extension ON file_list(evidence_id, extension)",
-            "CREATE INDEX IF NOT EXISTS idx_file_list_partition ON file_list(evidence_id, partition_index)",
-            "CREATE INDEX IF NOT EXISTS idx_file_list_name ON file_list(file_name)",
-            "CREATE INDEX IF NOT EXISTS idx_file_list_path ON file_list(file_path)",
-            # Use COALESCE to match schema definition - handles NULL partition_index correctly
-            "CREATE UNIQUE INDEX IF NOT EXISTS idx_file_list_unique_path ON file_list(evidence_id, COALESCE(partition_index, -1), file_path)",
-        ]
-        for sql in index_definitions:
-            try:
-                self.evidence_conn.execute(sql)
-            except sqlite3.Error as e:
-                logger.warning("Failed to create index: %s - %s", sql, e)
-        self.evidence_conn.commit()
+        try:
+            restore_deferred_indexes(self.evidence_conn, ["file_list"])
+        except sqlite3.Error as e:
+            logger.warning("Failed to recreate file_list indexes: %s", e)
+        self._ensure_unique_index()
         logger.debug("Recreated file_list indexes")
 
     def clear_existing(self) -> int:
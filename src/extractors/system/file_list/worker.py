@@ -11,10 +11,13 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+from core.database import BULK_INGEST_MIN_ROWS, bulk_ingest
+
 from .parser import detect_parser, BaseFileListParser
 
 __all__ = ["FileListExtractor"]
@@ -100,31 +103,38 @@ class FileListExtractor:
             logger.error(f"Failed to parse CSV: {e}")
             raise
 
-        # Insert into database in batches
+        # Insert into database in batches; large lists load with the
+        # non-unique file_list indexes deferred
         inserted_rows = 0
         skipped_rows = 0
+        bulk = (
+            bulk_ingest(self.evidence_conn, ("file_list",))
+            if total_rows >= BULK_INGEST_MIN_ROWS
+            else nullcontext()
+        )
 
-        for batch_start in range(0, total_rows, self.BATCH_SIZE):
-            batch_end = min(batch_start + self.BATCH_SIZE, total_rows)
-            batch = entries[batch_start:batch_end]
+        with bulk:
+            for batch_start in range(0, total_rows, self.BATCH_SIZE):
+                batch_end = min(batch_start + self.BATCH_SIZE, total_rows)
+                batch = entries[batch_start:batch_end]
 
-            try:
-                inserted = self._insert_batch(batch, import_timestamp)
-                inserted_rows += inserted
-                skipped_rows += len(batch) - inserted
+                try:
+                    inserted = self._insert_batch(batch, import_timestamp)
+                    inserted_rows += inserted
+                    skipped_rows += len(batch) - inserted
 
-                # Report progress
-                if progress_callback:
-                    progress_callback(batch_end, total_rows)
+                    # Report progress
+                    if progress_callback:
+                        progress_callback(batch_end, total_rows)
 
-                logger.debug(
-                    f"Inserted batch {batch_start}-{batch_end}: {inserted}/{len(batch)} rows"
-                )
+                    logger.debug(
+                        f"Inserted batch {batch_start}-{batch_end}: {inserted}/{len(batch)} rows"
+                    )
 
-            except Exception as e:
-                logger.error(f"Failed to insert batch {batch_start}-{batch_end}: {e}")
-                skipped_rows += len(batch)
-                continue
+                except Exception as e:
+                    logger.error(f"Failed to insert batch {batch_start}-{batch_end}: {e}")
+                    skipped_rows += len(batch)
+                    continue
 
         end_time = datetime.now(timezone.utc)
         duration = (end_time - start_time).total_seconds()
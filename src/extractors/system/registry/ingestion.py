@@ -7,14 +7,16 @@ Performs analysis of local registry hives using rules and loads findings into th
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
-from pathlib import Path
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Dict, Any, Iterator, List
 from datetime import datetime, timezone
 
 from core.logging import get_logger
 from ...callbacks import ExtractorCallbacks
-from .parser import process_hive_file
+from .parser import process_hive_targets
 from .rules_util import load_registry_rules
 
 LOGGER = get_logger("extractors.system.registry.ingestion")
@@ -30,6 +32,78 @@ def save_ingestion_summary(output_dir: Path, summary: Dict[str, Any]) -> None:
         LOGGER.error("Failed to save ingestion summary: %s", e)
 
 
+def _hive_matches_target(original_path: str, target: Dict[str, Any]) -> bool:
+    """
+    Check whether a hive's original evidence path matches a target's hive paths.
+
+    Matching is case-insensitive for Windows compatibility.
+    """
+    # Normalize path separators for matching
+    path_lower = original_path.replace("\\", "/").lower()
+
+    for path_pattern in target.get("paths", []):
+        pattern_lower = path_pattern.lower()
+
+        # pathlib.PurePosixPath.match() doesn't support ** prefix, so we strip it
+        if pattern_lower.startswith("**/"):
+            pattern_lower = pattern_lower[3:]
+
+        # Now use PurePosixPath.match() which supports * wildcards
+        if PurePosixPath(path_lower).match(pattern_lower):
+            LOGGER.debug("Path %s matched pattern %s", original_path, path_pattern)
+            return True
+    return False
+
+
+def _analyze_hives(
+    jobs: List[tuple],
+    config: Dict[str, Any],
+    callbacks: ExtractorCallbacks,
+) -> Iterator[tuple]:
+    """
+    Yield ``(job, per_target_findings)`` for each ``(hive_info, path, targets)`` job, in order.
+
+    Hives (one per user for NTUSER/UsrClass) are analyzed in a process pool
+    unless ``enable_parallel`` is false or only one hive has targets. A
+    failed hive yields its exception instead of findings.
+    """
+    work = [job for job in jobs if job[2]]
+    futures: Dict[int, Any] = {}
+    executor = None
+
+    parallel_workers = config.get("parallel_workers") or min(len(work), os.cpu_count() or 1)
+    if config.get("enable_parallel", True) and len(work) > 1 and parallel_workers > 1:
+        try:
+            executor = ProcessPoolExecutor(max_workers=parallel_workers)
+            for job in work:
+                futures[id(job)] = executor.submit(process_hive_targets, job[1], job[2])
+        except PermissionError as e:
+            LOGGER.warning("Parallel hive analysis unavailable (%s); analyzing sequentially", e)
+            callbacks.on_log("Parallel hive analysis unavailable; analyzing sequentially", "warning")
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            executor = None
+            futures = {}
+
+    try:
+        for hive_job in jobs:
+            if not hive_job[2]:
+                # No matching targets: nothing to parse
+                yield hive_job, []
+                continue
+            try:
+                future = futures.get(id(hive_job))
+                if future is not None:
+                    yield hive_job, future.result()
+                else:
+                    yield hive_job, process_hive_targets(hive_job[1], hive_job[2])
+            except Exception as e:
+                yield hive_job, e
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
 def run_registry_ingestion(
     manifest_data: Dict[str, Any],
     evidence_conn: sqlite3.Connection,
@@ -101,7 +175,8 @@ def run_registry_ingestion(
 
     all_findings = []
 
-    # Process each hive against all targets
+    # Match each hive to its targets, then analyze every hive in one traversal
+    jobs = []
     for hive_info in extracted_hives:
         local_path = hive_info.get("local_path")
         if not local_path:
@@ -113,6 +188,13 @@ def run_registry_ingestion(
             summary["errors"].append(f"Hive file not found: {local_path}")
             continue
 
+        matched_targets = [
+            target for target in registry_targets
+            if _hive_matches_target(hive_info.get("original_path", ""), target)
+        ]
+        jobs.append((hive_info, hive_full_path, matched_targets))
+
+    for (hive_info, hive_full_path, matched_targets), per_target in _analyze_hives(jobs, config, callbacks):
         callbacks.on_step(f"Analyzing {hive_info.get('filename', 'hive')}")
         summary["hives_processed"] += 1
 
@@ -123,56 +205,23 @@ def run_registry_ingestion(
             "findings": 0
         }
 
-        # We need to match the hive to the target based on the original path
-        # But since we don't have the original path structure locally, we rely on the filename or just try all targets?
-        # The parser logic in worker.py was iterating targets and finding paths.
-        # Here we have the file, we need to know which target applies.
-        # A simple heuristic: check if the original path matches the target pattern.
-
-        original_path = hive_info.get("original_path", "")
-        # Normalize path separators for matching
-        original_path_normalized = original_path.replace("\\", "/")
-
-        for target in registry_targets:
-            # Check if this hive matches any path in the target
-            matches_target = False
-            for path_pattern in target.get("paths", []):
-                # Use pathlib-style glob matching (supports **)
-                # Case-insensitive comparison for Windows compatibility
-                from pathlib import PurePosixPath
-
-                pattern_lower = path_pattern.lower()
-                path_lower = original_path_normalized.lower()
-
-                # Handle ** prefix (recursive glob)
-                # pathlib.PurePosixPath.match() doesn't support ** prefix, so we strip it
-                if pattern_lower.startswith("**/"):
-                    pattern_lower = pattern_lower[3:]  # Remove "**/
-
-                # Now use PurePosixPath.match() which supports * wildcards
-                if PurePosixPath(path_lower).match(pattern_lower):
-                    matches_target = True
-                    LOGGER.debug("Path %s matched pattern %s", original_path, path_pattern)
-                    break
-
-            if matches_target:
-                callbacks.on_log(f"Hive {hive_info.get('filename')} matches target '{target.get('name')}'", "info")
-                try:
-                    findings = process_hive_file(hive_full_path, target)
-                    if findings:
-                        all_findings.extend(findings)
-                        summary["rules_matched"] += 1
-                        hive_summary["matched_rules"].append(target.get("name"))
-                        hive_summary["findings"] += len(findings)
-                        callbacks.on_log(f"  -> Found {len(findings)} indicators for '{target.get('name')}'", "info")
-                    else:
-                        callbacks.on_log(f"  -> No indicators found for '{target.get('name')}'", "info")
-
-                except Exception as e:
-                    LOGGER.error("Error processing hive %s with target %s: %s",
-                               hive_info.get("filename"), target.get("name"), e)
-                    callbacks.on_log(f"Error processing {hive_info.get('filename')}: {e}", "error")
-                    summary["errors"].append(f"Error processing {hive_info.get('filename')}: {str(e)}")
+        if isinstance(per_target, Exception):
+            LOGGER.error("Error processing hive %s: %s", hive_info.get("filename"), per_target)
+            callbacks.on_log(f"Error processing {hive_info.get('filename')}: {per_target}", "error")
+            summary["errors"].append(f"Error processing {hive_info.get('filename')}: {str(per_target)}")
+            summary["processed_hives"].append(hive_summary)
+            continue
+
+        for target, findings in zip(matched_targets, per_target):
+            callbacks.on_log(f"Hive {hive_info.get('filename')} matches target '{target.get('name')}'", "info")
+            if findings:
+                all_findings.extend(findings)
+                summary["rules_matched"] += 1
+                hive_summary["matched_rules"].append(target.get("name"))
+                hive_summary["findings"] += len(findings)
+                callbacks.on_log(f"  -> Found {len(findings)} indicators for '{target.get('name')}'", "info")
+            else:
+                callbacks.on_log(f"  -> No indicators found for '{target.get('name')}'", "info")
 
         summary["processed_hives"].append(hive_summary)
 
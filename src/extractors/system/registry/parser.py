@@ -8,9 +8,11 @@ from __future__ import annotations
 
 import codecs
 import json
+import os
 import re
 import struct
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable, Dict, List, Any, Optional, Union
@@ -306,62 +308,293 @@ def _expand_wildcard_parts(
             )
 
 
-def process_hive_file(
-    hive_path: Path,
-    target: Dict[str, Any],
-) -> List[RegistryFinding]:
+# =============================================================================
+# Hive Sessions and Traversal Plans
+# =============================================================================
+
+# Open hive sessions kept per process (a few hives are analyzed at a time)
+HIVE_SESSION_CACHE_SIZE = 4
+
+_hive_sessions: "OrderedDict[tuple, HiveSession]" = OrderedDict()
+
+
+class HiveSession:
+    """
+    A registry hive opened once, with cached key lookups.
+
+    Subkeys of every visited key are indexed by lowercased name on first
+    access, and every resolved key path is remembered, so repeated lookups
+    (several targets, sibling keys read by handlers) never walk the same
+    subkey lists twice. Lookups are always case-insensitive manual
+    traversals; ``hive.get_key`` is not used because of its WOW6432Node
+    redirection (see ``_get_key_robust``).
     """
-    Process a local hive file against a target definition.
 
-    Args:
-        hive_path: Path to the local hive file
-        target: Target definition from rules
+    def __init__(self, hive_path: Union[str, Path], hive=None):
+        if hive is None:
+            from regipy.registry import RegistryHive  # type: ignore
+            hive = RegistryHive(str(hive_path))
+        self.hive_path = str(hive_path)
+        self.hive = hive
+        # Lowercased key path -> key object ("" is the root key)
+        self._keys: Dict[str, Any] = {"": hive.root}
+        # Lowercased key path -> (ordered subkeys, lowercased name -> subkey)
+        self._subkeys: Dict[str, tuple] = {}
+
+    @property
+    def root(self):
+        return self.hive.root
+
+    def subkeys(self, key_path_lower: str, key) -> tuple:
+        """Return ``(subkey_list, by_lower_name)`` for a key, cached by path."""
+        cached = self._subkeys.get(key_path_lower)
+        if cached is None:
+            try:
+                ordered = list(key.iter_subkeys())
+            except Exception as e:
+                LOGGER.debug("Failed to list subkeys of %s: %s", key_path_lower or "(root)", e)
+                ordered = []
+            by_name: Dict[str, Any] = {}
+            for subkey in ordered:
+                by_name.setdefault(subkey.name.lower(), subkey)
+            cached = (ordered, by_name)
+            self._subkeys[key_path_lower] = cached
+        return cached
+
+    def get_key(self, path: str):
+        """
+        Get a key by path (case-insensitive).
+
+        Raises:
+            ValueError: If a path component does not exist
+        """
+        parts = [p for p in path.replace("/", "\\").split("\\") if p]
+        key_path_lower = "\\".join(parts).lower()
+        key = self._keys.get(key_path_lower)
+        if key is not None:
+            return key
+
+        key = self.hive.root
+        current = ""
+        for part in parts:
+            child_path = f"{current}\\{part.lower()}" if current else part.lower()
+            child = self._keys.get(child_path)
+            if child is None:
+                child = self.subkeys(current, key)[1].get(part.lower())
+                if child is None:
+                    raise ValueError(f"Key not found: {path} (failed at '{part}')")
+                self._keys[child_path] = child
+            key = child
+            current = child_path
+        return key
+
+    def resolve(self, path_pattern: str) -> List[tuple]:
+        """Resolve a path pattern with optional ``*`` parts (see ``_resolve_wildcard_path``)."""
+        plan = TraversalPlan()
+        plan.add(path_pattern, None)
+        return [(path, key) for _, path, key in self.walk(plan)]
+
+    def walk(self, plan: "TraversalPlan") -> List[tuple]:
+        """
+        Walk the hive once for all paths in a plan.
+
+        Returns:
+            List of (payload, resolved_path_str, key) in plan order
+        """
+        matches: List[tuple] = []
+        self._walk_node(plan.root, self.hive.root, "", [], matches)
+        # Stable sort: keys of one path keep their traversal order
+        matches.sort(key=lambda match: match[0])
+        return [(plan.entries[index][1], path, key) for index, path, key in matches]
+
+    def _walk_node(self, node: "_PlanNode", key, key_path_lower: str, path_acc: List[str], matches: List[tuple]) -> None:
+        for index in node.entries:
+            literal = node.literal_paths.get(index)
+            matches.append((index, literal if literal is not None else "\\".join(path_acc), key))
+
+        if not node.children and node.wildcard is None:
+            return
 
-    Returns:
-        List of RegistryFinding objects
+        ordered, by_name = self.subkeys(key_path_lower, key)
+        prefix = f"{key_path_lower}\\" if key_path_lower else ""
+
+        for part, child_node in node.children.items():
+            subkey = by_name.get(part)
+            if subkey is None:
+                LOGGER.debug("Key part '%s' not found under %s", part, "\\".join(path_acc) or "(root)")
+                continue
+            self._walk_node(child_node, subkey, prefix + part, path_acc + [subkey.name], matches)
+
+        if node.wildcard is not None:
+            for subkey in ordered:
+                self._walk_node(
+                    node.wildcard, subkey, prefix + subkey.name.lower(), path_acc + [subkey.name], matches
+                )
+
+
+@dataclass(slots=True)
+class _PlanNode:
+    """One path component of a traversal plan."""
+    children: Dict[str, "_PlanNode"] = field(default_factory=dict)
+    wildcard: Optional["_PlanNode"] = None
+    # Plan entry indexes ending at this node
+    entries: List[int] = field(default_factory=list)
+    # Entry index -> path string reported for wildcard-free patterns
+    literal_paths: Dict[int, str] = field(default_factory=dict)
+
+
+class TraversalPlan:
     """
-    try:
-        from regipy.registry import RegistryHive  # type: ignore
-    except ImportError:
-        LOGGER.error("regipy not installed")
-        return []
+    Key path patterns merged into a single trie.
 
-    findings: List[RegistryFinding] = []
+    Patterns sharing a prefix share the walk down to it, so a hive is
+    traversed once for any number of key definitions.
+    """
+
+    def __init__(self) -> None:
+        self.root = _PlanNode()
+        # (pattern, payload) in insertion order
+        self.entries: List[tuple] = []
+
+    def add(self, path_pattern: str, payload: Any) -> None:
+        parts = [p for p in path_pattern.replace("/", "\\").split("\\") if p]
+        index = len(self.entries)
+        self.entries.append((path_pattern, payload))
+
+        node = self.root
+        for part in parts:
+            if part == "*":
+                if node.wildcard is None:
+                    node.wildcard = _PlanNode()
+                node = node.wildcard
+            else:
+                node = node.children.setdefault(part.lower(), _PlanNode())
+        node.entries.append(index)
+        if "*" not in parts:
+            # Matches _resolve_wildcard_path: exact paths are reported as written
+            node.literal_paths[index] = path_pattern
+
+    def __len__(self) -> int:
+        return len(self.entries)
 
-    try:
-        hive = RegistryHive(str(hive_path))
 
+def compile_traversal_plan(targets: List[Dict[str, Any]]) -> TraversalPlan:
+    """
+    Compile the registry_reader key definitions of several targets into one plan.
+
+    Entry payloads are ``(target_index, target, action, key_def)``.
+    """
+    plan = TraversalPlan()
+    for target_index, target in enumerate(targets):
         for action in target.get("actions", []):
             if action.get("type") != "registry_reader":
                 continue
-
-            # Process keys
             for key_def in action.get("keys", []):
                 key_path_pattern = key_def.get("path")
                 if not key_path_pattern:
                     continue
+                plan.add(key_path_pattern, (target_index, target, action, key_def))
+    return plan
+
 
-                # Resolve wildcard patterns into concrete key paths
-                resolved_paths = _resolve_wildcard_path(hive, key_path_pattern)
-
-                for resolved_path, resolved_key in resolved_paths:
-                    try:
-                        _process_registry_key(
-                            resolved_key,
-                            key_def,
-                            target,
-                            action,
-                            str(hive_path),
-                            findings,
-                            resolved_path
-                        )
-                    except Exception as e:
-                        LOGGER.debug("Failed to process key %s in hive %s: %s", resolved_path, hive_path, e)
+def open_hive_session(hive_path: Union[str, Path]) -> HiveSession:
+    """
+    Return an open session for a hive file, reusing a cached one.
 
+    Sessions are keyed by path, size and mtime, so a re-exported hive at the
+    same path is opened again.
+    """
+    hive_path = str(hive_path)
+    try:
+        stat = os.stat(hive_path)
+        cache_key = (hive_path, stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        cache_key = (hive_path, None, None)
+
+    session = _hive_sessions.get(cache_key)
+    if session is not None:
+        _hive_sessions.move_to_end(cache_key)
+        return session
+
+    session = HiveSession(hive_path)
+    _hive_sessions[cache_key] = session
+    while len(_hive_sessions) > HIVE_SESSION_CACHE_SIZE:
+        _hive_sessions.popitem(last=False)
+    return session
+
+
+def clear_hive_sessions() -> None:
+    """Drop all cached hive sessions."""
+    _hive_sessions.clear()
+
+
+def process_hive_targets(
+    hive_path: Path,
+    targets: List[Dict[str, Any]],
+) -> List[List[RegistryFinding]]:
+    """
+    Process a local hive file against several targets in one traversal.
+
+    Top-level so it can run in a process pool.
+
+    Args:
+        hive_path: Path to the local hive file
+        targets: Target definitions from rules
+
+    Returns:
+        One list of RegistryFinding objects per target, in target order
+    """
+    results: List[List[RegistryFinding]] = [[] for _ in targets]
+
+    try:
+        session = open_hive_session(hive_path)
+    except ImportError:
+        LOGGER.error("regipy not installed")
+        return results
     except Exception as e:
         LOGGER.warning("Error processing hive %s: %s", hive_path, e)
+        return results
 
-    return findings
+    try:
+        plan = compile_traversal_plan(targets)
+        for (target_index, target, action, key_def), resolved_path, resolved_key in session.walk(plan):
+            try:
+                _process_registry_key(
+                    resolved_key,
+                    key_def,
+                    target,
+                    action,
+                    str(hive_path),
+                    results[target_index],
+                    resolved_path
+                )
+            except Exception as e:
+                LOGGER.debug("Failed to process key %s in hive %s: %s", resolved_path, hive_path, e)
+    except Exception as e:
+        LOGGER.warning("Error processing hive %s: %s", hive_path, e)
+
+    return results
+
+
+def process_hive_file(
+    hive_path: Path,
+    target: Dict[str, Any],
+) -> List[RegistryFinding]:
+    """
+    Process a local hive file against a target definition.
+
+    The hive is opened through the session cache, so calling this for
+    several targets on the same hive parses it once. Prefer
+    ``process_hive_targets`` to also share the traversal.
+
+    Args:
+        hive_path: Path to the local hive file
+        target: Target definition from rules
+
+    Returns:
+        List of RegistryFinding objects
+    """
+    return process_hive_targets(hive_path, [target])[0]
 
 
 def _process_registry_key(
@@ -726,11 +959,8 @@ def _process_typed_urls(
     try:
         # Navigate to the parent and find TypedURLsTime
         time_key_path = key_path_str.rsplit("\\", 1)[0] + "\\TypedURLsTime"
-        from regipy.registry import RegistryHive  # type: ignore
-        # The hive is already open; use _get_key_robust to find the sibling
-        # We need to get the hive object — reconstruct from hive_path
-        hive = RegistryHive(hive_path)
-        time_key = _get_key_robust(hive, time_key_path)
+        # The hive is already open in the session cache
+        time_key = open_hive_session(hive_path).get_key(time_key_path)
         for val in time_key.iter_values():
             if val.name and isinstance(val.value, bytes) and len(val.value) == 8:
                 timestamps[val.name] = filetime_to_datetime(val.value)
@@ -7,10 +7,23 @@ They share the same filter and rendering interface but live in a distinct regist
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import sqlite3
+from typing import Any, Dict, List, Sequence, TypeVar
 
 from ..modules.base import BaseReportModule, FilterField, FilterType, ModuleMetadata
 
+T = TypeVar("T")
+
+
+def split_rows(rows: Sequence[T], chunk_rows: int) -> List[Sequence[T]]:
+    """Split rows into consecutive chunks of at most ``chunk_rows`` rows.
+
+    Always returns at least one chunk; ``chunk_rows <= 0`` means no split.
+    """
+    if chunk_rows <= 0 or len(rows) <= chunk_rows:
+        return [rows]
+    return [rows[i:i + chunk_rows] for i in range(0, len(rows), chunk_rows)]
+
 
 class BaseAppendixModule(BaseReportModule):
     """Base class for all appendix modules."""
@@ -19,6 +32,31 @@ class BaseAppendixModule(BaseReportModule):
         """Return default title for appendix items."""
         return self.metadata.name
 
+    def render_chunks(
+        self,
+        db_conn: sqlite3.Connection,
+        evidence_id: int,
+        config: Dict[str, Any],
+        chunk_rows: int = 0,
+    ) -> List[str]:
+        """Render the module as consecutive HTML fragments.
+
+        Modules that list many rows override this so that each fragment holds
+        at most ``chunk_rows`` rows; large appendices are then laid out as
+        separate PDF sub-documents. Joined, the fragments are the module's
+        full content. The default is a single fragment from :meth:`render`.
+
+        Args:
+            db_conn: SQLite connection to the evidence database
+            evidence_id: Current evidence ID
+            config: Dictionary of filter values from user configuration
+            chunk_rows: Maximum rows per fragment (0 = no limit)
+
+        Returns:
+            List of HTML fragments (at least one)
+        """
+        return [self.render(db_conn, evidence_id, config)]
+
     # Re-export type hints for convenience in appendix modules.
     FilterField = FilterField
     FilterType = FilterType
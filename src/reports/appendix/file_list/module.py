@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Optional
 
 from jinja2 import Environment, FileSystemLoader
 
-from ..base import BaseAppendixModule, FilterField, FilterType, ModuleMetadata
+from ..base import BaseAppendixModule, FilterField, FilterType, ModuleMetadata, split_rows
 from ...dates import format_datetime
 from ...paths import get_module_template_dir
 
@@ -113,6 +113,15 @@ class AppendixFileListModule(BaseAppendixModule):
         evidence_id: int,
         config: Dict[str, Any],
     ) -> str:
+        return self.render_chunks(db_conn, evidence_id, config)[0]
+
+    def render_chunks(
+        self,
+        db_conn: sqlite3.Connection,
+        evidence_id: int,
+        config: Dict[str, Any],
+        chunk_rows: int = 0,
+    ) -> List[str]:
         # Extract locale and translations from config
         locale = config.get("_locale", "en")
         translations = config.get("_translations", {})
@@ -151,7 +160,7 @@ class AppendixFileListModule(BaseAppendixModule):
                     }
                 )
         except Exception as exc:
-            return f'<div class="module-error">Error loading files: {exc}</div>'
+            return [f'<div class="module-error">Error loading files: {exc}</div>']
 
         # Sort by file path
         files.sort(key=lambda x: x["file_path"].lower())
@@ -161,12 +170,17 @@ class AppendixFileListModule(BaseAppendixModule):
         env.filters["format_size"] = self._format_size
         template = env.get_template("template.html")
 
-        return template.render(
-            files=files,
-            total_count=len(files),
-            t=translations,
-            locale=locale,
-        )
+        parts = split_rows(files, chunk_rows)
+        return [
+            template.render(
+                files=part,
+                total_count=len(files),
+                last_chunk=index == len(parts) - 1,
+                t=translations,
+                locale=locale,
+            )
+            for index, part in enumerate(parts)
+        ]
 
     def _build_query(
         self,
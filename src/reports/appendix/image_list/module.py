@@ -24,7 +24,7 @@ from typing import Any, Callable, Dict, List, Optional
 
 from jinja2 import Environment, FileSystemLoader
 
-from ..base import BaseAppendixModule, FilterField, FilterType, ModuleMetadata
+from ..base import BaseAppendixModule, FilterField, FilterType, ModuleMetadata, split_rows
 from ...dates import format_datetime
 from ...paths import get_module_template_dir
 from core.image_codecs import ensure_pillow_heif_registered
@@ -195,6 +195,15 @@ class AppendixImageListModule(BaseAppendixModule):
         evidence_id: int,
         config: Dict[str, Any],
     ) -> str:
+        return self.render_chunks(db_conn, evidence_id, config)[0]
+
+    def render_chunks(
+        self,
+        db_conn: sqlite3.Connection,
+        evidence_id: int,
+        config: Dict[str, Any],
+        chunk_rows: int = 0,
+    ) -> List[str]:
         # Extract config values
         locale = config.get("_locale", "en")
         translations = config.get("_translations", {})
@@ -232,7 +241,7 @@ class AppendixImageListModule(BaseAppendixModule):
                 seen_ids.add(image_id)
                 images.append(dict(row))
         except Exception as exc:
-            return f'<div class="module-error">Error loading images: {exc}</div>'
+            return [f'<div class="module-error">Error loading images: {exc}</div>']
 
         if progress_cb:
             progress_cb(5, f"Loaded {len(images)} images from database")
@@ -254,7 +263,7 @@ class AppendixImageListModule(BaseAppendixModule):
         )
 
         if cancelled_fn and cancelled_fn():
-            return '<div class="module-error">Report generation was cancelled.</div>'
+            return ['<div class="module-error">Report generation was cancelled.</div>']
 
         # ── Step 3: Build display data for each image ──────────────────
         processed: List[Dict[str, Any]] = []
@@ -307,14 +316,19 @@ class AppendixImageListModule(BaseAppendixModule):
         env = Environment(loader=FileSystemLoader(template_dir), autoescape=True)
         template = env.get_template("template.html")
 
-        return template.render(
-            images=processed,
-            total_count=len(processed),
-            include_filepath=include_filepath,
-            include_url=include_url,
-            t=translations,
-            locale=locale,
-        )
+        parts = split_rows(processed, chunk_rows)
+        return [
+            template.render(
+                images=part,
+                total_count=len(processed),
+                last_chunk=index == len(parts) - 1,
+                include_filepath=include_filepath,
+                include_url=include_url,
+                t=translations,
+                locale=locale,
+            )
+            for index, part in enumerate(parts)
+        ]
 
     # ── Chunked batch query helpers ───────────────────────────────────
 
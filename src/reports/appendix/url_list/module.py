@@ -13,7 +13,7 @@ from typing import Any, Dict, List, Optional
 
 from jinja2 import Environment, FileSystemLoader
 
-from ..base import BaseAppendixModule, FilterField, FilterType, ModuleMetadata
+from ..base import BaseAppendixModule, FilterField, FilterType, ModuleMetadata, split_rows
 from ...paths import get_module_template_dir
 
 
@@ -113,6 +113,15 @@ class AppendixUrlListModule(BaseAppendixModule):
         evidence_id: int,
         config: Dict[str, Any],
     ) -> str:
+        return self.render_chunks(db_conn, evidence_id, config)[0]
+
+    def render_chunks(
+        self,
+        db_conn: sqlite3.Connection,
+        evidence_id: int,
+        config: Dict[str, Any],
+        chunk_rows: int = 0,
+    ) -> List[str]:
         # Extract locale and translations from config
         locale = config.get("_locale", "en")
         translations = config.get("_translations", {})
@@ -141,27 +150,40 @@ class AppendixUrlListModule(BaseAppendixModule):
                     }
                 )
         except Exception as exc:
-            return f'<div class="module-error">Error loading URLs: {exc}</div>'
+            return [f'<div class="module-error">Error loading URLs: {exc}</div>']
 
         # Sort alphabetically by URL
         urls.sort(key=lambda x: x["url"].lower())
 
-        grouped = None
-        if group_by_domain:
-            grouped = self._group_by_domain(urls)
-
         template_dir = get_module_template_dir(__file__)
         env = Environment(loader=FileSystemLoader(template_dir), autoescape=True)
         template = env.get_template("template.html")
 
-        return template.render(
-            urls=urls,
-            grouped=grouped,
-            group_by_domain=group_by_domain,
-            total_count=len(urls),
-            t=translations,
-            locale=locale,
-        )
+        if group_by_domain:
+            grouped = self._group_by_domain(urls)
+            return [
+                template.render(
+                    urls=urls,
+                    grouped=part,
+                    group_by_domain=True,
+                    total_count=len(urls),
+                    t=translations,
+                    locale=locale,
+                )
+                for part in self._pack_groups(grouped, chunk_rows)
+            ]
+
+        return [
+            template.render(
+                urls=part,
+                grouped=None,
+                group_by_domain=False,
+                total_count=len(urls),
+                t=translations,
+                locale=locale,
+            )
+            for part in split_rows(urls, chunk_rows)
+        ]
 
     def _build_query(
         self,
@@ -253,6 +275,23 @@ class AppendixUrlListModule(BaseAppendixModule):
             )
         return result
 
+    @staticmethod
+    def _pack_groups(
+        grouped: List[Dict[str, Any]], chunk_rows: int
+    ) -> List[List[Dict[str, Any]]]:
+        """Pack whole domain groups into chunks of about ``chunk_rows`` URLs."""
+        if chunk_rows <= 0:
+            return [grouped]
+        chunks: List[List[Dict[str, Any]]] = [[]]
+        rows = 0
+        for group in grouped:
+            if rows and rows + len(group["urls"]) > chunk_rows:
+                chunks.append([])
+                rows = 0
+            chunks[-1].append(group)
+            rows += len(group["urls"])
+        return chunks
+
     def _normalize_domain(self, domain: str) -> str:
         """Normalize domain by removing www. prefix for grouping."""
         if domain.lower().startswith("www."):
@@ -6,6 +6,9 @@ This module provides:
 - ReportGenerator: Converts HTML to PDF using WeasyPrint
 - Preview functionality: Opens HTML in default browser
 
+Rendered module HTML is cached per evidence (see render_cache), and PDFs are
+written in worker processes (see pdf_pipeline).
+
 Usage:
     from reports.generator import ReportBuilder, ReportGenerator
 
@@ -21,6 +24,9 @@ Usage:
 
     # Or preview in browser
     generator.preview_in_browser(html)
+
+    # Report and appendix PDFs from a loaded builder, rendered concurrently
+    generator.generate_documents(builder, ReportMode.COMPLETE, report_pdf, appendix_pdf)
 """
 
 from __future__ import annotations
@@ -33,7 +39,7 @@ import webbrowser
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from jinja2 import Environment, FileSystemLoader
 
@@ -42,6 +48,21 @@ from .appendix import AppendixRegistry
 from .database import get_custom_sections, get_section_modules, get_appendix_modules
 from .locales import get_translations, DEFAULT_LOCALE, TranslationDict
 from .paths import get_templates_dir
+from .pdf_pipeline import (
+    APPENDIX_CHUNK_ROWS,
+    HAS_PYPDF,
+    count_pages,
+    merge_pdfs,
+    page_offsets,
+    pdf_workers,
+    write_pdf,
+)
+from .render_cache import (
+    SectionRenderCache,
+    config_fingerprint,
+    evidence_data_version,
+    get_render_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -124,6 +145,7 @@ class ReportBuilder:
         template_name: str = "base_report.html",
         case_folder: Optional[Path] = None,
         locale: str = DEFAULT_LOCALE,
+        render_cache: Optional[SectionRenderCache] = None,
     ):
         """Initialize the report builder.
 
@@ -133,6 +155,8 @@ class ReportBuilder:
             template_name: Name of the Jinja2 template to use
             case_folder: Path to the case folder for resolving image paths
             locale: Locale for report text (e.g., "en", "de")
+            render_cache: Cache for rendered module HTML (defaults to the
+                process-wide cache)
         """
         self._db_conn = db_conn
         self._evidence_id = evidence_id
@@ -142,6 +166,7 @@ class ReportBuilder:
         self._translations = get_translations(locale)
         self._registry = ModuleRegistry()
         self._appendix_registry = AppendixRegistry()
+        self._render_cache = render_cache if render_cache is not None else get_render_cache()
 
         # Report data
         self._data = ReportData(locale=locale)
@@ -384,6 +409,7 @@ class ReportBuilder:
             self for method chaining
         """
         self._data.sections.clear()
+        data_version = evidence_data_version(self._db_conn)
 
         # Get all sections for this evidence
         sections = get_custom_sections(self._db_conn, self._evidence_id)
@@ -416,10 +442,16 @@ class ReportBuilder:
                 module_instance = self._registry.get_module(module_id)
                 if module_instance is not None:
                     try:
-                        rendered_html = module_instance.render(
-                            self._db_conn,
-                            self._evidence_id,
+                        rendered_html = self._render_cached(
+                            "section",
+                            module_id,
                             render_config,
+                            data_version,
+                            lambda: module_instance.render(
+                                self._db_conn,
+                                self._evidence_id,
+                                render_config,
+                            ),
                         )
                         section_data.modules.append({
                             "module_id": module_id,
@@ -462,6 +494,7 @@ class ReportBuilder:
             self for method chaining
         """
         self._data.appendix_modules.clear()
+        data_version = evidence_data_version(self._db_conn)
 
         modules = get_appendix_modules(self._db_conn, self._evidence_id)
         total = len(modules) or 1
@@ -493,10 +526,18 @@ class ReportBuilder:
             module_instance = self._appendix_registry.get_module(module_id)
             if module_instance is not None:
                 try:
-                    rendered_html = module_instance.render(
-                        self._db_conn,
-                        self._evidence_id,
+                    chunks = self._render_cached(
+                        ("appendix", APPENDIX_CHUNK_ROWS),
+                        module_id,
                         render_config,
+                        data_version,
+                        lambda: module_instance.render_chunks(
+                            self._db_conn,
+                            self._evidence_id,
+                            render_config,
+                            APPENDIX_CHUNK_ROWS,
+                        ),
+                        cancelled_fn,
                     )
                     module_title = title or getattr(module_instance, "get_default_title", lambda: module_instance.metadata.name)()
                     self._data.appendix_modules.append(
@@ -504,7 +545,8 @@ class ReportBuilder:
                             "module_id": module_id,
                             "config": config,
                             "title": module_title,
-                            "rendered_html": rendered_html,
+                            "rendered_html": "".join(chunks),
+                            "chunks": chunks,
                         }
                     )
                 except Exception as e:
@@ -535,6 +577,55 @@ class ReportBuilder:
 
         return self
 
+    def _render_cached(
+        self,
+        kind: Any,
+        module_id: str,
+        render_config: Dict[str, Any],
+        data_version: Optional[str],
+        render: Callable[[], Any],
+        cancelled_fn: Optional[Callable[[], bool]] = None,
+    ) -> Any:
+        """Return cached module output or call ``render`` and cache it.
+
+        Output is not cached when the data version is unknown, when the
+        module reported an error, or when the build was cancelled while
+        rendering.
+        """
+        if data_version is None:
+            return render()
+
+        key = (kind, module_id, config_fingerprint(render_config), data_version)
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            return cached
+
+        rendered = render()
+        fragments = [rendered] if isinstance(rendered, str) else rendered
+        failed = any('class="module-error"' in fragment for fragment in fragments)
+        if not failed and not (cancelled_fn and cancelled_fn()):
+            self._render_cache.put(key, rendered)
+        return rendered
+
+    def get_appendix_parts(self) -> List[Dict[str, Any]]:
+        """Split loaded appendix modules into parts, one per rendered chunk.
+
+        Returns:
+            List of dicts with ``number`` (1-based module number), ``title``,
+            ``rendered_html`` and ``continued`` (False for a module's first part)
+        """
+        parts: List[Dict[str, Any]] = []
+        for number, module in enumerate(self._data.appendix_modules, start=1):
+            chunks = module.get("chunks") or [module.get("rendered_html", "")]
+            for index, chunk in enumerate(chunks):
+                parts.append({
+                    "number": number,
+                    "title": module.get("title", ""),
+                    "rendered_html": chunk,
+                    "continued": index > 0,
+                })
+        return parts
+
     def add_section(
         self,
         title: str,
@@ -624,20 +715,55 @@ class ReportBuilder:
         })
         return template.render(**ctx)
 
-    def render_appendix_html(self) -> str:
+    def render_appendix_html(
+        self,
+        parts: Optional[List[Dict[str, Any]]] = None,
+        *,
+        front_matter: bool = True,
+        page_offset: int = 0,
+        page_total: Optional[int] = None,
+        toc_pages: Optional[Dict[int, int]] = None,
+    ) -> str:
         """Render the appendix as a standalone HTML document.
 
         The appendix document has its own title page, TOC, and page numbering
         starting at 1 with the format "Appendix — Page X of Y".
 
+        The keyword arguments render one sub-document of a chunked appendix
+        (see :meth:`ReportGenerator.generate_documents`).
+
+        Args:
+            parts: Parts from :meth:`get_appendix_parts` to include
+                (default: every module, unchunked)
+            front_matter: Include the title page and TOC
+            page_offset: Number of pages preceding this document
+            page_total: Total page count of the merged appendix
+            toc_pages: Starting page per module number, for the TOC
+
         Returns:
             Complete HTML string for the appendix document
         """
         template = self._env.get_template("appendix_report.html")
 
+        if parts is None:
+            parts = [
+                {
+                    "number": number,
+                    "title": module.get("title", ""),
+                    "rendered_html": module.get("rendered_html", ""),
+                    "continued": False,
+                }
+                for number, module in enumerate(self._data.appendix_modules, start=1)
+            ]
+
         ctx = self._get_common_template_context()
         ctx.update({
             "appendix_modules": self._data.appendix_modules,
+            "appendix_parts": parts,
+            "front_matter": front_matter,
+            "page_offset": page_offset,
+            "page_total": page_total,
+            "toc_pages": toc_pages,
         })
         return template.render(**ctx)
 
@@ -675,9 +801,14 @@ class ReportBuilder:
 class ReportGenerator:
     """Generates PDF reports and provides preview functionality."""
 
-    def __init__(self):
-        """Initialize the report generator."""
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize the report generator.
+
+        Args:
+            max_workers: Maximum PDF worker processes (default: CPU count)
+        """
         self._weasyprint_available = False
+        self._max_workers = max_workers
         self._check_weasyprint()
 
     def _check_weasyprint(self) -> None:
@@ -739,7 +870,7 @@ class ReportGenerator:
         report_path: Path | str,
         appendix_path: Path | str,
     ) -> Tuple[bool, bool]:
-        """Generate both report and appendix PDFs.
+        """Generate both report and appendix PDFs in parallel processes.
 
         Args:
             report_html: HTML for the report document
@@ -753,9 +884,140 @@ class ReportGenerator:
         Raises:
             ImportError: If WeasyPrint is not available
         """
-        report_ok = self.generate_pdf(report_html, report_path)
-        appendix_ok = self.generate_pdf(appendix_html, appendix_path)
-        return (report_ok, appendix_ok)
+        if not self._weasyprint_available:
+            raise ImportError("WeasyPrint is not installed. Please install it with: pip install weasyprint")
+
+        base_url = str(TEMPLATES_DIR)
+        jobs = [(report_html, Path(report_path)), (appendix_html, Path(appendix_path))]
+        with pdf_workers(len(jobs), self._max_workers) as submit:
+            futures = []
+            for html_content, output_path in jobs:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                futures.append(submit(write_pdf, html_content, str(output_path), base_url))
+            for future, (_, output_path) in zip(futures, jobs):
+                future.result()
+                logger.info(f"PDF generated: {output_path}")
+        return (True, True)
+
+    def generate_documents(
+        self,
+        builder: ReportBuilder,
+        mode: ReportMode,
+        report_path: Optional[Path | str] = None,
+        appendix_path: Optional[Path | str] = None,
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+    ) -> Tuple[Optional[Path], Optional[Path]]:
+        """Render the PDFs for ``mode`` from a loaded builder.
+
+        The report and the appendix are written concurrently in worker
+        processes. An appendix with chunked modules (more than
+        APPENDIX_CHUNK_ROWS rows) is written as parallel sub-documents that
+        are merged with continuous page numbers; without pypdf it is written
+        as one document.
+
+        Args:
+            builder: ReportBuilder with sections and/or appendix loaded
+            mode: Which documents to write
+            report_path: Output path for the report PDF
+            appendix_path: Output path for the appendix PDF
+            progress_callback: Optional ``(percent, message)`` callable
+
+        Returns:
+            Tuple of (report_path, appendix_path); None for documents not
+            written in this mode
+
+        Raises:
+            ImportError: If WeasyPrint is not available
+        """
+        if not self._weasyprint_available:
+            raise ImportError("WeasyPrint is not installed. Please install it with: pip install weasyprint")
+
+        base_url = str(TEMPLATES_DIR)
+        want_report = mode != ReportMode.APPENDIX_ONLY
+        want_appendix = mode != ReportMode.REPORT_ONLY
+
+        parts = builder.get_appendix_parts() if want_appendix else []
+        chunked = HAS_PYPDF and len(parts) > len(builder.get_data().appendix_modules)
+        jobs = int(want_report) + (len(parts) + 1 if chunked else int(want_appendix))
+
+        report_out = Path(report_path) if want_report else None
+        appendix_out = Path(appendix_path) if want_appendix else None
+        for output_path in (report_out, appendix_out):
+            if output_path is not None:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with pdf_workers(jobs, self._max_workers) as submit:
+            report_future = None
+            if report_out is not None:
+                report_future = submit(
+                    write_pdf, builder.render_report_html(), str(report_out), base_url
+                )
+
+            if appendix_out is not None:
+                if chunked:
+                    self._write_chunked_appendix(
+                        builder, parts, appendix_out, submit, progress_callback
+                    )
+                else:
+                    if progress_callback:
+                        progress_callback(88, "Generating appendix PDF…")
+                    submit(
+                        write_pdf, builder.render_appendix_html(), str(appendix_out), base_url
+                    ).result()
+                logger.info(f"PDF generated: {appendix_out}")
+
+            if report_future is not None:
+                report_future.result()
+                logger.info(f"PDF generated: {report_out}")
+
+        return (report_out, appendix_out)
+
+    def _write_chunked_appendix(
+        self,
+        builder: ReportBuilder,
+        parts: List[Dict[str, Any]],
+        output_path: Path,
+        submit: Callable[..., Any],
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+    ) -> None:
+        """Write the appendix as per-chunk sub-documents and merge them.
+
+        Pass 1 lays out the front matter (title page, TOC) and every part in
+        parallel to count pages. Pass 2 writes each sub-document with its
+        page offset, the total page count and the TOC page numbers.
+        """
+        base_url = str(TEMPLATES_DIR)
+        documents: List[Tuple[List[Dict[str, Any]], bool]] = [([], True)]
+        documents.extend(([part], False) for part in parts)
+
+        if progress_callback:
+            progress_callback(86, f"Laying out {len(documents)} appendix parts…")
+        count_futures = [
+            submit(count_pages, builder.render_appendix_html(doc_parts, front_matter=front), base_url)
+            for doc_parts, front in documents
+        ]
+        offsets, total = page_offsets([future.result() for future in count_futures])
+        toc_pages = {
+            part["number"]: offset + 1
+            for part, offset in zip(parts, offsets[1:])
+            if not part["continued"]
+        }
+
+        if progress_callback:
+            progress_callback(92, f"Writing {total} appendix pages…")
+        with tempfile.TemporaryDirectory(prefix="appendix_parts_") as tmp_dir:
+            write_futures = []
+            for index, ((doc_parts, front), offset) in enumerate(zip(documents, offsets)):
+                html_content = builder.render_appendix_html(
+                    doc_parts,
+                    front_matter=front,
+                    page_offset=offset,
+                    page_total=total,
+                    toc_pages=toc_pages,
+                )
+                part_path = Path(tmp_dir) / f"part_{index:04d}.pdf"
+                write_futures.append(submit(write_pdf, html_content, str(part_path), base_url))
+            merge_pdfs([future.result() for future in write_futures], output_path)
 
     def preview_in_browser(self, html_content: str) -> Path:
         """Open HTML preview in the default web browser.
@@ -30,6 +30,7 @@ TRANSLATIONS: Dict[str, TranslationDict] = {
         "generated": "Generated",
         "appendix": "Appendix",
         "appendix_page": "Appendix",
+        "continued": "continued",
         "no_content": "No Content",
         "no_sections_message": "No sections have been added to this report. Use the Reports tab to add custom sections and modules.",
 
@@ -477,6 +478,7 @@ TRANSLATIONS: Dict[str, TranslationDict] = {
         "generated": "Erstellt",
         "appendix": "Anhang",
         "appendix_page": "Anhang",
+        "continued": "Fortsetzung",
         "no_content": "Kein Inhalt",
         "no_sections_message": "Diesem Bericht wurden keine Abschnitte hinzugefügt. Verwenden Sie die Registerkarte Berichte, um benutzerdefinierte Abschnitte und Module hinzuzufügen.",
 
@@ -25,7 +25,7 @@ from ...dates import format_datetime
 from ...locales import get_translations, DEFAULT_LOCALE
 from core.database.helpers import get_screenshots, get_sequences, get_screenshot_count
 from core.image_codecs import ensure_pillow_heif_registered
-from core.database.manager import slugify_label
+from core.screenshot_store import resolve_screenshot_path
 from reports.paths import get_module_template_dir
 
 # Try to import PIL for thumbnail generation
@@ -311,8 +311,9 @@ class ScreenshotsModule(BaseReportModule):
             # Try to load thumbnail
             if workspace_path and evidence_label:
                 try:
-                    slug = slugify_label(evidence_label, evidence_id)
-                    image_path = workspace_path / "evidences" / slug / screenshot["dest_path"]
+                    image_path = resolve_screenshot_path(
+                        workspace_path, evidence_label, evidence_id, screenshot["dest_path"]
+                    )
 
                     if image_path.exists():
                         item["thumbnail_b64"] = self._generate_thumbnail(image_path)
@@ -0,0 +1,110 @@
+"""
+Parallel PDF rendering for report builds.
+
+WeasyPrint layout is single-threaded and CPU bound, so every PDF document is
+written in a worker process:
+
+- The report and the appendix render concurrently.
+- Appendix modules that were rendered in several chunks (large URL, file
+  and image lists) become separate sub-documents. A first pass lays out all
+  sub-documents in parallel to count their pages; the second pass writes
+  each one with its starting page number, the total page count and the TOC
+  page numbers filled in, and the parts are concatenated with pypdf.
+
+Without pypdf, or when no appendix module has more than one chunk, the
+appendix is written as a single document.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    from pypdf import PdfWriter
+    HAS_PYPDF = True
+except ImportError:
+    HAS_PYPDF = False
+
+# Rows per appendix sub-document for modules that support chunking
+APPENDIX_CHUNK_ROWS = 2000
+
+Submit = Callable[..., "Future[Any]"]
+
+
+def write_pdf(html_content: str, output_path: str, base_url: str) -> str:
+    """Write ``html_content`` as a PDF. Top-level so it can run in a process pool."""
+    import weasyprint
+
+    weasyprint.HTML(string=html_content, base_url=base_url).write_pdf(output_path)
+    return output_path
+
+
+def count_pages(html_content: str, base_url: str) -> int:
+    """Lay out ``html_content`` and return its page count (process pool task)."""
+    import weasyprint
+
+    return len(weasyprint.HTML(string=html_content, base_url=base_url).render().pages)
+
+
+def merge_pdfs(part_paths: Sequence[Path | str], output_path: Path | str) -> None:
+    """Concatenate PDF files in order into ``output_path``.
+
+    Raises:
+        ImportError: If pypdf is not installed
+    """
+    if not HAS_PYPDF:
+        raise ImportError("pypdf is not installed. Please install it with: pip install pypdf")
+    writer = PdfWriter()
+    for path in part_paths:
+        writer.append(str(path))
+    with open(output_path, "wb") as fh:
+        writer.write(fh)
+
+
+def page_offsets(page_counts: Sequence[int]) -> Tuple[List[int], int]:
+    """Return the number of pages before each document and the total."""
+    offsets: List[int] = []
+    total = 0
+    for count in page_counts:
+        offsets.append(total)
+        total += count
+    return offsets, total
+
+
+def _submit_inline(fn: Callable[..., Any], *args: Any) -> "Future[Any]":
+    """Run ``fn`` now and return a completed future (sequential fallback)."""
+    future: "Future[Any]" = Future()
+    try:
+        future.set_result(fn(*args))
+    except BaseException as exc:
+        future.set_exception(exc)
+    return future
+
+
+@contextmanager
+def pdf_workers(max_jobs: int, max_workers: Optional[int] = None) -> Iterator[Submit]:
+    """Yield a ``submit(fn, *args)`` callable backed by a process pool.
+
+    Falls back to running jobs inline when only one job or CPU is available
+    or the platform does not allow worker processes.
+    """
+    workers = min(max_jobs, max_workers or os.cpu_count() or 1)
+    executor = None
+    if workers > 1:
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        except PermissionError as e:
+            logger.warning("Parallel PDF rendering unavailable (%s); rendering sequentially", e)
+
+    if executor is None:
+        yield _submit_inline
+        return
+    with executor:
+        yield executor.submit
@@ -0,0 +1,202 @@
+"""
+Cache for rendered report and appendix module HTML.
+
+Rebuilding a report (preview, then PDF, then another PDF after a wording
+change) used to re-run every module's queries. Rendered HTML is cached
+under ``(kind, module_id, config hash, data version)``:
+
+- The config hash covers the module's filter values and the render context
+  injected by ReportBuilder (locale, date format, evidence label, ...).
+- The data version identifies the artifact data of the evidence database:
+  the highest rowid of every artifact table (inserts) plus the
+  ``data_version`` counter that triggers bump on in-place updates and on
+  deletes from the user-edited tables. Deletes from the bulk artifact
+  tables, which have no delete trigger, are detected from their row counts.
+  Report configuration tables are left out, so editing one section does
+  not invalidate the others.
+
+Entries are evicted least-recently-used once the cached HTML exceeds a size
+budget.
+
+Usage:
+    from reports.render_cache import get_render_cache, evidence_data_version
+
+    version = evidence_data_version(db_conn)
+    key = (kind, module_id, config_fingerprint(config), version)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on cached HTML (characters, roughly bytes)
+DEFAULT_MAX_CHARS = 128 * 1024 * 1024
+
+# Render-context keys that never affect the output
+_IGNORED_CONFIG_KEYS = frozenset({"_translations", "_progress_callback", "_cancelled_fn"})
+
+# Tables whose changes never affect rendered module output
+_IGNORED_TABLES = frozenset({
+    "appendix_modules",
+    "artifact_count_marks",
+    "artifact_counts",
+    "custom_report_sections",
+    "data_version",
+    "deferred_indexes",
+    "file_list_filter_cache",
+    "process_log",
+    "schema_version",
+    "section_modules",
+})
+_IGNORED_TABLE_PREFIXES = ("report_", "sqlite_")
+
+# Name of the AFTER DELETE trigger bumping data_version
+# (core.database.manager._ensure_data_version_triggers)
+_DELETE_TRIGGER = "trg_data_version_{}_ad"
+
+
+def evidence_data_version(db_conn: Any) -> Optional[str]:
+    """Return a version token for the artifact data in ``db_conn``.
+
+    Args:
+        db_conn: Connection to the evidence database
+
+    Returns:
+        Hex digest that changes whenever artifact rows are inserted, deleted
+        or updated in place, or None for in-memory databases and when it
+        cannot be determined (the caller should not cache).
+    """
+    if not isinstance(db_conn, sqlite3.Connection):
+        return None
+    try:
+        main = db_conn.execute("PRAGMA database_list").fetchone()
+        if main is None or not main[2]:
+            # In-memory or temporary database
+            return None
+        tables = [
+            row[0]
+            for row in db_conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' "
+                "AND sql NOT LIKE 'CREATE VIRTUAL TABLE%' ORDER BY name"
+            )
+            if row[0] not in _IGNORED_TABLES and not row[0].startswith(_IGNORED_TABLE_PREFIXES)
+        ]
+        delete_triggers = {
+            row[0]
+            for row in db_conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_data_version_%'"
+            )
+        }
+        state: list = [main[2]]
+        for table in tables:
+            try:
+                # MAX(rowid) reads the last b-tree entry, not the table
+                (max_rowid,) = db_conn.execute(f'SELECT MAX(rowid) FROM "{table}"').fetchone()
+            except sqlite3.OperationalError:
+                # WITHOUT ROWID table (FTS shadow tables; their content follows the base table)
+                continue
+            if _DELETE_TRIGGER.format(table) in delete_triggers:
+                state.append((table, max_rowid))
+            else:
+                # No delete trigger (bulk artifact table): count rows
+                (count,) = db_conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()
+                state.append((table, max_rowid, count))
+        try:
+            updates = db_conn.execute("SELECT version FROM data_version WHERE id = 1").fetchone()
+        except sqlite3.OperationalError:
+            # Evidence database predates the data_version migration
+            return None
+        state.append(("data_version", updates[0] if updates else 0))
+    except sqlite3.Error as exc:
+        logger.debug("Data version unavailable: %s", exc)
+        return None
+    return hashlib.sha1(repr(state).encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def config_fingerprint(config: Dict[str, Any]) -> str:
+    """Hash a module render config (filter values plus injected context).
+
+    Args:
+        config: Render config passed to the module
+
+    Returns:
+        Hex digest identifying the config
+    """
+    relevant = {k: v for k, v in config.items() if k not in _IGNORED_CONFIG_KEYS}
+    encoded = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.sha1(encoded.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def _html_size(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    return sum(len(part) for part in value)
+
+
+class SectionRenderCache:
+    """Thread-safe LRU cache of rendered module HTML.
+
+    Values are an HTML string (report modules) or a list of HTML fragments
+    (chunked appendix modules).
+    """
+
+    def __init__(self, max_chars: int = DEFAULT_MAX_CHARS):
+        self.max_chars = max_chars
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached HTML for ``key`` or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store rendered HTML, evicting least-recently-used entries."""
+        size = _html_size(value)
+        if size > self.max_chars:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._chars -= _html_size(old)
+            self._entries[key] = value
+            self._chars += size
+            while self._chars > self.max_chars:
+                _, evicted = self._entries.popitem(last=False)
+                self._chars -= _html_size(evicted)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._chars = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_instance = SectionRenderCache()
+
+
+def get_render_cache() -> SectionRenderCache:
+    """Process-wide cache shared by all report builders."""
+    return _instance
+
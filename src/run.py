@@ -16,7 +16,12 @@ src_dir = Path(__file__).resolve().parent
 if str(src_dir) not in sys.path:
     sys.path.insert(0, str(src_dir))
 
-from app.main import main
+# Start the startup profiler before the application modules load so the
+# optional import-time report (--profile-startup) covers them too.
+from app.startup import get_startup_profiler
+
+with get_startup_profiler().phase("import_app_main"):
+    from app.main import main
 
 if __name__ == "__main__":
     sys.exit(main())
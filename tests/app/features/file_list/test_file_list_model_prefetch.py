@@ -0,0 +1,112 @@
+"""
+Tests for per-page prefetching of tags/matches in FileListModel.
+"""
+import sqlite3
+
+import pytest
+
+from app.features.file_list.models.file_list_model import FileListModel
+from core.database import DatabaseManager
+
+
+@pytest.fixture
+def case_setup(tmp_path):
+    case_path = tmp_path / "case"
+    case_path.mkdir()
+    case_db_path = case_path / "CASE-001_surfsifter.sqlite"
+    case_conn = sqlite3.connect(case_db_path)
+    case_conn.execute(
+        "CREATE TABLE evidences (id INTEGER PRIMARY KEY, label TEXT NOT NULL, source_path TEXT NOT NULL)"
+    )
+    case_conn.execute("INSERT INTO evidences (id, label, source_path) VALUES (1, 'EV-001', '/test.E01')")
+    case_conn.commit()
+    case_conn.close()
+
+    manager = DatabaseManager(case_path, case_db_path=case_db_path)
+    conn = manager.get_evidence_conn(1, label="EV-001")
+    conn.executemany(
+        """
+        INSERT INTO file_list (id, evidence_id, file_path, file_name, import_timestamp)
+        VALUES (?, 1, ?, ?, '2025-01-01T00:00:00Z')
+        """,
+        [(i, f"/dir/file{i:04d}.exe", f"file{i:04d}.exe") for i in range(1, 1001)],
+    )
+    conn.execute("INSERT INTO tags (evidence_id, name, name_normalized) VALUES (1, 'Flagged', 'flagged')")
+    conn.executemany(
+        "INSERT INTO tag_associations (tag_id, evidence_id, artifact_type, artifact_id) VALUES (1, 1, 'file_list', ?)",
+        [(i,) for i in range(1, 1001, 10)],
+    )
+    conn.executemany(
+        """
+        INSERT INTO file_list_matches (evidence_id, file_list_id, reference_list_name, match_type, matched_value, matched_at)
+        VALUES (1, ?, 'malware', 'filename', 'x', '2025-01-01T00:00:00Z')
+        """,
+        [(i,) for i in range(1, 1001, 7)],
+    )
+    conn.commit()
+    manager.close_all()
+    return case_path, case_db_path
+
+
+def _count_statements(model):
+    conn = model.db_manager.get_evidence_conn(1, label="EV-001")
+    statements = []
+    conn.set_trace_callback(statements.append)
+    return conn, statements
+
+
+def test_page_load_prefetches_tags_and_matches(case_setup):
+    case_path, case_db_path = case_setup
+    model = FileListModel(str(case_path), 1, case_db_path)
+
+    assert len(model._rows) == 1000
+    assert len(model._tags_cache) == 1000
+    assert model._get_tags(1) == "Flagged"
+    assert model._get_matches(1) == "malware"
+    assert model._get_tags(2) == ""
+    assert model._get_matches(8) == "malware"
+
+    conn, statements = _count_statements(model)
+    try:
+        for row in range(model.rowCount()):
+            for column in (6, 7):
+                model.data(model.index(row, column))
+    finally:
+        conn.set_trace_callback(None)
+    # Painting every row issues no per-row queries
+    assert statements == []
+    model.db_manager.close_all()
+
+
+def test_prefetch_uses_one_query_per_chunk(case_setup):
+    case_path, case_db_path = case_setup
+    model = FileListModel(str(case_path), 1, case_db_path)
+    model._matches_cache.clear()
+    model._tags_cache.clear()
+
+    conn, statements = _count_statements(model)
+    try:
+        model._prefetch_annotations(row["id"] for row in model._rows)
+    finally:
+        conn.set_trace_callback(None)
+
+    chunks = -(-1000 // FileListModel.ANNOTATION_CHUNK_SIZE)
+    assert len([s for s in statements if "file_list_annotations" in s]) == chunks
+    assert model._get_tags(11) == "Flagged"
+    model.db_manager.close_all()
+
+
+def test_grouped_fallback_without_side_table(case_setup):
+    case_path, case_db_path = case_setup
+    model = FileListModel(str(case_path), 1, case_db_path)
+    conn = model.db_manager.get_evidence_conn(1, label="EV-001")
+    conn.execute("DROP TABLE file_list_annotations")
+    model._matches_cache.clear()
+    model._tags_cache.clear()
+
+    model._prefetch_annotations([1, 2, 8, 21])
+
+    assert model._get_tags(21) == "Flagged"
+    assert model._get_matches(8) == "malware"
+    assert model._get_matches(2) == ""
+    model.db_manager.close_all()
@@ -0,0 +1,196 @@
+"""Tests for downloaded-image post-processing.
+
+Covers:
+- analyze_downloaded_image deriving hashes, dimensions, EXIF, pHash and the
+  thumbnail from one open (same values as the per-step helpers)
+- Non-image and missing files
+- iter_postprocess_batches order, sequential vs process pool
+- Benchmark against the previous per-item loop (slow)
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from app.services import thumbnailer
+from app.services.download_postprocess import (
+    analyze_downloaded_image,
+    analyze_image_chunk,
+    iter_postprocess_batches,
+)
+from core.database import EVIDENCE_MIGRATIONS_DIR, migrate
+from core.database.helpers.downloads import (
+    insert_download,
+    update_download_image_metadata,
+    update_download_image_metadata_batch,
+)
+from core.hashing import hash_file
+from core.phash import compute_phash
+from extractors._shared.carving.exif import extract_exif
+
+
+@pytest.fixture(autouse=True)
+def _reset_thumbnail_cache():
+    thumbnailer._CACHE_INDEX.clear()
+    yield
+    thumbnailer._CACHE_INDEX.clear()
+
+
+def _write_images(directory: Path, count: int, size: int = 64) -> list:
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        img = Image.new("RGB", (size + i % 7, size), color=(i * 37 % 256, i * 11 % 256, 90))
+        if i % 2:
+            path = directory / f"img_{i:05d}.png"
+            img.save(path, format="PNG")
+        else:
+            path = directory / f"img_{i:05d}.jpg"
+            exif = Image.Exif()
+            exif[0x010F] = "TestCam"  # Make
+            img.save(path, format="JPEG", exif=exif)
+        paths.append(path)
+    return paths
+
+
+def test_single_open_matches_per_step_helpers(tmp_path):
+    (path,) = _write_images(tmp_path / "dl", 1, size=120)
+    thumb_dir = tmp_path / "thumbs"
+
+    result = analyze_downloaded_image(7, 8, path, thumb_dir)
+
+    assert result.error is None
+    assert (result.item_id, result.download_id) == (7, 8)
+    assert (result.width, result.height) == (120, 120)
+    assert result.md5 == hash_file(path, alg="md5")
+    assert result.sha256 == hash_file(path, alg="sha256")
+    assert result.phash == compute_phash(path)
+    assert json.loads(result.exif_json) == extract_exif(path)
+    assert thumbnailer.thumbnail_path(path, thumb_dir).exists()
+    # The shared thumbnailer finds the same cached thumbnail
+    assert thumbnailer.ensure_thumbnail(path, thumb_dir) == thumbnailer.thumbnail_path(path, thumb_dir)
+
+
+def test_non_image_and_missing_files(tmp_path):
+    text = tmp_path / "page.jpg"
+    text.write_bytes(b"<html>not an image</html>")
+
+    undecodable = analyze_downloaded_image(1, 1, text, tmp_path / "thumbs")
+    missing = analyze_downloaded_image(2, 2, tmp_path / "gone.jpg", tmp_path / "thumbs")
+
+    assert undecodable.error is None
+    assert undecodable.sha256 == hash_file(text)
+    assert undecodable.phash is None and undecodable.width is None
+    assert undecodable.exif_json == "{}"
+    assert missing.error == "File not found"
+
+
+def test_batches_in_input_order(tmp_path):
+    paths = _write_images(tmp_path / "dl", 40)
+    items = [(i, 100 + i, p) for i, p in enumerate(paths)]
+
+    parallel = [r for b in iter_postprocess_batches(items, tmp_path / "t1", max_workers=2, chunk_size=4) for r in b]
+    sequential = [
+        r for b in iter_postprocess_batches(items, tmp_path / "t2", enable_parallel=False) for r in b
+    ]
+
+    assert [r.item_id for r in parallel] == list(range(40))
+    assert [(r.sha256, r.phash, r.width) for r in parallel] == [
+        (r.sha256, r.phash, r.width) for r in sequential
+    ]
+
+
+_real_analyze_chunk = analyze_image_chunk
+
+
+def _crash_in_worker(items, thumb_dir, parent_pid=os.getpid()):
+    if os.getpid() != parent_pid:
+        os._exit(1)  # Worker dies, e.g. killed for running out of memory
+    return _real_analyze_chunk(items, thumb_dir)
+
+
+def test_crashed_worker_fails_only_its_chunk(tmp_path, monkeypatch):
+    import app.services.download_postprocess as postprocess_mod
+
+    monkeypatch.setattr(postprocess_mod, "analyze_image_chunk", _crash_in_worker)
+    paths = _write_images(tmp_path / "dl", 40)
+    items = [(i, 100 + i, p) for i, p in enumerate(paths)]
+
+    results = [r for b in iter_postprocess_batches(items, tmp_path / "t", max_workers=2, chunk_size=8) for r in b]
+
+    # The first chunk gets the broken pool error; the rest run in this process
+    assert [r.item_id for r in results] == list(range(40))
+    assert all(r.error.startswith("Worker failed") for r in results[:8])
+    assert all(r.error is None and r.sha256 for r in results[8:])
+
+
+def test_batches_stop_when_cancelled(tmp_path):
+    paths = _write_images(tmp_path / "dl", 12)
+    items = [(i, i, p) for i, p in enumerate(paths)]
+    seen = []
+
+    for batch in iter_postprocess_batches(
+        items, tmp_path / "thumbs", enable_parallel=False, chunk_size=4,
+        is_cancelled=lambda: len(seen) >= 4,
+    ):
+        seen.extend(batch)
+
+    assert len(seen) == 4
+
+
+@pytest.mark.slow
+def test_benchmark_download_postprocess(tmp_path):
+    """
+    Compare the batched pipeline with the previous per-item loop.
+
+    The previous loop ran compute_phash, extract_exif, a separate PIL open
+    for dimensions and ensure_thumbnail per image, then committed one
+    UPDATE per image. Image count defaults to 3000 (override with
+    POSTPROCESS_BENCH_IMAGES).
+    """
+    count = int(os.environ.get("POSTPROCESS_BENCH_IMAGES", "3000"))
+    paths = _write_images(tmp_path / "dl", count, size=640)
+    conn = sqlite3.connect(tmp_path / "evidence.sqlite")
+    migrate(conn, migrations_dir=EVIDENCE_MIGRATIONS_DIR)
+    ids = [
+        insert_download(conn, 1, f"https://example.com/{p.name}", "example.com", "image", p.suffix, filename=p.name)
+        for p in paths
+    ]
+    conn.commit()
+    items = list(zip(range(count), ids, paths))
+
+    def per_item():
+        for _, download_id, path in items:
+            phash = compute_phash(path)
+            exif = extract_exif(path)
+            with Image.open(path) as img:
+                width, height = img.size
+            thumbnailer.ensure_thumbnail(path, tmp_path / "thumbs_old")
+            update_download_image_metadata(
+                conn, 1, download_id, phash=phash, exif_json=json.dumps(exif, sort_keys=True),
+                width=width, height=height,
+            )
+            conn.commit()
+
+    def batched():
+        for batch in iter_postprocess_batches(items, tmp_path / "thumbs_new"):
+            update_download_image_metadata_batch(conn, 1, [r.to_db_record() for r in batch])
+            conn.commit()
+
+    timings = {}
+    for name, func in (("per_item", per_item), ("batched", batched)):
+        started = time.perf_counter()
+        func()
+        timings[name] = time.perf_counter() - started
+
+    for name, elapsed in timings.items():
+        print(f"{name}: {count / elapsed:,.0f} images/s ({elapsed:.2f}s)")
+    print(f"speedup: {timings['per_item'] / timings['batched']:.2f}x on {os.cpu_count()} CPUs")
+    assert conn.execute("SELECT COUNT(*) FROM downloads WHERE width IS NOT NULL").fetchone()[0] == count
+    conn.close()
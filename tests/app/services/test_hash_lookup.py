@@ -2,6 +2,7 @@ import sqlite3
 from pathlib import Path
 
 from app.services.workers import HashLookupTask
+from core.matching import import_hash_list
 from tests.fixtures.helpers import prepare_case_with_data
 
 
@@ -34,3 +35,28 @@ def test_hash_lookup_persists_matches(tmp_path: Path) -> None:
 
     persisted = case_data.list_hash_matches(evidence_id, [image_id])
     assert persisted and persisted[0]["db_md5"] == "deadbeef"
+
+
+def test_hash_lookup_uses_hash_index(tmp_path: Path) -> None:
+    case_data, evidence_id = prepare_case_with_data(tmp_path)
+    case_db = tmp_path / "test_surfsifter.sqlite"
+
+    evidence_db_path = case_data.db_manager.evidence_db_path(evidence_id, "EVID")
+    with sqlite3.connect(evidence_db_path) as evidence_conn:
+        image_id = evidence_conn.execute("SELECT id FROM images LIMIT 1").fetchone()[0]
+        evidence_conn.execute(
+            "UPDATE images SET md5 = ? WHERE id = ?",
+            ("d41d8cd98f00b204e9800998ecf8427e", image_id),
+        )
+
+    hash_list = tmp_path / "known_bad.txt"
+    hash_list.write_text("D41D8CD98F00B204E9800998ECF8427E, Known bad actor\n")
+    hash_db = tmp_path / "hash_database.sqlite"
+    import_hash_list(hash_list, hash_db)
+
+    task = HashLookupTask(case_db, hash_db, evidence_id, [image_id], db_manager=case_data.db_manager)
+    matches = task.run_task()
+
+    assert matches == [(image_id, "d41d8cd98f00b204e9800998ecf8427e", "Known bad actor")]
+    persisted = case_data.list_hash_matches(evidence_id, [image_id])
+    assert persisted and persisted[0]["list_name"] == "known_bad"
@@ -0,0 +1,111 @@
+"""Tests for startup instrumentation and deferred imports in app.main."""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from app.startup import (
+    DEFAULT_STARTUP_BUDGET_S,
+    ImportTimeRecorder,
+    StartupProfiler,
+    startup_budget_seconds,
+    startup_profiling_requested,
+)
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+
+def test_profiling_requested_by_flag_or_env():
+    assert startup_profiling_requested(["run.py", "--profile-startup"], {}) is True
+    assert startup_profiling_requested(["run.py"], {"SURFSIFTER_PROFILE_STARTUP": "1"}) is True
+    assert startup_profiling_requested(["run.py"], {"SURFSIFTER_PROFILE_STARTUP": "0"}) is False
+    assert startup_profiling_requested(["run.py"], {}) is False
+
+
+def test_budget_precedence():
+    assert startup_budget_seconds(None, {}) == DEFAULT_STARTUP_BUDGET_S
+    assert startup_budget_seconds(4.0, {}) == 4.0
+    assert startup_budget_seconds(4.0, {"SURFSIFTER_STARTUP_BUDGET_S": "2.5"}) == 2.5
+    assert startup_budget_seconds(4.0, {"SURFSIFTER_STARTUP_BUDGET_S": "bogus"}) == 4.0
+
+
+def test_profiler_records_phases():
+    profiler = StartupProfiler()
+    with profiler.phase("first"):
+        time.sleep(0.01)
+    profiler.mark("second", time.perf_counter())
+
+    assert list(profiler.phases) == ["first", "second"]
+    assert profiler.phases["first"] >= 0.01
+    breakdown = profiler.format_breakdown()
+    assert breakdown.startswith("Startup timing: first=")
+    assert "total_since_start=" in breakdown
+
+
+def test_import_recorder_captures_nested_imports(tmp_path, monkeypatch):
+    pkg = tmp_path / "startup_probe_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("from . import child\n")
+    (pkg / "child.py").write_text("import time\ntime.sleep(0.01)\nVALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    recorder = ImportTimeRecorder().install()
+    try:
+        import startup_probe_pkg  # noqa: F401
+    finally:
+        recorder.uninstall()
+        sys.modules.pop("startup_probe_pkg.child", None)
+        sys.modules.pop("startup_probe_pkg", None)
+
+    by_name = {rec.name: rec for rec in recorder.records}
+    parent = by_name["startup_probe_pkg"]
+    child = by_name["startup_probe_pkg.child"]
+    assert child.depth == parent.depth + 1
+    assert child.cumulative_us >= 10_000
+    assert parent.cumulative_us >= child.cumulative_us
+    assert parent.self_us < parent.cumulative_us
+    # Real loader restored after exec
+    assert type(startup_probe_pkg.__loader__).__name__ != "_TimedLoader"
+
+    report = recorder.format_report(limit=5)
+    assert report.splitlines()[0].startswith("import time: self [us]")
+    assert "startup_probe_pkg.child" in report
+
+
+def test_importing_main_defers_feature_packages():
+    """Importing app.main must not pull in the feature tabs or extractors."""
+    script = (
+        "import json, sys\n"
+        "import app.main\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.startswith(('app.', 'extractors')))))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=SRC_DIR,
+        env={"PYTHONPATH": str(SRC_DIR), "QT_QPA_PLATFORM": "offscreen", "PATH": ""},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if result.returncode != 0 and "No module named 'PySide6'" in result.stderr:
+        pytest.skip("PySide6 not available")
+    assert result.returncode == 0, result.stderr
+
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    deferred = (
+        "app.features.urls",
+        "app.features.images",
+        "app.features.os_artifacts",
+        "app.features.timeline",
+        "app.features.tags",
+        "app.features.settings",
+        "app.features.downloads",
+        "app.services.workers",
+        "extractors",
+    )
+    assert not [name for name in loaded if name.startswith(deferred)]
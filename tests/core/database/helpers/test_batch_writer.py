@@ -0,0 +1,174 @@
+"""Tests for compiled TableSchema inserts and the batched writer."""
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from core.database import EVIDENCE_MIGRATIONS_DIR, migrate
+from core.database.helpers.batch_writer import BatchWriter, compile_insert
+from core.database.helpers.generic import insert_row, insert_rows
+from core.database.schema import Column, ConflictAction, TableSchema
+
+
+def _upper_note(record):
+    return {**record, "note": (record.get("note") or "").upper() or None}
+
+
+NOTES = TableSchema(
+    name="notes",
+    columns=[
+        Column("id", "INTEGER"),
+        Column("evidence_id", "INTEGER"),
+        Column("name", "TEXT"),
+        Column("note", "TEXT"),
+        Column("size", "INTEGER", default=0),
+        Column("label", "TEXT", dict_key="label_text"),
+    ],
+    conflict_action=ConflictAction.IGNORE,
+    pre_insert_hook=_upper_note,
+)
+
+PARENTS = TableSchema(
+    name="parents",
+    columns=[Column("id", "INTEGER"), Column("evidence_id", "INTEGER"), Column("name", "TEXT")],
+)
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE notes (id INTEGER PRIMARY KEY, evidence_id INTEGER, name TEXT UNIQUE, "
+        "note TEXT, size INTEGER, label TEXT)"
+    )
+    conn.execute("CREATE TABLE parents (id INTEGER PRIMARY KEY, evidence_id INTEGER, name TEXT)")
+    yield conn
+    conn.close()
+
+
+def _notes(conn):
+    return conn.execute("SELECT evidence_id, name, note, size, label FROM notes ORDER BY id").fetchall()
+
+
+def test_compiled_insert_is_cached_per_schema():
+    compiled = compile_insert(NOTES)
+    assert compile_insert(NOTES) is compiled
+    assert compiled.sql == (
+        "INSERT OR IGNORE INTO notes (evidence_id, name, note, size, label) VALUES (?, ?, ?, ?, ?)"
+    )
+
+
+def test_insert_rows_uses_defaults_hook_and_conflict_action(conn):
+    records = [
+        {"name": "a", "note": "x", "size": 3, "label_text": "L"},
+        {"name": "b"},
+        {"name": "a", "note": "dup"},
+    ]
+
+    assert insert_rows(conn, NOTES, 7, records) == 2
+    assert insert_row(conn, NOTES, 7, {"name": "c", "label_text": "M"}) == 3  # lastrowid
+
+    assert _notes(conn) == [
+        (7, "a", "X", 3, "L"),
+        (7, "b", None, 0, None),
+        (7, "c", None, 0, "M"),
+    ]
+
+
+def test_writer_matches_insert_rows(conn):
+    records = [{"name": f"n{i}", "note": "t" if i % 2 else None, "size": i} for i in range(50)]
+    records.append({"name": "n1", "note": "dup"})
+
+    with BatchWriter(conn, 7) as writer:
+        assert writer.add(NOTES, records) == 51
+        assert writer.pending == 51
+        assert _notes(conn) == []
+    written = _notes(conn)
+
+    conn.execute("DELETE FROM notes")
+    insert_rows(conn, NOTES, 7, records)
+    assert written == _notes(conn)
+    assert writer.stats["notes"].queued == 51
+    assert writer.stats["notes"].inserted == 50
+
+
+def test_writer_flushes_at_batch_size(conn):
+    writer = BatchWriter(conn, 1, batch_size=10, flush_interval=3600)
+    for i in range(25):
+        writer.add_row(NOTES, {"name": f"n{i}"})
+
+    assert len(_notes(conn)) == 20
+    assert writer.pending == 5
+    assert writer.flush() == 5
+    assert writer.stats["notes"].batches == 3
+
+
+def test_writer_flushes_after_interval(conn):
+    writer = BatchWriter(conn, 1, batch_size=1000, flush_interval=5.0)
+    with patch("core.database.helpers.batch_writer.time.monotonic", side_effect=[101.0, 106.0, 106.0]):
+        writer._last_flush = 100.0
+        writer.add_row(NOTES, {"name": "a"})
+        assert writer.pending == 1
+        writer.add_row(NOTES, {"name": "b"})
+    assert writer.pending == 0
+    assert len(_notes(conn)) == 2
+
+
+def test_writer_flushes_tables_in_first_use_order(conn):
+    statements = []
+    conn.set_trace_callback(statements.append)
+
+    with BatchWriter(conn, 1) as writer:
+        writer.add(PARENTS, [{"name": "p"}])
+        writer.add(NOTES, [{"name": "child"}])
+        writer.add(PARENTS, [{"name": "q"}])
+
+    inserts = [s.split(" INTO ")[1].split()[0] for s in statements if s.startswith("INSERT")]
+    assert inserts == ["parents", "parents", "notes"]
+    assert set(writer.stats) == {"parents", "notes"}
+
+
+def test_writer_keeps_rows_queued_before_error(conn):
+    with pytest.raises(RuntimeError):
+        with BatchWriter(conn, 1) as writer:
+            writer.add_row(NOTES, {"name": "a"})
+            raise RuntimeError("boom")
+    assert len(_notes(conn)) == 1
+
+    writer = BatchWriter(conn, 1)
+    writer.add_row(NOTES, {"name": "z"})
+    writer.discard()
+    assert writer.flush() == 0
+    assert len(_notes(conn)) == 1
+
+
+def test_failed_flush_keeps_rows_queued(conn):
+    writer = BatchWriter(conn, 1, batch_size=3, flush_interval=3600)
+    writer.add(PARENTS, [{"name": "p"}])
+    conn.execute("ALTER TABLE notes RENAME TO notes_away")
+    writer.add_row(NOTES, {"name": "a"})
+
+    with pytest.raises(sqlite3.OperationalError):
+        writer.add_row(NOTES, {"name": "b"})  # Size-triggered flush fails
+
+    assert writer.pending == 3
+    assert conn.execute("SELECT COUNT(*) FROM parents").fetchone()[0] == 0  # Rolled back
+    assert writer.stats["notes"].inserted == 0
+    conn.execute("ALTER TABLE notes_away RENAME TO notes")
+    writer.add_row(NOTES, {"name": "c"})  # Retried with the next flush
+
+    assert writer.pending == 0
+    assert [row[1] for row in _notes(conn)] == ["a", "b", "c"]
+    assert writer.stats["parents"].inserted == 1 and writer.stats["parents"].batches == 1
+
+
+def test_writer_accepts_registered_table_names(tmp_path):
+    conn = sqlite3.connect(tmp_path / "evidence.sqlite")
+    migrate(conn, migrations_dir=EVIDENCE_MIGRATIONS_DIR)
+
+    with BatchWriter(conn, 1) as writer:
+        writer.add("urls", [{"url": "https://example.com/", "discovered_by": "test"}])
+
+    assert conn.execute("SELECT evidence_id, url FROM urls").fetchall() == [(1, "https://example.com/")]
+    assert writer.stats["urls"].rows_per_second > 0
+    conn.close()
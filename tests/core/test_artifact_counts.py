@@ -0,0 +1,168 @@
+"""Tests for maintained per-evidence artifact counters (core.database.helpers.artifact_counts)."""
+import sqlite3
+
+import pytest
+
+from core.database import (
+    COUNTED_TABLES,
+    EVIDENCE_MIGRATIONS_DIR,
+    bulk_ingest,
+    ensure_artifact_counters,
+    get_artifact_counts,
+    get_evidence_table_counts,
+    migrate,
+    purge_evidence_data,
+    reconcile_artifact_counts,
+)
+
+
+@pytest.fixture
+def evidence_conn(tmp_path):
+    conn = sqlite3.connect(tmp_path / "evidence.sqlite")
+    migrate(conn, migrations_dir=EVIDENCE_MIGRATIONS_DIR)
+    yield conn
+    conn.close()
+
+
+def _insert_urls(conn, evidence_id, count, offset=0):
+    conn.executemany(
+        "INSERT INTO urls (evidence_id, url, domain, discovered_by, run_id) VALUES (?, ?, ?, ?, ?)",
+        [
+            (evidence_id, f"https://example.com/{i}", "example.com", "test", "run1")
+            for i in range(offset, offset + count)
+        ],
+    )
+    conn.commit()
+
+
+def _stored(conn, table, evidence_id):
+    row = conn.execute(
+        "SELECT row_count FROM artifact_counts WHERE table_name = ? AND evidence_id = ?",
+        (table, evidence_id),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def _mark(conn, table):
+    row = conn.execute(
+        "SELECT counted_rowid FROM artifact_count_marks WHERE table_name = ?", (table,)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def test_ensure_seeds_existing_rows(evidence_conn):
+    _insert_urls(evidence_conn, 1, 5)
+    _insert_urls(evidence_conn, 2, 3, offset=100)
+
+    built = ensure_artifact_counters(evidence_conn)
+
+    assert "urls" in built
+    assert ensure_artifact_counters(evidence_conn) == []
+    assert (_stored(evidence_conn, "urls", 1), _stored(evidence_conn, "urls", 2)) == (5, 3)
+    assert _mark(evidence_conn, "urls") == 8
+
+
+def test_inserts_are_counted_above_watermark_and_folded(evidence_conn):
+    ensure_artifact_counters(evidence_conn)
+    _insert_urls(evidence_conn, 1, 4)
+
+    # No insert trigger: the new rows are counted on read
+    assert _stored(evidence_conn, "urls", 1) is None
+    assert get_artifact_counts(evidence_conn, 1, ["urls", "images"]) == {"urls": 4, "images": 0}
+
+    ensure_artifact_counters(evidence_conn, ["urls"])
+    assert (_stored(evidence_conn, "urls", 1), _mark(evidence_conn, "urls")) == (4, 4)
+    assert get_artifact_counts(evidence_conn, 1, ["urls"]) == {"urls": 4}
+
+
+def test_deletes_and_moves_below_watermark(evidence_conn):
+    _insert_urls(evidence_conn, 1, 6)
+    ensure_artifact_counters(evidence_conn)
+    _insert_urls(evidence_conn, 1, 2, offset=100)
+
+    evidence_conn.execute("DELETE FROM urls WHERE url LIKE '%/0' OR url LIKE '%/100'")
+    evidence_conn.execute("UPDATE urls SET evidence_id = 2 WHERE url LIKE '%/1' OR url LIKE '%/101'")
+    evidence_conn.commit()
+
+    assert get_artifact_counts(evidence_conn, 1, ["urls"]) == {"urls": 4}
+    assert get_artifact_counts(evidence_conn, 2, ["urls"]) == {"urls": 2}
+    assert (_stored(evidence_conn, "urls", 1), _stored(evidence_conn, "urls", 2)) == (4, 1)
+    assert reconcile_artifact_counts(evidence_conn) == []
+
+
+def test_counts_match_direct_count_after_purge(evidence_conn):
+    ensure_artifact_counters(evidence_conn)
+    _insert_urls(evidence_conn, 1, 10)
+    evidence_conn.execute(
+        "INSERT INTO os_indicators (evidence_id, type, name, value, run_id) VALUES (1, 't', 'n', 'v', 'r')"
+    )
+    evidence_conn.commit()
+    ensure_artifact_counters(evidence_conn)
+
+    counts = get_evidence_table_counts(evidence_conn, 1)
+    assert counts["urls"] == 10
+    assert counts["os_indicators"] == 1
+    assert counts["url_groups"] == 0  # Table does not exist
+
+    purge_evidence_data(evidence_conn, 1, ["urls"])
+    assert get_evidence_table_counts(evidence_conn, 1)["urls"] == 0
+
+
+def test_replace_tables_are_counted_directly(evidence_conn):
+    assert "hsts_entries" not in COUNTED_TABLES
+    ensure_artifact_counters(evidence_conn)
+    evidence_conn.execute(
+        "INSERT INTO hsts_entries (evidence_id, browser, hashed_host, run_id, source_path) "
+        "VALUES (1, 'chrome', 'h', 'r', 'p')"
+    )
+    evidence_conn.commit()
+
+    assert _mark(evidence_conn, "hsts_entries") is None
+    assert get_artifact_counts(evidence_conn, 1, ["hsts_entries"]) == {"hsts_entries": 1}
+
+
+def test_reconcile_reports_and_fixes_drift(evidence_conn):
+    _insert_urls(evidence_conn, 1, 6)
+    ensure_artifact_counters(evidence_conn)
+    evidence_conn.execute(
+        "UPDATE artifact_counts SET row_count = 2 WHERE table_name = 'urls' AND evidence_id = 1"
+    )
+    evidence_conn.execute(
+        "INSERT INTO artifact_counts (table_name, evidence_id, row_count) VALUES ('urls', 9, 4)"
+    )
+    evidence_conn.commit()
+
+    drift = reconcile_artifact_counts(evidence_conn, fix=False)
+    assert [(d.table, d.evidence_id, d.stored, d.actual) for d in drift] == [
+        ("urls", 1, 2, 6),
+        ("urls", 9, 4, 0),
+    ]
+    assert _stored(evidence_conn, "urls", 1) == 2
+
+    assert len(reconcile_artifact_counts(evidence_conn)) == 2
+    assert get_artifact_counts(evidence_conn, 1, ["urls"]) == {"urls": 6}
+    assert reconcile_artifact_counts(evidence_conn) == []
+
+
+def test_missing_triggers_rebuild_counters(evidence_conn):
+    _insert_urls(evidence_conn, 1, 3)
+    ensure_artifact_counters(evidence_conn)
+    evidence_conn.execute("DROP TRIGGER trg_urls_count_ad")
+    evidence_conn.execute("DELETE FROM urls WHERE url LIKE '%/0'")
+    evidence_conn.commit()
+
+    assert ensure_artifact_counters(evidence_conn) == ["urls"]
+    assert _stored(evidence_conn, "urls", 1) == 2
+
+
+def test_bulk_ingest_folds_loaded_rows(evidence_conn):
+    ensure_artifact_counters(evidence_conn)
+    _insert_urls(evidence_conn, 1, 3)
+
+    with bulk_ingest(evidence_conn, ("urls",)):
+        _insert_urls(evidence_conn, 1, 50, offset=10)
+        assert get_artifact_counts(evidence_conn, 1, ["urls"]) == {"urls": 53}
+
+    assert _stored(evidence_conn, "urls", 1) == 53
+    assert _mark(evidence_conn, "urls") == 53
+    assert reconcile_artifact_counts(evidence_conn) == []
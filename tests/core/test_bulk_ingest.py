@@ -0,0 +1,169 @@
+"""Tests for bulk ingest mode (deferred index builds) on evidence databases."""
+import sqlite3
+import time
+from contextlib import nullcontext
+
+import pytest
+
+from core.database import (
+    EVIDENCE_MIGRATIONS_DIR,
+    DatabaseManager,
+    bulk_ingest,
+    defer_indexes,
+    migrate,
+)
+
+
+def _indexes(conn, table):
+    return {
+        row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (table,),
+        )
+    }
+
+
+@pytest.fixture
+def evidence_conn(tmp_path):
+    conn = sqlite3.connect(tmp_path / "evidence.sqlite")
+    conn.execute("PRAGMA journal_mode = WAL")
+    migrate(conn, migrations_dir=EVIDENCE_MIGRATIONS_DIR)
+    yield conn
+    conn.close()
+
+
+def _url_rows(count, offset=0):
+    return [
+        (1, f"https://host{i % 500}.example.com/p/{i}", f"host{i % 500}.example.com", "https",
+         "bench", f"2024-01-{i % 28 + 1:02d}T00:00:00", "run1")
+        for i in range(offset, offset + count)
+    ]
+
+
+def _insert_urls(conn, rows):
+    conn.executemany(
+        "INSERT INTO urls (evidence_id, url, domain, scheme, discovered_by, first_seen_utc, run_id) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+
+
+def _file_rows(count, offset=0):
+    return [
+        (1, f"/Users/u/dir{i % 1000}/file{i}.txt", f"file{i}.txt", ".txt", i, "2024-01-01T00:00:00Z", "run1")
+        for i in range(offset, offset + count)
+    ]
+
+
+def _insert_files(conn, rows):
+    conn.executemany(
+        "INSERT OR IGNORE INTO file_list "
+        "(evidence_id, file_path, file_name, extension, size_bytes, import_timestamp, run_id) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+
+
+def test_defers_non_unique_indexes_and_rebuilds(evidence_conn):
+    before = {t: _indexes(evidence_conn, t) for t in ("urls", "file_list")}
+    assert len(before["urls"]) >= 10
+    assert "idx_file_list_unique_path" in before["file_list"]
+
+    with bulk_ingest(evidence_conn) as result:
+        assert _indexes(evidence_conn, "urls") == set()
+        # The unique index is kept so INSERT OR IGNORE still deduplicates
+        assert _indexes(evidence_conn, "file_list") == {"idx_file_list_unique_path"}
+        _insert_urls(evidence_conn, _url_rows(100))
+        _insert_files(evidence_conn, _file_rows(50) + _file_rows(50))
+
+    assert {t: _indexes(evidence_conn, t) for t in ("urls", "file_list")} == before
+    assert sorted(result.deferred_indexes) == sorted((before["urls"] | before["file_list"]) - {"idx_file_list_unique_path"})
+    assert evidence_conn.execute("SELECT COUNT(*) FROM file_list").fetchone()[0] == 50
+    assert evidence_conn.execute("SELECT COUNT(*) FROM deferred_indexes").fetchone()[0] == 0
+    stats = {row[0] for row in evidence_conn.execute("SELECT tbl FROM sqlite_stat1")}
+    assert {"urls", "file_list"} <= stats
+    # Rebuilt indexes are used by the planner again
+    plan = evidence_conn.execute("EXPLAIN QUERY PLAN SELECT id FROM urls WHERE domain = 'x'").fetchall()
+    assert "idx_urls_domain" in str(plan)
+
+
+def test_connection_settings_restored(evidence_conn):
+    evidence_conn.execute("PRAGMA cache_size = -2000")
+    before = [evidence_conn.execute(f"PRAGMA {p}").fetchone()[0] for p in ("cache_size", "mmap_size", "wal_autocheckpoint")]
+
+    with bulk_ingest(evidence_conn, ("urls",)):
+        assert evidence_conn.execute("PRAGMA cache_size").fetchone()[0] < -100_000
+        assert evidence_conn.execute("PRAGMA wal_autocheckpoint").fetchone()[0] == 10_000
+
+    after = [evidence_conn.execute(f"PRAGMA {p}").fetchone()[0] for p in ("cache_size", "mmap_size", "wal_autocheckpoint")]
+    assert after == before
+
+
+def test_indexes_rebuilt_when_load_fails(evidence_conn):
+    before = _indexes(evidence_conn, "urls")
+    with pytest.raises(RuntimeError):
+        with bulk_ingest(evidence_conn, ("urls",)):
+            _insert_urls(evidence_conn, _url_rows(10))
+            raise RuntimeError("parser crashed")
+    assert _indexes(evidence_conn, "urls") == before
+
+
+def test_nested_block_leaves_rebuild_to_outer(evidence_conn):
+    with bulk_ingest(evidence_conn, ("urls",)):
+        with bulk_ingest(evidence_conn, ("urls",)) as inner:
+            pass
+        assert inner.deferred_indexes == []
+        assert _indexes(evidence_conn, "urls") == set()
+    assert _indexes(evidence_conn, "urls")
+
+
+def test_manager_restores_indexes_of_interrupted_load(tmp_path):
+    case_db = tmp_path / "CASE_surfsifter.sqlite"
+    with DatabaseManager(tmp_path, case_db_path=case_db) as manager:
+        conn = manager.get_evidence_conn(1, "E01")
+        expected = _indexes(conn, "urls")
+        db_path = manager.evidence_db_path(1, "E01")
+
+    # A load that died between the drop and the rebuild
+    conn = sqlite3.connect(db_path)
+    defer_indexes(conn, ["urls"])
+    conn.close()
+
+    with DatabaseManager(tmp_path, case_db_path=case_db) as manager:
+        conn = manager.get_evidence_conn(1, "E01")
+        assert _indexes(conn, "urls") == expected
+
+        with manager.evidence_bulk_ingest(1, "E01", ("urls",)):
+            assert _indexes(conn, "urls") == set()
+        assert _indexes(conn, "urls") == expected
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("table,insert,make_rows", [
+    ("urls", _insert_urls, _url_rows),
+    ("file_list", _insert_files, _file_rows),
+])
+def test_bulk_ingest_throughput(tmp_path, table, insert, make_rows):
+    """Ingest rate with and without bulk ingest mode (includes the index rebuild)."""
+    total, batch = 300_000, 10_000
+    rates = {}
+    for bulk in (False, True):
+        conn = sqlite3.connect(tmp_path / f"evidence_{bulk}.sqlite")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        migrate(conn, migrations_dir=EVIDENCE_MIGRATIONS_DIR)
+        started = time.perf_counter()
+        with bulk_ingest(conn, (table,)) if bulk else nullcontext():
+            for offset in range(0, total, batch):
+                insert(conn, make_rows(batch, offset))
+        rates[bulk] = total / (time.perf_counter() - started)
+        assert conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == total
+        conn.close()
+
+    print(
+        f"\n{table}: {total:,} rows - default {rates[False]:,.0f} rows/s, "
+        f"bulk ingest {rates[True]:,.0f} rows/s ({rates[True] / rates[False]:.1f}x)"
+    )
+    assert rates[True] > rates[False]
@@ -0,0 +1,172 @@
+"""
+Tests for bulk tag operations (set-based SQL helpers and TagQueryMixin APIs).
+"""
+import sqlite3
+
+import pytest
+
+from app.data.case_data import CaseDataAccess
+from core.database import init_db
+from core.database.helpers import tags as tag_helpers
+
+
+@pytest.fixture
+def dao(tmp_path):
+    """CaseDataAccess with an evidence DB holding 250 URLs."""
+    db_path = tmp_path / "test_surfsifter.sqlite"
+    conn = init_db(tmp_path, db_path)
+    conn.execute("INSERT INTO cases (id, case_id, title, created_at_utc) VALUES (1, 'TEST', 'Test Case', datetime('now'))")
+    conn.execute("INSERT INTO evidences (id, case_id, label, source_path, added_at_utc) VALUES (1, 1, 'ev', '/tmp/test', datetime('now'))")
+    conn.commit()
+    conn.close()
+
+    dao = CaseDataAccess(tmp_path, db_path=db_path)
+    with dao._use_evidence_conn(1):
+        with dao._connect() as ev_conn:
+            ev_conn.executemany(
+                "INSERT INTO urls (id, evidence_id, url, domain, discovered_by) VALUES (?, 1, ?, ?, 'test')",
+                [
+                    (i, f"https://{'casino' if i % 5 == 0 else 'news'}.example/{i}",
+                     "casino.example" if i % 5 == 0 else "news.example")
+                    for i in range(1, 251)
+                ],
+            )
+    yield dao
+    dao.close()
+
+
+def _tag_count(dao, name):
+    tag = dao.get_tag(1, name)
+    return tag["usage_count"] if tag else 0
+
+
+def test_tag_artifacts_inserts_all_and_updates_usage(dao):
+    result = dao.tag_artifacts(1, "Bulk", "url", range(1, 201))
+
+    assert result == {"tag_id": result["tag_id"], "changed": 200, "cancelled": False}
+    assert _tag_count(dao, "Bulk") == 200
+    assert dao.get_artifacts_by_tag(1, "Bulk")["url"] == list(range(1, 201))
+
+
+def test_tag_artifacts_skips_existing_and_duplicates(dao):
+    dao.tag_artifact(1, "Bulk", "url", 5)
+
+    result = dao.tag_artifacts(1, "Bulk", "url", [5, 6, 6, 7])
+
+    assert result["changed"] == 2
+    assert _tag_count(dao, "Bulk") == 3
+
+
+def test_untag_artifacts(dao):
+    dao.tag_artifacts(1, "Bulk", "url", range(1, 101))
+
+    result = dao.untag_artifacts(1, "Bulk", "url", range(1, 51))
+
+    assert result["changed"] == 50
+    assert _tag_count(dao, "Bulk") == 50
+    assert dao.untag_artifacts(1, "Missing", "url", [1])["tag_id"] is None
+
+
+def test_progress_reported_per_chunk(dao, monkeypatch):
+    monkeypatch.setattr(tag_helpers, "BULK_TAG_CHUNK_SIZE", 100)
+    seen = []
+
+    with dao._use_evidence_conn(1):
+        conn = dao._connect()
+        with conn:
+            tag_id = tag_helpers.get_or_create_tag(conn, 1, "Chunked")
+            tag_helpers.insert_tag_associations_bulk(
+                conn, tag_id, 1, "url", range(1, 251),
+                chunk_size=100,
+                progress_callback=lambda done, total: seen.append((done, total)),
+            )
+
+    assert seen == [(100, 250), (200, 250), (250, 250)]
+
+
+def test_cancel_rolls_back_whole_operation(dao):
+    calls = {"n": 0}
+
+    def cancel_after_first_chunk():
+        calls["n"] += 1
+        return calls["n"] > 1
+
+    with dao._use_evidence_conn(1):
+        conn = dao._connect()
+        with conn:
+            tag_id = tag_helpers.get_or_create_tag(conn, 1, "Cancelled")
+        with pytest.raises(tag_helpers.BulkTagCancelled):
+            with conn:
+                tag_helpers.insert_tag_associations_bulk(
+                    conn, tag_id, 1, "url", range(1, 251),
+                    chunk_size=100, cancel_check=cancel_after_first_chunk,
+                )
+
+    assert _tag_count(dao, "Cancelled") == 0
+
+    result = dao.tag_artifacts(1, "Cancelled", "url", range(1, 251), cancel_check=lambda: True)
+    assert result["cancelled"] is True
+    assert result["changed"] == 0
+    assert _tag_count(dao, "Cancelled") == 0
+
+
+def test_tag_and_untag_where_predicate(dao):
+    result = dao.tag_artifacts_where(1, "Casino", "url", "urls", "a.domain = ?", ["casino.example"])
+
+    assert result["changed"] == 50
+    assert _tag_count(dao, "Casino") == 50
+
+    # Re-running is idempotent
+    assert dao.tag_artifacts_where(1, "Casino", "url", "urls", "a.domain = ?", ["casino.example"])["changed"] == 0
+
+    removed = dao.untag_artifacts_where(1, "Casino", "url", "urls", "a.id <= ?", [100])
+    assert removed["changed"] == 20
+    assert _tag_count(dao, "Casino") == 30
+
+
+def test_tag_where_cancel_before_statement(dao):
+    result = dao.tag_artifacts_where(1, "Stop", "url", "urls", "1", cancel_check=lambda: True)
+
+    assert result["cancelled"] is True
+    assert _tag_count(dao, "Stop") == 0
+
+
+def test_tag_where_cancel_interrupts_running_statement(dao, monkeypatch):
+    monkeypatch.setattr(tag_helpers, "_CANCEL_CHECK_OPS", 50)
+    calls = {"n": 0}
+
+    def cancel_once_running():
+        calls["n"] += 1
+        return calls["n"] > 1
+
+    result = dao.tag_artifacts_where(1, "Stop", "url", "urls", "1", cancel_check=cancel_once_running)
+
+    assert result["cancelled"] is True
+    assert calls["n"] > 1
+    assert _tag_count(dao, "Stop") == 0
+
+
+def test_tag_where_rejects_bad_table_name(dao):
+    with pytest.raises(ValueError):
+        dao.tag_artifacts_where(1, "Bad", "url", "urls; DROP TABLE urls", "1")
+
+
+def test_get_tags_for_artifacts(dao):
+    dao.tag_artifacts(1, "A", "url", [1, 2])
+    dao.tag_artifacts(1, "B", "url", [3])
+    dao.tag_artifacts(1, "C", "url", [200])
+
+    names = [t["name"] for t in dao.get_tags_for_artifacts(1, "url", [1, 2, 3])]
+
+    assert names == ["A", "B"]
+
+
+def test_tag_cache_invalidated_once_per_bulk_call(dao, monkeypatch):
+    dao.create_tag(1, "Cached")
+    calls = []
+    original = dao._invalidate_tag_cache
+    monkeypatch.setattr(dao, "_invalidate_tag_cache", lambda ev: (calls.append(ev), original(ev)))
+
+    dao.tag_artifacts(1, "Cached", "url", range(1, 251))
+
+    assert calls == [1]
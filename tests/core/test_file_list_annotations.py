@@ -0,0 +1,124 @@
+"""
+Tests for the file_list_annotations side table (_ensure_file_list_annotations) that keeps
+pre-aggregated tags/matches per file_list row in sync via triggers.
+"""
+import sqlite3
+
+import pytest
+
+from core.database import DatabaseManager
+
+
+@pytest.fixture
+def evidence_conn(tmp_path):
+    case_path = tmp_path / "case"
+    case_path.mkdir()
+    case_db_path = case_path / "CASE-001_surfsifter.sqlite"
+    case_conn = sqlite3.connect(case_db_path)
+    case_conn.execute(
+        "CREATE TABLE evidences (id INTEGER PRIMARY KEY, label TEXT NOT NULL, source_path TEXT NOT NULL)"
+    )
+    case_conn.execute("INSERT INTO evidences (id, label, source_path) VALUES (1, 'EV-001', '/test.E01')")
+    case_conn.commit()
+    case_conn.close()
+
+    manager = DatabaseManager(case_path, case_db_path=case_db_path)
+    conn = manager.get_evidence_conn(1, label="EV-001")
+    conn.executemany(
+        """
+        INSERT INTO file_list (id, evidence_id, file_path, file_name, import_timestamp)
+        VALUES (?, 1, ?, ?, '2025-01-01T00:00:00Z')
+        """,
+        [(i, f"/dir/file{i}.exe", f"file{i}.exe") for i in range(1, 4)],
+    )
+    conn.commit()
+    yield conn
+    manager.close_all()
+
+
+def _annotation(conn, file_id):
+    row = conn.execute(
+        "SELECT matches, tags FROM file_list_annotations WHERE file_list_id = ?", (file_id,)
+    ).fetchone()
+    return tuple(row) if row else None
+
+
+def _add_match(conn, file_id, list_name):
+    conn.execute(
+        """
+        INSERT INTO file_list_matches (evidence_id, file_list_id, reference_list_name, match_type, matched_value, matched_at)
+        VALUES (1, ?, ?, 'filename', 'x', '2025-01-01T00:00:00Z')
+        """,
+        (file_id, list_name),
+    )
+
+
+def _add_tag(conn, file_id, tag_name):
+    conn.execute(
+        "INSERT OR IGNORE INTO tags (evidence_id, name, name_normalized) VALUES (1, ?, ?)",
+        (tag_name, tag_name.lower()),
+    )
+    tag_id = conn.execute("SELECT id FROM tags WHERE name = ?", (tag_name,)).fetchone()[0]
+    conn.execute(
+        "INSERT INTO tag_associations (tag_id, evidence_id, artifact_type, artifact_id) VALUES (?, 1, 'file_list', ?)",
+        (tag_id, file_id),
+    )
+    return tag_id
+
+
+def test_match_and_tag_inserts_populate_side_table(evidence_conn):
+    assert _annotation(evidence_conn, 1) is None
+
+    _add_match(evidence_conn, 1, "malware")
+    _add_match(evidence_conn, 1, "tools")
+    _add_tag(evidence_conn, 1, "Suspicious")
+
+    matches, tags = _annotation(evidence_conn, 1)
+    assert sorted(matches.split(",")) == ["malware", "tools"]
+    assert tags == "Suspicious"
+    assert _annotation(evidence_conn, 2) is None
+
+
+def test_other_artifact_types_are_ignored(evidence_conn):
+    evidence_conn.execute("INSERT INTO tags (evidence_id, name, name_normalized) VALUES (1, 'U', 'u')")
+    evidence_conn.execute(
+        "INSERT INTO tag_associations (tag_id, evidence_id, artifact_type, artifact_id) VALUES (1, 1, 'url', 1)"
+    )
+    assert _annotation(evidence_conn, 1) is None
+
+
+def test_removals_and_renames_keep_side_table_exact(evidence_conn):
+    _add_match(evidence_conn, 2, "malware")
+    tag_id = _add_tag(evidence_conn, 2, "Old")
+
+    evidence_conn.execute("UPDATE tags SET name = 'New', name_normalized = 'new' WHERE id = ?", (tag_id,))
+    assert _annotation(evidence_conn, 2) == ("malware", "New")
+
+    evidence_conn.execute("DELETE FROM tag_associations WHERE artifact_id = 2")
+    assert _annotation(evidence_conn, 2) == ("malware", None)
+
+    evidence_conn.execute("DELETE FROM file_list_matches WHERE file_list_id = 2")
+    assert _annotation(evidence_conn, 2) is None
+
+
+def test_deleting_file_and_tag_cleans_up(evidence_conn):
+    _add_match(evidence_conn, 3, "malware")
+    tag_id = _add_tag(evidence_conn, 1, "Gone")
+
+    evidence_conn.execute("DELETE FROM tags WHERE id = ?", (tag_id,))
+    assert _annotation(evidence_conn, 1) is None
+
+    evidence_conn.execute("DELETE FROM file_list WHERE id = 3")
+    assert _annotation(evidence_conn, 3) is None
+    assert evidence_conn.execute("SELECT COUNT(*) FROM file_list_annotations").fetchone()[0] == 0
+
+
+def test_ensure_skips_partial_legacy_schema():
+    from core.database.manager import _ensure_file_list_annotations
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE file_list (id INTEGER PRIMARY KEY, evidence_id INTEGER, file_path TEXT)")
+    _ensure_file_list_annotations(conn)
+    tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    assert "file_list_annotations" not in tables
+    conn.close()
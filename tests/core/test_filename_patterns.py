@@ -0,0 +1,94 @@
+"""Tests for compiled file list patterns (core.matching.filename_patterns)."""
+import fnmatch
+import random
+import re
+
+import pytest
+
+from core.matching import CompiledFileList
+
+
+def _first_wildcard(patterns, name):
+    """Reference: the per-pattern fnmatch loop CompiledFileList replaces."""
+    for pattern in patterns:
+        if fnmatch.fnmatch(name.lower(), pattern.lower()):
+            return pattern
+    return None
+
+
+def _first_regex(patterns, name):
+    for pattern in patterns:
+        if re.search(pattern, name, re.IGNORECASE):
+            return pattern
+    return None
+
+
+def test_wildcard_kinds_match_like_fnmatch():
+    patterns = [
+        "DeepFreeze.exe",    # exact
+        "*.tmp",             # suffix
+        "Frz*",              # prefix
+        "*freeze*.exe",      # glob
+        "setup?.msi",        # glob
+        "[ab]*.log",         # glob
+        "*",                 # matches everything
+    ]
+    compiled = CompiledFileList(patterns)
+
+    assert compiled.match("deepfreeze.EXE") == "DeepFreeze.exe"
+    assert compiled.match("cache.TMP") == "*.tmp"
+    assert compiled.match("FrzState2020.exe") == "Frz*"
+    assert compiled.match("myfreezer.exe") == "*freeze*.exe"
+    assert compiled.match("setup1.msi") == "setup?.msi"
+    assert compiled.match("b.log") == "[ab]*.log"
+    assert compiled.match("other") == "*"
+    assert CompiledFileList(patterns[:-1]).match("other") is None
+
+
+def test_first_pattern_in_list_order_wins():
+    compiled = CompiledFileList(["*.exe", "deepfreeze.exe", "deep*"])
+    assert compiled.match("deepfreeze.exe") == "*.exe"
+
+    compiled = CompiledFileList(["*free*.exe", "deep*", "deepfreeze.exe"])
+    assert compiled.match("deepfreeze.exe") == "*free*.exe"
+
+
+def test_glob_must_match_whole_name():
+    compiled = CompiledFileList(["a*b"])
+    assert compiled.match("xab") is None
+    assert compiled.match("ab") == "a*b"
+    assert compiled.match("abx") is None
+
+
+def test_random_wildcard_lists_agree_with_fnmatch():
+    rng = random.Random(49)
+    alphabet = "ab.x]"
+    parts = ["*", "?", "[ab]", "[!a]", "]", "a", "b", ".", "x", "ab"]
+    patterns = ["".join(rng.choice(parts) for _ in range(rng.randint(1, 4))) for _ in range(300)]
+    names = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 6))) for _ in range(2000)]
+    compiled = CompiledFileList(patterns)
+
+    for name in names:
+        assert compiled.match(name) == _first_wildcard(patterns, name), name
+
+
+def test_regex_lists_agree_with_search():
+    patterns = [
+        "^.*slots\\d+\\.exe$",
+        "(ab)\\1",           # backreference: tested on its own
+        "[",                 # invalid: skipped
+        "poker",
+        "(?i)casino",        # global flag: list cannot be combined
+    ]
+    valid = [p for p in patterns if p != "["]
+    names = ["slots99.EXE", "xababx", "PokerStars.exe", "casino.dll", "notes.txt", "ab"]
+
+    for compiled in (CompiledFileList(patterns, is_regex=True), CompiledFileList(patterns[:4], is_regex=True)):
+        for name in names:
+            expected = _first_regex([p for p in valid if p in compiled.patterns], name)
+            assert compiled.match(name) == expected, name
+
+
+@pytest.mark.parametrize("is_regex", [False, True])
+def test_empty_list(is_regex):
+    assert CompiledFileList([], is_regex).match("a.exe") is None
@@ -0,0 +1,171 @@
+"""
+Tests for the optional FTS5 trigram search index (core.database.helpers.fts).
+
+The index must return exactly the rows a plain ``LIKE '%term%'`` returns and
+stay in sync with inserts, updates and deletes once built.
+"""
+import sqlite3
+
+import pytest
+
+from core.database import DatabaseManager
+from core.database.helpers import (
+    build_fts_index,
+    drop_fts_index,
+    ensure_fts_indexes,
+    fts_like_any_condition,
+    fts_like_condition,
+    fts_trigram_available,
+    get_browser_history,
+    get_local_storage,
+    has_fts_index,
+    insert_browser_history,
+    insert_urls,
+)
+from tests.fixtures.helpers import prepare_case_with_data
+
+URLS = [
+    "https://example.com/login",
+    "https://EXAMPLE.org/search?q=forensics",
+    "http://tracker.test/pixel.gif",
+    "https://mail.example.net/inbox",
+    "ftp://files.test/ab",
+]
+
+
+@pytest.fixture
+def evidence_conn(tmp_path):
+    case_path = tmp_path / "case"
+    case_path.mkdir()
+    case_db_path = case_path / "CASE-001_surfsifter.sqlite"
+    case_conn = sqlite3.connect(case_db_path)
+    case_conn.execute(
+        "CREATE TABLE evidences (id INTEGER PRIMARY KEY, label TEXT NOT NULL, source_path TEXT NOT NULL)"
+    )
+    case_conn.execute("INSERT INTO evidences (id, label, source_path) VALUES (1, 'EV-001', '/test.E01')")
+    case_conn.commit()
+    case_conn.close()
+
+    manager = DatabaseManager(case_path, case_db_path=case_db_path)
+    conn = manager.get_evidence_conn(1, label="EV-001")
+    if not fts_trigram_available(conn):
+        manager.close_all()
+        pytest.skip("SQLite build lacks FTS5 trigram tokenizer")
+    insert_urls(conn, 1, [{"url": u, "discovered_by": "test"} for u in URLS])
+    yield conn
+    manager.close_all()
+
+
+def _like_ids(conn, pattern):
+    return sorted(r[0] for r in conn.execute("SELECT id FROM urls WHERE url LIKE ?", (pattern,)))
+
+
+def _fts_ids(conn, pattern):
+    condition = fts_like_condition(conn, "urls", "url", pattern)
+    assert condition is not None
+    return sorted(r[0] for r in conn.execute(f"SELECT id FROM urls WHERE {condition}", (pattern,)))
+
+
+def test_no_index_falls_back_to_like(evidence_conn):
+    assert not has_fts_index(evidence_conn, "urls")
+    assert fts_like_condition(evidence_conn, "urls", "url", "%example%") is None
+
+
+def test_index_matches_like_semantics(evidence_conn):
+    assert ensure_fts_indexes(evidence_conn, ["urls"]) == ["urls"]
+    assert has_fts_index(evidence_conn, "urls")
+
+    for pattern in ["%example%", "%EXAMPLE%", "%.test/%", "%search?q=for%", "https://%", "%ex_mple%", "%nothing-here%"]:
+        assert _fts_ids(evidence_conn, pattern) == _like_ids(evidence_conn, pattern), pattern
+
+
+def test_short_or_wildcard_patterns_use_plain_like(evidence_conn):
+    build_fts_index(evidence_conn, "urls")
+    assert fts_like_condition(evidence_conn, "urls", "url", "%ab%") is None
+    assert fts_like_condition(evidence_conn, "urls", "url", "%") is None
+    assert fts_like_condition(evidence_conn, "urls", "domain", "%example%") is None
+
+
+def test_triggers_keep_index_in_sync(evidence_conn):
+    build_fts_index(evidence_conn, "urls")
+
+    insert_urls(evidence_conn, 1, [{"url": "https://newsite.example/after-build", "discovered_by": "test"}])
+    assert _fts_ids(evidence_conn, "%after-build%") == _like_ids(evidence_conn, "%after-build%") != []
+
+    evidence_conn.execute("UPDATE urls SET url = 'https://renamed.test/' WHERE url LIKE '%login%'")
+    evidence_conn.execute("DELETE FROM urls WHERE url LIKE '%tracker%'")
+    evidence_conn.commit()
+
+    assert _fts_ids(evidence_conn, "%login%") == []
+    assert _fts_ids(evidence_conn, "%tracker%") == []
+    assert _fts_ids(evidence_conn, "%renamed%") == _like_ids(evidence_conn, "%renamed%") != []
+    evidence_conn.execute("INSERT INTO urls_fts(urls_fts) VALUES ('integrity-check')")
+
+
+def test_drop_and_rebuild(evidence_conn):
+    build_fts_index(evidence_conn, "urls")
+    drop_fts_index(evidence_conn, "urls")
+    assert not has_fts_index(evidence_conn, "urls")
+    assert ensure_fts_indexes(evidence_conn, ["urls"]) == ["urls"]
+    assert ensure_fts_indexes(evidence_conn, ["urls"]) == []
+
+
+def test_unknown_table_rejected(evidence_conn):
+    with pytest.raises(ValueError):
+        build_fts_index(evidence_conn, "cookies")
+
+
+def test_get_rows_routes_title_and_value_filters(evidence_conn):
+    insert_browser_history(
+        evidence_conn,
+        1,
+        [
+            {"url": "https://a.test/", "title": "Quarterly Report", "browser": "chrome", "ts_utc": "2024-01-01T00:00:00"},
+            {"url": "https://b.test/", "title": "Inbox", "browser": "chrome", "ts_utc": "2024-01-02T00:00:00"},
+        ],
+    )
+    evidence_conn.executemany(
+        """
+        INSERT INTO local_storage (evidence_id, run_id, browser, origin, key, value, source_path)
+        VALUES (1, 'r1', 'chrome', ?, ?, ?, 'Local Storage/leveldb')
+        """,
+        [("https://a.test", "token", "secret-session-value"), ("https://b.test", "theme", "dark")],
+    )
+    evidence_conn.commit()
+
+    before = [r["title"] for r in get_browser_history(evidence_conn, 1, title_filter="report")]
+    ensure_fts_indexes(evidence_conn)
+    assert has_fts_index(evidence_conn, "browser_history")
+    assert has_fts_index(evidence_conn, "local_storage")
+    assert [r["title"] for r in get_browser_history(evidence_conn, 1, title_filter="report")] == before == ["Quarterly Report"]
+    assert [r["key"] for r in get_local_storage(evidence_conn, 1, value="session")] == ["token"]
+
+
+def test_file_list_search_covers_name_and_path(evidence_conn):
+    evidence_conn.executemany(
+        """
+        INSERT INTO file_list (evidence_id, file_path, file_name, import_timestamp)
+        VALUES (1, ?, ?, '2025-01-01T00:00:00Z')
+        """,
+        [("/Users/bob/Desktop/notes.txt", "notes.txt"), ("/Windows/System32/cmd.exe", "cmd.exe")],
+    )
+    evidence_conn.commit()
+    build_fts_index(evidence_conn, "file_list")
+
+    pattern = "%desktop%"
+    condition = fts_like_any_condition(evidence_conn, "file_list", ("file_name", "file_path"), pattern, id_expr="fl.id")
+    rows = evidence_conn.execute(
+        f"SELECT fl.file_name FROM file_list fl WHERE fl.evidence_id = 1 AND {condition}", (pattern, pattern)
+    ).fetchall()
+    assert [r[0] for r in rows] == ["notes.txt"]
+
+
+def test_case_data_url_search_uses_index(tmp_path):
+    case_data, evidence_id = prepare_case_with_data(tmp_path)
+    assert case_data.iter_urls(evidence_id, url_like="%example%")
+    before = case_data.count_urls(evidence_id, url_like="%example%")
+
+    assert "urls" in case_data.ensure_search_index(evidence_id)
+    assert case_data.has_search_index(evidence_id, "urls")
+    assert case_data.count_urls(evidence_id, url_like="%example%") == before == 1
+    assert case_data.iter_urls(evidence_id, url_like="%missing-term%") == []
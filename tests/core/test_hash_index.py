@@ -0,0 +1,118 @@
+"""Tests for the sorted hash index (core.matching.hash_index) and its use in hash_db."""
+import hashlib
+import random
+
+import pytest
+
+from core.matching import (
+    HashIndex,
+    HashIndexBuilder,
+    import_hash_list,
+    lookup_hash,
+    lookup_hashes,
+)
+from core.matching import hash_index
+
+
+def _md5(n):
+    return hashlib.md5(str(n).encode()).digest()
+
+
+def _build(path, records, **kwargs):
+    with HashIndexBuilder(path, "md5", **kwargs) as builder:
+        for digest, list_id in records:
+            builder.add(digest, list_id)
+        builder.write()
+        builder.commit()
+
+
+def test_external_merge_builds_sorted_deduplicated_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(hash_index, "MAX_MERGE_FANIN", 3)  # Force several merge passes
+    path = tmp_path / "h.md5.idx"
+    records = [(_md5(n % 40), 1 + n % 3) for n in range(100)]
+    random.Random(50).shuffle(records)
+
+    _build(path, records, run_records=7)
+
+    with HashIndex(path) as index:
+        stored = list(index.iter_records())
+        assert stored == sorted(set(records))
+        assert len(index) == len(set(records))
+        assert index.lookup(_md5(5)) == sorted({1 + n % 3 for n in range(100) if n % 40 == 5})
+        assert index.lookup(_md5(1000)) == []
+        assert index.lookup(b"short") == []
+    assert not list(tmp_path.glob("*.run")) and not list(tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.parametrize("bloom_bits", [0, 8])
+def test_match_sorted_agrees_with_lookup(tmp_path, bloom_bits):
+    path = tmp_path / "h.md5.idx"
+    _build(path, [(_md5(n), n % 5) for n in range(0, 3000, 3)], bloom_bits_per_entry=bloom_bits)
+    queries = sorted(_md5(n) for n in range(0, 3000, 2))
+
+    with HashIndex(path) as index:
+        merged = list(index.match_sorted(queries))
+        expected = [(q, list_id) for q in queries for list_id in index.lookup(q)]
+
+    assert merged == expected
+    assert len({digest for digest, _ in merged}) == len(range(0, 3000, 6))
+
+
+def _write_list(path, lines):
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+MD5_A = "d41d8cd98f00b204e9800998ecf8427e"
+MD5_B = "098f6bcd4621d373cade4e832627b4f6"
+SHA_C = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+
+
+def test_import_indexes_lists_and_lookups_use_it(tmp_path):
+    db_path = tmp_path / "hash_database.sqlite"
+    import_hash_list(_write_list(tmp_path / "bad.txt", [MD5_A + ", known bad", SHA_C]), db_path)
+    import_hash_list(_write_list(tmp_path / "nsrl.txt", [MD5_A, MD5_B]), db_path, store_entries=False)
+
+    assert len(list(db_path.with_name("hash_database.index").glob("*.idx"))) == 4
+
+    matches = sorted(lookup_hash(db_path, md5=MD5_A.upper()), key=lambda m: m["list_name"])
+    assert [(m["list_name"], m["note"]) for m in matches] == [("bad", "known bad"), ("nsrl", None)]
+    assert [m["list_name"] for m in lookup_hash(db_path, sha256=SHA_C)] == ["bad"]
+    assert lookup_hash(db_path, md5="0" * 32) == []
+
+    bulk = lookup_hashes(db_path, md5s=[MD5_B, "0" * 32, "not a hash"], sha256s=[SHA_C])
+    assert sorted(bulk) == [MD5_B, SHA_C]
+    assert bulk[MD5_B][0]["hash_md5"] == MD5_B and bulk[MD5_B][0]["list_name"] == "nsrl"
+
+
+def _index_files(db_path):
+    return sorted(p.name for p in db_path.with_name(f"{db_path.stem}.index").glob("*.idx"))
+
+
+def test_updated_list_gets_new_index_files(tmp_path):
+    db_path = tmp_path / "hash_database.sqlite"
+    source = _write_list(tmp_path / "bad.txt", [MD5_A])
+    import_hash_list(source, db_path)
+    assert lookup_hash(db_path, md5=MD5_A)  # Opens (and caches) the first version
+    old_files = _index_files(db_path)
+    _write_list(source, [MD5_B])
+
+    assert import_hash_list(source, db_path) == 1
+
+    assert lookup_hash(db_path, md5=MD5_A) == []
+    assert [m["list_name"] for m in lookup_hash(db_path, md5=MD5_B)] == ["bad"]
+    new_files = _index_files(db_path)
+    assert len(new_files) == 2 and not set(old_files) & set(new_files)
+
+
+def test_list_without_index_files_is_queried_in_database(tmp_path):
+    db_path = tmp_path / "hash_database.sqlite"
+    import_hash_list(_write_list(tmp_path / "old.txt", [MD5_A + " legacy"]), db_path)
+    for path in db_path.with_name("hash_database.index").glob("*.idx"):
+        path.unlink()  # Imported before index files existed
+    import_hash_list(_write_list(tmp_path / "new.txt", [MD5_B]), db_path)
+
+    bulk = lookup_hashes(db_path, md5s=[MD5_A, MD5_B])
+
+    assert [(m["list_name"], m["note"]) for m in bulk[MD5_A]] == [("old", "legacy")]
+    assert [m["list_name"] for m in bulk[MD5_B]] == ["new"]
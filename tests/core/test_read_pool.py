@@ -0,0 +1,161 @@
+"""Tests for the read-only connection pool and query instrumentation."""
+import sqlite3
+import threading
+
+import pytest
+
+from core.database import (
+    DatabaseManager,
+    QueryInstrumentation,
+    ReadConnectionPool,
+    open_read_connection,
+)
+from core.database import query_stats
+from core.database.query_stats import full_table_scans, normalize_sql
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "data.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, kind TEXT)")
+    conn.execute("CREATE INDEX idx_items_kind ON items(kind)")
+    conn.executemany(
+        "INSERT INTO items (name, kind) VALUES (?, ?)",
+        [(f"item{i}", f"k{i % 10}") for i in range(200)],
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def instrumentation(monkeypatch):
+    inst = QueryInstrumentation(slow_threshold=0.0)
+    monkeypatch.setattr(query_stats, "_instance", inst)
+    return inst
+
+
+def test_read_connection_rejects_writes(db_path):
+    conn = open_read_connection(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 200
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO items (name, kind) VALUES ('x', 'y')")
+        assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+    finally:
+        conn.close()
+
+
+def test_read_connection_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        open_read_connection(tmp_path / "missing.sqlite")
+
+
+def test_pool_reuses_idle_connections(db_path):
+    pool = ReadConnectionPool(max_idle=2)
+    with pool.connection(db_path) as first:
+        pass
+    with pool.connection(db_path) as second:
+        assert second is first
+        with pool.connection(db_path) as nested:
+            assert nested is not first
+    assert pool.idle_count(db_path) == 2
+    pool.close_all()
+    assert pool.idle_count(db_path) == 0
+
+
+def test_pool_sees_committed_writes(db_path):
+    pool = ReadConnectionPool()
+    with pool.connection(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 200
+
+    writer = sqlite3.connect(db_path)
+    writer.execute("INSERT INTO items (name, kind) VALUES ('new', 'k0')")
+    writer.commit()
+    writer.close()
+
+    with pool.connection(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 201
+    pool.close_all()
+
+
+def test_instrumentation_records_latency_and_plan(db_path, instrumentation):
+    pool = ReadConnectionPool()
+    with pool.connection(db_path) as conn:
+        for kind in ("k1", "k2", "k3"):
+            conn.execute("SELECT * FROM items WHERE kind = ?", (kind,)).fetchall()
+        conn.execute("SELECT * FROM items WHERE name LIKE ?", ("%5%",)).fetchall()
+    pool.close_all()
+
+    stats = {s.sql: s for s in instrumentation.snapshot()}
+    indexed = stats["SELECT * FROM items WHERE kind = ?"]
+    assert indexed.calls == 3
+    assert sum(indexed.histogram) == 3
+    assert indexed.database == "data.sqlite"
+    assert indexed.plan and not indexed.full_scans
+
+    scanned = stats["SELECT * FROM items WHERE name LIKE ?"]
+    assert scanned.full_scans == ["items"]
+
+
+def test_instrumentation_below_threshold_skips_plan(db_path, instrumentation):
+    instrumentation.slow_threshold = 60.0
+    conn = open_read_connection(db_path)
+    conn.execute("SELECT * FROM items WHERE name = ?", ("item1",)).fetchall()
+    conn.close()
+
+    (stats,) = instrumentation.snapshot()
+    assert stats.calls == 1
+    assert stats.slow_calls == 0
+    assert stats.plan is None
+
+
+def test_instrumentation_is_thread_safe(db_path, instrumentation):
+    pool = ReadConnectionPool()
+
+    def worker():
+        for _ in range(50):
+            with pool.connection(db_path) as conn:
+                conn.execute("SELECT COUNT(*) FROM items").fetchone()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    pool.close_all()
+
+    (stats,) = instrumentation.snapshot()
+    assert stats.calls == 200
+
+
+def test_normalize_sql_collapses_placeholder_lists():
+    a = normalize_sql("SELECT * FROM t\n  WHERE id IN (?, ?, ?)")
+    b = normalize_sql("SELECT * FROM t WHERE id IN (?,?)")
+    assert a == b == "SELECT * FROM t WHERE id IN (?, ...)"
+
+
+def test_full_table_scans_ignores_index_scans():
+    plan = [
+        "SCAN u",
+        "SCAN t USING INDEX idx_t",
+        "SEARCH x USING INTEGER PRIMARY KEY (rowid=?)",
+        "SCAN TABLE legacy",
+        "USE TEMP B-TREE FOR ORDER BY",
+    ]
+    assert full_table_scans(plan) == ["u", "legacy"]
+
+
+def test_manager_read_conns_use_pool(tmp_path, instrumentation):
+    mgr = DatabaseManager(tmp_path, case_db_path=tmp_path / "case_surfsifter.sqlite")
+    with mgr.read_evidence_conn(1, "EV1") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0] == 0
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM urls")
+    with mgr.read_case_conn() as conn:
+        conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+    assert mgr._read_pool.idle_count(mgr.evidence_db_path(1, "EV1")) == 1
+    mgr.close_all()
+    assert mgr._read_pool.idle_count(mgr.evidence_db_path(1, "EV1")) == 0
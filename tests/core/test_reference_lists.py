@@ -326,6 +326,28 @@ def test_match_filelist_regex(evidence_db, ref_manager):
     assert "slots99.exe" in matched_files
 
 
+def test_match_filelist_batches_and_duplicates(evidence_db, ref_manager, monkeypatch):
+    """Test that batched filename matching records the first matching pattern once."""
+    conn, evidence_id = evidence_db
+    monkeypatch.setattr(ReferenceListMatcher, "ROW_BATCH_SIZE", 2)
+
+    patterns = ["*.exe", "deepfreeze.exe", "Frz*"]
+    ref_manager.create_list("filelist", "exes", {"NAME": "Exes", "REGEX": "false"}, patterns)
+
+    matcher = ReferenceListMatcher(conn, evidence_id)
+    matcher.ref_manager = ref_manager
+    progress_calls = []
+    match_count = matcher.match_filelist("exes", progress_callback=lambda c, t: progress_calls.append((c, t)))
+
+    assert match_count == 4
+    assert matcher.match_filelist("exes") == 0
+    values = {row[0] for row in conn.execute(
+        "SELECT matched_value FROM file_list_matches WHERE reference_list_name = 'exes'"
+    )}
+    assert values == {"*.exe"}
+    assert progress_calls[-1] == (5, 5)
+
+
 def test_match_progress_callback(evidence_db, ref_manager):
     """Test progress callback during matching."""
     conn, evidence_id = evidence_db
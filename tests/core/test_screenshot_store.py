@@ -0,0 +1,140 @@
+"""Tests for the content-addressed screenshot store (core.screenshot_store)."""
+import hashlib
+import threading
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from core.database.manager import slugify_label
+from core.screenshot_store import STORE_DIRNAME, ScreenshotStore, resolve_screenshot_path
+
+
+def _png(color, size=(40, 20)):
+    buffer = BytesIO()
+    Image.new("RGB", size, color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ScreenshotStore(tmp_path)
+
+
+def _blob_files(store):
+    return sorted(
+        p.relative_to(store.root).as_posix()
+        for p in store.root.rglob("*")
+        if p.is_file() and p.name != "index.sqlite"
+    )
+
+
+def test_put_bytes_stores_hashes_dimensions_and_thumbnail(store, tmp_path):
+    data = _png("red")
+
+    blob = store.put_bytes(data, ".png", evidence_id=1)
+
+    assert blob.created
+    assert blob.sha256 == hashlib.sha256(data).hexdigest()
+    assert blob.md5 == hashlib.md5(data).hexdigest()
+    assert (blob.size_bytes, blob.width, blob.height) == (len(data), 40, 20)
+    assert blob.rel_path == f"{STORE_DIRNAME}/{blob.sha256[:2]}/{blob.sha256}.png"
+    assert (tmp_path / blob.rel_path).read_bytes() == data
+    assert (tmp_path / blob.thumb_rel_path).exists()
+    assert store.thumbnail_path(blob.sha256) == tmp_path / blob.thumb_rel_path
+
+
+def test_identical_content_is_stored_once_across_evidences(store, tmp_path):
+    data = _png("blue")
+    source = tmp_path / "upload.PNG"
+    source.write_bytes(data)
+
+    first = store.put_bytes(data, ".png", evidence_id=1)
+    second = store.put_file(source, evidence_id=2)
+    third = store.put_bytes(data, ".png", evidence_id=2)
+
+    assert first.created and not second.created and not third.created
+    assert first.rel_path == second.rel_path == third.rel_path
+    assert (second.width, second.height) == (40, 20)
+    assert len(_blob_files(store)) == 2  # One blob, one thumbnail
+    assert not list(store.root.rglob("*.part"))
+    assert store.ref_count(first.sha256) == 3
+    assert store.ref_count(first.sha256, evidence_id=2) == 2
+
+
+def test_put_file_hashes_while_copying(store, tmp_path):
+    source = tmp_path / "shot.jpg"
+    Image.new("RGB", (10, 10), "green").save(source, format="JPEG")
+    data = source.read_bytes()
+
+    blob = store.put_file(source, evidence_id=1)
+
+    assert blob.sha256 == hashlib.sha256(data).hexdigest()
+    assert blob.rel_path.endswith(".jpg")
+    assert (tmp_path / blob.rel_path).read_bytes() == data
+
+
+def test_release_removes_files_with_last_reference(store, tmp_path):
+    blob = store.put_bytes(_png("red"), ".png", evidence_id=1)
+    store.put_bytes(_png("red"), ".png", evidence_id=2)
+
+    assert store.release(blob.sha256, 1) is False
+    assert (tmp_path / blob.rel_path).exists()
+    assert store.release(blob.sha256, 2) is True
+    assert _blob_files(store) == []
+    assert store.ref_count(blob.sha256) == 0
+
+
+def test_release_evidence_keeps_shared_blobs(store, tmp_path):
+    shared = store.put_bytes(_png("red"), ".png", evidence_id=1)
+    store.put_bytes(_png("red"), ".png", evidence_id=2)
+    own = store.put_bytes(_png("white"), ".png", evidence_id=1)
+    store.put_bytes(_png("white"), ".png", evidence_id=1)
+
+    assert store.release_evidence(1) == 1
+
+    assert (tmp_path / shared.rel_path).exists()
+    assert not (tmp_path / own.rel_path).exists()
+    assert store.ref_count(shared.sha256) == 1
+    assert ScreenshotStore(tmp_path / "empty_case").release_evidence(1) == 0
+
+
+def test_release_from_other_instance_waits_for_put(store, tmp_path, monkeypatch):
+    data = _png("red")
+    blob = store.put_bytes(data, ".png", evidence_id=1)
+    other = ScreenshotStore(tmp_path)  # As created by a GUI handler
+    released = []
+    release_thread = threading.Thread(target=lambda: released.append(other.release(blob.sha256, 1)))
+    path_exists = Path.exists
+
+    def exists_then_release(path):
+        # Blob row checked, stored file about to be reused: release it now
+        if path.name.startswith(blob.sha256) and release_thread.ident is None:
+            release_thread.start()
+            release_thread.join(0.2)
+            assert release_thread.is_alive()  # Blocked until the put commits
+        return path_exists(path)
+
+    monkeypatch.setattr(Path, "exists", exists_then_release)
+    store.put_bytes(data, ".png", evidence_id=2)
+    release_thread.join(10)
+
+    assert released == [False]
+    assert (tmp_path / blob.rel_path).read_bytes() == data
+    assert store.ref_count(blob.sha256) == 1
+
+
+def test_undecodable_file_is_stored_without_dimensions(store, tmp_path):
+    blob = store.put_bytes(b"not an image", ".png", evidence_id=1)
+
+    assert (blob.width, blob.height) == (None, None)
+    assert (tmp_path / blob.rel_path).exists()
+
+
+def test_resolve_screenshot_path_store_and_legacy(tmp_path):
+    store_path = f"{STORE_DIRNAME}/ab/abcd.png"
+    assert resolve_screenshot_path(tmp_path, "Laptop", 3, store_path) == tmp_path / store_path
+
+    legacy = resolve_screenshot_path(tmp_path, "Laptop", 3, "screenshots/a.png")
+    assert legacy == tmp_path / "evidences" / slugify_label("Laptop", 3) / "screenshots" / "a.png"
@@ -7,6 +7,7 @@ Verifies:
 - Deterministic ordering
 - Configuration and environment variables
 - Performance improvements over sequential processing
+- Bounded in-flight window when streaming results (iter_batches)
 """
 from __future__ import annotations
 
@@ -14,6 +15,7 @@ import os
 import sqlite3
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
 
@@ -367,3 +369,122 @@ def test_parallel_processor_batch_timeout_calculation():
     # The batch timeout is calculated inside process_images, but we verify
     # that the default timeout is reasonable
     assert processor.timeout_per_image == 60
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    """Thread pool that records how many submitted chunks are outstanding."""
+
+    instances: list = []
+
+    def __init__(self, max_workers=None, **_pool_options):
+        # Pool initializer (worker progress queue) is for processes only
+        super().__init__(max_workers=max_workers or 2)
+        self.submitted = 0
+        self.handed_out = 0
+        self.peak = 0
+        _CountingExecutor.instances.append(self)
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted += 1
+        self.peak = max(self.peak, self.submitted - self.handed_out)
+        return super().submit(fn, *args, **kwargs)
+
+
+def _fake_chunk(image_paths, out_dir, thumb_size=(256, 256)):
+    return [
+        ImageProcessResult(path=p, rel_path=p.name, filename=p.name, md5="0" * 32)
+        for p in image_paths
+    ]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_iter_batches_bounds_in_flight_window(monkeypatch, ordered):
+    """200k streamed paths never have more than ``window`` chunks outstanding."""
+    import extractors._shared.carving.processor as processor_mod
+
+    monkeypatch.setattr(processor_mod, "ProcessPoolExecutor", _CountingExecutor)
+    monkeypatch.setattr(processor_mod, "process_image_chunk", _fake_chunk)
+    _CountingExecutor.instances.clear()
+
+    count = 200_000
+    drawn = {"n": 0}
+
+    def paths():
+        for i in range(count):
+            drawn["n"] += 1
+            yield Path(f"/carved/{i:07d}.jpg")
+
+    processor = ParallelImageProcessor(max_workers=4, chunk_size=64, max_in_flight=8)
+    batches = processor.iter_batches(paths(), Path("/carved"), ordered=ordered)
+
+    first = next(batches)
+    executor = _CountingExecutor.instances[0]
+    executor.handed_out += 1
+    # Input is consumed lazily: at most one window (plus the chunk being read) ahead
+    assert drawn["n"] <= (processor.window + 1) * processor.chunk_size
+
+    seen = len(first)
+    last_name = first[-1].filename
+    for batch in batches:
+        executor.handed_out += 1
+        assert len(batch) <= processor.chunk_size
+        if ordered:
+            assert batch[0].filename > last_name
+            last_name = batch[-1].filename
+        seen += len(batch)
+
+    assert seen == count
+    assert executor.submitted == -(-count // processor.chunk_size)
+    assert executor.peak <= processor.window
+
+
+def test_iter_batches_matches_process_images(temp_images):
+    """Streamed results in input order equal the collected, sorted results."""
+    images_dir, image_paths = temp_images
+    processor = ParallelImageProcessor(max_workers=2, enable_parallel=True, chunk_size=3)
+
+    streamed = [
+        r for batch in processor.iter_batches(iter(image_paths), images_dir) for r in batch
+    ]
+    collected = processor.process_images(list(reversed(image_paths)), images_dir)
+
+    assert [r.path for r in streamed] == image_paths
+    assert [r.sha256 for r in streamed] == [r.sha256 for r in collected]
+
+
+def _timed_worker(image_path, out_dir, thumb_size=(256, 256)):
+    # "hang" images outlast the stuck threshold, the others take a moment each
+    time.sleep(3.0 if image_path.stem == "hang" else 0.3)
+    return ImageProcessResult(path=image_path, rel_path=image_path.name, filename=image_path.name, md5="0" * 32)
+
+
+@pytest.fixture
+def fast_stuck_detection(monkeypatch):
+    import extractors._shared.carving.processor as processor_mod
+
+    monkeypatch.setattr(processor_mod, "process_image_worker", _timed_worker)
+    monkeypatch.setattr(processor_mod, "DEFAULT_STUCK_THRESHOLD", 1.0)
+    monkeypatch.setattr(processor_mod, "_WAIT_INTERVAL", 0.1)
+
+
+def test_slow_chunk_reporting_progress_is_not_stuck(fast_stuck_detection):
+    """A chunk taking longer than the stuck threshold still completes."""
+    paths = [Path(f"/carved/{i:02d}.jpg") for i in range(8)]  # ~2.4s in one chunk
+    processor = ParallelImageProcessor(max_workers=1, chunk_size=8, timeout_per_image=0.5)
+
+    results = [r for batch in processor.iter_batches(paths, Path("/carved")) for r in batch]
+
+    assert [r.path for r in results] == paths
+    assert all(r.error is None for r in results)
+
+
+def test_stuck_chunk_keeps_finished_images(fast_stuck_detection):
+    """Only the hung image and the ones after it in its chunk fail."""
+    paths = [Path(f"/carved/{name}.jpg") for name in ("a", "b", "hang", "c")]
+    processor = ParallelImageProcessor(max_workers=1, chunk_size=4, timeout_per_image=0.5)
+
+    results = [r for batch in processor.iter_batches(paths, Path("/carved")) for r in batch]
+
+    assert [r.path for r in results] == paths
+    assert [r.error is None for r in results] == [True, True, False, False]
+    assert results[2].error.startswith("Worker stuck")
@@ -0,0 +1,145 @@
+"""
+Tests for the per-evidence extraction store shared between extractors.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from extractors._shared.extraction_store import (
+    EXTRACTION_STORE_DIRNAME,
+    ExtractionStore,
+    source_key,
+)
+from extractors.browser.chromium.downloads import ChromiumDownloadsExtractor
+from extractors.browser.chromium.history import ChromiumHistoryExtractor
+
+
+class FakeEvidenceFS:
+    """Evidence filesystem that serves in-memory files and counts reads."""
+
+    partition_index = 1
+
+    def __init__(self, files):
+        self.files = files
+        self.reads = []
+
+    def read_file(self, path):
+        self.reads.append(path)
+        if path not in self.files:
+            raise FileNotFoundError(path)
+        return self.files[path]
+
+
+HISTORY = "Users/alice/AppData/Local/Google/Chrome/User Data/Default/History"
+
+
+@pytest.fixture
+def evidence_dir(tmp_path):
+    path = tmp_path / "evidences" / "ev-001"
+    path.mkdir(parents=True)
+    return path
+
+
+def test_second_materialize_reuses_copy(evidence_dir):
+    fs = FakeEvidenceFS({HISTORY: b"SQLite format 3\x00history"})
+    store = ExtractionStore.for_output_dir(evidence_dir / "chromium_history")
+    assert store.root == evidence_dir / EXTRACTION_STORE_DIRNAME
+
+    first = store.materialize(fs, HISTORY, evidence_dir / "a" / "History", inode=42, size_bytes=24)
+    second = store.materialize(fs, HISTORY, evidence_dir / "b" / "History", inode=42, size_bytes=24)
+
+    assert fs.reads == [HISTORY]
+    assert not first.reused and second.reused
+    assert first.sha256 == second.sha256 == hashlib.sha256(fs.files[HISTORY]).hexdigest()
+    assert first.md5 == hashlib.md5(fs.files[HISTORY]).hexdigest()
+    assert (evidence_dir / "b" / "History").read_bytes() == fs.files[HISTORY]
+    assert os.path.samefile(evidence_dir / "a" / "History", evidence_dir / "b" / "History")
+    assert (store.hits, store.misses) == (1, 1)
+
+
+def test_store_survives_new_instance(evidence_dir):
+    fs = FakeEvidenceFS({HISTORY: b"content"})
+    ExtractionStore(evidence_dir / EXTRACTION_STORE_DIRNAME).materialize(fs, HISTORY, evidence_dir / "x")
+    stored = ExtractionStore(evidence_dir / EXTRACTION_STORE_DIRNAME).materialize(fs, HISTORY, evidence_dir / "y")
+    assert stored.reused
+    assert fs.reads == [HISTORY]
+
+
+def test_keys_distinguish_partitions_and_inodes():
+    assert source_key(1, "a/b", inode=5, size_bytes=10) != source_key(2, "a/b", inode=5, size_bytes=10)
+    assert source_key(1, "a/b", inode=5, size_bytes=10) != source_key(1, "a/b", inode=6, size_bytes=10)
+    assert source_key(1, "a/b", inode=5, size_bytes=10) == source_key(1, "other/link", inode=5, size_bytes=10)
+    assert source_key(1, "a\\b") == source_key(1, "a/b")
+
+
+def test_redelivery_overwrites_existing_destination(evidence_dir):
+    fs = FakeEvidenceFS({HISTORY: b"new"})
+    dest = evidence_dir / "out" / "History"
+    dest.parent.mkdir()
+    dest.write_bytes(b"stale copy from a previous run")
+
+    store = ExtractionStore.for_output_dir(evidence_dir / "out")
+    store.materialize(fs, HISTORY, dest)
+    store.materialize(fs, HISTORY, dest)
+
+    assert dest.read_bytes() == b"new"
+
+
+def test_companions_skip_missing_files(evidence_dir):
+    fs = FakeEvidenceFS({HISTORY: b"db", HISTORY + "-wal": b"wal-frames"})
+    store = ExtractionStore.for_output_dir(evidence_dir / "out")
+    dest = evidence_dir / "out" / "History"
+    store.materialize(fs, HISTORY, dest)
+
+    companions = store.materialize_companions(fs, HISTORY, dest)
+
+    assert companions == [{"suffix": "-wal", "size_bytes": 10}]
+    assert (evidence_dir / "out" / "History-wal").read_bytes() == b"wal-frames"
+    assert not (evidence_dir / "out" / "History-journal").exists()
+
+
+def test_companions_are_private_copies(evidence_dir):
+    fs = FakeEvidenceFS({HISTORY: b"db", HISTORY + "-shm": b"shm-index"})
+    store = ExtractionStore.for_output_dir(evidence_dir / "a")
+    for name in ("a", "b"):
+        store.materialize(fs, HISTORY, evidence_dir / name / "History")
+        store.materialize_companions(fs, HISTORY, evidence_dir / name / "History")
+
+    # SQLite rewrites -shm even on a read-only open
+    (evidence_dir / "a" / "History-shm").write_bytes(b"rebuilt")
+
+    assert fs.reads.count(HISTORY + "-shm") == 1
+    assert (evidence_dir / "b" / "History-shm").read_bytes() == b"shm-index"
+    stored = store.lookup(source_key(1, HISTORY + "-shm"))
+    assert stored.path.read_bytes() == b"shm-index"
+    assert hashlib.sha256(stored.path.read_bytes()).hexdigest() == stored.sha256
+
+
+def test_history_and_downloads_share_one_read(evidence_dir):
+    fs = FakeEvidenceFS({HISTORY: b"SQLite format 3\x00" + b"\x00" * 100, HISTORY + "-wal": b"wal"})
+    file_info = {
+        "logical_path": HISTORY,
+        "browser": "chrome",
+        "profile": "Default",
+        "partition_index": 1,
+        "inode": 1234,
+        "size_bytes": 116,
+    }
+    history_dir = evidence_dir / "chromium_history"
+    downloads_dir = evidence_dir / "chromium_downloads"
+    history_dir.mkdir()
+    downloads_dir.mkdir()
+
+    history = ChromiumHistoryExtractor()._extract_file(fs, dict(file_info), history_dir, MagicMock())
+    downloads = ChromiumDownloadsExtractor()._extract_file_from_info(fs, dict(file_info), downloads_dir, "run")
+
+    # One read each for History and its WAL; missing companions are probed per extractor
+    assert fs.reads.count(HISTORY) == 1
+    assert fs.reads.count(HISTORY + "-wal") == 1
+    assert history["sha256"] == downloads["sha256"]
+    assert history["companion_files"] == downloads["companion_files"] == [{"suffix": "-wal", "size_bytes": 3}]
+    assert os.path.samefile(history["extracted_path"], downloads["extracted_path"])
@@ -0,0 +1,182 @@
+"""
+Tests for streamed SNSS parsing and pooled session ingestion.
+"""
+import json
+import mmap
+import os
+import sqlite3
+import struct
+import tracemalloc
+from unittest.mock import Mock
+
+import pytest
+
+from core.database import EVIDENCE_MIGRATIONS_DIR, migrate
+from extractors.browser.chromium.sessions import ChromiumSessionsExtractor
+from extractors.browser.chromium.sessions import extractor as sessions_extractor
+from extractors.browser.chromium.sessions.snss_parser import (
+    CMD_SET_SELECTED_NAVIGATION_INDEX,
+    CMD_SET_TAB_WINDOW,
+    CMD_TAB_CLOSED,
+    CMD_UPDATE_TAB_NAVIGATION,
+    SNSS_SIGNATURE,
+    iter_snss_commands,
+    parse_snss_data,
+    parse_snss_file,
+    parse_snss_stream,
+)
+
+
+def _pickle_string(value, encoding="utf-8", unit=1):
+    encoded = value.encode(encoding)
+    data = struct.pack("<I", len(encoded) // unit) + encoded
+    return data + b"\x00" * ((4 - len(data) % 4) % 4)
+
+
+def _command(command_id, payload):
+    return struct.pack("<HB", len(payload) + 1, command_id) + payload
+
+
+def _navigation(tab_id, index, url, title, page_state=b""):
+    body = (
+        struct.pack("<ii", tab_id, index)
+        + _pickle_string(url)
+        + _pickle_string(title, "utf-16-le", 2)
+        + struct.pack("<I", len(page_state)) + page_state + b"\x00" * ((4 - len(page_state) % 4) % 4)
+        + struct.pack("<i", 1)
+    )
+    return _command(CMD_UPDATE_TAB_NAVIGATION, struct.pack("<i", len(body)) + body)
+
+
+def _snss(tabs=3, navigations=4, page_state=b"", closed=()):
+    parts = [struct.pack("<II", SNSS_SIGNATURE, 1)]
+    for tab_id in range(1, tabs + 1):
+        parts.append(_command(CMD_SET_TAB_WINDOW, struct.pack("<ii", 7, tab_id)))
+        for index in range(navigations):
+            parts.append(_navigation(tab_id, index, f"https://t{tab_id}.example.com/{index}", f"Tab {tab_id}/{index}", page_state))
+        parts.append(_command(CMD_SET_SELECTED_NAVIGATION_INDEX, struct.pack("<ii", tab_id, navigations - 1)))
+    for tab_id in closed:
+        parts.append(_command(CMD_TAB_CLOSED, struct.pack("<iq", tab_id, 0)))
+    return b"".join(parts)
+
+
+def _summary(result):
+    return (
+        result.is_valid, result.version, result.total_commands,
+        sorted((t.tab_id, t.window_id, t.current_navigation_index, [n.url for n in t.navigations]) for t in result.tabs),
+        [w.window_id for w in result.windows],
+        [n.title for n in result.navigation_entries],
+    )
+
+
+def test_stream_parse_matches_buffer_parse(tmp_path):
+    data = _snss(tabs=5, closed=[2]) + struct.pack("<HB", 40, 6) + b"trunc"
+    path = tmp_path / "Session_1"
+    path.write_bytes(data)
+
+    expected = parse_snss_data(data)
+    assert len(expected.tabs) == 4
+
+    assert _summary(parse_snss_file(path)) == _summary(expected)
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        assert _summary(parse_snss_stream(mapped)) == _summary(expected)
+
+
+def test_stream_commands_stop_at_zero_size(tmp_path):
+    path = tmp_path / "Tabs_1"
+    path.write_bytes(struct.pack("<II", SNSS_SIGNATURE, 1) + _command(12, b"\x01\x00\x00\x00\x01") + b"\x00\x00" + _command(12, b"x" * 5))
+
+    with open(path, "rb") as fh:
+        fh.read(8)
+        assert list(iter_snss_commands(fh)) == [(12, b"\x01\x00\x00\x00\x01")]
+
+
+def test_unreadable_file_reports_read_error(tmp_path):
+    result = parse_snss_file(tmp_path / "missing")
+    assert not result.is_valid
+    assert result.errors[0].startswith("Failed to read file")
+
+
+@pytest.mark.slow
+def test_stream_parse_memory_independent_of_page_state(tmp_path):
+    """Large page-state blobs are skipped without holding the file in memory."""
+    path = tmp_path / "Session_big"
+    path.write_bytes(_snss(tabs=40, navigations=25, page_state=b"p" * 60_000))
+    size = path.stat().st_size
+
+    tracemalloc.start()
+    result = parse_snss_file(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(result.navigation_entries) == 1000
+    assert peak < size / 10, f"peak {peak} for {size} byte file"
+
+
+def _write_profiles(tmp_path):
+    files = []
+    for index, profile in enumerate(["Default", "Profile 1", "Profile 2", "Profile 3"]):
+        name = f"chrome_{index}_Session_1"
+        (tmp_path / name).write_bytes(_snss(tabs=index + 1, navigations=3))
+        files.append({
+            "browser": "chrome",
+            "profile": profile,
+            "logical_path": f"Users/a/AppData/Local/Google/Chrome/User Data/{profile}/Sessions/Session_1",
+            "extracted_path": name,
+            "local_filename": name,
+            "file_type": "session",
+        })
+    files.append({"browser": "chrome", "copy_status": "error", "error_message": "unreadable", "extracted_path": "x"})
+    (tmp_path / "manifest.json").write_text(json.dumps({
+        "run_id": "sess_run", "extraction_timestamp_utc": "2024-01-01T00:00:00+00:00", "files": files,
+    }))
+
+
+@pytest.mark.parametrize("enable_parallel", [True, False])
+def test_ingestion_parses_profiles_concurrently(tmp_path, enable_parallel):
+    _write_profiles(tmp_path)
+    conn = sqlite3.connect(tmp_path / "evidence.sqlite")
+    migrate(conn, migrations_dir=EVIDENCE_MIGRATIONS_DIR)
+    callbacks = Mock()
+    callbacks.is_cancelled = Mock(return_value=False)
+
+    result = ChromiumSessionsExtractor().run_ingestion(
+        tmp_path, conn, 1, {"enable_parallel": enable_parallel}, callbacks
+    )
+
+    assert result == {"windows": 4, "tabs": 10}
+    profiles = conn.execute(
+        "SELECT profile, COUNT(*) FROM session_tabs GROUP BY profile ORDER BY profile"
+    ).fetchall()
+    assert profiles == [("Default", 1), ("Profile 1", 2), ("Profile 2", 3), ("Profile 3", 4)]
+    assert conn.execute("SELECT COUNT(*) FROM session_tab_history").fetchone()[0] == 30
+    # Current tab + every history entry is cross-posted to urls
+    assert conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0] == 40
+    progress = [c.args[0] for c in callbacks.on_progress.call_args_list]
+    assert progress == [0, 1, 2, 3, 4]
+    conn.close()
+
+
+def _crash_worker(file_path):
+    os._exit(1)  # Worker dies, e.g. killed for running out of memory
+
+
+def test_crashed_worker_fails_only_its_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(sessions_extractor, "_parse_session_file", _crash_worker)
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)  # Use the pool on any host
+    _write_profiles(tmp_path)
+    conn = sqlite3.connect(tmp_path / "evidence.sqlite")
+    migrate(conn, migrations_dir=EVIDENCE_MIGRATIONS_DIR)
+    callbacks = Mock()
+    callbacks.is_cancelled = Mock(return_value=False)
+
+    result = ChromiumSessionsExtractor().run_ingestion(tmp_path, conn, 1, {}, callbacks)
+
+    # The first file gets the broken pool error; the others are parsed in-process
+    assert result == {"windows": 3, "tabs": 9}
+    statuses = conn.execute(
+        "SELECT profile, ingestion_status FROM browser_cache_inventory ORDER BY profile"
+    ).fetchall()
+    assert statuses == [("Default", "error"), ("Profile 1", "ok"), ("Profile 2", "ok"), ("Profile 3", "ok")]
+    assert callbacks.on_error.call_count == 1
+    conn.close()
@@ -0,0 +1,189 @@
+"""
+Tests for streamed Firefox session-store parsing.
+"""
+import json
+import sqlite3
+import tracemalloc
+from unittest.mock import Mock
+
+import pytest
+
+from core.database import EVIDENCE_MIGRATIONS_DIR, migrate
+from extractors._shared.extraction_warnings import ExtractionWarningCollector
+from extractors.browser.firefox.sessions import FirefoxSessionsExtractor
+from extractors.browser.firefox.sessions._parsers import (
+    decompress_session_file,
+    iter_session_records,
+    parse_session_data,
+)
+
+FILE_ENTRY = {"logical_path": "Users/a/AppData/Roaming/Mozilla/Firefox/Profiles/x.default/sessionstore.js"}
+ARGS = ("run1", "firefox", "x.default", "firefox_sessions:1:run1")
+
+
+def _entry(url, ms, formdata=None):
+    entry = {"url": url, "title": f"Title {url}", "lastAccessed": ms, "ID": 1}
+    if formdata:
+        entry["formdata"] = formdata
+    return entry
+
+
+def _tab(n, entries=3, **extra):
+    tab = {
+        "entries": [_entry(f"https://t{n}.example.com/{i}", 1_700_000_000_000 + i) for i in range(entries)],
+        "index": entries,
+        "lastAccessed": 1_700_000_100_000,
+        "pinned": n == 0,
+    }
+    tab.update(extra)
+    return tab
+
+
+def _session():
+    form_tab = _tab(9, entries=1)
+    form_tab["entries"][0]["formdata"] = {"id": {"q": "secret"}, "xpath": {"//input": "x"}, "innerHTML": "<b>hi</b>"}
+    return {
+        "version": ["sessionrestore", 1],
+        "futureKey": {"a": 1},
+        "windows": [
+            {
+                "tabs": [_tab(0, newTabKey=1), form_tab],
+                "selected": 2,
+                "_closedTabs": [{"state": _tab(5, entries=1), "closedAt": 1_700_000_200_000}],
+                "windowFuture": True,
+            },
+            {"tabs": [_tab(1)], "selected": 1},
+        ],
+        # closedAt after the tabs, as Firefox writes it
+        "_closedWindows": [
+            {"tabs": [_tab(6, entries=2), _tab(7, entries=1, closedAt=1_700_000_400_000), {"entries": []}],
+             "closedAt": 1_700_000_300_000},
+        ],
+    }
+
+
+def _write(tmp_path, data, name="sessionstore.js"):
+    path = tmp_path / name
+    path.write_text(json.dumps(data))
+    return path
+
+
+def _collector():
+    return ExtractionWarningCollector(extractor_name="firefox_sessions", run_id="run1", evidence_id=1)
+
+
+def _by_kind(records):
+    result = {"windows": [], "tabs": [], "history": [], "closed_tabs": [], "form_data": []}
+    for kind, record in records:
+        result[kind].append(record)
+    return result
+
+
+def _warnings(collector):
+    return sorted((w.warning_type, w.item_name, w.item_value) for w in collector._warnings)
+
+
+def test_stream_matches_tree_parse(tmp_path):
+    path = _write(tmp_path, _session())
+    tree_warnings, stream_warnings = _collector(), _collector()
+
+    expected = parse_session_data(
+        decompress_session_file(path, "sessionstore_js"), FILE_ENTRY, ARGS[0], 1, *ARGS[1:], tree_warnings
+    )
+    streamed = _by_kind(iter_session_records(path, "sessionstore_js", FILE_ENTRY, *ARGS, stream_warnings))
+
+    assert streamed == expected
+    assert [r["selected_tab_index"] for r in streamed["windows"]] == [1, 0]
+    assert len(streamed["form_data"]) == 3
+    assert [r["closed_at_utc"][:19] for r in streamed["closed_tabs"]] == [
+        "2023-11-14T22:16:40", "2023-11-14T22:18:20", "2023-11-14T22:20:00",
+    ]
+    assert _warnings(stream_warnings) == _warnings(tree_warnings)
+    assert {w[1] for w in _warnings(stream_warnings)} == {"session.futureKey", "window.windowFuture", "tab.newTabKey"}
+
+
+def test_legacy_prefix_is_stripped(tmp_path):
+    path = tmp_path / "sessionstore.js"
+    path.write_text("sessionstore = " + json.dumps({"windows": [{"tabs": [_tab(0)], "selected": 1}]}))
+
+    records = _by_kind(iter_session_records(path, "sessionstore_js", FILE_ENTRY, *ARGS))
+
+    assert len(records["tabs"]) == 1 and len(records["history"]) == 3
+
+
+def test_truncated_file_yields_records_before_damage(tmp_path):
+    text = json.dumps({"windows": [{"tabs": [_tab(0), _tab(1), _tab(2)], "selected": 1}]})
+    path = tmp_path / "sessionstore.js"
+    path.write_text(text[: text.index("t2.example.com")])
+    collector = _collector()
+
+    records = _by_kind(iter_session_records(path, "sessionstore_js", FILE_ENTRY, *ARGS, collector))
+
+    assert [r["url"] for r in records["tabs"]] == ["https://t0.example.com/2", "https://t1.example.com/2"]
+    assert records["windows"] == []
+    assert [w[0] for w in _warnings(collector)] == ["json_parse_error"]
+
+
+def test_missing_file_reports_read_error(tmp_path):
+    collector = _collector()
+    assert list(iter_session_records(tmp_path / "missing.js", "sessionstore_js", FILE_ENTRY, *ARGS, collector)) == []
+    assert [w[0] for w in _warnings(collector)] == ["file_read_error"]
+
+
+def test_ingestion_resolves_tab_ids_across_batches(tmp_path, monkeypatch):
+    _write(tmp_path, _session(), name="firefox_sessionstore.js")
+    (tmp_path / "manifest.json").write_text(json.dumps({
+        "run_id": "run1",
+        "extraction_timestamp_utc": "2024-01-01T00:00:00+00:00",
+        "files": [{
+            "browser": "firefox",
+            "profile": "x.default",
+            "logical_path": FILE_ENTRY["logical_path"],
+            "extracted_path": "firefox_sessionstore.js",
+            "file_type": "sessionstore_js",
+        }],
+    }))
+    conn = sqlite3.connect(tmp_path / "evidence.sqlite")
+    migrate(conn, migrations_dir=EVIDENCE_MIGRATIONS_DIR)
+    callbacks = Mock()
+    callbacks.is_cancelled = Mock(return_value=False)
+    monkeypatch.setattr(FirefoxSessionsExtractor, "RECORD_BATCH_SIZE", 4)
+
+    result = FirefoxSessionsExtractor().run_ingestion(tmp_path, conn, 1, {}, callbacks)
+
+    assert (result["windows"], result["tabs"], result["history"], result["closed_tabs"], result["form_data"]) == (
+        2, 3, 7, 3, 3,
+    )
+    rows = conn.execute(
+        "SELECT t.url, h.url FROM session_tab_history h JOIN session_tabs t ON t.id = h.tab_id"
+    ).fetchall()
+    assert len(rows) == 7
+    assert all(tab_url.split("/")[2] == hist_url.split("/")[2] for tab_url, hist_url in rows)
+    conn.close()
+
+
+@pytest.mark.slow
+def test_stream_memory_bounded_by_file_size(tmp_path):
+    """A multi-hundred-MB session is streamed without building its JSON tree."""
+    path = tmp_path / "sessionstore.js"
+    with path.open("w") as fh:
+        fh.write('{"version": ["sessionrestore", 1], "windows": [{"selected": 1, "tabs": [')
+        for n in range(6_000):
+            fh.write(("," if n else "") + json.dumps(_tab(n, entries=300)))
+        fh.write(']}], "_closedWindows": [')
+        for n in range(600):
+            fh.write(("," if n else "") + json.dumps({"tabs": [_tab(n, entries=300)], "closedAt": 1}))
+        fh.write("]}")
+    size = path.stat().st_size
+    assert size > 200 * 1024 * 1024
+
+    counts = dict.fromkeys(("windows", "tabs", "history", "closed_tabs", "form_data"), 0)
+    tracemalloc.start()
+    for kind, _record in iter_session_records(path, "sessionstore_js", FILE_ENTRY, *ARGS):
+        counts[kind] += 1
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert counts == {"windows": 1, "tabs": 6_000, "history": 1_800_000, "closed_tabs": 600, "form_data": 0}
+    # File bytes and decoded text; the decoded tree would be several times the file size
+    assert peak < 2.2 * size, f"peak {peak} for {size} byte file"
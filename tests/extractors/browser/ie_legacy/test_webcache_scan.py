@@ -0,0 +1,141 @@
+"""
+Tests for the shared single-pass WebCache scan.
+
+No ESE library is needed: WebCacheReader is replaced by an in-memory fake
+that counts how often each table is read.
+"""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from extractors.browser.ie_legacy import _webcache_scan
+from extractors.browser.ie_legacy._ese_reader import ESERecord
+from extractors.browser.ie_legacy._webcache_scan import (
+    WEBCACHE_CONTAINER_FILTERS,
+    WebCacheConsumer,
+    WebCacheScan,
+    scan_cache_path,
+)
+
+CONTAINERS = [
+    {"container_id": 1, "name": "History", "directory": None, "secure_directories": None, "partition_id": "L"},
+    {"container_id": 2, "name": "Cookies", "directory": None, "secure_directories": None, "partition_id": "L"},
+    {"container_id": 3, "name": "iedownload", "directory": None, "secure_directories": None, "partition_id": "L"},
+    {"container_id": 4, "name": "Content", "directory": None, "secure_directories": None, "partition_id": "L"},
+    {"container_id": 5, "name": "DOMStore", "directory": None, "secure_directories": None, "partition_id": "L"},
+]
+
+TABLES = {
+    "Container_1": [
+        {"Url": "Visited: alice@https://example.com/", "AccessedTime": 133000000000000000, "AccessCount": 3},
+        {"Url": "Visited: alice@https://example.org/", "AccessedTime": 133000000000000001, "AccessCount": None},
+    ],
+    "Container_2": [{"Url": "Cookie:alice@example.com/", "ResponseHeaders": b"\x00\x01binary"}],
+    "Container_3": [{"Url": "https://dl.test/setup.exe", "ResponseHeaders": b"HTTP/1.1 200"}],
+    "Container_4": [{"Url": "https://cdn.test/app.js", "FileSize": 1024}],
+    "Container_5": [{"Url": "https://storage.test/"}],
+}
+
+
+class FakeWebCacheReader:
+    reads: list = []
+
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def tables(self):
+        return ["Containers", *TABLES]
+
+    def get_containers(self):
+        self.reads.append("Containers")
+        return [dict(c) for c in CONTAINERS]
+
+    def read_table(self, table_name, columns=None, limit=None):
+        self.reads.append(table_name)
+        for values in TABLES[table_name][:limit]:
+            yield ESERecord(table_name=table_name, values=dict(values))
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    FakeWebCacheReader.reads = []
+    monkeypatch.setattr(_webcache_scan, "WebCacheReader", FakeWebCacheReader)
+    path = tmp_path / "alice_WebCacheV01.dat"
+    path.write_bytes(b"\xef\xcd\xab\x89" + b"\x00" * 60)
+    return path
+
+
+def _read_history(db_path):
+    with WebCacheScan(db_path) as reader:
+        history = [c for c in reader.get_containers() if c["name"] == "History"]
+        return [r.values for c in history for r in reader.read_table(f"Container_{c['container_id']}")]
+
+
+def test_four_extractors_scan_once(db_path):
+    for _ in range(4):
+        with WebCacheScan(db_path) as reader:
+            containers = reader.get_containers()
+            for container in containers:
+                list(reader.read_table(f"Container_{container['container_id']}", limit=1))
+            containers_read_so_far = list(FakeWebCacheReader.reads)
+
+    # Containers and each wanted table were read from ESE exactly once;
+    # DOMStore (no WebCache consumer) goes to ESE on demand only.
+    assert containers_read_so_far.count("Containers") == 1
+    for table in ("Container_1", "Container_2", "Container_3", "Container_4"):
+        assert FakeWebCacheReader.reads.count(table) == 1
+    assert FakeWebCacheReader.reads.count("Container_5") == 4
+    assert scan_cache_path(db_path).exists()
+
+
+def test_cached_records_round_trip(db_path):
+    first = _read_history(db_path)
+    second = _read_history(db_path)
+    assert first == second == TABLES["Container_1"]
+
+    with WebCacheScan(db_path) as reader:
+        cookie = next(reader.read_table("Container_2"))
+        assert cookie["ResponseHeaders"] == b"\x00\x01binary"
+        assert next(reader.read_table("Container_4", columns=["Url"])).values == {"Url": "https://cdn.test/app.js"}
+        assert reader.tables() == ["Containers", *TABLES]
+
+
+def test_cache_rebuilt_when_database_changes(db_path):
+    _read_history(db_path)
+    assert WebCacheScan(db_path)._cache_is_fresh()
+
+    stat = db_path.stat()
+    os.utime(db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    scan = WebCacheScan(db_path)
+    assert not scan._cache_is_fresh()
+    with scan:
+        assert scan.scanned_from_ese
+    assert FakeWebCacheReader.reads.count("Container_1") == 2
+
+
+def test_dispatch_feeds_consumers_in_one_pass(db_path):
+    received = {"history": [], "cookies": [], "everything": []}
+    consumers = [
+        WebCacheConsumer("history", WEBCACHE_CONTAINER_FILTERS["history"],
+                         lambda c, r: received["history"].append(r["Url"])),
+        WebCacheConsumer("cookies", WEBCACHE_CONTAINER_FILTERS["cookies"],
+                         lambda c, r: received["cookies"].append(c["name"])),
+        WebCacheConsumer("everything", lambda name: name != "DOMStore",
+                         lambda c, r: received["everything"].append(r.table_name)),
+    ]
+
+    delivered = WebCacheScan(db_path, persist=False).dispatch(consumers)
+
+    assert delivered == {"history": 2, "cookies": 1, "everything": 5}
+    assert received["history"] == [r["Url"] for r in TABLES["Container_1"]]
+    assert received["cookies"] == ["Cookies"]
+    assert not scan_cache_path(db_path).exists()
+    assert FakeWebCacheReader.reads.count("Container_1") == 1
@@ -0,0 +1,226 @@
+"""Tests for parallel Firefox cache2 entry processing.
+
+Covers:
+- parse_cache2_entry reading only the metadata region (mmap)
+- iter_entry_outcomes order and statuses, sequential vs process pool
+- CacheIngestionHandler writing worker-built URL/image rows
+- Throughput/memory benchmark over a synthetic cache2 directory (slow)
+"""
+from __future__ import annotations
+
+import json
+import os
+import resource
+import sqlite3
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from core.database import EVIDENCE_MIGRATIONS_DIR, migrate
+from extractors.browser.firefox.cache._entries import (
+    STATUS_ERROR,
+    STATUS_PARSED,
+    STATUS_SKIPPED_FAILED,
+    STATUS_SKIPPED_SUPPORTING,
+    build_url_record,
+    iter_entry_outcomes,
+)
+from extractors.browser.firefox.cache.ingestion import CacheIngestionHandler
+from extractors.browser.firefox.cache.parser import parse_cache2_entry, parse_cache2_metadata
+from tests.extractors.cache.test_cache_firefox_ingestion import FakeCallbacks
+from tests.extractors.cache.test_cache_firefox_parser import create_cache2_entry
+
+PNG_BODY = b"\x89PNG\r\n\x1a\n" + b"\x00\x00\x00\x0dIHDR" + b"\x00" * 64
+
+
+def _write_run(
+    run_dir: Path,
+    count: int,
+    *,
+    image_every: int = 0,
+    body_size: int = 64,
+    large_every: int = 0,
+    large_body_size: int = 0,
+) -> list:
+    """Write ``count`` cache2 entries under ``entries/``; return manifest file entries."""
+    entries_dir = run_dir / "entries"
+    entries_dir.mkdir(parents=True, exist_ok=True)
+    files = []
+    for i in range(count):
+        name = f"{i:040X}"
+        if image_every and i % image_every == 0:
+            data = create_cache2_entry(
+                url=f"https://img.example.com/{i}.png", body=PNG_BODY, content_type="image/png"
+            )
+        else:
+            size = large_body_size if large_every and i % large_every == 0 else body_size
+            data = create_cache2_entry(
+                url=f"https://host{i % 50}.example.com/page/{i}", body=b"b" * size
+            )
+        (entries_dir / name).write_bytes(data)
+        files.append({
+            "source_path": f"/profile/cache2/entries/{name}",
+            "logical_path": f"/profile/cache2/entries/{name}",
+            "extracted_path": f"entries/{name}",
+            "artifact_type": "cache_firefox",
+            "cache_filename": name,
+            "profile": "default",
+            "success": True,
+        })
+    return files
+
+
+def test_parse_reads_only_metadata(tmp_path):
+    body = b"x" * (4 * 1024 * 1024)
+    path = tmp_path / "BIGENTRY"
+    path.write_bytes(create_cache2_entry(url="https://example.com/big", body=body))
+
+    tracemalloc.start()
+    result = parse_cache2_entry(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert result.url == "https://example.com/big"
+    assert result.body_size == len(body)
+    assert peak < len(body) / 8
+
+
+def test_parse_metadata_matches_whole_file_parse(tmp_path):
+    data = create_cache2_entry(url="https://example.com/a.png", body=b"y" * 300_000,
+                               content_type="image/png")
+    path = tmp_path / "ENTRY"
+    path.write_bytes(data)
+    meta_offset = int.from_bytes(data[-4:], "big")
+
+    assert parse_cache2_metadata(data[meta_offset:], meta_offset) == parse_cache2_entry(path)
+
+
+@pytest.mark.parametrize("enable_parallel", [True, False])
+def test_outcomes_in_manifest_order(tmp_path, enable_parallel):
+    files = _write_run(tmp_path, 600, image_every=100)
+    files.insert(3, {"source_path": "/x/index", "artifact_type": "cache_index", "extracted_path": "index"})
+    files.insert(5, {"source_path": "/x/failed", "success": False, "extracted_path": ""})
+    files.insert(7, {"source_path": "/x/missing", "artifact_type": "cache_firefox", "extracted_path": "entries/NOPE"})
+
+    outcomes = list(iter_entry_outcomes(
+        files, tmp_path, "run1", "1.0", enable_parallel=enable_parallel, chunk_size=64
+    ))
+
+    assert [o.index for o in outcomes] == list(range(len(files)))
+    assert outcomes[3].status == STATUS_SKIPPED_SUPPORTING
+    assert outcomes[5].status == STATUS_SKIPPED_FAILED
+    assert outcomes[7].status == STATUS_ERROR
+    assert "Extracted file missing" in outcomes[7].error
+    parsed = [o for o in outcomes if o.status == STATUS_PARSED]
+    assert len(parsed) == 600
+    assert parsed[1].url_record["url"] == "https://host1.example.com/page/1"
+    assert parsed[1].url_record["discovered_by"] == "cache_firefox:1.0:run1"
+    assert sum(1 for o in parsed if o.image_data) == 6
+    assert parsed[0].discovery_data["cache_url"] == "https://img.example.com/0.png"
+
+
+def _crash_chunk(run_dir, run_id, extractor_version, chunk):
+    os._exit(1)  # Worker dies, e.g. killed for running out of memory
+
+
+def test_crashed_worker_fails_only_its_chunk(tmp_path, monkeypatch):
+    import extractors.browser.firefox.cache._entries as entries_mod
+
+    monkeypatch.setattr(entries_mod, "process_entry_chunk", _crash_chunk)
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)  # Use the pool on any host
+    files = _write_run(tmp_path, 600)
+
+    outcomes = list(iter_entry_outcomes(files, tmp_path, "run1", "1.0", chunk_size=64))
+
+    # The first chunk gets the broken pool error; the rest run in-process
+    assert [o.index for o in outcomes] == list(range(600))
+    assert all(o.status == STATUS_ERROR and "Worker failed" in o.error for o in outcomes[:64])
+    assert all(o.status == STATUS_PARSED for o in outcomes[64:])
+
+
+def test_outcomes_stop_when_cancelled(tmp_path):
+    files = _write_run(tmp_path, 20)
+    seen = []
+
+    for outcome in iter_entry_outcomes(
+        files, tmp_path, "run1", "1.0", enable_parallel=False, is_cancelled=lambda: len(seen) >= 5
+    ):
+        seen.append(outcome)
+
+    assert len(seen) == 5
+
+
+@pytest.mark.parametrize("enable_parallel", [True, False])
+def test_ingestion_writes_worker_rows(tmp_path, enable_parallel):
+    run_dir = tmp_path / "run_20240101"
+    files = _write_run(run_dir, 700, image_every=50)
+    (run_dir / "manifest.json").write_text(json.dumps({
+        "run_id": "run1", "status": "ok", "files": files,
+    }))
+    conn = sqlite3.connect(tmp_path / "evidence.sqlite")
+    migrate(conn, migrations_dir=EVIDENCE_MIGRATIONS_DIR)
+
+    handler = CacheIngestionHandler(extractor_name="cache_firefox", extractor_version="1.0")
+    stats = handler.run(
+        tmp_path, conn, 1, {"enable_parallel": enable_parallel}, FakeCallbacks()
+    )
+
+    assert stats["entries_parsed"] == 700
+    assert stats["urls_inserted"] == 700
+    assert stats["inventory_entries"] == 700
+    assert conn.execute("SELECT COUNT(*) FROM urls WHERE run_id = 'run1'").fetchone()[0] == 700
+    assert stats["images_inserted"] == conn.execute("SELECT COUNT(*) FROM images").fetchone()[0]
+    assert stats["images_inserted"] > 0
+    conn.close()
+
+
+@pytest.mark.slow
+def test_benchmark_cache2_ingestion_engine(tmp_path):
+    """
+    Compare the mmap/process-pool engine with the previous per-file path.
+
+    The previous path read each entry with read_bytes() and parsed entries
+    one at a time. Entry count defaults to 100k (override with
+    CACHE2_BENCH_ENTRIES); every 1000th entry has a 2 MiB body. Prints
+    entries/s and peak traced memory of this process for both paths, and
+    peak RSS of the workers.
+    """
+    count = int(os.environ.get("CACHE2_BENCH_ENTRIES", "100000"))
+    files = _write_run(
+        tmp_path, count, body_size=4 * 1024, large_every=1000, large_body_size=2 * 1024 * 1024
+    )
+
+    def whole_file_parse():
+        urls = 0
+        for entry in files:
+            data = (tmp_path / entry["extracted_path"]).read_bytes()
+            meta_offset = int.from_bytes(data[-4:], "big")
+            parsed = parse_cache2_metadata(data[meta_offset:], meta_offset)
+            if parsed.url:
+                build_url_record(parsed, entry, "bench", entry["cache_filename"], "1.0")
+                urls += 1
+        return urls
+
+    def engine_parse():
+        return sum(
+            1 for o in iter_entry_outcomes(files, tmp_path, "bench", "1.0") if o.url_record
+        )
+
+    results = {}
+    for name, func in (("whole_file", whole_file_parse), ("engine", engine_parse)):
+        tracemalloc.start()
+        started = time.perf_counter()
+        urls = func()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert urls == count
+        results[name] = (count / elapsed, peak)
+
+    for name, (rate, peak) in results.items():
+        print(f"{name}: {rate:,.0f} entries/s, peak traced {peak / 1024 / 1024:.1f} MiB")
+    children_rss_kib = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    print(f"workers ({os.cpu_count()} CPUs): peak RSS {children_rss_kib / 1024:.1f} MiB")
+    assert results["engine"][1] < results["whole_file"][1]
@@ -11,6 +11,7 @@ Covers:
 from __future__ import annotations
 
 import struct
+import time
 from pathlib import Path
 from typing import List, Optional
 
@@ -33,7 +34,9 @@ from extractors.browser.firefox.cache._index import (
     KNOWN_VERSIONS,
     MAX_KNOWN_CONTENT_TYPE,
     RECORD_SIZE,
+    CacheIndexRecords,
     _parse_index_record,
+    iter_index_fields,
     parse_cache_index,
     parse_journal,
 )
@@ -431,6 +434,82 @@ class TestJournalParsing:
         assert any("too small" in w for w in warnings)
 
 
+# =====================================================================
+# Whole-region record decoding
+# =====================================================================
+
+class TestCacheIndexRecords:
+    """Records are decoded in one pass and exposed as a lazy sequence."""
+
+    def _records(self, count: int) -> List[bytes]:
+        return [
+            _make_record(
+                sha1=i.to_bytes(20, "big"),
+                frecency=i,
+                origin_attrs_hash=2**64 - 1 - i,
+                content_type=i % 9,
+                flags=(FLAG_INITIALIZED | (i % 4096)) | (FLAG_REMOVED if i % 3 == 0 else 0),
+            )
+            for i in range(count)
+        ]
+
+    def test_lazy_view_matches_single_record_parse(self, tmp_path: Path):
+        records = self._records(50)
+        path = _write_index(tmp_path, _make_header_v0a(), records)
+
+        index, _ = parse_cache_index(path)
+
+        assert isinstance(index.entries, CacheIndexRecords)
+        assert list(index.entries) == [_parse_index_record(r) for r in records]
+        assert index.entries[-1] == _parse_index_record(records[-1])
+        assert index.entries[10:12] == [_parse_index_record(r) for r in records[10:12]]
+
+    def test_fields_match_entry_properties(self, tmp_path: Path):
+        path = _write_index(tmp_path, _make_header_v9(), self._records(30))
+        index, _ = parse_cache_index(path)
+
+        for fields, entry in zip(iter_index_fields(index.entries), index.entries):
+            assert fields["hash"] == entry.hash
+            assert fields["origin_attrs_hash"] == entry.origin_attrs_hash
+            assert fields["content_type_name"] == entry.content_type_name
+            assert fields["file_size_kb"] == entry.file_size_kb
+            assert fields["raw_flags"] == entry.flags
+            assert fields["is_removed"] is entry.is_removed
+            assert fields["is_initialized"] is entry.is_initialized
+
+    def test_fields_from_plain_entry_list(self):
+        entry = _parse_index_record(_make_record(sha1=b"\xab" * 20, flags=FLAG_PINNED | 7))
+
+        (fields,) = iter_index_fields([entry])
+
+        assert fields["hash"] == "AB" * 20
+        assert fields["is_pinned"] is True
+        assert fields["file_size_kb"] == 7
+
+    def test_journal_returns_records_view(self, tmp_path: Path):
+        path = tmp_path / "index.log"
+        path.write_bytes(b"".join(self._records(5)) + _make_crc())
+
+        entries, _ = parse_journal(path)
+
+        assert isinstance(entries, CacheIndexRecords)
+        assert [e.frecency for e in entries] == [0, 1, 2, 3, 4]
+
+    @pytest.mark.slow
+    def test_large_index_parses_quickly(self, tmp_path: Path):
+        count = 300_000
+        record = _make_record()
+        path = _write_index(tmp_path, _make_header_v0a(), [record] * count)
+
+        started = time.perf_counter()
+        index, warnings = parse_cache_index(path)
+        elapsed = time.perf_counter() - started
+
+        assert len(index.entries) == count
+        assert warnings == []
+        assert elapsed < 1.0, f"{count} records took {elapsed:.2f}s"
+
+
 # =====================================================================
 # Structured warning tests
 # =====================================================================
@@ -672,6 +751,24 @@ class TestCorrelateIndexWithFiles:
         assert by_hash["BBBB"]["file_source"] == "doomed"
         assert by_hash["CCCC"]["has_file"] is False
 
+    def test_records_view_joined_on_hash(self, tmp_path: Path):
+        entries_dir = tmp_path / "entries"
+        entries_dir.mkdir()
+        (entries_dir / ("0A" * 20)).write_bytes(b"x")
+        path = _write_index(
+            tmp_path,
+            _make_header_v0a(),
+            [_make_record(sha1=b"\x0a" * 20), _make_record(sha1=b"\x0b" * 20)],
+        )
+        index, _ = parse_cache_index(path)
+        files = {"entries": list(entries_dir.iterdir()), "doomed": [], "trash": []}
+
+        result = correlate_index_with_files(index.entries, files)
+
+        assert [r["has_file"] for r in result] == [True, False]
+        assert result[0]["file_path"] == entries_dir / ("0A" * 20)
+        assert result[1]["file_source"] is None
+
 
 # =====================================================================
 # Database helper tests
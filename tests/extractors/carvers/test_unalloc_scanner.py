@@ -0,0 +1,151 @@
+"""
+Tests for the streaming unallocated-space scanner of the browser carver.
+
+A raw image file stands in for the E01; the chunking, boundary, range,
+resume and process-pool logic is the same for both sources.
+"""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from extractors.carvers.browser_carver.unalloc_scanner import (
+    HIT_EMAIL,
+    HIT_SQLITE_HEADER,
+    HIT_URL,
+    UnallocatedScanner,
+    iter_hits,
+    merge_ranges,
+    parse_blkls_list,
+    plan_chunks,
+)
+
+CHUNK = 64 * 1024
+URL = b"https://www.example.org/path/to/page?q=boundary"
+SQLITE = b"SQLite format 3\x00" + (4096).to_bytes(2, "big")
+
+
+def _make_image(tmp_path, size=CHUNK * 8, placements=()):
+    data = bytearray(size)
+    for offset, payload in placements:
+        data[offset:offset + len(payload)] = payload
+    path = tmp_path / "image.dd"
+    path.write_bytes(bytes(data))
+    return path
+
+
+def _hits(result):
+    return sorted((h["kind"], h["offset"], h["value"]) for h in iter_hits(result.hits_path))
+
+
+@pytest.fixture
+def image(tmp_path):
+    return _make_image(tmp_path, placements=[
+        (CHUNK - 10, URL),                      # straddles the first chunk boundary
+        (3 * CHUNK + 100, b" someone@example.com "),
+        (5 * CHUNK, SQLITE),
+        (6 * CHUNK + 7, b"sqlite FORMAT 3\x00"),  # wrong case: not a header
+    ])
+
+
+def test_boundary_match_found_once(tmp_path, image):
+    scanner = UnallocatedScanner(("raw", str(image)), None, tmp_path / "out",
+                                 chunk_size=CHUNK, enable_parallel=False)
+    result = scanner.run()
+
+    assert _hits(result) == [
+        (HIT_EMAIL, 3 * CHUNK + 101, "someone@example.com"),
+        (HIT_SQLITE_HEADER, 5 * CHUNK, 4096),
+        (HIT_URL, CHUNK - 10, URL.decode()),
+    ]
+    assert result.hits == {HIT_URL: 1, HIT_EMAIL: 1, HIT_SQLITE_HEADER: 1}
+    assert result.bytes_scanned == result.bytes_total == CHUNK * 8
+    assert result.mb_per_second > 0
+    assert not scanner.checkpoint_path.exists()
+
+
+def test_email_crossing_chunk_boundary_found_once(tmp_path):
+    email = b"john.smithsonian@example.com"
+    path = _make_image(tmp_path, size=4 * 4096, placements=[(4088, b" " + email + b" ")])
+    scanner = UnallocatedScanner(("raw", str(path)), None, tmp_path / "out",
+                                 chunk_size=4096, enable_parallel=False)
+
+    assert _hits(scanner.run()) == [(HIT_EMAIL, 4089, email.decode())]
+
+
+def test_scan_restricted_to_ranges(tmp_path, image):
+    scanner = UnallocatedScanner(("raw", str(image)), [(2 * CHUNK, 4 * CHUNK), (5 * CHUNK, 5 * CHUNK + 4096)],
+                                 tmp_path / "out", chunk_size=CHUNK, enable_parallel=False)
+    result = scanner.run()
+
+    assert [h[0] for h in _hits(result)] == [HIT_EMAIL, HIT_SQLITE_HEADER]
+    assert result.bytes_total == 2 * CHUNK + 4096
+
+
+def test_resume_after_cancel_matches_full_run(tmp_path, image):
+    full = UnallocatedScanner(("raw", str(image)), None, tmp_path / "full",
+                              chunk_size=CHUNK, enable_parallel=False).run()
+
+    polls = {"n": 0}
+
+    def cancel_after_four():
+        polls["n"] += 1
+        return polls["n"] > 4
+
+    scanner = UnallocatedScanner(("raw", str(image)), None, tmp_path / "resume",
+                                 chunk_size=CHUNK, enable_parallel=False)
+    first = scanner.run(is_cancelled=cancel_after_four)
+    assert first.cancelled
+    assert first.chunks_scanned == 4
+    state = json.loads(scanner.checkpoint_path.read_text())
+    assert state["done_below"] == 4
+
+    second = scanner.run()
+    assert second.resumed and not second.cancelled
+    assert second.chunks_scanned == 4
+    assert second.bytes_resumed == 4 * CHUNK
+    assert _hits(second) == _hits(full)
+    assert second.hits == full.hits
+
+
+def test_changed_plan_restarts_scan(tmp_path, image):
+    out = tmp_path / "out"
+    UnallocatedScanner(("raw", str(image)), None, out, chunk_size=CHUNK,
+                       enable_parallel=False).run(is_cancelled=lambda: True)
+    result = UnallocatedScanner(("raw", str(image)), [(0, 2 * CHUNK)], out, chunk_size=CHUNK,
+                                enable_parallel=False).run()
+    assert not result.resumed
+    assert [h[0] for h in _hits(result)] == [HIT_URL]
+
+
+def test_process_pool_matches_inline(tmp_path, image):
+    inline = UnallocatedScanner(("raw", str(image)), None, tmp_path / "inline",
+                                chunk_size=CHUNK, enable_parallel=False).run()
+    pooled = UnallocatedScanner(("raw", str(image)), None, tmp_path / "pool",
+                                chunk_size=CHUNK, max_workers=2).run()
+    assert _hits(pooled) == _hits(inline)
+    assert pooled.chunks_scanned == 8
+
+
+def test_parse_blkls_list_coalesces_free_runs():
+    lines = [
+        "class|host|image|first_time|unit",
+        "blkls|host|image.E01|1700000000|Cluster",
+        "addr|alloc",
+        "0|a", "1|f", "2|f", "3|a", "4|f", "5|f", "6|f", "9|f",
+    ]
+    assert parse_blkls_list(lines, 4096, base_offset=1_048_576) == [
+        (1_048_576 + 4096, 1_048_576 + 3 * 4096),
+        (1_048_576 + 4 * 4096, 1_048_576 + 7 * 4096),
+        (1_048_576 + 9 * 4096, 1_048_576 + 10 * 4096),
+    ]
+
+
+def test_plan_chunks_aligns_and_merges():
+    assert merge_ranges([(10, 20), (0, 5), (5, 8), (15, 30)]) == [(0, 8), (10, 30)]
+    assert plan_chunks([(4096, 3 * CHUNK + 10)], CHUNK) == [
+        (4096, CHUNK), (CHUNK, 2 * CHUNK), (2 * CHUNK, 3 * CHUNK), (3 * CHUNK, 3 * CHUNK + 10),
+    ]
+    with pytest.raises(ValueError):
+        plan_chunks([(0, 10)], 1000)
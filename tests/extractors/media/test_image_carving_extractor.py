@@ -350,7 +350,7 @@ def test_run_ingestion_success(mock_processor_class, extractor, temp_workspace,
 
     # Mock processing results
     from extractors._shared.carving.processor import ImageProcessResult
-    mock_processor.process_images.return_value = [
+    mock_processor.iter_batches.return_value = [[
         ImageProcessResult(
             path=carved_dir / "image1.jpg",
             rel_path="carved/jpg/image1.jpg",
@@ -369,7 +369,7 @@ def test_run_ingestion_success(mock_processor_class, extractor, temp_workspace,
             phash=None,  # Corrupted image
             exif_json="{}",
         ),
-    ]
+    ]]
 
     conn = sqlite3.connect(evidence_db)
     success = extractor.run_ingestion(
@@ -582,7 +582,7 @@ def test_full_workflow_e2e(mock_discover, mock_carving, extractor, temp_workspac
         from extractors._shared.carving.processor import ImageProcessResult
         mock_instance = Mock()
         mock_proc.return_value = mock_instance
-        mock_instance.process_images.return_value = [
+        mock_instance.iter_batches.return_value = [[
             ImageProcessResult(
                 path=carved_dir / "image1.jpg",
                 rel_path="carved/jpg/image1.jpg",
@@ -601,7 +601,7 @@ def test_full_workflow_e2e(mock_discover, mock_carving, extractor, temp_workspac
                 phash="phash2",
                 exif_json="{}",
             ),
-        ]
+        ]]
 
         # Run ingestion
         conn = sqlite3.connect(evidence_db)
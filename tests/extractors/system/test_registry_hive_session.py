@@ -0,0 +1,213 @@
+"""
+Tests for registry hive sessions, traversal plans and per-hive ingestion.
+"""
+import json
+import sqlite3
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from core.database import EVIDENCE_MIGRATIONS_DIR, migrate
+from extractors.system.registry import ingestion
+from extractors.system.registry.parser import (
+    HiveSession,
+    RegistryFinding,
+    clear_hive_sessions,
+    compile_traversal_plan,
+    process_hive_file,
+    process_hive_targets,
+)
+
+
+def _key(name, subkeys=(), values=()):
+    key = MagicMock()
+    key.name = name
+    key.iter_subkeys.return_value = list(subkeys)
+    key.iter_values.side_effect = lambda: iter(values)
+    key.header.last_modified = "2024-01-01"
+    return key
+
+
+def _value(name, value):
+    val = MagicMock()
+    val.name = name
+    val.value = value
+    return val
+
+
+def _ntuser_hive():
+    count1 = _key("Count", values=[_value("a", "1")])
+    count2 = _key("Count", values=[_value("b", "2")])
+    user_assist = _key("UserAssist", [_key("{GUID1}", [count1]), _key("{GUID2}", [count2, _key("Other")])])
+    run = _key("Run", values=[_value("Updater", "C:\\u.exe"), _value("Tool", "C:\\t.exe")])
+    current = _key("CurrentVersion", [run, _key("Explorer", [user_assist])])
+    software = _key("Software", [_key("Microsoft", [_key("Windows", [current])])])
+    hive = MagicMock()
+    hive.root = _key("ROOT", [software])
+    return hive
+
+
+def _target(name, *key_defs):
+    return {
+        "name": name,
+        "paths": ["**/NTUSER.DAT"],
+        "actions": [{
+            "type": "registry_reader",
+            "hive": "NTUSER",
+            "provenance": "registry_offline",
+            "keys": [dict(extract_all_values=True, indicator=name, **key_def) for key_def in key_defs],
+        }],
+    }
+
+
+RUN_PATH = "Software\\Microsoft\\Windows\\CurrentVersion\\Run"
+ASSIST_PATH = "Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\UserAssist\\*\\Count"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_sessions():
+    clear_hive_sessions()
+    yield
+    clear_hive_sessions()
+
+
+def _subkey_calls(key):
+    total = key.iter_subkeys.call_count
+    for child in key.iter_subkeys.return_value:
+        total += _subkey_calls(child)
+    return total
+
+
+def test_session_lookup_is_case_insensitive_and_cached():
+    hive = _ntuser_hive()
+    session = HiveSession("NTUSER.DAT", hive=hive)
+
+    run = session.get_key("software\\MICROSOFT/Windows\\CurrentVersion\\Run")
+    assert run.name == "Run"
+    calls = _subkey_calls(hive.root)
+    assert session.get_key(RUN_PATH) is run
+    assert session.get_key("Software\\Microsoft\\Windows\\CurrentVersion\\Explorer").name == "Explorer"
+    # Repeated lookups and siblings under a visited key list no subkeys again
+    assert _subkey_calls(hive.root) == calls
+
+    with pytest.raises(ValueError):
+        session.get_key("Software\\Missing")
+
+
+def test_resolve_expands_wildcards():
+    session = HiveSession("NTUSER.DAT", hive=_ntuser_hive())
+
+    resolved = session.resolve(ASSIST_PATH)
+
+    assert [path for path, _ in resolved] == [
+        "Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\UserAssist\\{GUID1}\\Count",
+        "Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\UserAssist\\{GUID2}\\Count",
+    ]
+    # Exact paths are reported as written
+    assert [path for path, _ in session.resolve(RUN_PATH.lower())] == [RUN_PATH.lower()]
+
+
+def test_plan_walks_each_subtree_once():
+    hive = _ntuser_hive()
+    targets = [
+        _target("t_run", {"path": RUN_PATH}),
+        _target("t_assist", {"path": ASSIST_PATH}, {"path": RUN_PATH.upper()}),
+        _target("t_missing", {"path": "Software\\Nope\\*"}),
+    ]
+    plan = compile_traversal_plan(targets)
+    assert len(plan) == 4
+
+    matches = HiveSession("NTUSER.DAT", hive=hive).walk(plan)
+
+    assert [(payload[0], path) for payload, path, _ in matches] == [
+        (0, RUN_PATH),
+        (1, "Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\UserAssist\\{GUID1}\\Count"),
+        (1, "Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\UserAssist\\{GUID2}\\Count"),
+        (1, RUN_PATH.upper()),
+    ]
+
+    def assert_listed_once(key):
+        assert key.iter_subkeys.call_count <= 1, key.name
+        for child in key.iter_subkeys.return_value:
+            assert_listed_once(child)
+
+    assert_listed_once(hive.root)
+
+
+def test_process_hive_targets_opens_hive_once():
+    hive = _ntuser_hive()
+    targets = [_target("t_run", {"path": RUN_PATH}), _target("t_assist", {"path": ASSIST_PATH})]
+
+    with patch("regipy.registry.RegistryHive", return_value=hive) as hive_cls:
+        per_target = process_hive_targets("/case/NTUSER_1.hive", targets)
+        # The per-target wrapper reuses the open session
+        single = process_hive_file("/case/NTUSER_1.hive", targets[0])
+
+    assert hive_cls.call_count == 1
+    assert [[f.path for f in findings] for findings in per_target] == [
+        [f"{RUN_PATH}\\Updater", f"{RUN_PATH}\\Tool"],
+        [
+            "Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\UserAssist\\{GUID1}\\Count\\a",
+            "Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\UserAssist\\{GUID2}\\Count\\b",
+        ],
+    ]
+    assert all(f.detector_id == "t_run" for f in per_target[0])
+    assert [f.value for f in single] == [f.value for f in per_target[0]]
+
+
+def test_unreadable_hive_yields_empty_results():
+    with patch("regipy.registry.RegistryHive", side_effect=Exception("bad hive")):
+        assert process_hive_targets("/case/broken.hive", [_target("a"), _target("b")]) == [[], []]
+
+
+def _fake_process_hive_targets(hive_path, targets):
+    """Picklable stand-in for process_hive_targets in pool workers."""
+    if str(hive_path).endswith("NTUSER_2.hive"):
+        raise RuntimeError("corrupt hive")
+    return [
+        [RegistryFinding(
+            detector_id=target["name"], name="user:run", value=str(hive_path),
+            confidence="1.0", provenance="registry_offline", hive=str(hive_path), path="Run\\x",
+        )]
+        for target in targets
+    ]
+
+
+@pytest.mark.parametrize("enable_parallel", [True, False])
+def test_ingestion_analyzes_user_hives_per_hive(tmp_path, enable_parallel):
+    hives = []
+    for index, user in enumerate(["alice", "bob", "carol"]):
+        local = f"hives/NTUSER_{index}.hive"
+        (tmp_path / "hives").mkdir(exist_ok=True)
+        (tmp_path / local).write_bytes(b"regf")
+        hives.append({
+            "original_path": f"Users/{user}/NTUSER.DAT",
+            "local_path": local,
+            "filename": "NTUSER.DAT",
+        })
+    hives.append({"original_path": "Windows/notes.txt", "local_path": "hives/NTUSER_0.hive", "filename": "notes.txt"})
+    targets = [_target("user_run", {"path": RUN_PATH}), _target("user_assist", {"path": ASSIST_PATH})]
+
+    conn = sqlite3.connect(tmp_path / "evidence.sqlite")
+    migrate(conn, migrations_dir=EVIDENCE_MIGRATIONS_DIR)
+    callbacks = Mock()
+    with patch.object(ingestion, "process_hive_targets", _fake_process_hive_targets), \
+            patch.object(ingestion, "load_registry_rules", return_value=Mock(targets=targets)):
+        result = ingestion.run_registry_ingestion(
+            {"run_id": "run1", "extracted_hives": hives}, conn, 1, callbacks,
+            output_dir=tmp_path, config={"enable_parallel": enable_parallel},
+        )
+
+    assert result == {"inserted": 4, "errors": 0}
+    rows = conn.execute("SELECT value, provenance FROM os_indicators ORDER BY id").fetchall()
+    assert [row[0] for row in rows] == [
+        str(tmp_path / "hives/NTUSER_0.hive"), str(tmp_path / "hives/NTUSER_0.hive"),
+        str(tmp_path / "hives/NTUSER_1.hive"), str(tmp_path / "hives/NTUSER_1.hive"),
+    ]
+    summary = json.loads((tmp_path / "ingestion_registry.json").read_text())
+    assert summary["hives_processed"] == 4
+    assert [h["matched_rules"] for h in summary["processed_hives"]] == [
+        ["user_run", "user_assist"], ["user_run", "user_assist"], [], [],
+    ]
+    assert summary["errors"] == ["Error processing NTUSER.DAT: corrupt hive"]
+    conn.close()
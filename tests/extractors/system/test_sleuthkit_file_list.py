@@ -23,7 +23,6 @@ pytestmark = [pytest.mark.integration, pytest.mark.slow]
 
 from extractors.system.file_list.bodyfile_parser import BodyfileEntry, BodyfileParser
 from extractors.system.file_list.sleuthkit_generator import (
-    FILE_LIST_INDEXES,
     GenerationResult,
     SleuthKitFileListGenerator,
 )
@@ -274,6 +274,43 @@ class TestUpdateDownloadImageMetadata:
         parsed_exif = json.loads(download["exif_json"])
         assert parsed_exif["Camera"] == "TestCam"
 
+    def test_update_image_metadata_batch(
+        self, case_data: CaseDataAccess, evidence_id: int
+    ):
+        """Batch updates fill metadata; download-time hashes are kept."""
+        ids = []
+        for i in range(3):
+            did = case_data.insert_download(
+                evidence_id=evidence_id,
+                url=f"https://example.com/p{i}.jpg",
+                domain="example.com",
+                file_type="image",
+                file_extension=".jpg",
+                filename=f"p{i}.jpg",
+            )
+            case_data.update_download_status(
+                evidence_id, did, "completed", dest_path=f"p{i}.jpg",
+                md5="a" * 32 if i == 0 else None,
+            )
+            ids.append(did)
+
+        count = case_data.update_download_image_metadata_batch(evidence_id, [
+            {"download_id": ids[0], "phash": "0f0f0f0f0f0f0f0f", "width": 10, "height": 20,
+             "md5": "b" * 32, "sha256": "c" * 64},
+            {"download_id": ids[1], "phash": None, "width": 30, "height": 40, "md5": "d" * 32},
+        ])
+
+        assert count == 2
+        first = case_data.get_download(evidence_id, ids[0])
+        second = case_data.get_download(evidence_id, ids[1])
+        third = case_data.get_download(evidence_id, ids[2])
+        assert (first["phash"], first["width"], first["height"]) == ("0f0f0f0f0f0f0f0f", 10, 20)
+        assert first["md5"] == "a" * 32
+        assert first["sha256"] == "c" * 64
+        assert second["phash"] is None and second["width"] == 30
+        assert second["md5"] == "d" * 32
+        assert third["width"] is None
+
 
 class TestListDownloads:
     """Tests for list_downloads and filtering."""
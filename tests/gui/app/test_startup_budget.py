@@ -0,0 +1,73 @@
+"""
+Cold-start regression test: time from interpreter start to the first
+event-loop tick after MainWindow.show() must stay within the configured
+budget (config.yml ``startup.cold_start_budget_s`` or the
+``SURFSIFTER_STARTUP_BUDGET_S`` environment variable).
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.startup import startup_budget_seconds
+from core.config import load_app_config
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+
+_COLD_START_SCRIPT = """
+import json, sys, time
+t0 = time.perf_counter()
+from pathlib import Path
+from app.startup import get_startup_profiler
+profiler = get_startup_profiler()
+with profiler.phase("import_app_main"):
+    from app.main import MainWindow
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication
+
+app = QApplication(sys.argv[:1])
+with profiler.phase("main_window"):
+    window = MainWindow(Path(sys.argv[1]))
+window.show()
+
+def _first_tick():
+    profiler.mark("to_first_window", t0)
+    print(json.dumps({"elapsed": time.perf_counter() - t0, "phases": profiler.phases}))
+    app.quit()
+
+QTimer.singleShot(0, _first_tick)
+app.exec()
+"""
+
+
+@pytest.mark.gui_offscreen
+def test_cold_start_to_first_window_within_budget(tmp_path):
+    base_dir = tmp_path / "base"
+    shutil.copytree(REPO_ROOT / "config", base_dir / "config")
+    budget = startup_budget_seconds(load_app_config(base_dir).startup.cold_start_budget_s)
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(SRC_DIR)
+    env["QT_QPA_PLATFORM"] = "offscreen"
+    result = subprocess.run(
+        [sys.executable, "-c", _COLD_START_SCRIPT, str(base_dir)],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=max(60.0, budget * 6),
+    )
+    assert result.returncode == 0, result.stderr
+
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    assert report["elapsed"] <= budget, (
+        f"Cold start took {report['elapsed']:.2f}s, budget {budget:.2f}s; "
+        f"phases: {report['phases']}"
+    )
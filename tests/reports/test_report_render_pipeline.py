@@ -0,0 +1,325 @@
+"""Tests for report render caching and chunked/parallel PDF generation.
+
+Covers:
+- evidence_data_version invalidation (inserts, deletes, in-place updates)
+- ReportBuilder section/appendix render cache
+- Chunked appendix rendering (render_chunks, get_appendix_parts)
+- Appendix sub-documents with continued page numbering and merged output
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+import pytest
+
+from core.database import EVIDENCE_MIGRATIONS_DIR, migrate
+from core.database.helpers.urls import delete_urls_by_run
+from core.database.manager import _ensure_data_version_triggers
+from reports import generator as generator_module
+from reports.appendix.base import split_rows
+from reports.appendix.url_list.module import AppendixUrlListModule
+from reports.database import insert_appendix_module, insert_custom_section, insert_section_module
+from reports.generator import ReportBuilder, ReportGenerator, ReportMode
+from reports.pdf_pipeline import HAS_PYPDF, page_offsets
+from reports.render_cache import SectionRenderCache, config_fingerprint, evidence_data_version
+
+
+@pytest.fixture
+def evidence_conn(tmp_path):
+    conn = sqlite3.connect(tmp_path / "evidence.sqlite")
+    migrate(conn, migrations_dir=EVIDENCE_MIGRATIONS_DIR)
+    _ensure_data_version_triggers(conn)
+    yield conn
+    conn.close()
+
+
+def _insert_urls(conn: sqlite3.Connection, count: int, start: int = 0) -> None:
+    conn.executemany(
+        "INSERT INTO urls (evidence_id, url, domain, discovered_by) VALUES (1, ?, ?, 'test')",
+        [(f"https://site{i % 7}.example/{i}", f"site{i % 7}.example") for i in range(start, start + count)],
+    )
+    conn.commit()
+
+
+class CountingModule:
+    """Report/appendix module stand-in that counts render calls."""
+
+    def __init__(self, html: str = "<p>rendered</p>"):
+        self.html = html
+        self.calls = 0
+
+    def render(self, db_conn, evidence_id, config) -> str:
+        self.calls += 1
+        return self.html
+
+    def render_chunks(self, db_conn, evidence_id, config, chunk_rows=0):
+        self.calls += 1
+        return [self.html, self.html]
+
+    def get_default_title(self) -> str:
+        return "Counting"
+
+
+class TestEvidenceDataVersion:
+
+    def test_changes_on_insert_update_delete(self, evidence_conn):
+        v0 = evidence_data_version(evidence_conn)
+        _insert_urls(evidence_conn, 3)
+        v1 = evidence_data_version(evidence_conn)
+        evidence_conn.execute("UPDATE urls SET notes = 'x' WHERE id = 2")
+        evidence_conn.commit()
+        v2 = evidence_data_version(evidence_conn)
+        evidence_conn.execute("DELETE FROM urls WHERE id = 1")
+        evidence_conn.commit()
+        v3 = evidence_data_version(evidence_conn)
+
+        assert len({v0, v1, v2, v3}) == 4
+        assert evidence_data_version(evidence_conn) == v3
+
+    def test_purge_and_reinsert_of_same_rowid_changes_version(self, evidence_conn):
+        evidence_conn.execute(
+            "INSERT INTO urls (id, evidence_id, url, domain, discovered_by, run_id) VALUES (3, 1, 'https://a.example/', 'a.example', 'test', 'r1')"
+        )
+        evidence_conn.commit()
+        before = evidence_data_version(evidence_conn)
+        assert delete_urls_by_run(evidence_conn, 1, "r1") == 1
+        evidence_conn.execute(
+            "INSERT INTO urls (id, evidence_id, url, domain, discovered_by, run_id) VALUES (3, 1, 'https://other.example/', 'other.example', 'test', 'r2')"
+        )
+        evidence_conn.commit()
+        assert evidence_data_version(evidence_conn) != before
+
+    def test_untag_and_retag_changes_version(self, evidence_conn):
+        evidence_conn.execute("INSERT INTO tags (id, evidence_id, name, name_normalized) VALUES (1, 1, 'a', 'a')")
+        evidence_conn.execute(
+            "INSERT INTO tag_associations (id, tag_id, evidence_id, artifact_type, artifact_id) VALUES (1, 1, 1, 'url', 5)"
+        )
+        evidence_conn.commit()
+        before = evidence_data_version(evidence_conn)
+        evidence_conn.execute("DELETE FROM tag_associations WHERE id = 1")
+        evidence_conn.execute(
+            "INSERT INTO tag_associations (id, tag_id, evidence_id, artifact_type, artifact_id) VALUES (1, 1, 1, 'url', 6)"
+        )
+        evidence_conn.commit()
+        assert evidence_data_version(evidence_conn) != before
+
+    def test_only_tables_without_delete_trigger_are_counted(self, evidence_conn):
+        _insert_urls(evidence_conn, 3)
+        statements = []
+        evidence_conn.set_trace_callback(statements.append)
+        evidence_data_version(evidence_conn)
+        evidence_conn.set_trace_callback(None)
+        assert any('MAX(rowid) FROM "tag_associations"' in sql for sql in statements)
+        assert any('COUNT(*) FROM "urls"' in sql for sql in statements)
+        assert not any('COUNT(*) FROM "tag_associations"' in sql for sql in statements)
+
+    def test_delete_from_table_without_trigger_changes_version(self, evidence_conn):
+        _insert_urls(evidence_conn, 3)
+        before = evidence_data_version(evidence_conn)
+        evidence_conn.execute("DELETE FROM urls WHERE id = 1")
+        evidence_conn.commit()
+        assert evidence_data_version(evidence_conn) != before
+
+    def test_triggers_skip_tables_missing_from_legacy_schema(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE data_version (id INTEGER PRIMARY KEY, version INTEGER NOT NULL DEFAULT 0)")
+        conn.execute("CREATE TABLE urls (id INTEGER PRIMARY KEY, url TEXT)")
+        _ensure_data_version_triggers(conn)
+        triggers = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+        assert triggers == {"trg_data_version_urls"}
+        conn.close()
+
+    def test_report_config_writes_keep_version(self, evidence_conn):
+        before = evidence_data_version(evidence_conn)
+        section_id = insert_custom_section(evidence_conn, 1, "Summary")
+        insert_section_module(evidence_conn, section_id, "url_summary", {"limit": 5})
+        insert_appendix_module(evidence_conn, 1, "appendix_url_list")
+        assert evidence_data_version(evidence_conn) == before
+
+    def test_in_memory_database_is_not_versioned(self):
+        conn = sqlite3.connect(":memory:")
+        assert evidence_data_version(conn) is None
+        conn.close()
+
+
+def test_config_fingerprint_ignores_callbacks_and_translations():
+    base = {"limit": 5, "_locale": "en"}
+    assert config_fingerprint(base) == config_fingerprint(
+        {**base, "_translations": {"a": "b"}, "_progress_callback": print}
+    )
+    assert config_fingerprint(base) != config_fingerprint({**base, "_locale": "de"})
+
+
+def test_render_cache_evicts_least_recently_used():
+    cache = SectionRenderCache(max_chars=10)
+    cache.put("a", "12345")
+    cache.put("b", ["123", "45"])
+    assert cache.get("a") == "12345"
+    cache.put("c", "123")
+    assert cache.get("b") is None
+    assert cache.get("a") == "12345"
+    assert len(cache) == 2
+
+
+class TestBuilderRenderCache:
+
+    @pytest.fixture(autouse=True)
+    def _patch_registries(self, monkeypatch):
+        self.monkeypatch = monkeypatch
+
+    def _builder(self, conn, cache, module):
+        builder = ReportBuilder(conn, evidence_id=1, render_cache=cache)
+        # Registries are process-wide singletons
+        self.monkeypatch.setattr(builder._registry, "get_module", lambda module_id: module)
+        self.monkeypatch.setattr(builder._appendix_registry, "get_module", lambda module_id: module)
+        return builder
+
+    def test_unchanged_sections_are_not_rerendered(self, evidence_conn):
+        section_id = insert_custom_section(evidence_conn, 1, "URLs")
+        insert_section_module(evidence_conn, section_id, "counting", {"limit": 5})
+        module = CountingModule()
+        cache = SectionRenderCache()
+
+        self._builder(evidence_conn, cache, module).load_sections_from_db()
+        insert_custom_section(evidence_conn, 1, "Notes", content="<p>edited</p>")
+        builder = self._builder(evidence_conn, cache, module).load_sections_from_db()
+
+        assert module.calls == 1
+        assert builder.get_data().sections[0].modules[0]["rendered_html"] == "<p>rendered</p>"
+
+        _insert_urls(evidence_conn, 1)
+        self._builder(evidence_conn, cache, module).load_sections_from_db()
+        assert module.calls == 2
+
+    def test_error_output_is_not_cached(self, evidence_conn):
+        section_id = insert_custom_section(evidence_conn, 1, "URLs")
+        insert_section_module(evidence_conn, section_id, "counting", {})
+        module = CountingModule('<div class="module-error">boom</div>')
+        cache = SectionRenderCache()
+
+        for _ in range(2):
+            self._builder(evidence_conn, cache, module).load_sections_from_db()
+        assert module.calls == 2
+
+    def test_appendix_chunks_are_cached(self, evidence_conn):
+        insert_appendix_module(evidence_conn, 1, "counting", title="Big List")
+        module = CountingModule()
+        cache = SectionRenderCache()
+
+        for _ in range(2):
+            builder = self._builder(evidence_conn, cache, module).load_appendix_from_db()
+        assert module.calls == 1
+
+        (appendix,) = builder.get_data().appendix_modules
+        assert appendix["chunks"] == ["<p>rendered</p>", "<p>rendered</p>"]
+        assert appendix["rendered_html"] == "<p>rendered</p><p>rendered</p>"
+        parts = builder.get_appendix_parts()
+        assert [(p["number"], p["continued"]) for p in parts] == [(1, False), (1, True)]
+
+
+class TestChunkedModules:
+
+    def test_split_rows(self):
+        assert split_rows([1, 2, 3], 0) == [[1, 2, 3]]
+        assert split_rows([], 2) == [[]]
+        assert split_rows([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+
+    @pytest.mark.parametrize("group_by_domain", [True, False])
+    def test_url_list_chunks_cover_all_urls(self, evidence_conn, group_by_domain):
+        _insert_urls(evidence_conn, 250)
+        module = AppendixUrlListModule()
+        config = {"group_by_domain": group_by_domain}
+
+        chunks = module.render_chunks(evidence_conn, 1, config, chunk_rows=60)
+        full = module.render(evidence_conn, 1, config)
+
+        assert len(chunks) > 1
+        assert sum(c.count('class="url-cell"') for c in chunks) == 250
+        assert full.count('class="url-cell"') == 250
+
+
+class TestChunkedAppendixDocuments:
+
+    @pytest.fixture
+    def builder(self):
+        conn = sqlite3.connect(":memory:")
+        builder = ReportBuilder(conn, evidence_id=1)
+        builder.set_title("Case Report")
+        builder._data.appendix_modules.extend([
+            {"module_id": "a", "config": {}, "title": "URLs", "rendered_html": "u1u2",
+             "chunks": ["<p>u1</p>", "<p>u2</p>"]},
+            {"module_id": "b", "config": {}, "title": "Files", "rendered_html": "<p>f1</p>"},
+        ])
+        yield builder
+        conn.close()
+
+    def test_sub_document_continues_numbering(self, builder):
+        part = builder.get_appendix_parts()[1]
+        html = builder.render_appendix_html(
+            [part], front_matter=False, page_offset=7, page_total=42
+        )
+        assert "counter-reset: page 7" in html
+        assert '"42"' in html and "counter(pages)" not in html
+        assert "(continued)" in html
+        assert 'class="title-page"' not in html
+        assert 'id="appendix-1"' not in html
+
+    def test_front_matter_lists_toc_pages(self, builder):
+        html = builder.render_appendix_html(
+            [], page_total=42, toc_pages={1: 3, 2: 30}
+        )
+        assert 'class="title-page"' in html
+        assert 'class="toc-page-num">30</td>' in html
+        # The sections live in other sub-documents: links would not resolve after merging
+        assert 'href="#appendix-' not in html
+        assert "target-counter" not in html
+        assert "<p>u1</p>" not in html
+
+    def test_full_document_unchanged_by_chunks(self, builder):
+        html = builder.render_appendix_html()
+        assert "counter(pages)" in html
+        assert "target-counter" in html
+        assert 'id="appendix-1"' in html and 'id="appendix-2"' in html
+
+    def test_page_offsets(self):
+        assert page_offsets([2, 5, 1]) == ([0, 2, 7], 8)
+
+    @pytest.mark.skipif(not HAS_PYPDF, reason="pypdf not available")
+    def test_generate_documents_merges_chunks(self, builder, tmp_path, monkeypatch):
+        from pypdf import PdfReader, PdfWriter
+
+        pages_per_doc = {}
+
+        def fake_count_pages(html_content: str, base_url: str) -> int:
+            return 2 if 'class="title-page"' in html_content else 3
+
+        def fake_write_pdf(html_content: str, output_path: str, base_url: str) -> str:
+            writer = PdfWriter()
+            count = fake_count_pages(html_content, base_url)
+            for _ in range(count):
+                writer.add_blank_page(width=595, height=842)
+            with open(output_path, "wb") as fh:
+                writer.write(fh)
+            pages_per_doc[Path(output_path).name] = html_content
+            return output_path
+
+        monkeypatch.setattr(generator_module, "count_pages", fake_count_pages)
+        monkeypatch.setattr(generator_module, "write_pdf", fake_write_pdf)
+        generator = ReportGenerator(max_workers=1)
+        generator._weasyprint_available = True
+
+        report_path, appendix_path = generator.generate_documents(
+            builder,
+            ReportMode.COMPLETE,
+            tmp_path / "report.pdf",
+            tmp_path / "out" / "appendix.pdf",
+        )
+
+        assert report_path.exists()
+        assert len(PdfReader(str(appendix_path)).pages) == 2 + 3 * 3
+        front = pages_per_doc["part_0000.pdf"]
+        assert 'toc-page-num">3</td>' in front and 'toc-page-num">9</td>' in front
+        assert "counter-reset: page 5" in pages_per_doc["part_0002.pdf"]
+        parts = [html for name, html in pages_per_doc.items() if name.startswith("part_")]
+        assert len(parts) == 4 and all('"11"' in html for html in parts)
@@ -118,6 +118,26 @@ class TestScreenshotsDatabaseHelpers:
         assert row["sequence_order"] == 5
         assert row["source"] == "upload"
 
+    def test_insert_screenshots_batch(self, db_conn):
+        """Test inserting several screenshots in one call."""
+        from core.database.helpers import insert_screenshots
+
+        count = insert_screenshots(db_conn, 1, [
+            {"dest_path": "screenshot_store/aa/a.png", "filename": "a.png", "title": "A",
+             "source": "upload", "sequence_order": 0},
+            {"dest_path": "screenshot_store/bb/b.png", "filename": "b.png", "title": "B"},
+        ])
+
+        assert count == 2
+        rows = db_conn.execute(
+            "SELECT filename, source, sequence_order, captured_at_utc FROM screenshots ORDER BY id"
+        ).fetchall()
+        assert [(r["filename"], r["source"], r["sequence_order"]) for r in rows] == [
+            ("a.png", "upload", 0),
+            ("b.png", "sandbox", 0),
+        ]
+        assert all(r["captured_at_utc"] for r in rows)
+
     def test_get_screenshot(self, db_conn):
         """Test retrieving a single screenshot."""
         from core.database.helpers import insert_screenshot, get_screenshot
@@ -387,8 +407,10 @@ class TestScreenshotStorageQt:
         assert len(metadata.md5) == 32
         assert len(metadata.sha256) == 64
 
-        # Verify file exists
-        full_path = tmp_path / "evidences" / "ev-test" / metadata.dest_path
+        # Verify file exists in the case screenshot store
+        from app.features.screenshots.storage import resolve_screenshot_path
+        full_path = resolve_screenshot_path(tmp_path, "Test Evidence", 1, metadata.dest_path)
+        assert metadata.dest_path.startswith("screenshot_store/")
         assert full_path.exists()
 
 